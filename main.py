@@ -5,36 +5,45 @@
 基于 Ollama 的自动翻译工具
 """
 
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+# 启动计时器最先创建，用于统计各模块的导入耗时
+from modules.startup_timer import StartupTimer
+startup_timer = StartupTimer()
+
+with startup_timer.phase("import tkinter"):
+    import tkinter as tk
 import os
 import sys
 import threading
 import time
-import json
-import zipfile
-import shutil
-import requests
-import subprocess
-import re
-from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict
 
-# 导入自定义模块
-from modules.gui_manager import GUIManager
-from modules.ollama_manager import OllamaManager, OllamaTranslator
-from modules.translation_manager import TranslationManager
-from modules.config_manager import ConfigManager
-from modules.file_manager import FileManager
-from modules.translation_core import TranslationCore
-from modules.ui_text_manager import UITextManager
-from modules.modern_widgets import style_manager
+# 导入自定义模块（requests、zipfile、subprocess 等在首次使用时才导入）
+with startup_timer.phase("import gui_manager"):
+    from modules.gui_manager import GUIManager
+    from modules.modern_widgets import style_manager
+with startup_timer.phase("import ollama_manager"):
+    from modules.ollama_manager import OllamaManager, OllamaTranslator
+with startup_timer.phase("import translation_manager"):
+    from modules.translation_manager import TranslationManager
+with startup_timer.phase("import file_manager"):
+    from modules.file_manager import FileManager
+with startup_timer.phase("import other modules"):
+    from modules.config_manager import ConfigManager
+    from modules.ui_text_manager import UITextManager
+    from modules.ui_update_bus import UIUpdateBus
+    from modules.log_store import LogStore
+    from modules.metrics import MetricsStore
+    from modules.glossary import GlossaryStore
+    from modules.translation_memory import TranslationMemoryStore
+    from modules.embedding_index import EmbeddingStore
+    from modules.profiler import profiler
 
 
 
 class StardewValleyTranslator:
     def __init__(self):
-        self.root = tk.Tk()
+        with startup_timer.phase("create Tk root"):
+            self.root = tk.Tk()
         self.root.withdraw()  # 先隐藏窗口，避免初始化时的闪烁
         self.root.title("星露谷物语mod i18n AI翻译工具")  # 临时标题，将在load_config后更新
         self.root.geometry("900x600")
@@ -56,6 +65,19 @@ class StardewValleyTranslator:
                 except Exception as e:
                     print(f"设置主窗口图标失败: {e}")
         
+        # 请求级性能统计：每次翻译运行的耗时和token数据
+        self.metrics = MetricsStore()
+        
+        # 日志存储：有界环形缓冲区，可选写入Data/logs下的滚动日志文件
+        self.log_store = LogStore(max_lines=1000)
+        self._log_line_count = 0
+        
+        # 界面更新总线：工作线程的结果、进度和日志按固定帧率批量刷新
+        self.ui_bus = UIUpdateBus(self.root, interval_ms=100)
+        self.ui_bus.set_handlers(row_handler=self.apply_translation_updates,
+                                 progress_handler=self._update_log_frame_title,
+                                 log_handler=self._append_logs_to_gui)
+        
         # 初始化文件管理器（负责统一管理所有目录路径）
         self.file_manager = FileManager(self)
         
@@ -70,6 +92,13 @@ class StardewValleyTranslator:
         # 配置文件路径
         self.config_file = self.data_dir / "config.json"
         
+        # 术语表：内置原版术语 + Data/glossary/<语言代码>.json 中的用户术语
+        self.glossary = GlossaryStore(self.data_dir / "glossary")
+        # 翻译记忆：已通过校验的译文，按语言保存在 Data/translation_memory
+        self.translation_memory = TranslationMemoryStore(self.data_dir / "translation_memory")
+        # 翻译记忆原文的向量索引，用于按语义挑选示例
+        self.embedding_index = EmbeddingStore(self.data_dir / "translation_memory")
+        
         # Ollama 配置
         self.ollama_base_url = "http://localhost:11434"
         self.ollama_model = None  # 不再硬编码，启动时自动获取
@@ -159,8 +188,9 @@ class StardewValleyTranslator:
         self.batch_size = 5
         self.auto_save_interval = 20
         
-        # 加载配置
-        self.load_config()
+        # 加载配置（同时构建当前界面语言的文本表）
+        with startup_timer.phase("load config and ui texts"):
+            self.load_config()
         
         # GUI变量
         self.target_language_var = tk.StringVar(value=self.current_ui_language)
@@ -169,7 +199,11 @@ class StardewValleyTranslator:
         self.auto_save_interval_var = tk.StringVar(value=str(self.auto_save_interval))
         
         # 创建GUI
-        self.create_gui()
+        with startup_timer.phase("create gui"):
+            self.create_gui()
+        
+        # 开始批量刷新界面
+        self.ui_bus.start()
         
         # 异步初始化Ollama和显示窗口
         self._async_initialize()
@@ -211,6 +245,11 @@ class StardewValleyTranslator:
         self.ollama_model = config.get('ollama_model', 'qwen2.5:7b')
         self.batch_size = config.get('batch_size', 5)
         self.auto_save_interval = config.get('auto_save_interval', 20)
+        self.log_store.set_level(config.get('log_level', 'INFO'))
+        if config.get('log_to_file', False):
+            self.log_store.enable_file(self.data_dir / "logs" / "translator.log")
+        if config.get('profiling', False):
+            profiler.enabled = True
     
     def save_config(self):
         """保存配置文件"""
@@ -251,34 +290,38 @@ class StardewValleyTranslator:
         timestamp = time.strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {level}: {message}"
         
+        # 写入日志存储（低于显示级别的条目只写入日志文件）
+        if not self.log_store.append(log_entry, level):
+            return
+        
         # 输出到控制台
         print(log_entry)
         
-        # 输出到GUI日志区域
-        if hasattr(self, 'log_text'):
-            self.root.after(0, self._append_log_to_gui, log_entry)
+        # 输出到GUI日志区域（由界面更新总线批量刷新）
+        self.ui_bus.post_log(log_entry)
     
-    def _append_log_to_gui(self, log_entry: str):
-        """将日志条目添加到GUI日志区域"""
+    def _append_logs_to_gui(self, log_entries: List[str]):
+        """将一批日志条目添加到GUI日志区域"""
         try:
             if hasattr(self, 'log_text'):
                 # 启用文本框编辑
                 self.log_text.config(state=tk.NORMAL)
                 
-                # 添加日志条目（如果不是第一条日志，先添加换行）
-                if self.log_text.get("1.0", tk.END).strip():
+                # 一次性添加本批日志条目（如果不是第一条日志，先添加换行）
+                text = "\n".join(log_entries)
+                if self._log_line_count > 0:
                     self.log_text.insert(tk.END, "\n")
-                self.log_text.insert(tk.END, log_entry)
+                self.log_text.insert(tk.END, text)
+                self._log_line_count += text.count("\n") + 1
                 
                 # 自动滚动到底部
                 self.log_text.see(tk.END)
                 
-                # 限制日志行数，保持最新的1000行
-                lines = self.log_text.get("1.0", tk.END).split("\n")
-                if len(lines) > 1000:
-                    # 删除最旧的行
-                    lines_to_delete = len(lines) - 1000
+                # 限制日志行数，按计数删除最旧的行，保持最新的行数与日志存储一致
+                if self._log_line_count > self.log_store.max_lines:
+                    lines_to_delete = self._log_line_count - self.log_store.max_lines
                     self.log_text.delete("1.0", f"{lines_to_delete + 1}.0")
+                    self._log_line_count -= lines_to_delete
                 
                 # 禁用文本框编辑
                 self.log_text.config(state=tk.DISABLED)
@@ -295,15 +338,21 @@ class StardewValleyTranslator:
         if total is not None:
             self.translation_progress["total"] = total
         
-        # 更新日志框架标题以显示进度
-        self.root.after(0, self._update_log_frame_title)
+        # 更新日志框架标题以显示进度（每个刷新周期只更新一次）
+        self.ui_bus.post_progress()
     
     def _update_log_frame_title(self):
         """更新日志框架标题以显示进度"""
         base_title = self.get_ui_text("log")
         if self.translation_progress["total"] > 0:
-            progress_text = f"({self.translation_progress['current']}/{self.translation_progress['total']})"
-            title_with_progress = f"{base_title}{progress_text}"
+            progress_text = f"{self.translation_progress['current']}/{self.translation_progress['total']}"
+            estimator = self.translation_manager.eta_estimator
+            if estimator.completed_entries > 0:
+                eta_text = self.get_ui_text("progress_eta").format(
+                    estimator.format_duration(estimator.remaining_seconds()),
+                    estimator.entries_per_minute())
+                progress_text = f"{progress_text}, {eta_text}"
+            title_with_progress = f"{base_title}({progress_text})"
         else:
             title_with_progress = base_title
         
@@ -323,6 +372,18 @@ class StardewValleyTranslator:
         except Exception as e:
             self.log_message(self.get_ui_text("update_translation_display_failed").format(str(e)), "ERROR")
     
+    def apply_translation_updates(self, file_path, updates: Dict[str, str]) -> None:
+        """批量应用来自界面更新总线的译文行更新
+        
+        Args:
+            file_path: 译文所属文件
+            updates: {翻译键: 翻译文本}
+        """
+        # 只有当前显示的文件才需要刷新界面
+        if file_path != getattr(self, 'current_translation_file', None):
+            return
+        self.gui_manager.patch_translation_display(updates)
+    
     # GUI事件处理方法已迁移到gui_manager.py
     
     # edit_translation_dialog方法已迁移到gui_manager.py
@@ -446,7 +507,16 @@ class StardewValleyTranslator:
     def _async_initialize(self):
         """异步初始化，避免阻塞UI"""
         # 立即显示窗口，不等待任何初始化
-        self._show_window_centered()
+        with startup_timer.phase("show window"):
+            self._show_window_centered()
+        self._log_startup_report()
+        
+        # 立即显示上次保存的模型列表，后台发现完成后再校正
+        cached_models = self.ollama_manager.get_cached_models()
+        if cached_models:
+            saved_model = self.config_manager.get_ollama_model()
+            self.ollama_model = saved_model if saved_model else cached_models[0]
+            self._update_models_ui(cached_models)
         
         def initialize():
             try:
@@ -456,48 +526,27 @@ class StardewValleyTranslator:
                 # 先刷新mod列表
                 self.root.after(0, self.refresh_mod_list)
                 
-                # 等待一小段时间确保MOD列表刷新完成
-                time.sleep(0.1)
-                
-                # 然后检查Ollama服务状态
-                if self.ollama_manager.check_server_status():
-                    # 从配置文件读取保存的模型，如果没有则使用默认值
-                    saved_model = self.config_manager.get_ollama_model()
-                    self.ollama_model = saved_model if saved_model else "qwen2.5-coder:14b"
-                    
-                    # 立即初始化翻译器，不等待模型列表
-                    self.ollama_translator = OllamaTranslator(
-                        base_url=self.ollama_base_url,
-                        model=self.ollama_model,
-                        main_app=self
-                    )
-                    
-                    # 在主线程中显示初始化完成
-                    self.root.after(0, self.log_message, self.get_ui_text("model_initialized").format(self.ollama_model))
-                    
-                    # 立即获取模型列表
-                    def load_models():
-                        try:
-                            models = self.ollama_manager.get_available_models()
-                            if models:
-                                self.available_models = models
-                                # 验证当前模型是否在列表中
-                                if self.ollama_model not in models and models:
-                                    self.ollama_model = models[0]
-                                    self.config_manager.set_ollama_model(self.ollama_model)
-                                    self.ollama_translator.model = self.ollama_model
-                                # 更新UI
-                                self.root.after(0, self._update_models_ui, models)
-                                self.root.after(0, self.log_message, self.get_ui_text("models_loaded").format(len(models)))
-                            else:
-                                self.root.after(0, self.log_message, self.get_ui_text("no_available_models"), "WARNING")
-                        except Exception as e:
-                            self.root.after(0, self.log_message, self.get_ui_text("model_loading_failed").format(str(e)), "WARNING")
-                    
-                    # 在后台线程中立即加载模型列表
-                    threading.Thread(target=load_models, daemon=True).start()
-                else:
+                # 一次 /api/tags 请求同时完成服务状态检查和模型列表获取
+                models = self.ollama_manager.discover_models(force=True)
+                if models is None:
                     self.root.after(0, self.log_message, self.get_ui_text("ollama_not_installed"), "ERROR")
+                    return
+                
+                # 从配置文件读取保存的模型，如果没有则使用默认值
+                saved_model = self.config_manager.get_ollama_model()
+                self.ollama_model = saved_model if saved_model else "qwen2.5-coder:14b"
+                
+                # 初始化翻译器
+                self.ollama_translator = OllamaTranslator(
+                    base_url=self.ollama_base_url,
+                    model=self.ollama_model,
+                    main_app=self
+                )
+                
+                # 在主线程中显示初始化完成
+                self.root.after(0, self.log_message, self.get_ui_text("model_initialized").format(self.ollama_model))
+                
+                self.apply_discovered_models(models)
                 
             except Exception as e:
                 self.root.after(0, self.log_message, f"初始化失败: {str(e)}", "ERROR")
@@ -505,6 +554,43 @@ class StardewValleyTranslator:
         # 在后台线程中执行初始化
         threading.Thread(target=initialize, daemon=True).start()
     
+    def apply_discovered_models(self, models: List[str]):
+        """用发现到的模型列表校正界面和当前模型（可在后台线程调用）"""
+        if not models:
+            self.available_models = []
+            self.root.after(0, self.log_message, self.get_ui_text("no_available_models"), "WARNING")
+            return
+        
+        self.available_models = models
+        # 验证当前模型是否在列表中
+        if self.ollama_model not in models:
+            self.ollama_model = models[0]
+            self.config_manager.set_ollama_model(self.ollama_model)
+        self.ollama_manager.set_model(self.ollama_model)
+        if self.ollama_translator:
+            self.ollama_translator.model = self.ollama_model
+        # 更新UI
+        self.root.after(0, self._update_models_ui, models)
+        self.root.after(0, self.log_message, self.get_ui_text("models_loaded").format(len(models)))
+    
+    def report_profile(self):
+        """输出自上次报告以来的分阶段性能汇总，并导出Chrome trace到 Data/profiles"""
+        if not profiler.enabled or not profiler.has_events():
+            return
+        self.log_message("分阶段耗时:\n" + profiler.format_summary())
+        try:
+            trace_file = self.data_dir / "profiles" / f"trace_{time.strftime('%Y%m%d_%H%M%S')}.json"
+            profiler.export_chrome_trace(trace_file)
+            self.log_message(f"性能剖析trace已导出: {trace_file.name}")
+        except Exception as e:
+            self.log_message(f"导出性能剖析trace失败: {str(e)}", "WARNING")
+        profiler.reset()
+    
+    def _log_startup_report(self):
+        """输出启动计时报告（开启 --startup-report 时显示在日志面板，否则只写入日志文件）"""
+        level = "INFO" if startup_timer.enabled else "DEBUG"
+        self.log_message(startup_timer.report(), level)
+    
     def _update_models_ui(self, models):
         """更新模型UI（在主线程中调用）"""
         if hasattr(self, 'model_combo'):
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文本对比视图模块
+虚拟化的原文/译文双列表框，只渲染可见行
+"""
+
+import tkinter as tk
+import tkinter.font as tkFont
+from typing import Callable, Dict, List, Optional
+
+
+class ComparisonView:
+    """虚拟化文本对比视图
+
+    原文和译文保存在后台数组中，两个Listbox只负责渲染当前可见的若干行，
+    打开文件和滚动的开销与条目总数无关。
+    """
+
+    def __init__(self, original_listbox: tk.Listbox, translation_listbox: tk.Listbox,
+                 scrollbar: Optional[tk.Widget] = None):
+        """初始化对比视图
+
+        Args:
+            original_listbox: 原文列表框
+            translation_listbox: 译文列表框
+            scrollbar: 共用垂直滚动条
+        """
+        self.original_listbox = original_listbox
+        self.translation_listbox = translation_listbox
+        self.scrollbar = scrollbar
+
+        # 后台数据
+        self.keys: List[str] = []
+        self.originals: List[str] = []
+        self.translations: List[str] = []
+        self._key_to_row: Dict[str, int] = {}
+
+        # 可见窗口状态
+        self.top = 0
+        self.visible_rows = max(1, int(original_listbox.cget('height')))
+        self.selected_index = -1
+        self._row_height = None
+        # 滚动后回调（用于优先翻译可见条目）
+        self.on_scroll: Optional[Callable[[], None]] = None
+
+        for listbox in (self.original_listbox, self.translation_listbox):
+            listbox.bind('<Configure>', self._on_configure, add='+')
+            listbox.bind('<Up>', lambda e: self._on_arrow_key(-1))
+            listbox.bind('<Down>', lambda e: self._on_arrow_key(1))
+            listbox.bind('<Prior>', lambda e: self._on_arrow_key(-self.visible_rows))
+            listbox.bind('<Next>', lambda e: self._on_arrow_key(self.visible_rows))
+
+    # ---- 数据操作 ----
+
+    def set_rows(self, keys: List[str], originals: List[str], translations: List[str]) -> None:
+        """替换全部数据并从顶部开始渲染
+
+        Args:
+            keys: 条目键列表
+            originals: 原文列表
+            translations: 译文列表
+        """
+        self.keys = list(keys)
+        self.originals = list(originals)
+        self.translations = list(translations)
+        self._key_to_row = {key: row for row, key in enumerate(self.keys)}
+        self.top = 0
+        self.selected_index = -1
+        self._render()
+
+    def clear(self) -> None:
+        """清空视图"""
+        self.set_rows([], [], [])
+
+    def size(self) -> int:
+        """获取条目总数"""
+        return len(self.keys)
+
+    def get_key(self, index: int) -> str:
+        """获取指定行的键"""
+        return self.keys[index]
+
+    def get_original(self, index: int) -> str:
+        """获取指定行的原文"""
+        return self.originals[index]
+
+    def get_translation(self, index: int) -> str:
+        """获取指定行的译文"""
+        return self.translations[index]
+
+    def row_of(self, key: str) -> int:
+        """O(1)查找键对应的行号，不存在时返回-1"""
+        return self._key_to_row.get(key, -1)
+
+    def patch_rows(self, updates: Dict[str, str]) -> int:
+        """按键批量更新译文，可见窗口最多重绘一次
+
+        Args:
+            updates: {键: 新译文}
+
+        Returns:
+            实际更新的行数
+        """
+        patched = 0
+        visible_changed = False
+        for key, text in updates.items():
+            row = self._key_to_row.get(key, -1)
+            if row < 0:
+                continue
+            self.translations[row] = text
+            patched += 1
+            if self.top <= row < self.top + self._rendered_count():
+                visible_changed = True
+        if visible_changed:
+            self._render_translations()
+        return patched
+
+    def visible_keys(self) -> List[str]:
+        """当前可见行的条目键"""
+        return self.keys[self.top:self.top + self.visible_rows]
+
+    def set_translation(self, index: int, text: str) -> None:
+        """更新指定行的译文，仅当该行可见时才重绘
+
+        Args:
+            index: 行号
+            text: 新译文
+        """
+        if index < 0 or index >= len(self.translations):
+            return
+        self.translations[index] = text
+        local = index - self.top
+        if 0 <= local < self._rendered_count():
+            self.translation_listbox.delete(local)
+            self.translation_listbox.insert(local, text)
+            if index == self.selected_index:
+                self.translation_listbox.selection_set(local)
+
+    # ---- 行号换算与选择 ----
+
+    def row_at(self, listbox_index: int) -> int:
+        """将列表框内的局部索引换算为数据行号"""
+        return self.top + listbox_index
+
+    def index_at(self, y: int) -> int:
+        """获取列表框中y坐标处的数据行号，没有数据时返回-1"""
+        if not self.keys:
+            return -1
+        return min(self.row_at(self.translation_listbox.nearest(y)), len(self.keys) - 1)
+
+    def select(self, index: int, see: bool = True) -> None:
+        """选中指定行（两个列表框同步）
+
+        Args:
+            index: 数据行号
+            see: 是否滚动到该行
+        """
+        if index < 0 or index >= len(self.keys):
+            return
+        self.selected_index = index
+        if see and not self._is_visible(index):
+            self.see(index)
+        else:
+            self._apply_selection()
+
+    def see(self, index: int) -> None:
+        """滚动使指定行可见"""
+        if index < self.top:
+            self._set_top(index)
+        elif index >= self.top + self.visible_rows:
+            self._set_top(index - self.visible_rows + 1)
+
+    # ---- 滚动 ----
+
+    def yview(self, *args) -> None:
+        """滚动条命令回调，兼容 moveto/scroll 两种参数形式"""
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self._set_top(int(round(float(args[1]) * len(self.keys))))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            if len(args) > 2 and args[2] == 'pages':
+                amount *= self.visible_rows
+            self.scroll(amount)
+
+    def scroll(self, rows: int) -> None:
+        """按行数滚动"""
+        self._set_top(self.top + rows)
+
+    # ---- 内部实现 ----
+
+    def _max_top(self) -> int:
+        return max(0, len(self.keys) - self.visible_rows)
+
+    def _set_top(self, top: int) -> None:
+        top = max(0, min(self._max_top(), top))
+        if top != self.top:
+            self.top = top
+            self._render()
+            if self.on_scroll:
+                self.on_scroll()
+        else:
+            self._update_scrollbar()
+
+    def _rendered_count(self) -> int:
+        # 多渲染一行，避免底部出现半行空白
+        return max(0, min(self.visible_rows + 1, len(self.keys) - self.top))
+
+    def _is_visible(self, index: int) -> bool:
+        return self.top <= index < self.top + self.visible_rows
+
+    def _render(self) -> None:
+        """重绘可见窗口"""
+        end = self.top + self._rendered_count()
+        for listbox, rows in ((self.original_listbox, self.originals),
+                              (self.translation_listbox, self.translations)):
+            listbox.delete(0, tk.END)
+            if end > self.top:
+                listbox.insert(tk.END, *rows[self.top:end])
+            listbox.yview_moveto(0)
+        self._apply_selection()
+        self._update_scrollbar()
+
+    def _render_translations(self) -> None:
+        """只重绘译文列表框的可见窗口，保持水平滚动位置"""
+        xview = self.translation_listbox.xview()[0]
+        end = self.top + self._rendered_count()
+        self.translation_listbox.delete(0, tk.END)
+        if end > self.top:
+            self.translation_listbox.insert(tk.END, *self.translations[self.top:end])
+        self.translation_listbox.xview_moveto(xview)
+        self._apply_selection()
+
+    def _apply_selection(self) -> None:
+        for listbox in (self.original_listbox, self.translation_listbox):
+            listbox.selection_clear(0, tk.END)
+            local = self.selected_index - self.top
+            if self.selected_index >= 0 and 0 <= local < self._rendered_count():
+                listbox.selection_set(local)
+                listbox.activate(local)
+
+    def _update_scrollbar(self) -> None:
+        if not self.scrollbar:
+            return
+        total = len(self.keys)
+        if total <= self.visible_rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + self.visible_rows) / total))
+
+    def _get_row_height(self) -> int:
+        if self._row_height is None:
+            font = tkFont.Font(font=self.original_listbox.cget('font'))
+            self._row_height = font.metrics('linespace') + 1
+        return self._row_height
+
+    def _on_configure(self, event) -> None:
+        """列表框尺寸变化时重新计算可见行数"""
+        rows = max(1, event.height // self._get_row_height())
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self.top = min(self.top, self._max_top())
+            self._render()
+
+    def _on_arrow_key(self, step: int) -> str:
+        """键盘上下移动选中行"""
+        if self.keys:
+            current = self.selected_index if self.selected_index >= 0 else self.top
+            self.select(max(0, min(len(self.keys) - 1, current + step)))
+        return "break"
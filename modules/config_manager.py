@@ -27,7 +27,24 @@ class ConfigManager:
             'ui_language': '中文',
             'ollama_model': '',  # 不再硬编码，由程序自动获取
             'batch_size': 5,
-            'auto_save_interval': 20
+            'auto_save_interval': 20,
+            'log_level': 'INFO',  # 日志面板显示级别，DEBUG时显示逐条翻译日志
+            'log_to_file': False,  # 是否写入 Data/logs 下的滚动日志文件
+            'cached_models': [],  # 上次发现的Ollama模型列表，启动时立即显示
+            'cached_models_time': 0,  # 模型列表缓存时间（Unix时间戳）
+            'keep_alive': '30m',  # 翻译任务期间模型在Ollama中的驻留时间
+            'export_metrics': False,  # 每次翻译任务结束后把性能统计导出到 Data/metrics（JSON和CSV各一个，不会自动清理）
+            'profiling': False,  # 开启分阶段性能剖析，翻译结束后输出汇总并导出trace到 Data/profiles
+            'retry_attempts': 3,  # 单个翻译请求遇到超时、连接错误或5xx时的最大尝试次数
+            'schedule_by_length': True,  # 按原文长度调度发送顺序（短条目优先、限制同时进行的长条目），关闭则按文件顺序
+            'validation_retries': 1,  # 译文未通过校验（游戏标记、换行、长度、解释说明）时用严格提示词重译的轮数
+            'use_glossary': True,  # 按术语表（内置原版人名地名 + Data/glossary/<语言代码>.json）在提示词中注入命中的术语并检查译名
+            'use_translation_memory': True,  # 用 Data/translation_memory 中相似的历史译文作为示例，相同原文直接复用
+            'tm_reuse_threshold': 1.0,  # 翻译记忆直接复用译文的相似度下限，1.0 表示只复用去除游戏标记后完全相同的原文
+            'use_semantic_examples': True,  # 按语义挑选翻译记忆中最相近的2-3条译文作为示例，仅在Ollama中已安装嵌入模型时生效，否则使用n-gram检索
+            'embedding_model': 'nomic-embed-text',  # 计算向量使用的Ollama嵌入模型
+            'num_ctx': 0,  # 翻译请求的上下文大小（token），0 表示按模型参数量自动选择（≤4b 2048，≤10b 4096，更大 8192）
+            'fast_model': ''  # 级联模式的快速小模型（如 qwen2.5:3b）：短条目先由它翻译，长对话和未通过校验的条目交给所选模型；留空不使用
         }
         
         # 加载配置
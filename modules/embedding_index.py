@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+向量索引模块
+把翻译记忆中的原文（游戏标记已屏蔽）通过Ollama的 /api/embed 转成向量，
+以单位长度的float32矩阵保存在 Data/translation_memory 下，
+用numpy在整个矩阵上为每个待翻译条目找出语义最相近的几条历史译文作为示例
+"""
+
+import importlib.util
+import json
+import math
+import sys
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+# 默认的嵌入模型
+DEFAULT_EMBEDDING_MODEL = 'nomic-embed-text'
+
+# 每次请求 /api/embed 的文本数
+EMBED_BATCH_SIZE = 64
+
+# 每次批量翻译最多在后台为翻译记忆中的多少条历史译文补算向量（从最近的开始），避免长时间占用Ollama
+EMBED_BACKFILL_LIMIT = 5000
+
+# 建立numpy矩阵后新增的行单独计算，累计超过该行数时重建矩阵
+MATRIX_REBUILD_ROWS = 1024
+
+
+def vector_search_available() -> bool:
+    """是否可以进行向量检索（需要numpy；只检查是否已安装，不导入，避免拖慢启动）
+
+    没有numpy时不使用语义检索，由调用方回退到n-gram检索
+    """
+    return importlib.util.find_spec('numpy') is not None
+
+
+def _unit_vector(vector: Sequence[float]) -> Optional[array]:
+    """转换为单位长度的float32数组，零向量返回None"""
+    norm = math.sqrt(sum(x * x for x in vector))
+    if not norm:
+        return None
+    return array('f', (x / norm for x in vector))
+
+
+class EmbeddingIndex:
+    """单个目标语言、单个嵌入模型的向量索引"""
+
+    def __init__(self, model: str, dim: int = 0):
+        """初始化向量索引
+
+        Args:
+            model: 生成向量的嵌入模型，换模型后向量不可比较
+            dim: 向量维度，0表示由第一条向量决定
+        """
+        self.model = model
+        self.dim = dim
+        self.sources: List[str] = []
+        self._rows: Dict[str, int] = {}
+        # 所有向量按行连续存放
+        self._data = array('f')
+        # numpy矩阵缓存，只包含建立时已有的行
+        self._matrix = None
+        self._lock = threading.Lock()
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def __contains__(self, source: str) -> bool:
+        return source in self._rows
+
+    def add(self, source: str, vector: Sequence[float]) -> bool:
+        """添加一条原文的向量（已存在时覆盖），维度不符或为零向量时忽略
+
+        Returns:
+            是否已添加
+        """
+        if not self.dim:
+            self.dim = len(vector)
+        if len(vector) != self.dim:
+            return False
+        unit = _unit_vector(vector)
+        if unit is None:
+            return False
+        with self._lock:
+            row = self._rows.get(source)
+            if row is None:
+                self._rows[source] = len(self.sources)
+                self.sources.append(source)
+                self._data.extend(unit)
+            else:
+                self._data[row * self.dim:(row + 1) * self.dim] = unit
+                self._matrix = None
+            self.dirty = True
+        return True
+
+    def search(self, vector: Sequence[float], limit: int = 3,
+               exclude: Optional[str] = None) -> List[Tuple[float, str]]:
+        """检索余弦相似度最高的原文
+
+        Args:
+            vector: 查询向量
+            limit: 最多返回的条数
+            exclude: 不返回的原文（通常是待翻译文本本身）
+
+        Returns:
+            (相似度, 原文) 列表，按相似度从高到低排列；没有numpy时为空列表
+        """
+        query = _unit_vector(vector) if len(vector) == self.dim else None
+        if query is None or not vector_search_available():
+            return []
+        import numpy as np  # 延迟导入，避免拖慢启动
+        with self._lock:
+            count = len(self.sources)
+            if not count:
+                return []
+            extra = 1 if exclude in self._rows else 0
+            k = min(count, limit + extra)
+            dim = self.dim
+            matrix = self._matrix
+            if matrix is None or len(matrix) < count - MATRIX_REBUILD_ROWS:
+                matrix = np.frombuffer(self._data, dtype=np.float32).reshape(count, dim).copy()
+                self._matrix = matrix
+            query = np.frombuffer(query, dtype=np.float32)
+            scores = matrix @ query
+            if len(matrix) < count:
+                tail = np.frombuffer(self._data[len(matrix) * dim:], dtype=np.float32).reshape(-1, dim)
+                scores = np.concatenate((scores, tail @ query))
+            top = np.argpartition(-scores, k - 1)[:k] if k < count else np.arange(count)
+            ranked = [(float(scores[row]), self.sources[row]) for row in top]
+        ranked.sort(reverse=True)
+        return [(score, source) for score, source in ranked if source != exclude][:limit]
+
+    def to_bytes(self) -> bytes:
+        """向量矩阵的小端float32字节"""
+        with self._lock:
+            data = array('f', self._data)
+        if sys.byteorder != 'little':
+            data.byteswap()
+        return data.tobytes()
+
+    @classmethod
+    def from_bytes(cls, model: str, dim: int, sources: List[str], payload: bytes) -> "EmbeddingIndex":
+        """从 to_bytes 的结果恢复索引，数据不完整时返回空索引"""
+        index = cls(model, dim)
+        data = array('f')
+        data.frombytes(payload[:len(payload) - len(payload) % data.itemsize])
+        if sys.byteorder != 'little':
+            data.byteswap()
+        if not dim or len(data) != dim * len(sources) or len(set(sources)) != len(sources):
+            return cls(model)
+        index.sources = list(sources)
+        index._rows = {source: row for row, source in enumerate(sources)}
+        index._data = data
+        return index
+
+
+class EmbeddingStore:
+    """按语言加载、缓存和保存向量索引
+
+    每种语言保存为 <语言代码>.embed.json（模型、维度、原文列表）和 <语言代码>.embed.f32（向量矩阵）
+    """
+
+    def __init__(self, index_dir: Optional[Path] = None):
+        """初始化向量索引存储
+
+        Args:
+            index_dir: 保存目录
+        """
+        self.index_dir = Path(index_dir) if index_dir else None
+        self._indexes: Dict[str, EmbeddingIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(self, lang: str, model: str) -> EmbeddingIndex:
+        """获取目标语言的向量索引，首次使用时从文件加载；嵌入模型变化时重新建立"""
+        with self._lock:
+            index = self._indexes.get(lang)
+            if index is None or index.model != model:
+                index = self._load(lang, model) or EmbeddingIndex(model)
+                self._indexes[lang] = index
+            return index
+
+    def _load(self, lang: str, model: str) -> Optional[EmbeddingIndex]:
+        if not self.index_dir:
+            return None
+        header_path = self.index_dir / f"{lang}.embed.json"
+        vector_path = self.index_dir / f"{lang}.embed.f32"
+        if not header_path.exists() or not vector_path.exists():
+            return None
+        try:
+            with open(header_path, 'r', encoding='utf-8') as f:
+                header = json.load(f)
+            payload = vector_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if not isinstance(header, dict) or header.get('model') != model:
+            return None
+        sources = header.get('sources')
+        if not isinstance(sources, list) or not all(isinstance(s, str) for s in sources):
+            return None
+        return EmbeddingIndex.from_bytes(model, int(header.get('dim') or 0), sources, payload)
+
+    def save(self) -> int:
+        """保存有变化的向量索引
+
+        Returns:
+            保存的语言数
+        """
+        if not self.index_dir:
+            return 0
+        saved = 0
+        with self._lock:
+            indexes = list(self._indexes.items())
+        for lang, index in indexes:
+            if not index.dirty:
+                continue
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            with index._lock:
+                sources = list(index.sources)
+            payload = index.to_bytes()[:len(sources) * index.dim * 4]
+            (self.index_dir / f"{lang}.embed.f32").write_bytes(payload)
+            with open(self.index_dir / f"{lang}.embed.json", 'w', encoding='utf-8') as f:
+                json.dump({'model': index.model, 'dim': index.dim, 'sources': sources}, f, ensure_ascii=False)
+            index.dirty = False
+            saved += 1
+        return saved
@@ -2,26 +2,29 @@ import os
 import sys
 import json
 import shutil
-import zipfile
-import subprocess
 import threading
 import re
 from pathlib import Path
 from tkinter import filedialog
 
+from .profiler import profiler
+
 class FileManager:
     """文件操作管理类"""
     
-    def __init__(self, app_instance):
+    def __init__(self, app_instance, work_dir=None):
         """初始化文件管理器
         
         Args:
             app_instance: 主应用实例，用于访问配置和日志方法
+            work_dir: 工作目录，默认为程序所在目录（基准测试等场景可指定临时目录）
         """
         self.app = app_instance
         
         # 目录路径
-        if getattr(sys, 'frozen', False):
+        if work_dir is not None:
+            self.work_dir = Path(work_dir)
+        elif getattr(sys, 'frozen', False):
             # 打包后的exe环境，使用exe文件所在目录
             self.work_dir = Path(os.path.dirname(sys.executable))
         else:
@@ -41,6 +44,7 @@ class FileManager:
         for directory in [self.import_dir, self.extract_dir, self.i18n_dir, self.compress_dir]:
             directory.mkdir(parents=True, exist_ok=True)
     
+    @profiler.profiled("load_json")
     def load_json_with_comments(self, file_path):
         """静默加载支持注释和BOM的JSON文件，容错解析但不修复原文件"""
         try:
@@ -112,6 +116,7 @@ class FileManager:
             else:
                 raise e
     
+    @profiler.profiled("save_json")
     def save_json_with_original_format(self, data, original_file_path, target_file_path):
         """保存JSON文件并保持原始格式（包括注释）"""
         try:
@@ -303,10 +308,8 @@ class FileManager:
                 # 清空文件下拉菜单和文本显示区域
                 self.app.gui_manager.parent.file_combo.set('')
                 self.app.gui_manager.parent.file_combo['values'] = []
-                if hasattr(self.app, 'original_listbox'):
-                    self.app.original_listbox.delete(0, 'end')
-                if hasattr(self.app, 'translation_listbox'):
-                    self.app.translation_listbox.delete(0, 'end')
+                if hasattr(self.app, 'comparison_view'):
+                    self.app.comparison_view.clear()
                 self.app.log_message(self.app.ui_text_manager.get_text("no_mods_found"))
                 
         except Exception as e:
@@ -397,10 +400,8 @@ class FileManager:
                 self.app.log_message(self.app.get_ui_text("found_localization_files").format(len(file_names)))
             else:
                 # 没有文件时清空文本显示区域
-                if hasattr(self.app, 'original_listbox'):
-                    self.app.original_listbox.delete(0, 'end')
-                if hasattr(self.app, 'translation_listbox'):
-                    self.app.translation_listbox.delete(0, 'end')
+                if hasattr(self.app, 'comparison_view'):
+                    self.app.comparison_view.clear()
         except Exception as e:
             self.app.log_message(self.app.get_ui_text("refresh_file_list_failed").format(str(e)), "ERROR")
     
@@ -415,10 +416,8 @@ class FileManager:
             selected_file = self.app.gui_manager.parent.file_combo.get()
             if not selected_file:
                 # 没有选择文件时清空文本显示区域
-                if hasattr(self.app, 'original_listbox'):
-                    self.app.original_listbox.delete(0, 'end')
-                if hasattr(self.app, 'translation_listbox'):
-                    self.app.translation_listbox.delete(0, 'end')
+                if hasattr(self.app, 'comparison_view'):
+                    self.app.comparison_view.clear()
                 # 重置文件索引
                 self.app.current_file_index = -1
                 return
@@ -485,8 +484,16 @@ class FileManager:
         threading.Thread(target=import_files, daemon=True).start()
     
     def extract_mods(self):
-        """解压 MOD 文件"""
+        """解压 MOD 文件
+        
+        Returns:
+            执行解压的后台线程
+        """
+        @profiler.profiled("extract_mods")
         def extract():
+            # 延迟导入压缩和外部进程模块，避免拖慢启动
+            import zipfile
+            import subprocess
             try:
                 # 清理解压目录
                 if self.extract_dir.exists():
@@ -509,17 +516,18 @@ class FileManager:
                     self.app.log_message(self.app.get_ui_text("extracting_file").format(archive_file.name))
                     
                     try:
-                        if archive_file.suffix.lower() == '.zip':
-                            with zipfile.ZipFile(archive_file, 'r') as zip_ref:
-                                zip_ref.extractall(extract_path)
-                        else:
-                            # 对于 rar 和 7z 文件，尝试使用系统命令
-                            if archive_file.suffix.lower() == '.rar':
-                                subprocess.run(['unrar', 'x', str(archive_file), str(extract_path)], 
-                                             check=True, capture_output=True)
-                            elif archive_file.suffix.lower() == '.7z':
-                                subprocess.run(['7z', 'x', str(archive_file), f'-o{extract_path}'], 
-                                             check=True, capture_output=True)
+                        with profiler.span("extract_archive", file=archive_file.name):
+                            if archive_file.suffix.lower() == '.zip':
+                                with zipfile.ZipFile(archive_file, 'r') as zip_ref:
+                                    zip_ref.extractall(extract_path)
+                            else:
+                                # 对于 rar 和 7z 文件，尝试使用系统命令
+                                if archive_file.suffix.lower() == '.rar':
+                                    subprocess.run(['unrar', 'x', str(archive_file), str(extract_path)], 
+                                                 check=True, capture_output=True)
+                                elif archive_file.suffix.lower() == '.7z':
+                                    subprocess.run(['7z', 'x', str(archive_file), f'-o{extract_path}'], 
+                                                 check=True, capture_output=True)
                         
                         self.app.log_message(self.app.get_ui_text("extract_success").format(mod_name))
                     except Exception as e:
@@ -529,10 +537,17 @@ class FileManager:
             except Exception as e:
                 self.app.log_message(self.app.get_ui_text("extract_error").format(str(e)), "ERROR")
         
-        threading.Thread(target=extract, daemon=True).start()
+        thread = threading.Thread(target=extract, daemon=True)
+        thread.start()
+        return thread
     
     def extract_i18n(self):
-        """提取 i18n 文件"""
+        """提取 i18n 文件
+        
+        Returns:
+            执行提取的后台线程
+        """
+        @profiler.profiled("extract_i18n")
         def extract():
             try:
                 # 清理 i18n 目录
@@ -614,7 +629,9 @@ class FileManager:
             except Exception as e:
                 self.app.log_message(self.app.get_ui_text("i18n_extract_failed").format(str(e)), "ERROR")
         
-        threading.Thread(target=extract, daemon=True).start()
+        thread = threading.Thread(target=extract, daemon=True)
+        thread.start()
+        return thread
     
 
     
@@ -647,6 +664,7 @@ class FileManager:
         
         return None
     
+    @profiler.profiled("save_json")
     def save_json_with_original_format(self, data, original_file_path, target_file_path):
         """保存JSON文件并保持原始格式（包括注释）"""
         try:
@@ -780,10 +798,10 @@ class FileManager:
                 return
             
             # 更新翻译数据
-            for i in range(self.app.translation_listbox.size()):
+            for i in range(self.app.comparison_view.size()):
                 if i < len(self.app.current_translation_keys):
                     key = self.app.current_translation_keys[i]
-                    value = self.app.translation_listbox.get(i)
+                    value = self.app.comparison_view.get_translation(i)
                     self.app.current_translation_data[key] = value
             
             # 保存到文件
@@ -813,9 +831,18 @@ class FileManager:
         except Exception as e:
             self.app.log_message(self.app.get_ui_text("save_translation_file_failed").format(str(e)), "ERROR")
     
-    def recompress_mods(self):
-        """打包MOD MOD"""
+    def recompress_mods(self, open_folder=True):
+        """打包MOD MOD
+        
+        Args:
+            open_folder: 完成后是否打开4Compress文件夹
+        
+        Returns:
+            执行打包的后台线程
+        """
         def compress():
+            # 延迟导入外部进程模块，避免拖慢启动
+            import subprocess
             try:
                 # 清理压缩目录
                 if self.compress_dir.exists():
@@ -841,12 +868,7 @@ class FileManager:
                     # 创建带语言前缀的 ZIP 文件名
                     zip_filename = f"{language_code}_{mod_dir.name}.zip"
                     zip_path = self.compress_dir / zip_filename
-                    
-                    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                        for file_path in mod_dir.rglob('*'):
-                            if file_path.is_file():
-                                arcname = file_path.relative_to(mod_dir)
-                                zipf.write(file_path, arcname)
+                    self.compress_mod(mod_dir, zip_path)
                     
                     self.app.log_message(self.app.get_ui_text("compress_success").format(zip_path.name))
                 
@@ -854,7 +876,7 @@ class FileManager:
                 
                 # 压缩完成后自动打开4Compress文件夹
                 try:
-                    if self.compress_dir.exists():
+                    if open_folder and self.compress_dir.exists():
                         subprocess.run(['explorer', str(self.compress_dir)], check=False)
                 except Exception as folder_error:
                     # 打开文件夹失败不影响主要功能，只记录日志
@@ -862,7 +884,24 @@ class FileManager:
             except Exception as e:
                 self.app.log_message(self.app.get_ui_text("compress_error").format(str(e)), "ERROR")
         
-        threading.Thread(target=compress, daemon=True).start()
+        thread = threading.Thread(target=compress, daemon=True)
+        thread.start()
+        return thread
+    
+    @profiler.profiled("compress_mod")
+    def compress_mod(self, mod_dir, zip_path):
+        """将单个MOD目录压缩为ZIP文件
+        
+        Args:
+            mod_dir: MOD目录
+            zip_path: 目标ZIP文件路径
+        """
+        import zipfile  # 延迟导入，避免拖慢启动
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            for file_path in mod_dir.rglob('*'):
+                if file_path.is_file():
+                    arcname = file_path.relative_to(mod_dir)
+                    zipf.write(file_path, arcname)
     
     def clear_data_directories(self):
         """清空Data目录下的指定文件夹"""
@@ -906,10 +945,8 @@ class FileManager:
             self.app.gui_manager.parent.file_combo['values'] = []
             
             # 清空原文和翻译列表框
-            if hasattr(self.app, 'original_listbox'):
-                self.app.original_listbox.delete(0, 'end')
-            if hasattr(self.app, 'translation_listbox'):
-                self.app.translation_listbox.delete(0, 'end')
+            if hasattr(self.app, 'comparison_view'):
+                self.app.comparison_view.clear()
             
             # 清空当前数据
             self.app.current_original_data = {}
@@ -933,10 +970,8 @@ class FileManager:
             self.app.gui_manager.parent.file_combo['values'] = []
             
             # 清空原文和翻译列表框
-            if hasattr(self.app, 'original_listbox'):
-                self.app.original_listbox.delete(0, 'end')
-            if hasattr(self.app, 'translation_listbox'):
-                self.app.translation_listbox.delete(0, 'end')
+            if hasattr(self.app, 'comparison_view'):
+                self.app.comparison_view.clear()
             
             # 清空文件相关数据
             self.app.current_original_data = {}
@@ -952,10 +987,8 @@ class FileManager:
         """清空文本对比显示区域"""
         try:
             # 清空原文和翻译列表框
-            if hasattr(self.app, 'original_listbox'):
-                self.app.original_listbox.delete(0, 'end')
-            if hasattr(self.app, 'translation_listbox'):
-                self.app.translation_listbox.delete(0, 'end')
+            if hasattr(self.app, 'comparison_view'):
+                self.app.comparison_view.clear()
             
             # 清空对比数据
             self.app.current_original_data = {}
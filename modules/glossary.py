@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+术语表模块
+按语言管理术语（内置的星露谷人名地名 + Data/glossary/<语言>.json 中的用户术语），
+用Aho-Corasick自动机一次扫描找出原文中出现的术语，只把命中的术语注入提示词，
+翻译后检查译文是否使用了术语表中的译名。内置术语区分大小写（Penny 是人名，penny 是普通单词），
+用户术语不区分大小写
+"""
+
+import json
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# 原版村民名称
+VANILLA_NPCS = (
+    "Abigail", "Alex", "Caroline", "Clint", "Demetrius", "Elliott", "Emily", "Evelyn", "George", "Gus",
+    "Haley", "Harvey", "Jas", "Jodi", "Kent", "Krobus", "Leah", "Lewis", "Linus", "Marnie", "Maru",
+    "Pam", "Penny", "Pierre", "Robin", "Sam", "Sandy", "Sebastian", "Shane", "Vincent", "Willy",
+)
+
+# 原版术语的官方译名（拉丁字母语言的人名保持原文，见 get_vanilla_terms）
+VANILLA_TERMS = {
+    'zh': {
+        "Abigail": "阿比盖尔", "Alex": "亚历克斯", "Caroline": "卡洛琳", "Clint": "克林特",
+        "Demetrius": "德米特里厄斯", "Elliott": "艾利欧特", "Emily": "艾米丽", "Evelyn": "艾芙琳",
+        "George": "乔治", "Gus": "格斯", "Haley": "海莉", "Harvey": "哈维", "Jas": "贾斯", "Jodi": "乔迪",
+        "Kent": "肯特", "Krobus": "科罗布斯", "Leah": "莉亚", "Lewis": "刘易斯", "Linus": "莱纳斯",
+        "Marnie": "玛妮", "Maru": "玛鲁", "Pam": "潘姆", "Penny": "潘妮", "Pierre": "皮埃尔", "Robin": "罗宾",
+        "Sam": "山姆", "Sandy": "桑迪", "Sebastian": "塞巴斯蒂安", "Shane": "谢恩", "Vincent": "文森特",
+        "Willy": "威利",
+        "Stardew Valley": "星露谷", "Pelican Town": "鹈鹕镇", "Cindersap Forest": "煤灰森林",
+        "Calico Desert": "卡利科沙漠", "Ginger Island": "姜岛", "JojaMart": "Joja超市",
+        "Stardrop Saloon": "星之果实餐吧", "Stardrop": "星之果实", "Iridium": "铱",
+        "Prismatic Shard": "五彩碎片", "Quarry": "采石场",
+    },
+    'ja': {
+        "Abigail": "アビゲイル", "Alex": "アレックス", "Caroline": "キャロライン", "Demetrius": "デメトリウス",
+        "Elliott": "エリオット", "Evelyn": "エヴリン", "George": "ジョージ", "Haley": "ヘイリー",
+        "Harvey": "ハーヴィー", "Jas": "ジャス", "Jodi": "ジョディ", "Leah": "リア", "Maru": "マル",
+        "Penny": "ペニー", "Sam": "サム", "Sebastian": "セバスチャン", "Vincent": "ヴィンセント",
+    },
+    'ko': {
+        "Abigail": "애비게일", "Alex": "알렉스", "Caroline": "캐롤라인", "Demetrius": "데메트리우스",
+        "Elliott": "엘리엇", "Evelyn": "에블린", "George": "조지", "Haley": "헤일리", "Harvey": "하비",
+        "Jas": "재스", "Jodi": "조디", "Leah": "리아", "Maru": "마루", "Penny": "페니", "Sam": "샘",
+        "Sebastian": "세바스찬", "Vincent": "빈센트",
+    },
+    'ru': {
+        "Abigail": "Эбигейл", "Alex": "Алекс", "Caroline": "Кэролайн", "Demetrius": "Деметриус",
+        "Elliott": "Эллиот", "Evelyn": "Эвелин", "George": "Джордж", "Haley": "Хейли", "Harvey": "Харви",
+        "Jas": "Джас", "Jodi": "Джоди", "Leah": "Лия", "Maru": "Мару", "Penny": "Пенни", "Sam": "Сэм",
+        "Sebastian": "Себастьян", "Vincent": "Винсент",
+    },
+}
+
+# 使用拉丁字母的目标语言，人名不翻译
+LATIN_LANGUAGES = ('default', 'fr', 'de', 'es', 'pt', 'it', 'tr', 'hu')
+
+
+def get_vanilla_terms(lang: str) -> Dict[str, str]:
+    """获取内置的原版术语"""
+    if lang in LATIN_LANGUAGES:
+        return {name: name for name in VANILLA_NPCS}
+    return dict(VANILLA_TERMS.get(lang, {}))
+
+
+class AhoCorasick:
+    """Aho-Corasick多模式匹配（默认不区分大小写，ASCII术语要求整词匹配）"""
+
+    def __init__(self, patterns: List[str], case_sensitive: Iterable[int] = ()):
+        """构建自动机
+
+        Args:
+            patterns: 模式列表
+            case_sensitive: 需要大小写完全一致才算匹配的模式索引
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self.patterns = list(patterns)
+        self.case_sensitive = frozenset(case_sensitive)
+
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern.lower():
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(index)
+
+        # 广度优先计算失败链接，并合并输出
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find_all(self, text: str) -> List[Tuple[int, int, int]]:
+        """找出所有匹配
+
+        Returns:
+            (开始位置, 结束位置, 模式索引) 列表，已去除重叠（同一位置优先最长的模式）
+        """
+        matches = []
+        lowered = text.lower()
+        state = 0
+        goto, fail, output = self._goto, self._fail, self._output
+        for position, char in enumerate(lowered):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                start = position + 1 - len(self.patterns[index])
+                if index in self.case_sensitive and text[start:position + 1] != self.patterns[index]:
+                    continue
+                if _is_word_match(lowered, start, position + 1, self.patterns[index]):
+                    matches.append((start, position + 1, index))
+
+        # 从左到右、优先最长，去除重叠
+        matches.sort(key=lambda m: (m[0], m[0] - m[1]))
+        selected = []
+        last_end = 0
+        for match in matches:
+            if match[0] >= last_end:
+                selected.append(match)
+                last_end = match[1]
+        return selected
+
+
+def _is_word_match(text: str, start: int, end: int, pattern: str) -> bool:
+    """ASCII术语的前后不能紧接字母或数字（Sam 不匹配 Samurai，但匹配 Sam's）"""
+    if not pattern.isascii():
+        return True
+    if start > 0 and text[start - 1].isalnum():
+        return False
+    if end < len(text) and text[end].isalnum():
+        return False
+    return True
+
+
+class Glossary:
+    """单个目标语言的术语表"""
+
+    def __init__(self, terms: Dict[str, str], case_sensitive: Iterable[str] = ()):
+        """初始化术语表
+
+        Args:
+            terms: 原文术语到译名的映射，译名与原文相同的术语（如拉丁字母语言的人名）不注入提示也不检查
+            case_sensitive: 需要区分大小写匹配的原文术语
+        """
+        self.terms = {source: target for source, target in terms.items() if source and target and source != target}
+        self._sources = list(self.terms)
+        exact = set(case_sensitive)
+        self._matcher = AhoCorasick(self._sources, [i for i, source in enumerate(self._sources) if source in exact]) \
+            if self._sources else None
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def find_terms(self, text: str) -> List[Tuple[str, str]]:
+        """找出原文中出现的术语
+
+        Returns:
+            (原文术语, 译名) 列表，按首次出现顺序去重
+        """
+        if not self._matcher or not text:
+            return []
+        found = {}
+        for _start, _end, index in self._matcher.find_all(text):
+            source = self._sources[index]
+            if source not in found:
+                found[source] = self.terms[source]
+        return list(found.items())
+
+    @staticmethod
+    def find_violations(terms: List[Tuple[str, str]], translation: str) -> List[str]:
+        """检查译文是否使用了术语表中的译名
+
+        Returns:
+            译文中没有出现译名的原文术语
+        """
+        lowered = translation.lower()
+        return [source for source, target in terms if target.lower() not in lowered]
+
+    @staticmethod
+    def format_hint(terms: List[Tuple[str, str]]) -> str:
+        """生成注入提示词的术语说明"""
+        return "术语表：" + "；".join(f"{source}={target}" for source, target in terms) + "。"
+
+
+class GlossaryStore:
+    """按语言加载和缓存术语表"""
+
+    def __init__(self, glossary_dir: Optional[Path] = None):
+        """初始化术语表存储
+
+        Args:
+            glossary_dir: 用户术语目录，每种语言一个 <语言代码>.json，内容为 {"原文": "译名"}
+        """
+        self.glossary_dir = Path(glossary_dir) if glossary_dir else None
+        self._glossaries: Dict[str, Glossary] = {}
+
+    def get(self, lang: str) -> Glossary:
+        """获取目标语言的术语表，用户术语覆盖内置术语
+
+        内置术语区分大小写，避免 penny、robin、sandy 等普通单词被当作人名；用户术语不区分大小写。
+        """
+        glossary = self._glossaries.get(lang)
+        if glossary is None:
+            vanilla_terms = get_vanilla_terms(lang)
+            user_terms = self.load_user_terms(lang)
+            glossary = Glossary({**vanilla_terms, **user_terms},
+                                case_sensitive=[source for source in vanilla_terms if source not in user_terms])
+            self._glossaries[lang] = glossary
+        return glossary
+
+    def load_user_terms(self, lang: str) -> Dict[str, str]:
+        """读取用户术语文件，不存在或格式错误时返回空字典"""
+        if not self.glossary_dir:
+            return {}
+        file_path = self.glossary_dir / f"{lang}.json"
+        if not file_path.exists():
+            return {}
+        try:
+            with open(file_path, 'r', encoding='utf-8-sig') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {str(source): str(target) for source, target in data.items() if isinstance(target, str)}
+
+    def reload(self) -> None:
+        """清空缓存，下次使用时重新读取用户术语文件"""
+        self._glossaries.clear()
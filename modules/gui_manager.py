@@ -7,6 +7,7 @@ import sys
 import os
 from typing import Callable, Optional, Dict, Any
 from .modern_widgets import ModernButton, ModernFrame, ModernEntry, ModernLabel, apply_modern_style_to_widget, style_manager
+from .comparison_view import ComparisonView
 
 class GUIManager:
     """GUI界面管理类"""
@@ -92,133 +93,6 @@ class GUIManager:
             return False
     
 
-    def on_original_select(self, event):
-        """原文列表选择事件"""
-        try:
-            selection = self.parent.original_listbox.curselection()
-            if selection:
-                index = selection[0]
-                # 记录当前选中的索引
-                self.current_selected_index = index
-        except Exception as e:
-            self.parent.log_message(f"原文选择错误: {str(e)}")
-
-    def on_translation_select(self, event):
-        """译文列表选择事件"""
-        try:
-            selection = self.parent.translation_listbox.curselection()
-            if selection:
-                index = selection[0]
-                # 同步选择原文列表框的相同项目
-                self.parent.original_listbox.selection_clear(0, tk.END)
-                self.parent.original_listbox.selection_set(index)
-                self.parent.original_listbox.see(index)
-        except Exception as e:
-            self.parent.log_message(f"译文选择事件处理失败：{str(e)}")
-    
-    def on_shared_scrollbar(self, *args):
-        """共用垂直滚动条操作回调"""
-        # 同时滚动原文列表框和译文列表框
-        self.parent.original_listbox.yview(*args)
-        self.parent.translation_listbox.yview(*args)
-    
-    def on_shared_h_scrollbar(self, *args):
-        """共用水平滚动条操作回调"""
-        # 同时水平滚动原文列表框和译文列表框
-        self.parent.original_listbox.xview(*args)
-        self.parent.translation_listbox.xview(*args)
-    
-    def on_original_h_scroll(self, *args):
-        """原文水平滚动回调"""
-        # 更新原文滚动条
-        self.parent.original_h_scrollbar.set(*args)
-        # 同步译文滚动条
-        self.parent.translation_h_scrollbar.set(*args)
-    
-    def on_translation_h_scroll(self, *args):
-        """译文水平滚动回调"""
-        # 更新译文滚动条
-        self.parent.translation_h_scrollbar.set(*args)
-        # 同步原文滚动条
-        self.parent.original_h_scrollbar.set(*args)
-    
-    def on_mouse_wheel(self, event):
-        """鼠标滚轮事件处理"""
-        # 计算滚动量
-        if event.delta:
-            # Windows系统
-            delta = -1 * (event.delta / 120)
-        else:
-            # Linux系统
-            if event.num == 4:
-                delta = -1
-            elif event.num == 5:
-                delta = 1
-            else:
-                return "break"  # 阻止默认行为
-        
-        # 获取当前滚动位置
-        current_top, current_bottom = self.parent.original_listbox.yview()
-        
-        # 计算新的滚动位置
-        # 获取列表框总行数
-        total_items = self.parent.original_listbox.size()
-        if total_items == 0:
-            return "break"  # 阻止默认行为
-        
-        # 计算每个单位的滚动比例
-        scroll_unit = 1.0 / total_items
-        new_position = current_top + (delta * scroll_unit * 3)  # 乘以3增加滚动速度
-        
-        # 限制滚动范围
-        new_position = max(0.0, min(1.0, new_position))
-        
-        # 手动同步滚动两个框
-        self.parent.original_listbox.yview_moveto(new_position)
-        self.parent.translation_listbox.yview_moveto(new_position)
-        
-        # 同步更新共用滚动条位置
-        self.parent.shared_scrollbar.set(new_position, new_position + (current_bottom - current_top))
-        
-        return "break"  # 阻止默认滚动行为
-
-    def on_combobox_mousewheel(self, event):
-        """下拉菜单框滚轮事件处理 - 阻止滚轮选择"""
-        return "break"  # 阻止默认滚轮行为
-
-    def on_translation_double_click(self, event):
-        """译文双击编辑事件"""
-        try:
-            # 从事件中获取点击位置的索引
-            index = self.parent.translation_listbox.nearest(event.y)
-            
-            # 检查索引是否有效
-            if index < 0 or index >= self.parent.translation_listbox.size():
-                return
-            
-            # 选中该条目
-            self.parent.translation_listbox.selection_clear(0, tk.END)
-            self.parent.translation_listbox.selection_set(index)
-            self.parent.translation_listbox.activate(index)
-            
-            current_translation = self.parent.translation_listbox.get(index)
-            
-            # 获取对应的原文
-            original_text = ""
-            if hasattr(self.parent, 'current_translation_keys') and index < len(self.parent.current_translation_keys):
-                key = self.parent.current_translation_keys[index]
-                if hasattr(self.parent, 'current_original_data') and key in self.parent.current_original_data:
-                    original_text = self.parent.current_original_data[key]
-            
-            self.edit_translation_dialog(index, original_text, current_translation)
-            
-        except Exception as e:
-            self.parent.log_message(f"译文编辑失败：{str(e)}", "ERROR")
-    
-
-    
-
-        
     def create_gui(self):
         """创建图形界面"""
         # 主框架 - 使用现代化框架
@@ -473,11 +347,16 @@ class GUIManager:
         self.parent.shared_scrollbar = ttk.Scrollbar(container_frame, orient=tk.VERTICAL)
         self.parent.shared_scrollbar.grid(row=0, column=2, sticky="ns", padx=(2, 0))
         
+        # 虚拟化对比视图：两个列表框只渲染可见行，由共享滚动条驱动
+        self.parent.comparison_view = ComparisonView(self.parent.original_listbox,
+                                                     self.parent.translation_listbox,
+                                                     self.parent.shared_scrollbar)
+        # 翻译进行中滚动到的条目优先翻译
+        self.parent.comparison_view.on_scroll = lambda: self.parent.translation_manager.prioritize_visible()
+
         # 绑定垂直滚动条
         self.parent.shared_scrollbar.config(command=self.on_shared_scrollbar)
-        self.parent.original_listbox.config(yscrollcommand=self.parent.shared_scrollbar.set)
-        self.parent.translation_listbox.config(yscrollcommand=self.parent.shared_scrollbar.set)
-        
+
         # 绑定事件
         self.parent.original_listbox.bind('<<ListboxSelect>>', self.on_original_select)
         self.parent.translation_listbox.bind('<<ListboxSelect>>', self.on_translation_select)
@@ -698,15 +577,22 @@ class GUIManager:
             key: 翻译键
             translated_text: 翻译文本
         """
+        self.patch_translation_display({key: translated_text})
+    
+    def patch_translation_display(self, updates: Dict[str, str]) -> None:
+        """批量更新翻译显示，通过键→行索引定位，可见区域只重绘一次
+        
+        Args:
+            updates: {翻译键: 翻译文本}
+        """
         try:
-            if hasattr(self.parent, 'current_translation_keys') and key in self.parent.current_translation_keys:
-                index = self.parent.current_translation_keys.index(key)
-                if index < self.parent.translation_listbox.size():
-                    self.parent.translation_listbox.delete(index)
-                    self.parent.translation_listbox.insert(index, translated_text)
-                    # 更新当前翻译数据
-                    if hasattr(self.parent, 'current_translation_data'):
-                        self.parent.current_translation_data[key] = translated_text
+            if self.parent.comparison_view.patch_rows(updates):
+                # 更新当前翻译数据
+                if hasattr(self.parent, 'current_translation_data'):
+                    view = self.parent.comparison_view
+                    for key, translated_text in updates.items():
+                        if view.row_of(key) >= 0:
+                            self.parent.current_translation_data[key] = translated_text
         except Exception as e:
             self.parent.log_message(self.parent.get_ui_text("update_translation_display_failed").format(str(e)), "ERROR")
     
@@ -759,9 +645,11 @@ class GUIManager:
         try:
             selection = self.parent.original_listbox.curselection()
             if selection:
-                index = selection[0]
+                index = self.parent.comparison_view.row_at(selection[0])
                 # 记录当前选中的索引
                 self.parent.current_selected_index = index
+                # 同步选择译文列表框的相同项目
+                self.parent.comparison_view.select(index, see=False)
         except Exception as e:
             self.parent.log_message(f"原文选择错误: {str(e)}")
 
@@ -770,19 +658,16 @@ class GUIManager:
         try:
             selection = self.parent.translation_listbox.curselection()
             if selection:
-                index = selection[0]
+                index = self.parent.comparison_view.row_at(selection[0])
                 # 同步选择原文列表框的相同项目
-                self.parent.original_listbox.selection_clear(0, tk.END)
-                self.parent.original_listbox.selection_set(index)
-                self.parent.original_listbox.see(index)
+                self.parent.comparison_view.select(index)
         except Exception as e:
             self.parent.log_message(f"译文选择事件处理失败：{str(e)}")
     
     def on_shared_scrollbar(self, *args):
         """共用垂直滚动条操作回调"""
-        # 同时滚动原文列表框和译文列表框
-        self.parent.original_listbox.yview(*args)
-        self.parent.translation_listbox.yview(*args)
+        # 由虚拟化视图同时滚动原文列表框和译文列表框
+        self.parent.comparison_view.yview(*args)
     
     def on_shared_h_scrollbar(self, *args):
         """共用水平滚动条操作回调"""
@@ -819,28 +704,8 @@ class GUIManager:
             else:
                 return "break"  # 阻止默认行为
         
-        # 获取当前滚动位置
-        current_top, current_bottom = self.parent.original_listbox.yview()
-        
-        # 计算新的滚动位置
-        # 获取列表框总行数
-        total_items = self.parent.original_listbox.size()
-        if total_items == 0:
-            return "break"  # 阻止默认行为
-        
-        # 计算每个单位的滚动比例
-        scroll_unit = 1.0 / total_items
-        new_position = current_top + (delta * scroll_unit * 3)  # 乘以3增加滚动速度
-        
-        # 限制滚动范围
-        new_position = max(0.0, min(1.0, new_position))
-        
-        # 手动同步滚动两个框
-        self.parent.original_listbox.yview_moveto(new_position)
-        self.parent.translation_listbox.yview_moveto(new_position)
-        
-        # 同步更新共用滚动条位置
-        self.parent.shared_scrollbar.set(new_position, new_position + (current_bottom - current_top))
+        # 同步滚动两个框（乘以3增加滚动速度），滚动条由视图更新
+        self.parent.comparison_view.scroll(int(round(delta * 3)))
         
         return "break"  # 阻止默认滚动行为
 
@@ -852,18 +717,16 @@ class GUIManager:
         """译文双击编辑事件"""
         try:
             # 从事件中获取点击位置的索引
-            index = self.parent.translation_listbox.nearest(event.y)
+            index = self.parent.comparison_view.index_at(event.y)
             
             # 检查索引是否有效
-            if index < 0 or index >= self.parent.translation_listbox.size():
+            if index < 0 or index >= self.parent.comparison_view.size():
                 return
             
             # 选中该条目
-            self.parent.translation_listbox.selection_clear(0, tk.END)
-            self.parent.translation_listbox.selection_set(index)
-            self.parent.translation_listbox.activate(index)
+            self.parent.comparison_view.select(index)
             
-            current_translation = self.parent.translation_listbox.get(index)
+            current_translation = self.parent.comparison_view.get_translation(index)
             
             # 获取对应的原文
             original_text = ""
@@ -871,6 +734,9 @@ class GUIManager:
                 key = self.parent.current_translation_keys[index]
                 if hasattr(self.parent, 'current_original_data') and key in self.parent.current_original_data:
                     original_text = self.parent.current_original_data[key]
+                # 翻译进行中且该条目还在排队时，提前翻译
+                if self.parent.translation_manager.prioritize_keys(self.parent.current_translation_file, [key]):
+                    self.parent.log_message(f"已将条目 {key} 移到翻译队列最前")
             
             self.edit_translation_dialog(index, original_text, current_translation)
             
@@ -975,9 +841,8 @@ class GUIManager:
                 new_text = translation_text_widget.get(1.0, tk.END).strip()
                 
                 # 更新列表框显示
-                self.parent.translation_listbox.delete(index)
-                self.parent.translation_listbox.insert(index, new_text)
-                self.parent.translation_listbox.selection_set(index)
+                self.parent.comparison_view.set_translation(index, new_text)
+                self.parent.comparison_view.select(index)
                 
                 # 更新当前翻译数据
                 if hasattr(self.parent, 'current_translation_keys') and index < len(self.parent.current_translation_keys):
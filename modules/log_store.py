@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+日志存储模块
+有界环形缓冲区日志，支持级别过滤和可选的滚动日志文件
+"""
+
+import threading
+from collections import deque
+from pathlib import Path
+from typing import List, Optional
+
+
+# 日志级别数值，与标准logging模块保持一致（logging在启用日志文件时才导入）
+LOG_LEVELS = {
+    "DEBUG": 10,
+    "INFO": 20,
+    "WARNING": 30,
+    "ERROR": 40,
+}
+
+
+class LogStore:
+    """有界环形缓冲区日志存储
+
+    追加为O(1)，超过容量时自动丢弃最旧的条目；低于显示级别的条目
+    不进入缓冲区（也不会刷新到界面），但仍会写入日志文件（如已启用）。
+    """
+
+    def __init__(self, max_lines: int = 1000, min_level: str = "INFO"):
+        """初始化日志存储
+
+        Args:
+            max_lines: 缓冲区最大条目数
+            min_level: 进入缓冲区和界面的最低级别
+        """
+        self.max_lines = max_lines
+        self.min_level = LOG_LEVELS.get(min_level, LOG_LEVELS["INFO"])
+        self._entries = deque(maxlen=max_lines)
+        self._lock = threading.Lock()
+        self._file_logger = None
+        self._file_handler = None
+
+    def set_level(self, level: str) -> None:
+        """设置显示级别"""
+        self.min_level = LOG_LEVELS.get(level, LOG_LEVELS["INFO"])
+
+    def is_enabled_for(self, level: str) -> bool:
+        """判断指定级别的日志是否会被记录（显示或写入日志文件），用于跳过昂贵的日志格式化"""
+        return self._file_logger is not None or LOG_LEVELS.get(level, LOG_LEVELS["INFO"]) >= self.min_level
+
+    def append(self, log_entry: str, level: str = "INFO") -> bool:
+        """追加一条日志
+
+        Args:
+            log_entry: 已格式化的日志条目
+            level: 日志级别
+
+        Returns:
+            该条目是否达到显示级别
+        """
+        level_no = LOG_LEVELS.get(level, LOG_LEVELS["INFO"])
+        if self._file_logger:
+            self._file_logger.log(level_no, log_entry)
+        if level_no < self.min_level:
+            return False
+        with self._lock:
+            self._entries.append((level_no, log_entry))
+        return True
+
+    def get_lines(self, min_level: Optional[str] = None) -> List[str]:
+        """获取缓冲区内的日志
+
+        Args:
+            min_level: 过滤级别，默认使用当前显示级别
+
+        Returns:
+            日志条目列表（从旧到新）
+        """
+        threshold = LOG_LEVELS.get(min_level, self.min_level) if min_level else self.min_level
+        with self._lock:
+            return [entry for level_no, entry in self._entries if level_no >= threshold]
+
+    def clear(self) -> None:
+        """清空缓冲区"""
+        with self._lock:
+            self._entries.clear()
+
+    def enable_file(self, log_file: Path, max_bytes: int = 1024 * 1024, backup_count: int = 3) -> bool:
+        """启用滚动日志文件
+
+        Args:
+            log_file: 日志文件路径
+            max_bytes: 单个文件最大字节数
+            backup_count: 保留的历史文件数量
+
+        Returns:
+            是否启用成功
+        """
+        self.disable_file()
+        try:
+            import logging
+            import logging.handlers
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+            )
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            logger = logging.getLogger('stardew_translator')
+            logger.setLevel(logging.DEBUG)
+            logger.propagate = False
+            logger.addHandler(handler)
+            self._file_logger = logger
+            self._file_handler = handler
+            return True
+        except Exception as e:
+            print(f"启用日志文件失败: {e}")
+            return False
+
+    def disable_file(self) -> None:
+        """关闭日志文件"""
+        if self._file_logger and self._file_handler:
+            self._file_logger.removeHandler(self._file_handler)
+            self._file_handler.close()
+        self._file_logger = None
+        self._file_handler = None
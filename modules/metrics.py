@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+性能统计模块
+记录每次Ollama请求的耗时和token统计，汇总为按文件和按运行的指标并导出
+"""
+
+import csv
+import json
+import math
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+# 导出CSV时的列顺序
+METRIC_FIELDS = [
+    "timestamp", "file", "ok", "latency", "load_duration",
+    "prompt_eval_count", "prompt_eval_duration", "eval_count", "eval_duration",
+    "tokens_per_second",
+]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """计算百分位数（最近秩法）
+
+    Args:
+        values: 数值列表
+        pct: 百分位（0-100）
+
+    Returns:
+        百分位数，列表为空时返回0
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class MetricsStore:
+    """请求级性能统计存储
+
+    工作线程通过 record 追加记录（线程安全），翻译结束后按文件和整次运行汇总。
+    Ollama返回的各项 *_duration 为纳秒，入库时统一换算为秒。
+    """
+
+    def __init__(self):
+        """初始化统计存储"""
+        self._records: List[Dict] = []
+        self._lock = threading.Lock()
+        self.current_file = ""
+        self.run_started_at = 0.0
+        self.run_finished_at = 0.0
+        self.cold_start: Optional[float] = None
+
+    def begin_run(self) -> None:
+        """开始新的一次运行，清空上次的记录"""
+        with self._lock:
+            self._records = []
+        self.current_file = ""
+        self.run_started_at = time.time()
+        self.run_finished_at = 0.0
+        self.cold_start = None
+
+    def end_run(self) -> None:
+        """标记运行结束"""
+        self.run_finished_at = time.time()
+
+    def set_current_file(self, file_name: str) -> None:
+        """设置后续记录归属的文件"""
+        self.current_file = file_name
+
+    def set_cold_start(self, seconds: Optional[float]) -> None:
+        """记录本次运行的模型冷启动耗时（秒）"""
+        self.cold_start = seconds
+
+    def record(self, latency: float, response: Optional[dict] = None, file_name: str = None) -> None:
+        """记录一次请求
+
+        Args:
+            latency: 请求往返耗时（秒）
+            response: Ollama响应JSON，请求失败时为None
+            file_name: 所属文件，默认使用当前文件
+        """
+        response = response or {}
+        eval_count = response.get("eval_count", 0)
+        eval_duration = response.get("eval_duration", 0) / 1e9
+        entry = {
+            "timestamp": time.time(),
+            "file": file_name or self.current_file,
+            "ok": bool(response),
+            "latency": latency,
+            "load_duration": response.get("load_duration", 0) / 1e9,
+            "prompt_eval_count": response.get("prompt_eval_count", 0),
+            "prompt_eval_duration": response.get("prompt_eval_duration", 0) / 1e9,
+            "eval_count": eval_count,
+            "eval_duration": eval_duration,
+            "tokens_per_second": eval_count / eval_duration if eval_duration > 0 else 0.0,
+        }
+        with self._lock:
+            self._records.append(entry)
+
+    def get_records(self) -> List[Dict]:
+        """获取本次运行的全部记录副本"""
+        with self._lock:
+            return list(self._records)
+
+    @staticmethod
+    def summarize(records: List[Dict]) -> Dict[str, float]:
+        """汇总一组记录
+
+        Args:
+            records: 请求记录列表
+
+        Returns:
+            汇总指标：请求数、失败数、p50/p95延迟、生成速度、提示与输出token比等
+        """
+        ok_records = [r for r in records if r["ok"]]
+        latencies = [r["latency"] for r in ok_records]
+        prompt_tokens = sum(r["prompt_eval_count"] for r in ok_records)
+        output_tokens = sum(r["eval_count"] for r in ok_records)
+        eval_time = sum(r["eval_duration"] for r in ok_records)
+        prompt_time = sum(r["prompt_eval_duration"] for r in ok_records)
+        return {
+            "requests": len(records),
+            "failed": len(records) - len(ok_records),
+            "latency_p50": percentile(latencies, 50),
+            "latency_p95": percentile(latencies, 95),
+            "latency_mean": sum(latencies) / len(latencies) if latencies else 0.0,
+            "prompt_tokens": prompt_tokens,
+            "output_tokens": output_tokens,
+            "tokens_per_second": output_tokens / eval_time if eval_time > 0 else 0.0,
+            "prompt_tokens_per_second": prompt_tokens / prompt_time if prompt_time > 0 else 0.0,
+            "prompt_output_ratio": prompt_tokens / output_tokens if output_tokens else 0.0,
+            "load_time": sum(r["load_duration"] for r in ok_records),
+        }
+
+    def summary_by_file(self) -> Dict[str, Dict[str, float]]:
+        """按文件汇总"""
+        grouped: Dict[str, List[Dict]] = {}
+        for entry in self.get_records():
+            grouped.setdefault(entry["file"], []).append(entry)
+        return {file_name: self.summarize(records) for file_name, records in grouped.items()}
+
+    def run_summary(self) -> Dict[str, float]:
+        """汇总整次运行"""
+        summary = self.summarize(self.get_records())
+        end = self.run_finished_at or time.time()
+        summary["wall_time"] = end - self.run_started_at if self.run_started_at else 0.0
+        summary["cold_start"] = self.cold_start
+        return summary
+
+    @staticmethod
+    def format_summary(summary: Dict[str, float], title: str = "") -> str:
+        """将汇总指标格式化为一行日志"""
+        text = (f"请求 {summary['requests']} 次（失败 {summary['failed']}），"
+                f"延迟 p50 {summary['latency_p50']:.2f}s / p95 {summary['latency_p95']:.2f}s，"
+                f"生成 {summary['tokens_per_second']:.1f} tokens/s，"
+                f"提示/输出token比 {summary['prompt_output_ratio']:.1f}")
+        if summary.get("cold_start") is not None:
+            text += f"，冷启动 {summary['cold_start']:.1f}s"
+        return f"{title}: {text}" if title else text
+
+    def export_csv(self, file_path: Path) -> Path:
+        """导出请求明细为CSV"""
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=METRIC_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.get_records())
+        return file_path
+
+    def export_json(self, file_path: Path) -> Path:
+        """导出汇总指标和请求明细为JSON"""
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "run": self.run_summary(),
+            "files": self.summary_by_file(),
+            "requests": self.get_records(),
+        }
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return file_path
+
+    def export(self, metrics_dir: Path) -> Path:
+        """以运行开始时间命名，同时导出CSV和JSON
+
+        Args:
+            metrics_dir: 导出目录
+
+        Returns:
+            JSON文件路径
+        """
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(self.run_started_at or time.time()))
+        self.export_csv(metrics_dir / f"run_{stamp}.csv")
+        return self.export_json(metrics_dir / f"run_{stamp}.json")
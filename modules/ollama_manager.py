@@ -5,10 +5,230 @@ Ollama管理模块
 负责与Ollama服务的交互和翻译功能
 """
 
-import requests
-import concurrent.futures
+import random
 import threading
-from typing import List, Dict, Optional, Callable
+import time
+from typing import List, Dict, Optional, Callable, Tuple
+
+from .embedding_index import DEFAULT_EMBEDDING_MODEL, EMBED_BATCH_SIZE, EMBED_BACKFILL_LIMIT, vector_search_available
+from .profiler import profiler
+from .prompt_builder import ExpansionEstimator, PromptBuilder, estimate_tokens, model_family
+from .scheduler import create_scheduler
+from .translation_core import TranslationCore
+
+
+# 模型列表缓存有效期（秒），有效期内的状态检查和模型查询不再请求 /api/tags
+MODEL_CACHE_TTL = 60
+
+# 响应中 load_duration 超过该值（秒）视为模型被卸载后重新加载
+LOAD_STALL_THRESHOLD = 1.0
+
+# Ollama默认的模型驻留时间，翻译结束后恢复
+DEFAULT_KEEP_ALIVE = "5m"
+
+# 值得重试的HTTP状态码（请求超时、限流和服务端错误）
+TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+# 连续多少次连接失败后断开熔断器，暂停发送翻译请求
+BREAKER_FAILURE_THRESHOLD = 3
+
+# 熔断期间最长等待服务恢复的时间（秒），超过后剩余条目按失败处理
+BREAKER_MAX_WAIT = 600
+
+# 级联模式下交给快速模型的条目：原文（屏蔽后）不超过该字符数且不含换行（物品名、标签等）
+FAST_TIER_MAX_CHARS = 60
+
+# 按语义检索的示例数，以及作为示例的最低余弦相似度
+SEMANTIC_EXAMPLES = 3
+MIN_SEMANTIC_SIMILARITY = 0.5
+
+
+class TranslationError(Exception):
+    """翻译请求失败
+    
+    transient 为 True 表示瞬时错误（超时、连接重置、5xx），重试可能成功；
+    为 False 表示永久错误（如模型不存在、请求格式错误），重试无意义。
+    """
+    
+    def __init__(self, message: str, transient: bool = True, connection: bool = False):
+        super().__init__(message)
+        self.transient = transient
+        # 是否为连接失败（服务未启动或已崩溃），用于熔断判断
+        self.connection = connection
+
+
+class ValidationError(TranslationError):
+    """译文未通过校验（游戏标记、换行、长度比例、解释说明等），可用更严格的提示词重译"""
+    
+    def __init__(self, message: str, issues: List[str]):
+        super().__init__(message, transient=False)
+        self.issues = issues
+
+
+def is_transient_status(status_code: int) -> bool:
+    """判断HTTP状态码是否为瞬时错误"""
+    return status_code in TRANSIENT_STATUS_CODES or status_code >= 500
+
+
+class RetryPolicy:
+    """指数退避重试策略（全抖动）"""
+    
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5, max_delay: float = 8.0):
+        """初始化重试策略
+        
+        Args:
+            max_attempts: 单个请求的最大尝试次数（含首次）
+            base_delay: 首次重试前的基础等待（秒）
+            max_delay: 单次等待上限（秒）
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+    
+    def delay(self, attempt: int) -> float:
+        """第attempt次失败后的等待时间，在 [0, base*2^(attempt-1)] 内随机，避免并发请求同时重试"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+
+class CircuitBreaker:
+    """Ollama连接熔断器
+    
+    连续 failure_threshold 次连接失败后断开：所有工作线程在发送请求前阻塞等待，
+    由其中一个线程按指数退避探测服务，探测成功后闭合并唤醒其余线程。
+    断开期间的失败不消耗条目的重试次数，队列中的条目不会被快速耗尽。
+    超过最长等待时间后转为半开：放行请求，下一次连接失败立即重新断开。
+    """
+    
+    def __init__(self, probe: Callable[[], bool], failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 base_delay: float = 1.0, max_delay: float = 30.0, max_wait: float = BREAKER_MAX_WAIT,
+                 on_open: Optional[Callable] = None, on_close: Optional[Callable] = None):
+        """初始化熔断器
+        
+        Args:
+            probe: 探测函数，服务可用时返回True
+            failure_threshold: 断开前允许的连续连接失败次数
+            base_delay: 首次探测前的等待（秒），之后逐次翻倍
+            max_delay: 探测间隔上限（秒）
+            max_wait: 断开后最长等待时间（秒）
+            on_open: 断开时的回调
+            on_close: 恢复时的回调，参数为中断秒数
+        """
+        self.probe = probe
+        self.failure_threshold = max(1, failure_threshold)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_wait = max_wait
+        self.on_open = on_open
+        self.on_close = on_close
+        
+        self.is_open = False
+        self.trips = 0
+        self.outage_time = 0.0
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._cond = threading.Condition()
+    
+    def reset_stats(self):
+        """重置熔断状态、断开次数和中断时长统计（每次运行开始时调用）"""
+        with self._cond:
+            self.is_open = False
+            self._failures = 0
+            self._opened_at = 0.0
+            self.trips = 0
+            self.outage_time = 0.0
+            self._cond.notify_all()
+    
+    def record_success(self):
+        """服务有响应（包括HTTP错误），清零连续失败计数"""
+        with self._cond:
+            self._failures = 0
+    
+    def record_failure(self) -> bool:
+        """记录一次连接失败
+        
+        Returns:
+            熔断器是否处于断开状态
+        """
+        with self._cond:
+            self._failures += 1
+            if self.is_open or self._failures < self.failure_threshold:
+                return self.is_open
+            self.is_open = True
+            self.trips += 1
+            self._opened_at = time.monotonic()
+        if self.on_open:
+            self.on_open()
+        return True
+    
+    def wait(self, stop_check: Optional[Callable] = None) -> bool:
+        """闭合时立即返回；断开时阻塞直到服务恢复
+        
+        Returns:
+            False 表示等待期间被停止或超过最长等待时间
+        """
+        while True:
+            with self._cond:
+                if not self.is_open:
+                    return True
+                if time.monotonic() - self._opened_at > self.max_wait:
+                    self._half_open()
+                    return False
+                prober = not self._probing
+                if prober:
+                    self._probing = True
+                else:
+                    self._cond.wait(0.5)
+            if stop_check and stop_check():
+                return False
+            if prober:
+                self._probe_until_closed(stop_check)
+    
+    def _probe_until_closed(self, stop_check: Optional[Callable]):
+        """按指数退避探测服务，成功后闭合；被停止或超时则交还探测权"""
+        attempt = 0
+        try:
+            while time.monotonic() - self._opened_at <= self.max_wait:
+                deadline = time.monotonic() + min(self.max_delay, self.base_delay * (2 ** attempt))
+                while time.monotonic() < deadline:
+                    if stop_check and stop_check():
+                        return
+                    time.sleep(min(0.5, max(0.0, deadline - time.monotonic())))
+                attempt += 1
+                try:
+                    available = self.probe()
+                except Exception:
+                    available = False
+                if available:
+                    self._close()
+                    return
+        finally:
+            with self._cond:
+                self._probing = False
+                self._cond.notify_all()
+    
+    def _half_open(self):
+        """等待超时：放行请求但只允许再失败一次（需持有 _cond）"""
+        if not self.is_open:
+            return
+        self.is_open = False
+        self._failures = self.failure_threshold - 1
+        self.outage_time += time.monotonic() - self._opened_at
+        self._cond.notify_all()
+    
+    def _close(self):
+        with self._cond:
+            if not self.is_open:
+                # 已经超时转为半开
+                self._failures = 0
+                return
+            outage = time.monotonic() - self._opened_at
+            self.is_open = False
+            self._failures = 0
+            self.outage_time += outage
+            self._cond.notify_all()
+        if self.on_close:
+            self.on_close(outage)
 
 
 class OllamaManager:
@@ -19,25 +239,70 @@ class OllamaManager:
         self.model = model
         self.translator = OllamaTranslator(base_url=base_url, model=model, main_app=main_app)
         self.main_app = main_app  # 主应用引用
+        
+        # 模型列表缓存
+        self._models_cache: Optional[List[str]] = None
+        self._models_fetched_at = 0.0
+        self._models_lock = threading.Lock()
+        # 语义示例不可用的原因只提示一次
+        self._semantic_notice_shown = False
     
-    def check_server_status(self) -> bool:
-        """检查Ollama服务器状态"""
+    def discover_models(self, force: bool = False) -> Optional[List[str]]:
+        """发现可用模型（一次 /api/tags 请求同时完成状态检查和模型列表获取）
+        
+        Args:
+            force: 是否忽略缓存有效期强制请求
+            
+        Returns:
+            模型名称列表；服务未运行时返回None
+        """
+        with self._models_lock:
+            if not force and self._models_cache is not None and \
+                    time.time() - self._models_fetched_at < MODEL_CACHE_TTL:
+                return list(self._models_cache)
         try:
+            import requests  # 延迟导入，避免拖慢启动
             response = requests.get(f"{self.base_url}/api/tags", timeout=0.5)
-            return response.status_code == 200
+            if response.status_code != 200:
+                return None
+            models = [model['name'] for model in response.json().get('models', [])]
         except Exception:
-            return False
+            return None
+        
+        with self._models_lock:
+            self._models_cache = models
+            self._models_fetched_at = time.time()
+        self._save_models_cache(models)
+        return list(models)
+    
+    def get_cached_models(self) -> List[str]:
+        """获取缓存的模型列表（内存中没有时读取配置文件中保存的列表），不发起网络请求"""
+        with self._models_lock:
+            if self._models_cache is not None:
+                return list(self._models_cache)
+        if self.main_app and hasattr(self.main_app, 'config_manager'):
+            return list(self.main_app.config_manager.get('cached_models', []) or [])
+        return []
+    
+    def _save_models_cache(self, models: List[str]) -> None:
+        """将模型列表持久化到配置文件，供下次启动立即显示"""
+        if not self.main_app or not hasattr(self.main_app, 'config_manager'):
+            return
+        try:
+            self.main_app.config_manager.update({
+                'cached_models': models,
+                'cached_models_time': int(time.time())
+            })
+        except Exception as e:
+            print(f"保存模型缓存失败: {e}")
+    
+    def check_server_status(self) -> bool:
+        """检查Ollama服务器状态"""
+        return self.discover_models() is not None
     
     def get_available_models(self) -> List[str]:
         """获取可用模型列表"""
-        try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=0.5)
-            if response.status_code == 200:
-                data = response.json()
-                return [model['name'] for model in data.get('models', [])]
-            return []
-        except Exception:
-            return []
+        return self.discover_models() or []
     
     def set_model(self, model: str):
         """设置当前使用的模型"""
@@ -51,29 +316,131 @@ class OllamaManager:
     def translate_batch_async(self, texts: List[str], target_lang: str, batch_size: int = 5,
                             progress_callback: Optional[Callable] = None,
                             stop_check: Optional[Callable] = None,
-                            result_callback: Optional[Callable] = None) -> List[str]:
+                            result_callback: Optional[Callable] = None,
+                            failure_callback: Optional[Callable] = None) -> List[str]:
         """异步批量翻译"""
         return self.translator.translate_batch_async(
-            texts, target_lang, batch_size, progress_callback, stop_check, result_callback
+            texts, target_lang, batch_size, progress_callback, stop_check, result_callback, failure_callback
         )
     
+    def warm_up_model(self, model: str = None, keep_alive: str = None) -> Optional[float]:
+        """预热模型：发送空提示词让Ollama把模型加载到内存
+        
+        Args:
+            model: 模型名称，默认使用当前模型
+            keep_alive: 模型驻留时间（如"30m"）
+            
+        Returns:
+            冷启动耗时（秒，取响应中的load_duration）；请求失败时返回None
+        """
+        model = model or self.model
+        if not model:
+            return None
+        try:
+            import requests  # 延迟导入，避免拖慢启动
+            # 与翻译请求使用相同的上下文大小，否则第一个翻译请求会让Ollama重新加载模型
+            payload = {"model": model, "prompt": "", "stream": False,
+                       "options": {"num_ctx": self.translator.prompt_builder.context_size(model)}}
+            if keep_alive:
+                payload["keep_alive"] = keep_alive
+            # 大模型首次加载可能需要较长时间
+            response = requests.post(f"{self.base_url}/api/generate", json=payload, timeout=300)
+            if response.status_code != 200:
+                return None
+            return response.json().get('load_duration', 0) / 1e9
+        except Exception:
+            return None
+    
+    def prepare_run(self, keep_alive: str, texts: Optional[List[str]] = None) -> Optional[float]:
+        """翻译开始前预热模型并在整个任务期间保持驻留
+        
+        Args:
+            keep_alive: 任务期间的模型驻留时间
+            texts: 本次任务的全部待翻译文本，用于确定上下文大小
+            
+        Returns:
+            冷启动耗时（秒），预热失败时返回None
+        """
+        if self.main_app and getattr(self.main_app, 'ollama_model', None):
+            self.set_model(self.main_app.ollama_model)
+        self.translator.keep_alive = keep_alive
+        if self.main_app and hasattr(self.main_app, 'config_manager'):
+            self.translator.retry_policy = RetryPolicy(
+                max_attempts=self.main_app.config_manager.get('retry_attempts', 3))
+            self.translator.prompt_builder.num_ctx = int(self.main_app.config_manager.get('num_ctx', 0) or 0)
+        self.translator.prompt_builder.plan(texts or [])
+        self.translator.reset_run_stats()
+        self._prepare_semantic_search()
+        cold_start = self.warm_up_model(keep_alive=keep_alive)
+        self.translator.cold_start_time = cold_start
+        self._prepare_fast_model(keep_alive)
+        return cold_start
+    
+    def _prepare_semantic_search(self):
+        """语义示例需要numpy和Ollama中已安装的嵌入模型，缺少时本次运行使用n-gram检索相似译文"""
+        if not self.main_app or not hasattr(self.main_app, 'config_manager'):
+            return
+        config_manager = self.main_app.config_manager
+        if not config_manager.get('use_semantic_examples', True) or \
+                not config_manager.get('use_translation_memory', True):
+            return
+        embedding_model = config_manager.get('embedding_model', DEFAULT_EMBEDDING_MODEL)
+        if not vector_search_available():
+            reason = "未安装numpy（pip install numpy 后可按语义挑选示例）"
+        elif not self._has_model(embedding_model):
+            reason = f"Ollama中没有嵌入模型 {embedding_model}（ollama pull {embedding_model} 后可按语义挑选示例）"
+        else:
+            return
+        self.translator._embedding_available = False
+        if not self._semantic_notice_shown:
+            self._semantic_notice_shown = True
+            self.main_app.log_message(f"{reason}，使用n-gram检索相似译文作为示例")
+    
+    def _has_model(self, model: str) -> bool:
+        """模型是否在 /api/tags 的列表中（未写标签时匹配 :latest）"""
+        names = set(self.discover_models() or [])
+        return model in names or (':' not in model and f"{model}:latest" in names)
+    
+    def _prepare_fast_model(self, keep_alive: str):
+        """级联模式：预热配置的快速模型，不可用时本次运行只使用主模型"""
+        self.translator.fast_model = None
+        if not self.main_app or not hasattr(self.main_app, 'config_manager'):
+            return
+        fast_model = (self.main_app.config_manager.get('fast_model', '') or '').strip()
+        if not fast_model or fast_model == self.model:
+            return
+        if self.warm_up_model(fast_model, keep_alive) is None:
+            self.main_app.log_message(f"快速模型 {fast_model} 不可用，本次只使用 {self.model} 翻译", "WARNING")
+            return
+        self.translator.fast_model = fast_model
+        self.main_app.log_message(f"级联模式：短条目先由 {fast_model} 翻译，长对话和未通过校验的条目由 {self.model} 翻译")
+    
+    def finish_run(self) -> Dict[str, float]:
+        """翻译结束后恢复默认驻留时间并返回本次运行的模型加载和失败统计"""
+        stats = self.translator.get_run_stats()
+        self.translator.keep_alive = None
+        fast_model = self.translator.fast_model
+        
+        def restore():
+            self.warm_up_model(keep_alive=DEFAULT_KEEP_ALIVE)
+            if fast_model:
+                self.warm_up_model(fast_model, DEFAULT_KEEP_ALIVE)
+        
+        # 恢复驻留时间不需要等待结果
+        threading.Thread(target=restore, daemon=True).start()
+        return stats
+    
     def refresh_models(self):
         """刷新模型列表"""
         def refresh():
             try:
                 if self.main_app:
                     self.main_app.log_message("正在刷新模型列表...")
-                # 检查Ollama状态
-                if self.check_server_status():
-                    # 获取模型列表
-                    models = self.get_available_models()
+                # 一次请求同时检查服务状态并获取模型列表
+                models = self.discover_models(force=True)
+                if models is not None:
                     if self.main_app:
-                        # 更新available_models属性
-                        self.main_app.available_models = models
-                        # 通过主线程更新UI
-                        self.main_app.root.after(0, lambda: self.main_app._update_models_ui(models))
-                        if models:
-                            self.model = models[0]
+                        self.main_app.apply_discovered_models(models)
                         self.main_app.log_message("模型列表刷新成功")
                     else:
                         print("模型列表刷新成功")
@@ -99,281 +466,853 @@ class OllamaTranslator:
         self.model = model
         self.base_url = base_url
         self.main_app = main_app
+        
+        # 模型驻留时间，翻译任务期间由OllamaManager.prepare_run设置
+        self.keep_alive: Optional[str] = None
+        
+        # 重试策略
+        self.retry_policy = RetryPolicy()
+        
+        # 模型加载和失败统计
+        self.cold_start_time: Optional[float] = None
+        self.load_stalls = 0
+        self.load_stall_time = 0.0
+        self.retry_count = 0
+        self.transient_failures = 0
+        self.permanent_failures = 0
+        self.recovered = 0
+        self.validation_rejected = 0
+        self.validation_fixed = 0
+        self.glossary_violations = 0
+        self.memory_reused = 0
+        self.memory_examples = 0
+        self.semantic_examples = 0
+        self.examples_trimmed = 0
+        self.overruns = 0
+        self.escalations = 0
+        self.tier_stats = self._new_tier_stats()
+        self._stats_lock = threading.Lock()
+        
+        # 级联模式的快速模型，None表示所有条目都交给主模型
+        self.fast_model: Optional[str] = None
+        
+        # 正在进行的批量翻译的调度器，供 prioritize 插入优先通道
+        self._active_scheduler = None
+        
+        # 本次运行中 /api/embed 是否可用（嵌入模型未安装时回退到n-gram检索）
+        self._embedding_available = True
+        # 当前批次待翻译文本（屏蔽后）的向量，由后台线程逐步填充
+        self._query_vectors: Dict[str, List[float]] = {}
+        # 每次批量翻译加一，后台嵌入线程发现不一致时停止
+        self._embed_generation = 0
+        
+        # 最近一次批量翻译的校验统计，供按文件汇总
+        self.last_batch_validation: Dict[str, int] = {}
+        
+        # 占位符和游戏标记的屏蔽与恢复
+        self.translation_core = TranslationCore()
+        # 按语言缓存屏蔽后的示例对话
+        self._example_cache: Dict[tuple, List[tuple]] = {}
+        # 按上下文预算组装提示词
+        self.prompt_builder = PromptBuilder()
+        # 从本次运行已完成的译文学习扩展比例，限制每个条目的生成长度
+        self.expansion = ExpansionEstimator()
+        
+        # 连接熔断器：Ollama中途崩溃时暂停发送请求，恢复后自动继续
+        self.breaker = CircuitBreaker(self._probe_server, on_open=self._on_breaker_open,
+                                      on_close=self._on_breaker_close)
     
-    def translate_single_text(self, text: str, target_lang: str) -> str:
-        """翻译单个文本"""
-        try:
-            # 语言配置映射
-            lang_config = {
-                'zh': {
-                    'name': '中文',
-                    'examples': [
-                        ("Level {{level}} shield found!", "发现等级{{level}}护盾！"),
-                        ("Mod created by {{author}} - Requirements: {{parents}}", "模组由{{author}}制作 - 依赖项：{{parents}}"),
-                        ("Great sword with level {{level}}", "等级{{level}}大剑"),
-                        ("Farm Quarry", "农场采石场"),
-                        ("Elliot's Cabin", "艾利欧特的小屋"),
-                        ("Iridium Quarry", "铱矿采石场"),
-                        ("Beer, mead, and pale ale are worth 50% more.", "啤酒、蜂蜜酒和淡啤酒的价值提高50%。"),
-                        ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "阿比盖尔和山姆去看塞巴斯蒂安，而潘妮在哈维诊所附近教文森特和贾斯，玛鲁在那里和她的父亲德米特里厄斯一起工作。"),
-                        ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "亚历克斯帮助海莉拍照，而莉亚雕刻雕塑，艾利欧特写诗，卡洛琳和乔迪与艾芙琳和乔治一起准备晚餐。")
-                    ]
-                },
-                'default': {
-                    'name': 'English',
-                    'examples': [
-                        ("Level {{level}} shield found!", "Level {{level}} shield found!"),
-                        ("Mod created by {{author}} - Requirements: {{parents}}", "Mod created by {{author}} - Requirements: {{parents}}"),
-                        ("Great sword with level {{level}}", "Great sword with level {{level}}"),
-                        ("Farm Quarry", "Farm Quarry"),
-                        ("Elliot's Cabin", "Elliott's Cabin"),
-                        ("Iridium Quarry", "Iridium Quarry"),
-                        ("Beer, mead, and pale ale are worth 50% more.", "Beer, mead, and pale ale are worth 50% more."),
-                        ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius."),
-                        ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.")
-                    ]
-                },
-                'ja': {
-                    'name': '日本語',
-                    'examples': [
-                        ("Level {{level}} shield found!", "レベル{{level}}の盾を発見！"),
-                        ("Mod created by {{author}} - Requirements: {{parents}}", "{{author}}によって作成されたMod - 必要条件：{{parents}}"),
-                        ("Great sword with level {{level}}", "レベル{{level}}の大剣"),
-                        ("Farm Quarry", "農場の採石場"),
-                        ("Elliot's Cabin", "エリオットの小屋"),
-                        ("Iridium Quarry", "イリジウム採石場"),
-                        ("Beer, mead, and pale ale are worth 50% more.", "ビール、ミード、ペールエールの価値が50%向上します。"),
-                        ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "アビゲイルとサムはセバスチャンに会いに行き、ペニーはハーヴィーの診療所近くでヴィンセントとジャスに教えていました。そこではマルが父親のデメトリウスと一緒に働いています。"),
-                        ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "アレックスはヘイリーの写真撮影を手伝い、リアは彫刻を彫り、エリオットは詩を書いていました。その間、キャロラインとジョディはエヴリンとジョージと一緒に夕食を準備していました。")
-                    ]
-                },
-                'ko': {
-                    'name': '한국어',
-                    'examples': [
-                        ("Level {{level}} shield found!", "레벨 {{level}} 방패 발견!"),
-                        ("Mod created by {{author}} - Requirements: {{parents}}", "{{author}}가 제작한 모드 - 요구사항: {{parents}}"),
-                        ("Great sword with level {{level}}", "레벨 {{level}} 대검"),
-                        ("Farm Quarry", "농장 채석장"),
-                        ("Elliot's Cabin", "엘리엇의 오두막"),
-                        ("Iridium Quarry", "이리듐 채석장"),
-                        ("Beer, mead, and pale ale are worth 50% more.", "맥주, 벌꿀술, 페일 에일의 가치가 50% 증가합니다."),
-                        ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "애비게일과 샘은 세바스찬을 보러 갔고, 페니는 하비의 진료소 근처에서 빈센트와 재스를 가르치고 있었습니다. 그곳에서 마루는 아버지 데메트리우스와 함께 일하고 있었습니다."),
-                        ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "알렉스는 헤일리의 사진 촬영을 도왔고, 리아는 조각을 조각하고 엘리엇은 시를 썼으며, 캐롤라인과 조디는 에블린과 조지와 함께 저녁을 준비했습니다.")
-                    ]
-                },
-                'fr': {
-                    'name': 'Français',
-                    'examples': [
-                        ("Level {{level}} shield found!", "Bouclier de niveau {{level}} trouvé !"),
-                        ("Mod created by {{author}} - Requirements: {{parents}}", "Mod créé par {{author}} - Prérequis : {{parents}}"),
-                        ("Great sword with level {{level}}", "Grande épée de niveau {{level}}"),
-                        ("Farm Quarry", "Carrière de la ferme"),
-                        ("Elliot's Cabin", "Cabane d'Elliott"),
-                        ("Iridium Quarry", "Carrière d'iridium"),
-                        ("Beer, mead, and pale ale are worth 50% more.", "La bière, l'hydromel et la bière blonde valent 50% de plus."),
-                        ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Abigail et Sam sont allés voir Sebastian, tandis que Penny enseignait à Vincent et Jas près de la clinique d'Harvey où Maru travaille avec son père Demetrius."),
-                        ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Alex a aidé Haley à prendre des photos tandis que Leah sculptait et qu'Elliott écrivait des poèmes, pendant que Caroline et Jodi préparaient le dîner avec Evelyn et George.")
-                    ]
-                },
-                'de': {
-                    'name': 'Deutsch',
-                    'examples': [
-                        ("Level {{level}} shield found!", "Schild der Stufe {{level}} gefunden!"),
-                        ("Mod created by {{author}} - Requirements: {{parents}}", "Mod erstellt von {{author}} - Voraussetzungen: {{parents}}"),
-                        ("Great sword with level {{level}}", "Großes Schwert der Stufe {{level}}"),
-                        ("Farm Quarry", "Farm-Steinbruch"),
-                        ("Elliot's Cabin", "Elliotts Hütte"),
-                        ("Iridium Quarry", "Iridium-Steinbruch"),
-                        ("Beer, mead, and pale ale are worth 50% more.", "Bier, Met und helles Bier sind 50% mehr wert."),
-                        ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Abigail und Sam gingen zu Sebastian, während Penny Vincent und Jas in der Nähe von Harveys Klinik unterrichtete, wo Maru mit ihrem Vater Demetrius arbeitet."),
-                        ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Alex half Haley beim Fotografieren, während Leah Skulpturen schnitzte und Elliott Gedichte schrieb, als Caroline und Jodi das Abendessen mit Evelyn und George zubereiteten.")
-                    ]
-                },
-                'es': {
-                    'name': 'Español',
-                    'examples': [
-                        ("Level {{level}} shield found!", "¡Escudo de nivel {{level}} encontrado!"),
-                        ("Mod created by {{author}} - Requirements: {{parents}}", "Mod creado por {{author}} - Requisitos: {{parents}}"),
-                        ("Great sword with level {{level}}", "Gran espada de nivel {{level}}"),
-                        ("Farm Quarry", "Cantera de la granja"),
-                        ("Elliot's Cabin", "Cabaña de Elliott"),
-                        ("Iridium Quarry", "Cantera de iridio"),
-                        ("Beer, mead, and pale ale are worth 50% more.", "La cerveza, el hidromiel y la cerveza pálida valen 50% más."),
-                        ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Abigail y Sam fueron a ver a Sebastian, mientras Penny enseñaba a Vincent y Jas cerca de la clínica de Harvey donde Maru trabaja con su padre Demetrius."),
-                        ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Alex ayudó a Haley a tomar fotos mientras Leah tallaba esculturas y Elliott escribía poemas, mientras Caroline y Jodi preparaban la cena con Evelyn y George.")
-                    ]
-                },
-                'ru': {
-                    'name': 'Русский',
-                    'examples': [
-                        ("Level {{level}} shield found!", "Найден щит {{level}} уровня!"),
-                        ("Mod created by {{author}} - Requirements: {{parents}}", "Мод создан {{author}} - Требования: {{parents}}"),
-                        ("Great sword with level {{level}}", "Большой меч {{level}} уровня"),
-                        ("Farm Quarry", "Карьер фермы"),
-                        ("Elliot's Cabin", "Хижина Эллиота"),
-                        ("Iridium Quarry", "Иридиевый карьер"),
-                        ("Beer, mead, and pale ale are worth 50% more.", "Пиво, медовуха и светлый эль стоят на 50% больше."),
-                        ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Эбигейл и Сэм пошли к Себастьяну, пока Пенни учила Винсента и Джас возле клиники Харви, где Мару работает со своим отцом Деметриусом."),
-                        ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Алекс помогал Хейли фотографировать, пока Лия вырезала скульптуры, а Эллиот писал стихи, когда Кэролайн и Джоди готовили ужин с Эвелин и Джорджем.")
-                    ]
-                },
-                'pt': {
-                    'name': 'Português (BR)',
-                    'examples': [
-                        ("Level {{level}} shield found!", "Escudo nível {{level}} encontrado!"),
-                        ("Mod created by {{author}} - Requirements: {{parents}}", "Mod criado por {{author}} - Requisitos: {{parents}}"),
-                        ("Great sword with level {{level}}", "Grande espada nível {{level}}"),
-                        ("Farm Quarry", "Pedreira da fazenda"),
-                        ("Elliot's Cabin", "Cabana do Elliott"),
-                        ("Iridium Quarry", "Pedreira de irídio"),
-                        ("Beer, mead, and pale ale are worth 50% more.", "Cerveja, hidromel e cerveja clara valem 50% a mais."),
-                        ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Abigail e Sam foram ver Sebastian, enquanto Penny ensinava Vincent e Jas perto da clínica do Harvey onde Maru trabalha com seu pai Demetrius."),
-                        ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Alex ajudou Haley a tirar fotos enquanto Leah esculpia e Elliott escrevia poemas, enquanto Caroline e Jodi preparavam o jantar com Evelyn e George.")
-                    ]
-                },
-                'it': {
-                    'name': 'Italiano',
-                    'examples': [
-                        ("Level {{level}} shield found!", "Scudo di livello {{level}} trovato!"),
-                        ("Mod created by {{author}} - Requirements: {{parents}}", "Mod creata da {{author}} - Requisiti: {{parents}}"),
-                        ("Great sword with level {{level}}", "Grande spada di livello {{level}}"),
-                        ("Farm Quarry", "Cava della fattoria"),
-                        ("Elliot's Cabin", "Capanna di Elliott"),
-                        ("Iridium Quarry", "Cava di iridio"),
-                        ("Beer, mead, and pale ale are worth 50% more.", "Birra, idromele e birra chiara valgono il 50% in più."),
-                        ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Abigail e Sam andarono a trovare Sebastian, mentre Penny insegnava a Vincent e Jas vicino alla clinica di Harvey dove Maru lavora con suo padre Demetrius."),
-                        ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Alex aiutò Haley a scattare foto mentre Leah scolpiva e Elliott scriveva poesie, mentre Caroline e Jodi preparavano la cena con Evelyn e George.")
-                    ]
-                },
-                'tr': {
-                    'name': 'Türkçe',
-                    'examples': [
-                        ("Level {{level}} shield found!", "Seviye {{level}} kalkan bulundu!"),
-                        ("Mod created by {{author}} - Requirements: {{parents}}", "{{author}} tarafından oluşturulan mod - Gereksinimler: {{parents}}"),
-                        ("Great sword with level {{level}}", "Seviye {{level}} büyük kılıç"),
-                        ("Farm Quarry", "Çiftlik taş ocağı"),
-                        ("Elliot's Cabin", "Elliott'un kulübesi"),
-                        ("Iridium Quarry", "İridyum taş ocağı"),
-                        ("Beer, mead, and pale ale are worth 50% more.", "Bira, bal şarabı ve açık bira %50 daha değerli."),
-                        ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Abigail ve Sam Sebastian'ı görmeye gitti, Penny ise Harvey'nin kliniği yakınında Vincent ve Jas'a ders veriyordu, Maru'nun babası Demetrius ile çalıştığı yerde."),
-                        ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Alex, Haley'nin fotoğraf çekmesine yardım etti, Leah heykel oyarken Elliott şiir yazıyordu, Caroline ve Jodi ise Evelyn ve George ile akşam yemeği hazırlıyordu.")
-                    ]
-                },
-                'hu': {
-                    'name': 'Magyar',
-                    'examples': [
-                        ("Level {{level}} shield found!", "{{level}}. szintű pajzs találva!"),
-                        ("Mod created by {{author}} - Requirements: {{parents}}", "{{author}} által készített mod - Követelmények: {{parents}}"),
-                        ("Great sword with level {{level}}", "{{level}}. szintű nagy kard"),
-                        ("Farm Quarry", "Farm kőbánya"),
-                        ("Elliot's Cabin", "Elliott kunyhója"),
-                        ("Iridium Quarry", "Irídium kőbánya"),
-                        ("Beer, mead, and pale ale are worth 50% more.", "A sör, mézsör és világos sör 50%-kal többet ér."),
-                        ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Abigail és Sam elmentek Sebastianhoz, míg Penny Vincent-et és Jas-t tanította Harvey klinikája közelében, ahol Maru az apjával, Demetriusszal dolgozik."),
-                        ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Alex segített Haley-nek fotózni, míg Leah szobrokat faragott és Elliott verseket írt, Caroline és Jodi pedig Evelyn-nel és George-dzsal készítették a vacsorát.")
-                    ]
-                }
+    def reset_run_stats(self):
+        """重置本次运行的统计"""
+        with self._stats_lock:
+            self.cold_start_time = None
+            self.load_stalls = 0
+            self.load_stall_time = 0.0
+            self.retry_count = 0
+            self.transient_failures = 0
+            self.permanent_failures = 0
+            self.recovered = 0
+            self.validation_rejected = 0
+            self.validation_fixed = 0
+            self.glossary_violations = 0
+            self.memory_reused = 0
+            self.memory_examples = 0
+            self.semantic_examples = 0
+            self.examples_trimmed = 0
+            self.overruns = 0
+            self.escalations = 0
+            self.tier_stats = self._new_tier_stats()
+        self._embedding_available = True
+        self.expansion.reset()
+        self.breaker.reset_stats()
+    
+    def get_run_stats(self) -> Dict[str, float]:
+        """获取本次运行的统计：冷启动耗时、重新加载次数和耗时、重试和失败次数"""
+        with self._stats_lock:
+            return {
+                'cold_start': self.cold_start_time,
+                'load_stalls': self.load_stalls,
+                'load_stall_time': self.load_stall_time,
+                'retries': self.retry_count,
+                'transient_failures': self.transient_failures,
+                'permanent_failures': self.permanent_failures,
+                'recovered': self.recovered,
+                'validation_rejected': self.validation_rejected,
+                'validation_fixed': self.validation_fixed,
+                'glossary_violations': self.glossary_violations,
+                'memory_reused': self.memory_reused,
+                'memory_examples': self.memory_examples,
+                'semantic_examples': self.semantic_examples,
+                'examples_trimmed': self.examples_trimmed,
+                'overruns': self.overruns,
+                'fast_model': self.fast_model,
+                'escalations': self.escalations,
+                'tiers': {tier: dict(stats) for tier, stats in self.tier_stats.items()},
+                'outages': self.breaker.trips,
+                'outage_time': self.breaker.outage_time
             }
+    
+    @staticmethod
+    def _new_tier_stats() -> Dict[str, Dict[str, float]]:
+        return {tier: {'requests': 0, 'passed': 0, 'seconds': 0.0} for tier in ('fast', 'main')}
+    
+    def _choose_tier(self, masked_text: str, strict: bool) -> str:
+        """级联模式下短小的条目先交给快速模型，长对话和严格重译交给主模型"""
+        if self.fast_model and not strict and len(masked_text) <= FAST_TIER_MAX_CHARS and '\n' not in masked_text:
+            return 'fast'
+        return 'main'
+    
+    def _tier_model(self, tier: str) -> Optional[str]:
+        return self.fast_model if tier == 'fast' else self._current_model()
+    
+    def _record_tier(self, tier: str, seconds: float, passed: bool):
+        with self._stats_lock:
+            stats = self.tier_stats[tier]
+            stats['requests'] += 1
+            stats['passed'] += passed
+            stats['seconds'] += seconds
+    
+    def prioritize(self, indices: List[int]) -> int:
+        """把正在进行的批量翻译中尚未发送的条目移到优先通道，可在界面线程调用
+        
+        Args:
+            indices: 条目在 translate_batch_async 的 texts 中的索引
             
-            # 获取目标语言配置，默认为中文
-            current_lang = lang_config.get(target_lang, lang_config['zh'])
-            target_lang_name = current_lang['name']
-            fake_examples = current_lang['examples']
-            
-            # 动态生成用户提示词
-            user_prompt = f"你怎么还是把变量名内容翻译了? 请重新理解并将以下星露谷物语代码文本翻译成{target_lang_name}，不允许翻译任何花括号内的变量名避免编译错误, 人名和名词等都必须完全翻译,要求符合官方本地化名称, 只返回翻译结果，不需要解释："
-            
-            fake_history = []
-            for original, translation in fake_examples:
-                fake_history.extend([
-                    {"role": "user", "content": f"{user_prompt} {original}"},
-                    {"role": "assistant", "content": translation}
-                ])
-            
-            # 添加当前翻译请求
-            fake_history.append({
-                "role": "user",
-                "content": f"{user_prompt} {text}"
-            })
-            
-            # 发送带有历史记录的翻译请求
-            base_url = self.base_url
-            if self.main_app and hasattr(self.main_app, 'ollama_base_url'):
-                base_url = self.main_app.ollama_base_url
+        Returns:
+            实际提升的条目数，没有进行中的批量翻译时为0
+        """
+        scheduler = self._active_scheduler
+        return scheduler.promote(indices) if scheduler is not None else 0
+    
+    def _get_base_url(self) -> str:
+        if self.main_app and hasattr(self.main_app, 'ollama_base_url'):
+            return self.main_app.ollama_base_url
+        return self.base_url
+    
+    def _get_glossary(self, target_lang: str):
+        """获取目标语言的术语表，未启用时返回None"""
+        store = getattr(self.main_app, 'glossary', None) if self.main_app else None
+        if store is None:
+            return None
+        config_manager = getattr(self.main_app, 'config_manager', None)
+        if config_manager and not config_manager.get('use_glossary', True):
+            return None
+        return store.get(target_lang)
+    
+    def _get_translation_memory(self, target_lang: str):
+        """获取目标语言的翻译记忆，未启用时返回None"""
+        store = getattr(self.main_app, 'translation_memory', None) if self.main_app else None
+        if store is None:
+            return None
+        config_manager = getattr(self.main_app, 'config_manager', None)
+        if config_manager and not config_manager.get('use_translation_memory', True):
+            return None
+        return store.get(target_lang)
+    
+    def _get_embedding_index(self, target_lang: str):
+        """获取目标语言的向量索引，未启用、没有numpy或嵌入模型不可用时返回None"""
+        store = getattr(self.main_app, 'embedding_index', None) if self.main_app else None
+        if store is None or not self._embedding_available or not vector_search_available():
+            return None
+        config_manager = self.main_app.config_manager
+        if not config_manager.get('use_semantic_examples', True) or \
+                not config_manager.get('use_translation_memory', True):
+            return None
+        return store.get(target_lang, config_manager.get('embedding_model', DEFAULT_EMBEDDING_MODEL))
+    
+    def _embed(self, texts: List[str], model: str) -> Optional[List[List[float]]]:
+        """通过 /api/embed 计算向量，失败时本次运行不再使用语义检索
+        
+        Returns:
+            与 texts 一一对应的向量列表，失败时返回None
+        """
+        import requests  # 延迟导入，避免拖慢启动
+        try:
+            with profiler.span("embed", texts=len(texts)):
+                response = requests.post(f"{self._get_base_url()}/api/embed",
+                                         json={"model": model, "input": texts}, timeout=60)
+            embeddings = response.json().get('embeddings') if response.status_code == 200 else None
+            if isinstance(embeddings, list) and len(embeddings) == len(texts):
+                return embeddings
+            error = f"HTTP {response.status_code}"
+        except (requests.exceptions.RequestException, ValueError) as e:
+            error = f"{type(e).__name__}: {e}"
+        self._embedding_available = False
+        if self.main_app:
+            self.main_app.log_message(
+                f"嵌入模型 {model} 不可用（{error}），本次改用n-gram检索相似译文，可执行 ollama pull {model} 安装",
+                "WARNING")
+        return None
+    
+    def _prepare_semantic_examples(self, texts: List[str], target_lang: str) -> None:
+        """在后台为本批原文和翻译记忆中还没有向量的历史译文计算向量
+        
+        翻译不等待嵌入完成：向量还没有算好的条目使用n-gram检索的示例。
+        本批原文先算，历史译文从最近的开始补算。
+        """
+        self._query_vectors = {}
+        self._embed_generation += 1
+        index = self._get_embedding_index(target_lang)
+        memory = self._get_translation_memory(target_lang)
+        if index is None or memory is None:
+            return
+        # 已在索引中的原文同时在翻译记忆中，会直接复用译文，不需要查询向量
+        queries = [query for query in dict.fromkeys(self.translation_core.preserve_placeholders(text)[0]
+                                                    for text in texts) if query not in index]
+        query_set = set(queries)
+        missing = []
+        for source, _ in reversed(memory.to_pairs()):
+            if source not in index and source not in query_set:
+                missing.append(source)
+                if len(missing) >= EMBED_BACKFILL_LIMIT:
+                    break
+        if queries or missing:
+            threading.Thread(target=self._embed_in_background, daemon=True,
+                             args=(self._embed_generation, index, memory, queries + missing,
+                                   self._query_vectors)).start()
+    
+    def _embed_in_background(self, generation: int, index, memory, pending: List[str],
+                             query_vectors: Dict[str, List[float]]) -> None:
+        """分批计算向量：翻译记忆中已有的原文加入索引，其余作为查询向量；开始新的批量翻译或嵌入失败时停止"""
+        for start in range(0, len(pending), EMBED_BATCH_SIZE):
+            if generation != self._embed_generation or not self._embedding_available:
+                return
+            chunk = pending[start:start + EMBED_BATCH_SIZE]
+            vectors = self._embed(chunk, index.model)
+            if vectors is None:
+                return
+            for source, vector in zip(chunk, vectors):
+                query_vectors[source] = vector
+                if memory.get_exact(source) is not None:
+                    index.add(source, vector)
+    
+    def _get_semantic_examples(self, memory, index, masked_text: str) -> List[tuple]:
+        """从向量索引中取语义最相近的历史译文"""
+        vector = self._query_vectors.get(masked_text)
+        if vector is None:
+            return []
+        examples = []
+        for score, source in index.search(vector, SEMANTIC_EXAMPLES, exclude=masked_text):
+            target = memory.get_exact(source)
+            if score >= MIN_SEMANTIC_SIMILARITY and target is not None:
+                examples.append((source, target))
+        # 检索结果按相似度降序，最相近的放在最后，离当前请求最近
+        return examples[::-1]
+    
+    def _probe_server(self) -> bool:
+        """熔断探测：/api/tags 有响应即视为服务已恢复"""
+        import requests  # 延迟导入，避免拖慢启动
+        return requests.get(f"{self._get_base_url()}/api/tags", timeout=5).status_code == 200
+    
+    def _on_breaker_open(self):
+        if self.main_app:
+            self.main_app.log_message("无法连接Ollama服务，已暂停翻译，正在等待服务恢复...", "WARNING")
+    
+    def _on_breaker_close(self, outage: float):
+        if self.main_app:
+            self.main_app.log_message(f"Ollama服务已恢复，继续翻译（中断 {outage:.1f} 秒）")
+    
+    def _record_failure(self, error: TranslationError):
+        """记录一个最终失败的条目（重试用尽或永久错误）"""
+        with self._stats_lock:
+            if error.transient:
+                self.transient_failures += 1
+            else:
+                self.permanent_failures += 1
+    
+    def _record_load_duration(self, result: dict, model: str):
+        """根据响应中的load_duration检测模型是否在运行中被重新加载"""
+        load_duration = result.get('load_duration', 0) / 1e9
+        if load_duration < LOAD_STALL_THRESHOLD:
+            return
+        with self._stats_lock:
+            self.load_stalls += 1
+            self.load_stall_time += load_duration
+        if self.main_app:
+            self.main_app.log_message(f"检测到模型 {model} 被重新加载，等待 {load_duration:.1f} 秒", "WARNING")
+    
+    def translate_single_text(self, text: str, target_lang: str) -> str:
+        """翻译单个文本（重试后仍失败时返回原文）"""
+        try:
+            return self.translate_text(text, target_lang)
+        except TranslationError as e:
+            self._record_failure(e)
+            return text
+        except Exception:
+            return text
+    
+    @profiler.profiled("translate_text")
+    def translate_text(self, text: str, target_lang: str, stop_check: Optional[Callable] = None,
+                       strict: bool = False) -> str:
+        """按重试策略翻译单个文本，并校验译文
+        
+        Args:
+            text: 原文
+            target_lang: 目标语言代码
+            stop_check: 停止检查函数，熔断等待期间使用
+            strict: 使用更严格的提示词（校验未通过后重译时）
             
-            model = self.model
-            if self.main_app and hasattr(self.main_app, 'ollama_model'):
-                model = self.main_app.ollama_model
+        Returns:
+            译文
             
-            response = requests.post(
-                f"{base_url}/api/chat",
-                json={
-                    "model": model,
-                    "messages": fake_history,
-                    "stream": False
-                },
-                timeout=30
-            )
+        Raises:
+            ValidationError: 译文未通过校验
+            TranslationError: 永久错误，瞬时错误重试次数用尽，或服务长时间不可用
+        """
+        # 占位符和游戏标记在发送前替换为 {0}、{1}……，返回后校验并恢复
+        masked_text, placeholder_map = self.translation_core.preserve_placeholders(text)
+        # 只注入原文中出现的术语
+        glossary = self._get_glossary(target_lang)
+        terms = glossary.find_terms(text) if glossary else []
+        
+        # 翻译记忆：可复用的历史译文直接使用，相似的历史译文作为动态示例
+        memory = self._get_translation_memory(target_lang)
+        index = self._get_embedding_index(target_lang) if memory is not None else None
+        memory_examples = []
+        if memory is not None:
+            with profiler.span("memory_lookup"):
+                reused = None if strict else memory.find_reusable(masked_text, self._get_reuse_threshold())
+                if reused is not None:
+                    try:
+                        translated_text, _ = self._check_translation(
+                            text, reused, placeholder_map, target_lang, glossary, terms, strict)
+                        with self._stats_lock:
+                            self.memory_reused += 1
+                        return translated_text
+                    except ValidationError:
+                        pass  # 复用的译文不适用于当前原文，正常请求
+                if index is not None:
+                    memory_examples = self._get_semantic_examples(memory, index, masked_text)
+                semantic = bool(memory_examples)
+                if not semantic:
+                    memory_examples = [(source, target) for _, source, target in memory.search(masked_text)][::-1]
+            if memory_examples:
+                with self._stats_lock:
+                    self.memory_examples += 1
+                    self.semantic_examples += semantic
+        
+        tier = self._choose_tier(masked_text, strict)
+        attempt = 0
+        while True:
+            if not self.breaker.wait(stop_check):
+                raise TranslationError("Ollama服务不可用", transient=True, connection=True)
+            try:
+                model = self._tier_model(tier)
+                request_start = time.perf_counter()
+                try:
+                    masked_translation, output_tokens = self._request_translation(
+                        masked_text, target_lang, strict, terms, memory_examples, model)
+                    translated_text, clean = self._check_translation(
+                        text, masked_translation, placeholder_map, target_lang, glossary, terms, strict)
+                except ValidationError:
+                    self._record_tier(tier, time.perf_counter() - request_start, False)
+                    if tier != 'fast':
+                        raise
+                    # 快速模型的译文不合格，升级到主模型重译
+                    tier = 'main'
+                    with self._stats_lock:
+                        self.escalations += 1
+                    continue
+                self._record_tier(tier, time.perf_counter() - request_start, True)
+                if clean:
+                    source_tokens = estimate_tokens(masked_text, model_family(model))
+                    self.expansion.record(target_lang, source_tokens, output_tokens)
+                if memory is not None and clean:
+                    memory.add(masked_text, masked_translation)
+                    # 本批原文的向量已经算好，直接加入索引
+                    if index is not None and masked_text in self._query_vectors:
+                        index.add(masked_text, self._query_vectors[masked_text])
+                return translated_text
+            except TranslationError as e:
+                if e.connection and self.breaker.record_failure():
+                    # 熔断期间的失败不计入重试次数，等服务恢复后重新发送
+                    continue
+                attempt += 1
+                if not e.transient or attempt >= self.retry_policy.max_attempts:
+                    raise
+                with self._stats_lock:
+                    self.retry_count += 1
+                time.sleep(self.retry_policy.delay(attempt))
+    
+    def _current_model(self) -> Optional[str]:
+        if self.main_app and hasattr(self.main_app, 'ollama_model'):
+            return self.main_app.ollama_model
+        return self.model
+    
+    def _get_reuse_threshold(self) -> float:
+        if self.main_app and hasattr(self.main_app, 'config_manager'):
+            return float(self.main_app.config_manager.get('tm_reuse_threshold', 1.0))
+        return 1.0
+    
+    def _check_translation(self, text: str, masked_translation: str, placeholder_map: Dict[str, str],
+                           target_lang: str, glossary, terms: List[tuple], strict: bool):
+        """校验并恢复译文
+        
+        Returns:
+            (恢复游戏标记后的译文, 是否完全通过校验)
             
+        Raises:
+            ValidationError: 译文未通过校验
+        """
+        translated_text = masked_translation
+        if placeholder_map:
+            problems = self.translation_core.find_missing_placeholders(translated_text, placeholder_map)
+            if problems:
+                raise ValidationError(f"译文中的游戏标记不完整: {', '.join(problems)}", ['placeholders'])
+            translated_text = self.translation_core.restore_placeholders(translated_text, placeholder_map)
+        issues = self.translation_core.find_translation_issues(text, translated_text, target_lang)
+        if strict and issues == ['explanation']:
+            # 解释说明只是启发式判断，严格重译后仍命中时保留译文，不退回原文
+            return translated_text, False
+        if issues:
+            raise ValidationError(f"译文校验未通过: {self.translation_core.describe_issues(issues)}", issues)
+        violations = glossary.find_violations(terms, translated_text) if terms else []
+        if violations:
+            if not strict:
+                raise ValidationError(f"译文未使用术语表译名: {', '.join(violations)}", ['glossary'])
+            # 严格重译后仍不一致时保留译文，只计数（人名变体不应让整条退回原文）
+            with self._stats_lock:
+                self.glossary_violations += 1
+            return translated_text, False
+        return translated_text, True
+    
+    def _request_translation(self, text: str, target_lang: str, strict: bool = False,
+                             terms: Optional[List[tuple]] = None,
+                             memory_examples: Optional[List[tuple]] = None,
+                             model: Optional[str] = None) -> Tuple[str, int]:
+        """发送一次翻译请求
+        
+        strict 为 True 时在提示词前附加严格的输出要求，用于校验未通过后的重译；
+        terms 为原文中命中的术语，以术语表的形式加在提示词前；
+        memory_examples 为翻译记忆中相似的历史译文（最相近的在最后）：有2条及以上时只用它们作示例，
+        缩短提示词；只有1条时替换最后一个固定示例，放在离当前请求最近的位置。
+        生成长度按学到的扩展比例限制（严格重译时放宽一倍），达到上限视为校验未通过。
+        model 为空时使用当前选择的主模型。
+        
+        Returns:
+            (译文, 生成的token数)
+        
+        Raises:
+            ValidationError: 生成达到长度上限
+            TranslationError: 请求失败，transient 表示是否值得重试
+        """
+        build_start = time.perf_counter()
+        # 语言配置映射
+        lang_config = {
+            'zh': {
+                'name': '中文',
+                'examples': [
+                    ("Level {{level}} shield found!", "发现等级{{level}}护盾！"),
+                    ("Mod created by {{author}} - Requirements: {{parents}}", "模组由{{author}}制作 - 依赖项：{{parents}}"),
+                    ("Great sword with level {{level}}", "等级{{level}}大剑"),
+                    ("Farm Quarry", "农场采石场"),
+                    ("Elliot's Cabin", "艾利欧特的小屋"),
+                    ("Iridium Quarry", "铱矿采石场"),
+                    ("Beer, mead, and pale ale are worth 50% more.", "啤酒、蜂蜜酒和淡啤酒的价值提高50%。"),
+                    ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "阿比盖尔和山姆去看塞巴斯蒂安，而潘妮在哈维诊所附近教文森特和贾斯，玛鲁在那里和她的父亲德米特里厄斯一起工作。"),
+                    ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "亚历克斯帮助海莉拍照，而莉亚雕刻雕塑，艾利欧特写诗，卡洛琳和乔迪与艾芙琳和乔治一起准备晚餐。")
+                ]
+            },
+            'default': {
+                'name': 'English',
+                'examples': [
+                    ("Level {{level}} shield found!", "Level {{level}} shield found!"),
+                    ("Mod created by {{author}} - Requirements: {{parents}}", "Mod created by {{author}} - Requirements: {{parents}}"),
+                    ("Great sword with level {{level}}", "Great sword with level {{level}}"),
+                    ("Farm Quarry", "Farm Quarry"),
+                    ("Elliot's Cabin", "Elliott's Cabin"),
+                    ("Iridium Quarry", "Iridium Quarry"),
+                    ("Beer, mead, and pale ale are worth 50% more.", "Beer, mead, and pale ale are worth 50% more."),
+                    ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius."),
+                    ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.")
+                ]
+            },
+            'ja': {
+                'name': '日本語',
+                'examples': [
+                    ("Level {{level}} shield found!", "レベル{{level}}の盾を発見！"),
+                    ("Mod created by {{author}} - Requirements: {{parents}}", "{{author}}によって作成されたMod - 必要条件：{{parents}}"),
+                    ("Great sword with level {{level}}", "レベル{{level}}の大剣"),
+                    ("Farm Quarry", "農場の採石場"),
+                    ("Elliot's Cabin", "エリオットの小屋"),
+                    ("Iridium Quarry", "イリジウム採石場"),
+                    ("Beer, mead, and pale ale are worth 50% more.", "ビール、ミード、ペールエールの価値が50%向上します。"),
+                    ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "アビゲイルとサムはセバスチャンに会いに行き、ペニーはハーヴィーの診療所近くでヴィンセントとジャスに教えていました。そこではマルが父親のデメトリウスと一緒に働いています。"),
+                    ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "アレックスはヘイリーの写真撮影を手伝い、リアは彫刻を彫り、エリオットは詩を書いていました。その間、キャロラインとジョディはエヴリンとジョージと一緒に夕食を準備していました。")
+                ]
+            },
+            'ko': {
+                'name': '한국어',
+                'examples': [
+                    ("Level {{level}} shield found!", "레벨 {{level}} 방패 발견!"),
+                    ("Mod created by {{author}} - Requirements: {{parents}}", "{{author}}가 제작한 모드 - 요구사항: {{parents}}"),
+                    ("Great sword with level {{level}}", "레벨 {{level}} 대검"),
+                    ("Farm Quarry", "농장 채석장"),
+                    ("Elliot's Cabin", "엘리엇의 오두막"),
+                    ("Iridium Quarry", "이리듐 채석장"),
+                    ("Beer, mead, and pale ale are worth 50% more.", "맥주, 벌꿀술, 페일 에일의 가치가 50% 증가합니다."),
+                    ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "애비게일과 샘은 세바스찬을 보러 갔고, 페니는 하비의 진료소 근처에서 빈센트와 재스를 가르치고 있었습니다. 그곳에서 마루는 아버지 데메트리우스와 함께 일하고 있었습니다."),
+                    ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "알렉스는 헤일리의 사진 촬영을 도왔고, 리아는 조각을 조각하고 엘리엇은 시를 썼으며, 캐롤라인과 조디는 에블린과 조지와 함께 저녁을 준비했습니다.")
+                ]
+            },
+            'fr': {
+                'name': 'Français',
+                'examples': [
+                    ("Level {{level}} shield found!", "Bouclier de niveau {{level}} trouvé !"),
+                    ("Mod created by {{author}} - Requirements: {{parents}}", "Mod créé par {{author}} - Prérequis : {{parents}}"),
+                    ("Great sword with level {{level}}", "Grande épée de niveau {{level}}"),
+                    ("Farm Quarry", "Carrière de la ferme"),
+                    ("Elliot's Cabin", "Cabane d'Elliott"),
+                    ("Iridium Quarry", "Carrière d'iridium"),
+                    ("Beer, mead, and pale ale are worth 50% more.", "La bière, l'hydromel et la bière blonde valent 50% de plus."),
+                    ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Abigail et Sam sont allés voir Sebastian, tandis que Penny enseignait à Vincent et Jas près de la clinique d'Harvey où Maru travaille avec son père Demetrius."),
+                    ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Alex a aidé Haley à prendre des photos tandis que Leah sculptait et qu'Elliott écrivait des poèmes, pendant que Caroline et Jodi préparaient le dîner avec Evelyn et George.")
+                ]
+            },
+            'de': {
+                'name': 'Deutsch',
+                'examples': [
+                    ("Level {{level}} shield found!", "Schild der Stufe {{level}} gefunden!"),
+                    ("Mod created by {{author}} - Requirements: {{parents}}", "Mod erstellt von {{author}} - Voraussetzungen: {{parents}}"),
+                    ("Great sword with level {{level}}", "Großes Schwert der Stufe {{level}}"),
+                    ("Farm Quarry", "Farm-Steinbruch"),
+                    ("Elliot's Cabin", "Elliotts Hütte"),
+                    ("Iridium Quarry", "Iridium-Steinbruch"),
+                    ("Beer, mead, and pale ale are worth 50% more.", "Bier, Met und helles Bier sind 50% mehr wert."),
+                    ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Abigail und Sam gingen zu Sebastian, während Penny Vincent und Jas in der Nähe von Harveys Klinik unterrichtete, wo Maru mit ihrem Vater Demetrius arbeitet."),
+                    ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Alex half Haley beim Fotografieren, während Leah Skulpturen schnitzte und Elliott Gedichte schrieb, als Caroline und Jodi das Abendessen mit Evelyn und George zubereiteten.")
+                ]
+            },
+            'es': {
+                'name': 'Español',
+                'examples': [
+                    ("Level {{level}} shield found!", "¡Escudo de nivel {{level}} encontrado!"),
+                    ("Mod created by {{author}} - Requirements: {{parents}}", "Mod creado por {{author}} - Requisitos: {{parents}}"),
+                    ("Great sword with level {{level}}", "Gran espada de nivel {{level}}"),
+                    ("Farm Quarry", "Cantera de la granja"),
+                    ("Elliot's Cabin", "Cabaña de Elliott"),
+                    ("Iridium Quarry", "Cantera de iridio"),
+                    ("Beer, mead, and pale ale are worth 50% more.", "La cerveza, el hidromiel y la cerveza pálida valen 50% más."),
+                    ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Abigail y Sam fueron a ver a Sebastian, mientras Penny enseñaba a Vincent y Jas cerca de la clínica de Harvey donde Maru trabaja con su padre Demetrius."),
+                    ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Alex ayudó a Haley a tomar fotos mientras Leah tallaba esculturas y Elliott escribía poemas, mientras Caroline y Jodi preparaban la cena con Evelyn y George.")
+                ]
+            },
+            'ru': {
+                'name': 'Русский',
+                'examples': [
+                    ("Level {{level}} shield found!", "Найден щит {{level}} уровня!"),
+                    ("Mod created by {{author}} - Requirements: {{parents}}", "Мод создан {{author}} - Требования: {{parents}}"),
+                    ("Great sword with level {{level}}", "Большой меч {{level}} уровня"),
+                    ("Farm Quarry", "Карьер фермы"),
+                    ("Elliot's Cabin", "Хижина Эллиота"),
+                    ("Iridium Quarry", "Иридиевый карьер"),
+                    ("Beer, mead, and pale ale are worth 50% more.", "Пиво, медовуха и светлый эль стоят на 50% больше."),
+                    ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Эбигейл и Сэм пошли к Себастьяну, пока Пенни учила Винсента и Джас возле клиники Харви, где Мару работает со своим отцом Деметриусом."),
+                    ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Алекс помогал Хейли фотографировать, пока Лия вырезала скульптуры, а Эллиот писал стихи, когда Кэролайн и Джоди готовили ужин с Эвелин и Джорджем.")
+                ]
+            },
+            'pt': {
+                'name': 'Português (BR)',
+                'examples': [
+                    ("Level {{level}} shield found!", "Escudo nível {{level}} encontrado!"),
+                    ("Mod created by {{author}} - Requirements: {{parents}}", "Mod criado por {{author}} - Requisitos: {{parents}}"),
+                    ("Great sword with level {{level}}", "Grande espada nível {{level}}"),
+                    ("Farm Quarry", "Pedreira da fazenda"),
+                    ("Elliot's Cabin", "Cabana do Elliott"),
+                    ("Iridium Quarry", "Pedreira de irídio"),
+                    ("Beer, mead, and pale ale are worth 50% more.", "Cerveja, hidromel e cerveja clara valem 50% a mais."),
+                    ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Abigail e Sam foram ver Sebastian, enquanto Penny ensinava Vincent e Jas perto da clínica do Harvey onde Maru trabalha com seu pai Demetrius."),
+                    ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Alex ajudou Haley a tirar fotos enquanto Leah esculpia e Elliott escrevia poemas, enquanto Caroline e Jodi preparavam o jantar com Evelyn e George.")
+                ]
+            },
+            'it': {
+                'name': 'Italiano',
+                'examples': [
+                    ("Level {{level}} shield found!", "Scudo di livello {{level}} trovato!"),
+                    ("Mod created by {{author}} - Requirements: {{parents}}", "Mod creata da {{author}} - Requisiti: {{parents}}"),
+                    ("Great sword with level {{level}}", "Grande spada di livello {{level}}"),
+                    ("Farm Quarry", "Cava della fattoria"),
+                    ("Elliot's Cabin", "Capanna di Elliott"),
+                    ("Iridium Quarry", "Cava di iridio"),
+                    ("Beer, mead, and pale ale are worth 50% more.", "Birra, idromele e birra chiara valgono il 50% in più."),
+                    ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Abigail e Sam andarono a trovare Sebastian, mentre Penny insegnava a Vincent e Jas vicino alla clinica di Harvey dove Maru lavora con suo padre Demetrius."),
+                    ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Alex aiutò Haley a scattare foto mentre Leah scolpiva e Elliott scriveva poesie, mentre Caroline e Jodi preparavano la cena con Evelyn e George.")
+                ]
+            },
+            'tr': {
+                'name': 'Türkçe',
+                'examples': [
+                    ("Level {{level}} shield found!", "Seviye {{level}} kalkan bulundu!"),
+                    ("Mod created by {{author}} - Requirements: {{parents}}", "{{author}} tarafından oluşturulan mod - Gereksinimler: {{parents}}"),
+                    ("Great sword with level {{level}}", "Seviye {{level}} büyük kılıç"),
+                    ("Farm Quarry", "Çiftlik taş ocağı"),
+                    ("Elliot's Cabin", "Elliott'un kulübesi"),
+                    ("Iridium Quarry", "İridyum taş ocağı"),
+                    ("Beer, mead, and pale ale are worth 50% more.", "Bira, bal şarabı ve açık bira %50 daha değerli."),
+                    ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Abigail ve Sam Sebastian'ı görmeye gitti, Penny ise Harvey'nin kliniği yakınında Vincent ve Jas'a ders veriyordu, Maru'nun babası Demetrius ile çalıştığı yerde."),
+                    ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Alex, Haley'nin fotoğraf çekmesine yardım etti, Leah heykel oyarken Elliott şiir yazıyordu, Caroline ve Jodi ise Evelyn ve George ile akşam yemeği hazırlıyordu.")
+                ]
+            },
+            'hu': {
+                'name': 'Magyar',
+                'examples': [
+                    ("Level {{level}} shield found!", "{{level}}. szintű pajzs találva!"),
+                    ("Mod created by {{author}} - Requirements: {{parents}}", "{{author}} által készített mod - Követelmények: {{parents}}"),
+                    ("Great sword with level {{level}}", "{{level}}. szintű nagy kard"),
+                    ("Farm Quarry", "Farm kőbánya"),
+                    ("Elliot's Cabin", "Elliott kunyhója"),
+                    ("Iridium Quarry", "Irídium kőbánya"),
+                    ("Beer, mead, and pale ale are worth 50% more.", "A sör, mézsör és világos sör 50%-kal többet ér."),
+                    ("Abigail and Sam went to see Sebastian, while Penny was teaching Vincent and Jas near Harvey's clinic where Maru works with her father Demetrius.", "Abigail és Sam elmentek Sebastianhoz, míg Penny Vincent-et és Jas-t tanította Harvey klinikája közelében, ahol Maru az apjával, Demetriusszal dolgozik."),
+                    ("Alex helped Haley take photos while Leah carved sculptures and Elliott wrote poems, as Caroline and Jodi prepared dinner with Evelyn and George.", "Alex segített Haley-nek fotózni, míg Leah szobrokat faragott és Elliott verseket írt, Caroline és Jodi pedig Evelyn-nel és George-dzsal készítették a vacsorát.")
+                ]
+            }
+        }
+        
+        # 获取目标语言配置，默认为中文
+        current_lang = lang_config.get(target_lang, lang_config['zh'])
+        target_lang_name = current_lang['name']
+        glossary = self._get_glossary(target_lang)
+        fake_examples = self._get_masked_examples(target_lang, current_lang['examples'], glossary)
+        if len(memory_examples or []) >= 2:
+            fake_examples = memory_examples
+        elif memory_examples:
+            fake_examples = fake_examples[:-1] + memory_examples
+        
+        # 动态生成用户提示词（游戏标记已替换为 {0} 等编号）
+        user_prompt = f"请将以下星露谷物语文本翻译成{target_lang_name}，{{0}}等花括号编号必须原样保留, 人名和名词等都必须完全翻译,要求符合官方本地化名称, 只返回翻译结果，不需要解释："
+        
+        # 只加在当前翻译请求前的说明
+        prefix = ""
+        if strict:
+            prefix += "注意：上一次的译文不合格。只输出译文本身，不要添加解释、注释或引号，保持与原文相同的换行数量。"
+        if terms:
+            prefix += glossary.format_hint(terms)
+        
+        # 发送带有历史记录的翻译请求
+        base_url = self._get_base_url()
+        
+        model = model or self._current_model()
+        
+        # 按上下文预算装入示例，预算不足时省略最不相关的示例
+        num_predict = self.expansion.num_predict(target_lang, estimate_tokens(text, model_family(model)))
+        if strict:
+            num_predict *= 2
+        fake_history, options = self.prompt_builder.build(model, user_prompt, fake_examples, text, prefix,
+                                                          num_predict)
+        if len(fake_history) < 2 * len(fake_examples) + 1:
+            with self._stats_lock:
+                self.examples_trimmed += 1
+        
+        payload = {
+            "model": model,
+            "messages": fake_history,
+            "stream": False,
+            "options": options
+        }
+        if self.keep_alive:
+            payload["keep_alive"] = self.keep_alive
+        if profiler.enabled:
+            profiler.add("prompt_build", build_start, time.perf_counter() - build_start)
+        
+        metrics = getattr(self.main_app, 'metrics', None) if self.main_app else None
+        import requests  # 延迟导入，避免拖慢启动
+        request_start = time.perf_counter()
+        result = None
+        try:
+            with profiler.span("http_wait"):
+                response = requests.post(f"{base_url}/api/chat", json=payload, timeout=30)
+            self.breaker.record_success()
             if response.status_code == 200:
                 result = response.json()
-                translated_text = result.get('message', {}).get('content', '').strip()
-                return translated_text if translated_text else text
-            else:
-                return text
-                
-        except Exception as e:
-            return text
+        except requests.exceptions.ConnectionError as e:
+            # 服务未启动或已崩溃，交给熔断器判断
+            raise TranslationError(f"{type(e).__name__}: {e}", transient=True, connection=True) from e
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # 超时、连接重置和响应损坏都视为瞬时错误
+            raise TranslationError(f"{type(e).__name__}: {e}", transient=True) from e
+        finally:
+            # 失败的请求也记录耗时，result为None时计为失败
+            if metrics:
+                metrics.record(time.perf_counter() - request_start, result)
+        
+        if result is None:
+            raise TranslationError(f"HTTP {response.status_code}",
+                                   transient=is_transient_status(response.status_code))
+        self._record_load_duration(result, model)
+        if result.get('done_reason') == 'length':
+            # 达到生成长度上限，通常是模型在输出大段解释，截断的译文不可用
+            with self._stats_lock:
+                self.overruns += 1
+            raise ValidationError(f"译文超出生成长度上限（{num_predict} tokens）", ['overrun'])
+        translated_text = result.get('message', {}).get('content', '').strip()
+        return (translated_text if translated_text else text), result.get('eval_count', 0)
+    
+    def _get_masked_examples(self, target_lang: str, examples: List[tuple], glossary=None) -> List[tuple]:
+        """示例对话中的占位符按与待翻译文本相同的方式屏蔽，按语言缓存
+        
+        启用术语表时，去掉主要用来示范人名译法的示例（命中3个及以上术语），人名改由术语表按需注入。
+        """
+        cache_key = (target_lang, glossary is not None)
+        masked = self._example_cache.get(cache_key)
+        if masked is None:
+            masked = []
+            for original, translation in examples:
+                if glossary is not None and len(glossary.find_terms(original)) >= 3:
+                    continue
+                pair = self.translation_core.mask_pair(original, translation)
+                if pair:
+                    masked.append(pair)
+            self._example_cache[cache_key] = masked
+        return masked
     
     def translate_batch_async(self, texts: List[str], target_lang: str, batch_size: int,
                             progress_callback: Optional[Callable] = None,
                             stop_check: Optional[Callable] = None,
-                            result_callback: Optional[Callable] = None) -> List[str]:
-        """异步批量翻译（真正的批量翻译实现）"""
+                            result_callback: Optional[Callable] = None,
+                            failure_callback: Optional[Callable] = None,
+                            priority: Optional[List[int]] = None) -> List[str]:
+        """异步批量翻译（真正的批量翻译实现）
+        
+        条目按调度器决定的顺序逐个发送（默认按原文长度分桶，见 scheduler 模块），
+        同一时刻在途的请求数不超过并发数，停止时没有排队中的任务需要取消。
+        重试用尽的条目先进入失败队列，其余条目全部完成后再统一重试一轮（永久错误不再重试）；
+        仍然失败的条目保留原文，只通过 failure_callback(index, 原文, 错误) 通知，不调用 result_callback。
+        priority 中的条目（如界面上可见的条目）先发送，进行中还可以通过 prioritize 插入优先通道。
+        """
+        import concurrent.futures  # 延迟导入，避免拖慢启动
         results = [None] * len(texts)
         total = len(texts)
         completed = 0
+        failed: Dict[int, Exception] = {}
+        ever_invalid = set()
         lock = threading.Lock()
+        by_length = True
+        validation_retries = 1
+        if self.main_app and hasattr(self.main_app, 'config_manager'):
+            by_length = self.main_app.config_manager.get('schedule_by_length', True)
+            validation_retries = self.main_app.config_manager.get('validation_retries', 1)
+            self._prepare_semantic_examples(texts, target_lang)
         
-        # 使用真正的异步处理，不等待整批完成
-        max_workers = min(batch_size, len(texts))  # 根据批量大小设置并发数
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # 直接提交单个翻译任务，而不是批次
-            future_to_index = {
-                executor.submit(self.translate_single_text, text, target_lang): i
-                for i, text in enumerate(texts)
-            }
-            
-            # 异步收集结果，不等待所有任务完成
-            for future in concurrent.futures.as_completed(future_to_index):
-                try:
-                    index = future_to_index[future]
-                    translated_text = future.result()
-                    results[index] = translated_text if translated_text else texts[index]
-                    
-                    # 立即更新进度和回调
-                    with lock:
-                        completed += 1
-                        if progress_callback:
-                            progress_callback(completed, total, f"已完成 {completed}/{total} 条翻译")
-                        
-                        if result_callback:
-                            result_callback(index, texts[index], results[index])
-                            
-                except Exception as e:
-                    index = future_to_index[future]
-                    results[index] = texts[index]  # 失败时保留原文
-                    with lock:
-                        completed += 1
-                        if progress_callback:
-                            progress_callback(completed, total, f"已完成 {completed}/{total} 条翻译（第{index+1}条失败）")
+        def run(indices, strict: bool = False) -> bool:
+            """并发翻译指定条目，返回是否未被停止"""
+            nonlocal completed
+            # 使用真正的异步处理，不等待整批完成
+            max_workers = max(1, min(batch_size, len(indices)))  # 根据批量大小设置并发数
+            scheduler = create_scheduler(texts, indices, max_workers, by_length)
+            if priority:
+                scheduler.promote(priority)
+            self._active_scheduler = scheduler
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                running = {}
+                
+                def dispatch():
+                    # 补满空闲的并发，由调度器决定下一条
+                    while len(running) < max_workers:
+                        i = scheduler.next()
+                        if i is None:
+                            break
+                        running[executor.submit(self.translate_text, texts[i], target_lang, stop_check, strict)] = i
                 
-                if stop_check and stop_check():
-                    # 取消所有未完成的任务
-                    for f in future_to_index:
-                        if not f.done():
+                dispatch()
+                # 异步收集结果，每完成一条就补发下一条
+                while running:
+                    done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        index = running.pop(future)
+                        scheduler.done(index)
+                        try:
+                            translated_text = future.result()
+                        except Exception as e:
+                            failed[index] = e
+                            if isinstance(e, ValidationError):
+                                ever_invalid.add(index)
+                        else:
+                            failed.pop(index, None)
+                            results[index] = translated_text if translated_text else texts[index]
+                            
+                            # 立即更新进度和回调
+                            with lock:
+                                completed += 1
+                                if progress_callback:
+                                    progress_callback(completed, total, f"已完成 {completed}/{total} 条翻译")
+                                
+                                if result_callback:
+                                    result_callback(index, texts[index], results[index])
+                    
+                    if stop_check and stop_check():
+                        # 在途的请求完成后即退出，未发送的条目保留原文
+                        for f in running:
                             f.cancel()
-                    break
+                        return False
+                    dispatch()
+            return True
+        
+        finished = run(range(total))
+        
+        # 失败队列：只重试瞬时错误
+        retry_indices = [i for i, e in sorted(failed.items()) if getattr(e, 'transient', False)]
+        if finished and retry_indices:
+            if self.main_app:
+                self.main_app.log_message(f"{len(retry_indices)} 条翻译失败，正在队列末尾重试...", "WARNING")
+            before = len(failed)
+            finished = run(retry_indices)
+            with self._stats_lock:
+                self.recovered += before - len(failed)
+        
+        # 未通过校验的条目用更严格的提示词重新排队，最多 validation_retries 轮
+        for _ in range(max(0, validation_retries)):
+            invalid = [i for i, e in sorted(failed.items()) if isinstance(e, ValidationError)]
+            if not finished or not invalid:
+                break
+            if self.main_app:
+                self.main_app.log_message(f"{len(invalid)} 条译文未通过校验，正在使用更严格的提示词重译...", "WARNING")
+            finished = run(invalid, strict=True)
+        self._active_scheduler = None
+        
+        still_invalid = sum(1 for e in failed.values() if isinstance(e, ValidationError))
+        self.last_batch_validation = {
+            'passed': sum(1 for result in results if result is not None),
+            'rejected': len(ever_invalid),
+            'fixed': len(ever_invalid) - still_invalid,
+            'failed': still_invalid
+        }
+        with self._stats_lock:
+            self.validation_rejected += len(ever_invalid)
+            self.validation_fixed += len(ever_invalid) - still_invalid
+        
+        if finished:
+            for index, error in sorted(failed.items()):
+                if not isinstance(error, TranslationError):
+                    error = TranslationError(str(error), transient=False)
+                self._record_failure(error)
+                results[index] = texts[index]  # 失败时保留原文
+                with lock:
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, total, f"已完成 {completed}/{total} 条翻译（第{index+1}条失败）")
+                if failure_callback:
+                    failure_callback(index, texts[index], error)
         
         # 对于未处理的条目，保留原文
         for i, result in enumerate(results):
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+性能剖析模块
+可选开启的分阶段计时：在JSON解析、提示词构建、HTTP等待、保存、界面刷新、
+解压和压缩等位置记录时间区间，导出Chrome trace格式文件并输出各阶段汇总
+"""
+
+import functools
+import math
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+# 通过命令行参数或环境变量开启（也可通过配置项 profiling 开启）
+PROFILE_FLAG = "--profile"
+PROFILE_ENV = "STARDEW_TRANSLATOR_PROFILE"
+
+# 最多保留的事件数，避免长时间运行时内存无限增长
+MAX_EVENTS = 200000
+
+
+class Profiler:
+    """分阶段计时器
+
+    关闭时 span 只做一次布尔判断，不记录任何数据。
+    事件以 (名称, 线程ID, 开始时间, 持续时间, 附加参数) 保存，时间单位为微秒。
+    """
+
+    def __init__(self):
+        """初始化剖析器"""
+        self.enabled = PROFILE_FLAG in sys.argv or os.environ.get(PROFILE_ENV) == "1"
+        self._events: List[tuple] = []
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self.dropped = 0
+
+    def reset(self) -> None:
+        """清空已记录的事件"""
+        with self._lock:
+            self._events = []
+            self._thread_names = {}
+            self.dropped = 0
+        self._origin = time.perf_counter()
+
+    def has_events(self) -> bool:
+        """是否记录了事件"""
+        return bool(self._events)
+
+    def add(self, name: str, start: float, duration: float, args: Optional[dict] = None) -> None:
+        """追加一个已完成的时间区间
+
+        Args:
+            name: 阶段名称
+            start: 开始时间（time.perf_counter）
+            duration: 持续时间（秒）
+            args: 附加参数，会写入trace
+        """
+        thread = threading.current_thread()
+        tid = thread.native_id or thread.ident
+        event = (name, tid, (start - self._origin) * 1e6, duration * 1e6, args)
+        with self._lock:
+            if len(self._events) >= MAX_EVENTS:
+                self.dropped += 1
+                return
+            self._events.append(event)
+            if tid not in self._thread_names:
+                self._thread_names[tid] = thread.name
+
+    @contextmanager
+    def _span(self, name: str, args: Optional[dict]):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, start, time.perf_counter() - start, args)
+
+    def span(self, name: str, **args):
+        """记录一个代码块的耗时
+
+        用法：with profiler.span("http_wait", model=model): ...
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(name, args or None)
+
+    def profiled(self, name: str):
+        """函数装饰器，记录每次调用的耗时"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.add(name, start, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def summary(self) -> List[Dict[str, float]]:
+        """按阶段汇总，按总耗时从高到低排列
+
+        Returns:
+            每个阶段的调用次数、总耗时、平均、p95和最大耗时（毫秒）
+        """
+        with self._lock:
+            events = list(self._events)
+        durations: Dict[str, List[float]] = {}
+        for name, _tid, _ts, dur, _args in events:
+            durations.setdefault(name, []).append(dur / 1000.0)
+        rows = []
+        for name, values in durations.items():
+            values.sort()
+            rows.append({
+                "name": name,
+                "count": len(values),
+                "total_ms": sum(values),
+                "mean_ms": sum(values) / len(values),
+                "p95_ms": values[max(0, math.ceil(0.95 * len(values)) - 1)],
+                "max_ms": values[-1],
+            })
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows
+
+    def format_summary(self) -> str:
+        """生成多行的阶段汇总文本"""
+        lines = [f"{'阶段':<24}{'次数':>8}{'总计ms':>12}{'平均ms':>10}{'p95ms':>10}{'最大ms':>10}"]
+        for row in self.summary():
+            lines.append(f"{row['name']:<24}{row['count']:>8}{row['total_ms']:>12.1f}"
+                         f"{row['mean_ms']:>10.2f}{row['p95_ms']:>10.2f}{row['max_ms']:>10.2f}")
+        if self.dropped:
+            lines.append(f"（事件数超过上限，丢弃 {self.dropped} 个）")
+        return "\n".join(lines)
+
+    def export_chrome_trace(self, file_path: Path) -> Path:
+        """导出Chrome trace格式文件（可在 chrome://tracing 或 Perfetto 中打开）"""
+        import json  # 只在导出时需要
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+        pid = os.getpid()
+        trace = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                 for tid, name in thread_names.items()]
+        for name, tid, ts, dur, args in events:
+            event = {"name": name, "cat": name.split(".", 1)[0], "ph": "X",
+                     "ts": round(ts, 1), "dur": round(dur, 1), "pid": pid, "tid": tid}
+            if args:
+                event["args"] = args
+            trace.append(event)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        return file_path
+
+
+class _NullSpan:
+    """关闭剖析时使用的空上下文"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+# 全局剖析器实例
+profiler = Profiler()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+提示词构建模块
+按模型家族估算token数，把示例对话、术语提示和待翻译文本装进上下文预算，
+并生成对应的 num_ctx、num_predict 请求参数：小模型用较小的上下文跑得更快，
+任务开始时按最长的条目确定上下文大小，任务期间保持不变（num_ctx 变化会让Ollama重新加载模型）；
+生成长度上限按本次运行已完成译文的扩展比例学习
+"""
+
+import re
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+# 各模型家族的估算参数：(每token的拉丁字符数, 每个汉字/假名/谚文的token数)
+FAMILY_TOKEN_RATIOS = {
+    'qwen': (3.8, 0.8),
+    'deepseek': (3.8, 0.8),
+    'llama': (4.0, 1.2),
+    'gemma': (4.0, 0.9),
+    'mistral': (3.6, 1.5),
+    'phi': (3.8, 1.3),
+    'default': (3.5, 1.5),
+}
+
+# 聊天模板给每条消息附加的token数（角色标记等）
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# 按模型参数量选择的默认上下文大小：(参数量上限（十亿）, num_ctx)
+CONTEXT_SIZES = ((4, 2048), (10, 4096), (float('inf'), 8192))
+
+# 无法从模型名判断参数量时的上下文大小
+DEFAULT_CONTEXT_SIZE = 4096
+
+# 长条目需要时上下文最多扩大到的大小
+MAX_CONTEXT_SIZE = 32768
+
+# 规划上下文时为翻译说明、术语表和严格要求预留的token数
+PROMPT_RESERVE_TOKENS = 256
+
+# 生成长度上限：原文token数的倍数加固定余量（倍数在学到扩展比例之前使用）
+PREDICT_RATIO = 3.0
+PREDICT_MARGIN = 32
+
+# 扩展比例学习：最少样本数、保留的最近样本数、取的分位数和额外余量
+MIN_RATIO_SAMPLES = 20
+RATIO_WINDOW = 200
+RATIO_QUANTILE = 0.95
+RATIO_HEADROOM = 1.5
+
+# 汉字、假名、谚文每个字符单独计数，其余按字符数折算
+_CJK_CHARS = re.compile(r'[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]')
+_PARAMETER_SIZE = re.compile(r'(\d+(?:\.\d+)?)b\b', re.IGNORECASE)
+
+
+def model_family(model: Optional[str]) -> str:
+    """从模型名判断模型家族（如 qwen2.5:7b -> qwen）"""
+    name = (model or '').lower()
+    for family in FAMILY_TOKEN_RATIOS:
+        if family in name:
+            return family
+    return 'default'
+
+
+@lru_cache(maxsize=8192)
+def estimate_tokens(text: str, family: str = 'default') -> int:
+    """估算文本的token数（偏保守，宁可高估）"""
+    if not text:
+        return 0
+    chars_per_token, tokens_per_cjk = FAMILY_TOKEN_RATIOS.get(family, FAMILY_TOKEN_RATIOS['default'])
+    cjk = len(_CJK_CHARS.findall(text)) if not text.isascii() else 0
+    return int((len(text) - cjk) / chars_per_token + cjk * tokens_per_cjk) + 1
+
+
+def default_context_size(model: Optional[str]) -> int:
+    """按模型名中的参数量（如 :3b、:14b）选择上下文大小"""
+    match = _PARAMETER_SIZE.search(model or '')
+    if not match:
+        return DEFAULT_CONTEXT_SIZE
+    size = float(match.group(1))
+    for limit, num_ctx in CONTEXT_SIZES:
+        if size <= limit:
+            return num_ctx
+    return DEFAULT_CONTEXT_SIZE
+
+
+class ExpansionEstimator:
+    """按目标语言学习 译文token数 / 原文估算token数，给出每个条目的生成长度上限
+
+    取最近样本的高分位数再乘以余量，正常译文不会被截断，而模型开始输出大段解释时能及早停止。
+    """
+
+    def __init__(self):
+        self._samples: dict = {}
+        self._ratios: dict = {}
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._ratios.clear()
+
+    def record(self, lang: str, source_tokens: int, output_tokens: int) -> None:
+        """记录一条通过校验的译文"""
+        if source_tokens <= 0 or output_tokens <= 0:
+            return
+        with self._lock:
+            samples = self._samples.setdefault(lang, deque(maxlen=RATIO_WINDOW))
+            samples.append(output_tokens / source_tokens)
+            if len(samples) >= MIN_RATIO_SAMPLES:
+                ordered = sorted(samples)
+                quantile = ordered[min(len(ordered) - 1, int(len(ordered) * RATIO_QUANTILE))]
+                self._ratios[lang] = min(quantile * RATIO_HEADROOM, PREDICT_RATIO * 2)
+
+    def ratio(self, lang: str) -> float:
+        """当前使用的扩展比例，样本不足时为 PREDICT_RATIO"""
+        return self._ratios.get(lang, PREDICT_RATIO)
+
+    def num_predict(self, lang: str, source_tokens: int) -> int:
+        """条目的生成长度上限"""
+        return int(source_tokens * self.ratio(lang)) + PREDICT_MARGIN
+
+
+class PromptBuilder:
+    """在上下文预算内组装翻译请求"""
+
+    def __init__(self, num_ctx: int = 0):
+        """初始化提示词构建器
+
+        Args:
+            num_ctx: 固定的上下文大小，0表示按模型参数量自动选择
+        """
+        self.num_ctx = num_ctx
+        # 本次任务最长的待翻译文本和按模型确定的上下文大小
+        self._longest = ''
+        self._planned: Dict[str, int] = {}
+
+    def plan(self, texts: Sequence[str]) -> None:
+        """按本次任务的全部待翻译文本重新确定各模型的上下文大小（预热前调用）"""
+        self._longest = max(texts, key=len, default='')
+        self._planned = {}
+
+    def context_size(self, model: Optional[str]) -> int:
+        """模型在本次任务中使用的上下文大小
+
+        基准大小（按参数量或配置）放不下最长的条目时按倍数扩大；同一任务内保持不变，
+        预热和所有翻译请求使用相同的值，避免Ollama因参数变化重新加载模型。
+        """
+        key = model or ''
+        num_ctx = self._planned.get(key)
+        if num_ctx is None:
+            num_ctx = self.num_ctx if self.num_ctx > 0 else default_context_size(model)
+            source_tokens = estimate_tokens(self._longest, model_family(model))
+            needed = source_tokens + PROMPT_RESERVE_TOKENS + int(source_tokens * PREDICT_RATIO) + PREDICT_MARGIN
+            while needed > num_ctx and num_ctx < MAX_CONTEXT_SIZE:
+                num_ctx *= 2
+            self._planned[key] = num_ctx
+        return num_ctx
+
+    def build(self, model: Optional[str], instruction: str, examples: Sequence[Tuple[str, str]],
+              text: str, prefix: str = '', num_predict: Optional[int] = None) -> Tuple[List[Dict[str, str]], Dict[str, int]]:
+        """组装消息列表和请求参数
+
+        待翻译文本和前缀（术语表、严格要求）总是保留；示例按顺序越靠后越相关，
+        从后往前装入，放不下的示例跳过（较短的示例仍可装入）；
+        上下文大小不随单个请求变化，放不下时压缩生成长度上限。
+
+        Args:
+            model: 模型名称
+            instruction: 每条用户消息前的翻译说明
+            examples: 示例对话 (原文, 译文) 列表
+            text: 待翻译文本
+            prefix: 只加在当前请求前的说明
+            num_predict: 生成长度上限，默认为原文token数的 PREDICT_RATIO 倍加余量
+
+        Returns:
+            (消息列表, Ollama options)
+        """
+        family = model_family(model)
+        instruction_tokens = estimate_tokens(instruction, family) + MESSAGE_OVERHEAD_TOKENS
+        request = f"{prefix}{instruction} {text}"
+        request_tokens = estimate_tokens(request, family) + MESSAGE_OVERHEAD_TOKENS
+        if num_predict is None:
+            num_predict = int(estimate_tokens(text, family) * PREDICT_RATIO) + PREDICT_MARGIN
+
+        num_ctx = self.context_size(model)
+        num_predict = max(PREDICT_MARGIN, min(num_predict, num_ctx - request_tokens))
+
+        budget = num_ctx - request_tokens - num_predict
+        selected = []
+        for original, translation in reversed(examples):
+            cost = (instruction_tokens + estimate_tokens(original, family)
+                    + estimate_tokens(translation, family) + MESSAGE_OVERHEAD_TOKENS)
+            if cost > budget:
+                continue
+            budget -= cost
+            selected.append((original, translation))
+
+        messages = []
+        for original, translation in reversed(selected):
+            messages.extend([
+                {"role": "user", "content": f"{instruction} {original}"},
+                {"role": "assistant", "content": translation}
+            ])
+        messages.append({"role": "user", "content": request})
+        return messages, {"num_ctx": num_ctx, "num_predict": num_predict}
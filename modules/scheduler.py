@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译调度模块
+决定批量翻译中条目的发送顺序：按原文长度分桶，短条目从短到长依次发送，
+长条目从长到短穿插发送并限制同时进行的数量，避免长对话占满所有并发而让短名称排队；
+界面上可见的条目和用户双击的条目可以随时插入优先通道，排在批量队列之前发送
+"""
+
+import threading
+from collections import deque
+from typing import Iterable, Optional, Sequence
+
+
+# 原文超过该字符数视为长条目（多句对话、说明文字）
+LONG_TEXT_CHARS = 200
+
+
+class FifoScheduler:
+    """按文件顺序发送，用于对比和关闭长度调度时"""
+
+    def __init__(self, texts: Sequence[str], indices: Sequence[int]):
+        self._pending = deque(indices)
+
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def next(self) -> Optional[int]:
+        """取出下一个要发送的条目索引，没有时返回None"""
+        return self._pending.popleft() if self._pending else None
+
+    def done(self, index: int) -> None:
+        """通知条目已完成"""
+
+
+class LengthScheduler(FifoScheduler):
+    """按原文长度分桶的调度器
+
+    - 短条目和中等条目按长度从短到长发送，尽早完成尽量多的条目
+    - 长条目从长到短发送，同时进行的数量不超过 max_long，其余并发留给短条目；
+      短条目全部发出后不再限制，让剩余长条目用满并发，缩短总耗时
+    """
+
+    def __init__(self, texts: Sequence[str], indices: Sequence[int], workers: int = 1,
+                 long_chars: int = LONG_TEXT_CHARS, max_long: Optional[int] = None):
+        """初始化调度器
+
+        Args:
+            texts: 全部原文
+            indices: 本轮要发送的条目索引
+            workers: 并发数
+            long_chars: 长条目的字符数阈值
+            max_long: 同时进行的长条目上限，默认为并发数的一半
+        """
+        long_indices = [i for i in indices if len(texts[i]) > long_chars]
+        long_set = set(long_indices)
+        short_indices = [i for i in indices if i not in long_set]
+        # 稳定排序：相同长度保持文件顺序
+        self._short = deque(sorted(short_indices, key=lambda i: len(texts[i])))
+        self._long = deque(sorted(long_indices, key=lambda i: -len(texts[i])))
+        self._long_set = long_set
+        self.max_long = max_long if max_long is not None else max(1, workers // 2)
+        self.running_long = 0
+
+    def has_pending(self) -> bool:
+        return bool(self._short or self._long)
+
+    def next(self) -> Optional[int]:
+        if self._long and (self.running_long < self.max_long or not self._short):
+            self.running_long += 1
+            return self._long.popleft()
+        if self._short:
+            return self._short.popleft()
+        return None
+
+    def done(self, index: int) -> None:
+        if index in self._long_set:
+            self.running_long -= 1
+
+
+class PriorityLanes:
+    """在批量调度器之前增加优先通道
+
+    promote 可以在其他线程（界面线程）调用：被提升且尚未发送的条目在下一个空闲并发时优先发送，
+    批量队列照常进行，之后轮到这些条目时跳过。
+    """
+
+    def __init__(self, bulk: FifoScheduler, indices: Sequence[int]):
+        """初始化优先通道
+
+        Args:
+            bulk: 批量队列的调度器
+            indices: 本轮要发送的条目索引
+        """
+        self.bulk = bulk
+        self._pending = set(indices)
+        self._priority = deque()
+        self._from_bulk = set()
+        self.promoted = 0
+        self._lock = threading.Lock()
+
+    def promote(self, indices: Iterable[int]) -> int:
+        """把尚未发送的条目移到优先通道（后提升的先发送）
+
+        Returns:
+            实际提升的条目数
+        """
+        with self._lock:
+            promoted = [i for i in dict.fromkeys(indices) if i in self._pending]
+            # 最新的请求最能代表用户当前关注的内容
+            self._priority.extendleft(reversed(promoted))
+            self.promoted += len(promoted)
+            return len(promoted)
+
+    def has_pending(self) -> bool:
+        with self._lock:
+            return bool(self._pending)
+
+    def next(self) -> Optional[int]:
+        with self._lock:
+            while self._priority:
+                index = self._priority.popleft()
+                if index in self._pending:
+                    self._pending.discard(index)
+                    return index
+            while self.bulk.has_pending():
+                index = self.bulk.next()
+                if index is None:
+                    return None
+                if index in self._pending:
+                    self._pending.discard(index)
+                    self._from_bulk.add(index)
+                    return index
+                # 已经从优先通道发送过，撤销批量调度器的计数
+                self.bulk.done(index)
+            return None
+
+    def done(self, index: int) -> None:
+        with self._lock:
+            if index in self._from_bulk:
+                self._from_bulk.discard(index)
+                self.bulk.done(index)
+
+
+def create_scheduler(texts: Sequence[str], indices: Sequence[int], workers: int,
+                     by_length: bool = True) -> PriorityLanes:
+    """创建调度器
+
+    Args:
+        texts: 全部原文
+        indices: 本轮要发送的条目索引
+        workers: 并发数
+        by_length: 是否按长度调度，False时按文件顺序
+
+    Returns:
+        带优先通道的调度器
+    """
+    indices = list(indices)
+    if by_length:
+        return PriorityLanes(LengthScheduler(texts, indices, workers), indices)
+    return PriorityLanes(FifoScheduler(texts, indices), indices)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+启动计时模块
+记录冷启动各阶段（模块导入、配置加载、界面创建等）的耗时并生成报告
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+
+# 通过命令行参数或环境变量开启启动计时报告
+STARTUP_REPORT_FLAG = "--startup-report"
+STARTUP_REPORT_ENV = "STARDEW_TRANSLATOR_STARTUP_REPORT"
+
+
+class StartupTimer:
+    """启动阶段计时器"""
+
+    def __init__(self):
+        """初始化计时器，以创建时刻作为启动起点"""
+        self.start_time = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self.enabled = STARTUP_REPORT_FLAG in sys.argv or os.environ.get(STARTUP_REPORT_ENV) == "1"
+
+    @contextmanager
+    def phase(self, name: str):
+        """记录一个阶段的耗时
+
+        Args:
+            name: 阶段名称
+        """
+        phase_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - phase_start))
+
+    def elapsed(self) -> float:
+        """获取从启动起点到现在的总耗时（秒）"""
+        return time.perf_counter() - self.start_time
+
+    def report(self) -> str:
+        """生成启动计时报告
+
+        Returns:
+            多行报告文本，按阶段耗时从高到低排列
+        """
+        total = self.elapsed()
+        lines = [f"启动耗时 {total * 1000:.1f} ms"]
+        for name, duration in sorted(self.phases, key=lambda item: item[1], reverse=True):
+            share = duration / total * 100 if total > 0 else 0.0
+            lines.append(f"  {name:<28} {duration * 1000:8.1f} ms  {share:5.1f}%")
+        return "\n".join(lines)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文本分类模块
+批量判断i18n条目是否需要翻译：按文字系统（拉丁、带变音的拉丁、汉字、假名、谚文、西里尔）
+统计字符，根据目标语言的文字系统判断条目是否已译，正则预编译，相同文本的判断结果缓存复用
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from .translation_core import GAME_TOKEN_PATTERN
+
+
+# 一次扫描按文字系统切分字符段
+SCRIPT_PATTERN = re.compile(
+    r'(?P<latin>[A-Za-z]+)'
+    r'|(?P<latin_ext>[\u00c0-\u00d6\u00d8-\u00f6\u00f8-\u024f\u1e00-\u1eff]+)'
+    r'|(?P<han>[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+)'
+    r'|(?P<kana>[\u3040-\u30ff\u31f0-\u31ff\uff66-\uff9f]+)'
+    r'|(?P<hangul>[\u1100-\u11ff\u3130-\u318f\uac00-\ud7af]+)'
+    r'|(?P<cyrillic>[\u0400-\u04ff]+)'
+)
+SCRIPTS = ('latin', 'latin_ext', 'han', 'kana', 'hangul', 'cyrillic')
+
+# 游戏标记的起始字符，文本中都不含时跳过标记剔除
+TOKEN_CHARS = '{[#$@^'
+
+# 删除ASCII字母的转换表，纯ASCII文本用长度差计算字母数
+_ASCII_LETTERS_TABLE = str.maketrans('', '', 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz')
+_ASCII_LETTER = re.compile(r'[A-Za-z]')
+
+# 各目标语言使用的文字系统（未列出的语言按拉丁字母处理）
+TARGET_SCRIPTS = {
+    'zh': ('han',),
+    'ja': ('han', 'kana'),
+    'ko': ('hangul', 'han'),
+    'ru': ('cyrillic',),
+    'default': ('latin', 'latin_ext'),
+}
+LATIN_SCRIPTS = ('latin', 'latin_ext')
+
+# 目标文字占字母的比例低于该值时视为未翻译（相当于原来“英文占比超过70%”）
+MIN_TARGET_SHARE = 0.3
+
+# 拉丁字母目标语言没有原文对照时，ASCII字母占比超过该值且没有变音字母视为英文
+ENGLISH_THRESHOLD = 0.7
+
+# 判断结果缓存的最大条目数，超过后清空
+CACHE_LIMIT = 200000
+
+
+class TextClassifier:
+    """按目标语言判断条目是否需要翻译"""
+
+    def __init__(self, target_lang: str = 'zh'):
+        """初始化分类器
+
+        Args:
+            target_lang: 目标语言代码（与 language_codes 一致，英文为 default）
+        """
+        self._cache: Dict[Tuple[str, bool], bool] = {}
+        self.set_target_lang(target_lang)
+
+    def set_target_lang(self, target_lang: str) -> None:
+        """切换目标语言，语言变化时清空缓存"""
+        if getattr(self, 'target_lang', None) == target_lang:
+            return
+        self.target_lang = target_lang
+        self.target_scripts = TARGET_SCRIPTS.get(target_lang, LATIN_SCRIPTS)
+        # 法语、德语等拉丁字母语言无法单靠文字系统与英文区分
+        self.target_is_latin = self.target_scripts == LATIN_SCRIPTS
+        self.ambiguous_latin = self.target_is_latin and target_lang != 'default'
+        self._cache.clear()
+
+    @staticmethod
+    def script_counts(text: str) -> Dict[str, int]:
+        """统计各文字系统的字符数（不含占位符和游戏标记）"""
+        if any(char in text for char in TOKEN_CHARS):
+            text = GAME_TOKEN_PATTERN.sub(' ', text)
+        counts = dict.fromkeys(SCRIPTS, 0)
+        if text.isascii():
+            # 大多数待翻译原文是纯ASCII，不需要逐段匹配
+            counts['latin'] = len(text) - len(text.translate(_ASCII_LETTERS_TABLE))
+            return counts
+        for match in SCRIPT_PATTERN.finditer(text):
+            counts[match.lastgroup] += match.end() - match.start()
+        return counts
+
+    def needs_translation(self, text: str, original: Optional[str] = None) -> bool:
+        """判断单个条目是否需要翻译
+
+        Args:
+            text: 译文文件中的当前文本
+            original: 对应的原文，没有原文文件时为None
+
+        Returns:
+            是否需要翻译
+        """
+        if not text or not text.strip():
+            return True
+        # 与原文相同说明尚未翻译
+        if original is not None and text == original:
+            return True
+
+        cache_key = (text, original is None)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        if len(self._cache) >= CACHE_LIMIT:
+            self._cache.clear()
+        result = self._classify(text, original is None)
+        self._cache[cache_key] = result
+        return result
+
+    def _classify(self, text: str, no_original: bool) -> bool:
+        if text.isascii():
+            # 纯ASCII文本的字母都是拉丁字母，只需判断是否含字母
+            if any(char in text for char in TOKEN_CHARS):
+                text = GAME_TOKEN_PATTERN.sub(' ', text)
+            if not _ASCII_LETTER.search(text):
+                return False
+            return not self.target_is_latin or (self.ambiguous_latin and no_original)
+        
+        counts = self.script_counts(text)
+        letters = sum(counts.values())
+        # 没有字母（纯数字、符号、占位符）不需要翻译
+        if not letters:
+            return False
+        target = sum(counts[script] for script in self.target_scripts)
+        if target / letters < MIN_TARGET_SHARE:
+            return True
+        if self.ambiguous_latin and no_original:
+            return counts['latin_ext'] == 0 and counts['latin'] / letters > ENGLISH_THRESHOLD
+        return False
+
+    def classify(self, data: dict, original_data: Optional[dict] = None) -> Tuple[List[str], List[str], int, int]:
+        """批量筛选需要翻译的条目
+
+        Args:
+            data: 译文文件数据
+            original_data: 原文文件数据，可选
+
+        Returns:
+            (待翻译键列表, 待翻译文本列表, 文本条目总数, 跳过条目数)
+        """
+        keys, values = [], []
+        total = 0
+        needs_translation = self.needs_translation
+        for key, value in data.items():
+            if not isinstance(value, str) or not value.strip() or value.startswith("["):
+                continue
+            total += 1
+            original = original_data.get(key) if original_data else None
+            if needs_translation(value, original if isinstance(original, str) else None):
+                keys.append(key)
+                values.append(value)
+        return keys, values, total, total - len(keys)
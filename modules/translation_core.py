@@ -6,9 +6,68 @@
 """
 
 import re
+import threading
+import time
 from typing import Dict, List, Optional, Tuple
 
 
+# 游戏的文本标签名称（[LocalizedText Strings\UI:Key]、[FarmName] 等），其余方括号中的文字照常翻译
+GAME_TAG_NAMES = (
+    'AchievementName', 'ArticleFor', 'CapitalizeFirstLetter', 'CharacterName', 'DataString', 'DayOfMonth',
+    'DayOfWeek', 'EscapedText', 'FarmerStat', 'FarmerUniqueId', 'FarmName', 'GenderedText', 'ItemName',
+    'ItemNameWithFlavor', 'LocalizedText', 'LocationName', 'MovieName', 'NumberWithSeparators',
+    'PositiveAdjective', 'Season', 'SpouseFarmerText', 'SpouseGenderedText', 'SuggestedItem', 'ToolName',
+)
+
+# 发送给模型前需要屏蔽的游戏标记，按优先级排列：
+# {{变量}}、已有的{n}、[74 128]/[(O)128] 物品编号、[文本标签]、[CP] 等内容包缩写、[#] 邮件标题分隔、
+# #$b# 等对话分隔、$h 等头像表情、@ 玩家名、^ 性别分隔
+GAME_TOKEN_PATTERN = re.compile(
+    r'\{\{[^}]+\}\}'
+    r'|\{\d+\}'
+    r'|\[(?:\(\w+\)\w+|\d+)(?: (?:\(\w+\)\w+|\d+))*\]'
+    r'|\[(?:' + '|'.join(sorted(GAME_TAG_NAMES, key=len, reverse=True)) + r')(?: [^\[\]\r\n]*)?\]'
+    r'|\[[A-Z]{2,5}\]'
+    r'|\[#\]'
+    r'|#\$[a-z]#'
+    r'|\$(?:[hslauek]|\d+)(?![A-Za-z])'
+    r'|[@^]'
+)
+
+# 屏蔽标记的格式：{0}、{1}……，比原标记更短，模型也习惯原样保留
+SENTINEL_PATTERN = re.compile(r'\{(\d+)\}')
+
+# 模型在译文前附加的说明：开头的“译文：”和“以下是……翻译”
+# （译文本身以“注意：”“以下是”开头属于正常翻译，如 Caution: → 注意：）
+EXPLANATION_PATTERN = re.compile(
+    r'^\s*(?:翻译|译文|翻译结果|Translation|Translated text)\s*[:：]'
+    r'|以下是[^\n]{0,20}?(?:翻译|译文)|Here(?: is|\'s) (?:the|your|my) translation',
+    re.IGNORECASE
+)
+
+# 模型在译文之后另起一行附加的注释（只在译文比原文多出行时检查）
+NOTE_PATTERN = re.compile(r'\S[^\n]*\n\s*[（(]?(?:注|注意|说明|Note|Explanation)\s*[:：]', re.IGNORECASE)
+
+# 译文与原文的字符数比例范围，超出视为异常；中日韩文字信息密度高，下限更低
+LENGTH_RATIO_RANGE = {'cjk': (0.1, 2.0), 'default': (0.3, 3.0)}
+CJK_LANGUAGES = {'zh', 'ja', 'ko'}
+
+# 原文少于该字符数时不检查长度比例（短名称的比例波动太大）
+LENGTH_RATIO_MIN_CHARS = 20
+
+# 校验问题的说明
+VALIDATION_ISSUE_LABELS = {
+    'empty': '译文为空',
+    'placeholders': '游戏标记不一致',
+    'line_breaks': '换行数量不一致',
+    'length_ratio': '长度比例异常',
+    'explanation': '包含解释说明',
+    'untranslated': '未翻译',
+    'glossary': '术语不一致',
+    'overrun': '超出生成长度上限',
+}
+
+
 class TranslationCore:
     """翻译核心处理类"""
     
@@ -29,25 +88,66 @@ class TranslationCore:
         return self.placeholder_pattern.findall(text)
     
     def preserve_placeholders(self, text: str) -> Tuple[str, Dict[str, str]]:
-        """保护占位符，替换为临时标记
+        """保护占位符和游戏标记，按出现顺序替换为 {0}、{1}…… 形式的屏蔽标记
         
         Args:
             text: 原始文本
             
         Returns:
-            (处理后的文本, 占位符映射)
+            (处理后的文本, 屏蔽标记到原标记的映射)
         """
-        placeholders = self.extract_placeholders(text)
         placeholder_map = {}
-        processed_text = text
         
-        for i, placeholder in enumerate(placeholders):
-            temp_marker = f"__PLACEHOLDER_{i}__"
-            placeholder_map[temp_marker] = placeholder
-            processed_text = processed_text.replace(placeholder, temp_marker, 1)
-            
+        def mask(match):
+            temp_marker = f"{{{len(placeholder_map)}}}"
+            placeholder_map[temp_marker] = match.group(0)
+            return temp_marker
+        
+        processed_text = GAME_TOKEN_PATTERN.sub(mask, text)
         return processed_text, placeholder_map
     
+    def mask_pair(self, original: str, translation: str) -> Optional[Tuple[str, str]]:
+        """用同一组屏蔽标记屏蔽原文和译文（用于示例对话和翻译记忆）
+        
+        Returns:
+            (屏蔽后的原文, 屏蔽后的译文)，译文中的游戏标记与原文不一致时返回None
+        """
+        masked_original, placeholder_map = self.preserve_placeholders(original)
+        # 同一标记多次出现时按出现顺序依次分配编号
+        markers_by_token: Dict[str, List[str]] = {}
+        for marker, placeholder in placeholder_map.items():
+            markers_by_token.setdefault(placeholder, []).append(marker)
+        unmatched = []
+        
+        def mask(match):
+            markers = markers_by_token.get(match.group(0))
+            if not markers:
+                unmatched.append(match.group(0))
+                return match.group(0)
+            return markers.pop(0)
+        
+        masked_translation = GAME_TOKEN_PATTERN.sub(mask, translation)
+        if unmatched or any(markers_by_token.values()):
+            return None
+        return masked_original, masked_translation
+    
+    def find_missing_placeholders(self, text: str, placeholder_map: Dict[str, str]) -> List[str]:
+        """检查译文中的屏蔽标记，每个标记应恰好出现一次
+        
+        Args:
+            text: 模型返回的译文（尚未恢复）
+            placeholder_map: 屏蔽标记映射
+            
+        Returns:
+            丢失、重复或多出的屏蔽标记，为空表示校验通过
+        """
+        counts: Dict[str, int] = {}
+        for match in SENTINEL_PATTERN.finditer(text):
+            counts[match.group(0)] = counts.get(match.group(0), 0) + 1
+        problems = [marker for marker in placeholder_map if counts.get(marker, 0) != 1]
+        problems.extend(marker for marker in counts if marker not in placeholder_map)
+        return problems
+    
     def restore_placeholders(self, text: str, placeholder_map: Dict[str, str]) -> str:
         """恢复占位符
         
@@ -58,10 +158,10 @@ class TranslationCore:
         Returns:
             恢复占位符后的文本
         """
-        restored_text = text
-        for temp_marker, original_placeholder in placeholder_map.items():
-            restored_text = restored_text.replace(temp_marker, original_placeholder)
-        return restored_text
+        if not placeholder_map:
+            return text
+        # 单次替换，避免恢复出的原标记（如 {0}）被再次替换
+        return SENTINEL_PATTERN.sub(lambda m: placeholder_map.get(m.group(0), m.group(0)), text)
     
     def is_translatable_text(self, text: str) -> bool:
         """判断文本是否需要翻译
@@ -84,12 +184,7 @@ class TranslationCore:
             return False
             
         # 跳过只包含占位符的文本
-        placeholders = self.extract_placeholders(text)
-        text_without_placeholders = text
-        for placeholder in placeholders:
-            text_without_placeholders = text_without_placeholders.replace(placeholder, '')
-        
-        if not text_without_placeholders.strip():
+        if not self.placeholder_pattern.sub('', text).strip():
             return False
             
         return True
@@ -117,31 +212,62 @@ class TranslationCore:
         
         return cleaned
     
-    def validate_translation(self, original: str, translation: str) -> bool:
+    def validate_translation(self, original: str, translation: str, target_lang: str = None) -> bool:
         """验证翻译质量
         
         Args:
             original: 原文
             translation: 译文
+            target_lang: 目标语言代码
             
         Returns:
             翻译是否有效
         """
-        if not translation or not translation.strip():
-            return False
-            
-        # 检查占位符是否保持一致
-        original_placeholders = set(self.extract_placeholders(original))
-        translation_placeholders = set(self.extract_placeholders(translation))
+        return not self.find_translation_issues(original, translation, target_lang)
+    
+    def find_translation_issues(self, original: str, translation: str, target_lang: str = None) -> List[str]:
+        """检查译文中的问题
         
-        if original_placeholders != translation_placeholders:
-            return False
-            
-        # 检查翻译是否与原文相同（可能未翻译）
-        if original.strip() == translation.strip():
-            return False
+        Args:
+            original: 原文
+            translation: 恢复游戏标记后的译文
+            target_lang: 目标语言代码，用于长度比例和未翻译判断
             
-        return True
+        Returns:
+            问题代码列表（见 VALIDATION_ISSUE_LABELS），为空表示通过
+        """
+        if not translation or not translation.strip():
+            return ['empty']
+        issues = []
+        
+        # 游戏标记的种类和数量保持一致
+        if sorted(GAME_TOKEN_PATTERN.findall(original)) != sorted(GAME_TOKEN_PATTERN.findall(translation)):
+            issues.append('placeholders')
+        
+        if original.count('\n') != translation.count('\n'):
+            issues.append('line_breaks')
+        
+        cjk = target_lang in CJK_LANGUAGES
+        if len(original.strip()) >= LENGTH_RATIO_MIN_CHARS:
+            low, high = LENGTH_RATIO_RANGE['cjk' if cjk else 'default']
+            ratio = len(translation.strip()) / len(original.strip())
+            if not low <= ratio <= high:
+                issues.append('length_ratio')
+        
+        if EXPLANATION_PATTERN.search(translation) and not EXPLANATION_PATTERN.search(original) or \
+                translation.count('\n') > original.count('\n') and NOTE_PATTERN.search(translation):
+            issues.append('explanation')
+        
+        # 译成中日韩文字时与含字母的原文完全相同，说明模型没有翻译
+        if cjk and original.strip() == translation.strip() and re.search(r'[A-Za-z]', original):
+            issues.append('untranslated')
+        
+        return issues
+    
+    @staticmethod
+    def describe_issues(issues: List[str]) -> str:
+        """问题代码转为说明文字"""
+        return '、'.join(VALIDATION_ISSUE_LABELS.get(issue, issue) for issue in issues)
     
     def format_translation_prompt(self, text: str, target_lang: str, examples: List[Tuple[str, str]] = None) -> str:
         """格式化翻译提示词
@@ -225,15 +351,125 @@ class TranslationCore:
         if total <= 0:
             return 0.0
         return min(100.0, (completed / total) * 100.0)
+
+
+class ThroughputEstimator:
+    """基于吞吐量的剩余时间估算器
     
-    def estimate_translation_time(self, text_count: int, avg_time_per_text: float = 2.0) -> int:
-        """估算翻译时间
+    以字符数加固定开销作为每个条目的工作量，用指数加权移动平均（EWMA）
+    跟踪单个并发通道的实际吞吐量（工作量/秒）。剩余时间按剩余工作量
+    除以当前有效并发数下的吞吐量计算，队列尾部条目少于并发数时自动降速。
+    """
+    
+    def __init__(self, alpha: float = 0.3, overhead_chars: int = 40,
+                 sample_interval: float = 1.0, prior_seconds_per_entry: float = 2.0):
+        """初始化估算器
         
         Args:
-            text_count: 文本数量
-            avg_time_per_text: 每个文本的平均翻译时间（秒）
-            
-        Returns:
-            估算时间（秒）
+            alpha: EWMA平滑系数，越大越偏向最近的吞吐量
+            overhead_chars: 每个请求的固定开销（折算为字符数，对应提示词和请求往返）
+            sample_interval: 两次吞吐量采样的最小间隔（秒），避免并发完成时的突发噪声
+            prior_seconds_per_entry: 尚无采样时假定的单条目耗时（秒）
+        """
+        self.alpha = alpha
+        self.overhead_chars = overhead_chars
+        self.sample_interval = sample_interval
+        self.prior_seconds_per_entry = prior_seconds_per_entry
+        
+        self.concurrency = 1
+        self.remaining_work = 0
+        self.remaining_entries = 0
+        self.completed_entries = 0
+        
+        # 单通道吞吐量（工作量/秒），跨文件保留以便后续文件立即得到估算
+        self.rate_per_worker: Optional[float] = None
+        self._entry_rate: Optional[float] = None
+        
+        self._sample_start = 0.0
+        self._sample_work = 0
+        self._sample_entries = 0
+        self._lock = threading.Lock()
+    
+    def _work_of(self, text: str) -> int:
+        return len(text) + self.overhead_chars
+    
+    def start(self, texts: List[str], concurrency: int = 1) -> None:
+        """开始估算一批条目（保留已学习的吞吐量）
+        
+        Args:
+            texts: 待翻译文本
+            concurrency: 并发数
         """
-        return int(text_count * avg_time_per_text)
\ No newline at end of file
+        with self._lock:
+            self.concurrency = max(1, concurrency)
+            self.remaining_work = sum(self._work_of(text) for text in texts)
+            self.remaining_entries = len(texts)
+            self.completed_entries = 0
+            self._sample_start = time.perf_counter()
+            self._sample_work = 0
+            self._sample_entries = 0
+    
+    def add_pending(self, texts: List[str]) -> None:
+        """加入排队中的后续条目（如自动切换后要翻译的文件）"""
+        with self._lock:
+            self.remaining_work += sum(self._work_of(text) for text in texts)
+            self.remaining_entries += len(texts)
+    
+    def set_concurrency(self, concurrency: int) -> None:
+        """更新并发数"""
+        with self._lock:
+            self.concurrency = max(1, concurrency)
+    
+    def complete(self, text: str) -> None:
+        """记录一个条目完成"""
+        now = time.perf_counter()
+        work = self._work_of(text)
+        with self._lock:
+            self.remaining_work = max(0, self.remaining_work - work)
+            self.remaining_entries = max(0, self.remaining_entries - 1)
+            self.completed_entries += 1
+            self._sample_work += work
+            self._sample_entries += 1
+            
+            elapsed = now - self._sample_start
+            if elapsed < self.sample_interval:
+                return
+            # 采样期间的有效并发数（尾部可能不足并发数）
+            workers = min(self.concurrency, self.remaining_entries + self._sample_entries)
+            worker_rate = self._sample_work / elapsed / max(1, workers)
+            entry_rate = self._sample_entries / elapsed
+            if self.rate_per_worker is None:
+                self.rate_per_worker = worker_rate
+                self._entry_rate = entry_rate
+            else:
+                self.rate_per_worker += self.alpha * (worker_rate - self.rate_per_worker)
+                self._entry_rate += self.alpha * (entry_rate - self._entry_rate)
+            self._sample_start = now
+            self._sample_work = 0
+            self._sample_entries = 0
+    
+    def remaining_seconds(self) -> float:
+        """估算剩余时间（秒）"""
+        with self._lock:
+            if self.remaining_entries <= 0:
+                return 0.0
+            workers = min(self.concurrency, self.remaining_entries)
+            if self.rate_per_worker is None:
+                # 尚无采样时使用先验的单条目耗时
+                return self.remaining_entries * self.prior_seconds_per_entry / workers
+            return self.remaining_work / (self.rate_per_worker * workers)
+    
+    def entries_per_minute(self) -> float:
+        """最近的完成速度（条/分钟），尚无采样时返回0"""
+        with self._lock:
+            return self._entry_rate * 60 if self._entry_rate else 0.0
+    
+    @staticmethod
+    def format_duration(seconds: float) -> str:
+        """将秒数格式化为 h:mm:ss 或 m:ss"""
+        seconds = int(round(seconds))
+        hours, rest = divmod(seconds, 3600)
+        minutes, secs = divmod(rest, 60)
+        if hours:
+            return f"{hours}:{minutes:02d}:{secs:02d}"
+        return f"{minutes}:{secs:02d}"
@@ -1,14 +1,27 @@
 import threading
 import time
-import re
-import tkinter as tk
 from pathlib import Path
 
+from .profiler import profiler
+from .text_classifier import TextClassifier
+from .translation_core import ThroughputEstimator, TranslationCore
+
 class TranslationManager:
     def __init__(self, main_app):
         self.main_app = main_app
         self.is_translating = False
         self.translation_thread = None
+        # 剩余时间估算器，吞吐量在连续翻译的文件之间保留
+        self.eta_estimator = ThroughputEstimator()
+        # 判断条目是否需要翻译，相同文本的结果在文件之间复用
+        self.text_classifier = TextClassifier()
+        self.translation_core = TranslationCore()
+        # 正在批量翻译的文件及其条目键到批次索引的映射，供优先通道使用
+        self._active_batch = None
+        # 任务开始时扫描的各文件待翻译文本（文件路径 -> 文本列表），自动切换文件后沿用
+        self._job_workload = None
+        # 任务已预热模型并开始统计、尚未输出统计（自动切换文件期间保持）
+        self._job_running = False
     
     def auto_translate(self):
         """自动翻译或停止翻译"""
@@ -20,12 +33,17 @@ class TranslationManager:
         # 开始翻译
         self.start_translation()
     
-    def start_translation(self):
-        """开始翻译"""
+    def start_translation(self, continue_job=False):
+        """开始翻译
+        
+        Args:
+            continue_job: 是否为自动切换文件后继续同一任务（沿用任务开始时扫描的结果）
+        """
         self.is_translating = True
         self.main_app.translate_btn.config(text=self.main_app.get_ui_text("stop_translate"))
         
         def translate():
+            next_file_scheduled = False
             try:
                 if not self.main_app.available_models:
                     self.main_app.log_message(self.main_app.get_ui_text("ollama_model_required"), "ERROR")
@@ -33,6 +51,7 @@ class TranslationManager:
                 
                 target_lang = self.main_app.target_language_var.get()
                 target_lang_en = self.main_app.language_codes[target_lang]
+                self.text_classifier.set_target_lang(target_lang_en)
                 
                 self.main_app.log_message(self.main_app.get_ui_text("start_auto_translate").format(target_lang))
                 
@@ -71,6 +90,13 @@ class TranslationManager:
                     except:
                         continue
                 
+                # 任务开始时扫描文件、预热模型并开始统计，自动切换文件后沿用
+                if not continue_job or not self._job_running:
+                    if self._job_running:
+                        # 上一个任务在等待自动切换时被新任务取代
+                        self._finish_job()
+                    self._begin_job()
+                
                 # 初始化进度和自动保存计数器
                 current_entry = 0
                 auto_save_counter = 0
@@ -78,50 +104,26 @@ class TranslationManager:
                 batch_size = getattr(self.main_app, 'batch_size', 5)
                 self.main_app.update_progress_display(current_entry, total_entries)
                 
+                # 自动切换后还要翻译的文件条目，用于估算整个任务的剩余时间
+                queued_texts = self._collect_queued_texts(self.main_app.current_file_index + 1)
+                
                 for json_file in json_files:
                     # 检查是否需要停止翻译
                     if not self.is_translating:
                         self.main_app.log_message("翻译已停止")
                         return
                         
-                    self.main_app.log_message(self.main_app.get_ui_text("translating_file").format(json_file.relative_to(self.main_app.file_manager.i18n_dir)))
+                    relative_path = json_file.relative_to(self.main_app.file_manager.i18n_dir)
+                    self.main_app.log_message(self.main_app.get_ui_text("translating_file").format(relative_path))
+                    # 按相对路径区分统计，不同模组的同名语言文件不会合并
+                    self.main_app.metrics.set_current_file(str(relative_path))
                     
                     try:
-                        # 读取 JSON 文件（支持注释和BOM）
-                        data = self.main_app.file_manager.load_json_with_comments(json_file)
-                        
-                        # 收集需要翻译的条目 - 智能对比原文和译文
-                        items_to_translate = []
-                        keys_to_translate = []
+                        # 读取 JSON 文件并智能对比原文和译文，收集需要翻译的条目
+                        data, keys_to_translate, items_to_translate, original_data, total_text_entries, skipped_entries = \
+                            self._collect_items_to_translate(json_file)
                         translated_data = data.copy()  # 保留原有数据
                         
-                        # 尝试加载对应的原文文件进行对比
-                        original_data = None
-                        try:
-                            # 智能匹配原文件
-                            mod_name = self.main_app.current_mod_path.name
-                            original_file = self.main_app.find_matching_original_file(json_file, mod_name)
-                            
-                            if original_file and original_file.exists():
-                                original_data = self.main_app.file_manager.load_json_with_comments(original_file)
-                                self.main_app.log_message(self.main_app.get_ui_text("loaded_original_file").format(original_file.name))
-                        except Exception as e:
-                            self.main_app.log_message(f"加载原文文件失败，将翻译所有条目: {str(e)}")
-                        
-                        # 智能判断哪些条目需要翻译
-                        total_text_entries = 0
-                        skipped_entries = 0
-                        
-                        for key, value in data.items():
-                            if isinstance(value, str) and value.strip() and not value.startswith("["):
-                                total_text_entries += 1
-                                needs_translation = self._should_translate_text(key, value, original_data)
-                                if needs_translation:
-                                    items_to_translate.append(value)
-                                    keys_to_translate.append(key)
-                                else:
-                                    skipped_entries += 1
-                        
                         # 详细的日志信息
                         if original_data:
                             self.main_app.log_message(self.main_app.get_ui_text("smart_comparison_complete").format(total_text_entries, len(items_to_translate), skipped_entries))
@@ -133,6 +135,11 @@ class TranslationManager:
                             self.main_app.log_message(self.main_app.get_ui_text("file_no_translation_needed").format(json_file.name))
                             continue
                         
+                        # 剩余时间按当前文件和后续排队文件的全部条目估算
+                        batch_size = int(self.main_app.batch_size_var.get())
+                        self.eta_estimator.start(items_to_translate, batch_size)
+                        self.eta_estimator.add_pending(queued_texts)
+                        
                         # 定义结果回调函数
                         def result_callback(index, original_text, translated_text):
                             if not self.is_translating:
@@ -142,12 +149,12 @@ class TranslationManager:
                             translated_data[key] = translated_text
                             self.main_app.log_message(self.main_app.get_ui_text("translate_entry").format(key, original_text, translated_text))
                             
-                            # 如果当前文件是显示的文件，实时更新界面
+                            # 如果当前文件是显示的文件，交给界面更新总线批量刷新
                             if hasattr(self.main_app, 'current_translation_file') and json_file == self.main_app.current_translation_file:
-                                if hasattr(self.main_app, 'update_translation_display'):
-                                    self.main_app.root.after(0, lambda k=key, t=translated_text: self.main_app.update_translation_display(k, t))
+                                self.main_app.ui_bus.post_row(json_file, key, translated_text)
                             
                             # 更新进度
+                            self.eta_estimator.complete(original_text)
                             nonlocal current_entry, auto_save_counter
                             current_entry += 1
                             auto_save_counter += 1
@@ -159,20 +166,35 @@ class TranslationManager:
                                 self.main_app.log_message(self.main_app.get_ui_text("auto_saved_translations").format(auto_save_interval))
                                 auto_save_counter = 0
                         
+                        # 定义失败回调函数：重试用尽的条目保留原文，下次运行时会被重新识别为待翻译
+                        def failure_callback(index, original_text, error):
+                            if not self.is_translating:
+                                return
+                            
+                            kind = "瞬时错误" if error.transient else "永久错误"
+                            self.main_app.log_message(f"翻译失败，保留原文: {keys_to_translate[index]}（{kind}: {error}）", "WARNING")
+                            
+                            self.eta_estimator.complete(original_text)
+                            nonlocal current_entry
+                            current_entry += 1
+                            self.main_app.update_progress_display(current_entry, total_entries)
+                        
                         # 定义停止检查函数
                         def stop_check():
                             return not self.is_translating
                         
-                        # 使用批量翻译
+                        # 使用批量翻译，界面上可见的条目先翻译
+                        self._active_batch = (json_file, {key: i for i, key in enumerate(keys_to_translate)})
                         try:
-                            batch_size = int(self.main_app.batch_size_var.get())
                             self.main_app.translator.translate_batch_async(
                                 items_to_translate,
                                 target_lang_en,
                                 batch_size,
                                 None,  # progress_callback
                                 stop_check,
-                                result_callback
+                                result_callback,
+                                failure_callback,
+                                priority=self._visible_indices(json_file)
                             )
                         except Exception as e:
                             self.main_app.log_message(f"批量翻译失败: {str(e)}", "ERROR")
@@ -182,6 +204,10 @@ class TranslationManager:
                                     break
                                 translated_text = self.main_app.translator.translate_single_text(value, target_lang_en)
                                 result_callback(i, value, translated_text)
+                        else:
+                            self._report_validation(json_file.name)
+                        finally:
+                            self._active_batch = None
                         
                         # 检查是否被停止
                         if not self.is_translating:
@@ -201,17 +227,156 @@ class TranslationManager:
                 self.main_app.log_message(self.main_app.get_ui_text("auto_translate_completed"))
                 
                 # 翻译正常完成后自动跳转到下一个文件
-                self.auto_switch_to_next_file()
+                next_file_scheduled = self.auto_switch_to_next_file()
                 
             except Exception as e:
                 self.main_app.log_message(self.main_app.get_ui_text("auto_translate_error").format(str(e)), "ERROR")
             finally:
+                if self._job_running:
+                    # 任务的统计在全部文件完成或被停止时输出一次
+                    self._save_translation_memory()
+                    if not next_file_scheduled:
+                        self._finish_job()
                 # 重置翻译状态和按钮文本
                 self.reset_translation_state()
         
         self.translation_thread = threading.Thread(target=translate, daemon=True)
         self.translation_thread.start()
     
+    def _begin_job(self):
+        """开始翻译任务：扫描当前及后续将被自动切换翻译的文件，预热模型并在任务期间保持驻留"""
+        self._job_workload = self._scan_job(self.main_app.current_file_index)
+        self.main_app.metrics.begin_run()
+        keep_alive = self.main_app.config_manager.get('keep_alive', '30m')
+        self.main_app.log_message(f"正在预热模型 {self.main_app.ollama_model}...")
+        # 上下文大小按整个任务确定，自动切换文件后不变，模型不会重新加载
+        job_texts = [text for texts in self._job_workload.values() for text in texts]
+        cold_start = self.main_app.ollama_manager.prepare_run(keep_alive, job_texts)
+        if cold_start is None:
+            self.main_app.log_message("模型预热失败，首批请求可能较慢", "WARNING")
+        else:
+            self.main_app.log_message(f"模型已就绪，冷启动耗时 {cold_start:.1f} 秒")
+        # 冷启动耗时单独统计
+        self.main_app.metrics.set_cold_start(cold_start)
+        self._job_running = True
+    
+    def _finish_job(self):
+        """结束翻译任务（全部文件完成或被停止）：恢复模型驻留时间，输出并导出整个任务的统计"""
+        self._job_running = False
+        self._report_run_stats(self.main_app.ollama_manager.finish_run())
+        self._report_run_metrics()
+        self.main_app.report_profile()
+    
+    def prioritize_keys(self, json_file, keys):
+        """把正在翻译的文件中尚未发送的条目移到优先通道
+        
+        Returns:
+            实际提升的条目数，文件不是正在翻译的文件时为0
+        """
+        batch = self._active_batch
+        if not batch or not self.is_translating or json_file != batch[0]:
+            return 0
+        indices = [batch[1][key] for key in keys if key in batch[1]]
+        return self.main_app.translator.prioritize(indices) if indices else 0
+    
+    def prioritize_visible(self):
+        """对比视图滚动后，可见的条目优先翻译"""
+        batch = self._active_batch
+        if batch and self.is_translating:
+            indices = self._visible_indices(batch[0])
+            if indices:
+                self.main_app.translator.prioritize(indices)
+    
+    def _visible_indices(self, json_file):
+        """对比视图显示的是正在翻译的文件时，返回可见条目在本批中的索引"""
+        view = getattr(self.main_app, 'comparison_view', None)
+        batch = self._active_batch
+        if view is None or not batch or json_file != batch[0] or \
+                json_file != getattr(self.main_app, 'current_translation_file', None):
+            return []
+        return [batch[1][key] for key in view.visible_keys() if key in batch[1]]
+    
+    def _report_run_stats(self, stats):
+        """输出本次运行的模型加载和失败统计"""
+        if stats['load_stalls']:
+            self.main_app.log_message(
+                f"运行中模型被重新加载 {stats['load_stalls']} 次，共等待 {stats['load_stall_time']:.1f} 秒", "WARNING")
+        else:
+            self.main_app.log_message("运行中模型未被卸载", "DEBUG")
+        
+        if stats['outages']:
+            self.main_app.log_message(
+                f"运行中Ollama服务中断 {stats['outages']} 次，共暂停 {stats['outage_time']:.1f} 秒", "WARNING")
+        
+        failures = stats['transient_failures'] + stats['permanent_failures']
+        if failures:
+            self.main_app.log_message(
+                f"{failures} 条翻译失败并保留原文（瞬时错误 {stats['transient_failures']}，永久错误 {stats['permanent_failures']}），"
+                f"共重试 {stats['retries']} 次，队列末尾重试挽回 {stats['recovered']} 条", "WARNING")
+        elif stats['retries']:
+            self.main_app.log_message(
+                f"共重试 {stats['retries']} 次，全部条目翻译成功（队列末尾重试挽回 {stats['recovered']} 条）")
+        
+        if stats['validation_rejected']:
+            self.main_app.log_message(
+                f"{stats['validation_rejected']} 条译文未通过校验，严格重译修复 {stats['validation_fixed']} 条")
+        if stats['memory_reused'] or stats['memory_examples']:
+            self.main_app.log_message(
+                f"翻译记忆：直接复用 {stats['memory_reused']} 条，{stats['memory_examples']} 条使用了相似译文作为示例"
+                f"（其中 {stats['semantic_examples']} 条按语义检索）")
+        if stats['overruns']:
+            self.main_app.log_message(f"{stats['overruns']} 次生成超出长度上限被截断，已按校验未通过处理", "WARNING")
+        if stats['examples_trimmed']:
+            self.main_app.log_message(f"{stats['examples_trimmed']} 条请求超出上下文预算，省略了部分示例")
+        if stats['glossary_violations']:
+            self.main_app.log_message(
+                f"{stats['glossary_violations']} 条译文重译后仍未使用术语表译名，已保留译文", "WARNING")
+        if stats['fast_model']:
+            self._report_cascade(stats)
+    
+    def _report_cascade(self, stats):
+        """输出级联模式各层模型的吞吐量和升级比例"""
+        names = {'fast': stats['fast_model'], 'main': self.main_app.ollama_model}
+        parts = []
+        for tier, tier_stats in stats['tiers'].items():
+            if not tier_stats['requests']:
+                continue
+            rate = tier_stats['passed'] / tier_stats['seconds'] if tier_stats['seconds'] else 0.0
+            parts.append(f"{names[tier]} 请求 {tier_stats['requests']} 次、通过 {tier_stats['passed']} 条"
+                         f"（{rate:.2f} 条/秒·并发）")
+        fast_requests = stats['tiers']['fast']['requests']
+        escalation_rate = stats['escalations'] / fast_requests * 100 if fast_requests else 0.0
+        self.main_app.log_message(
+            f"级联翻译：{'；'.join(parts)}；升级到主模型 {stats['escalations']} 条（{escalation_rate:.1f}%）")
+    
+    def _report_validation(self, file_name):
+        """输出单个文件的译文校验统计"""
+        stats = self.main_app.translator.last_batch_validation
+        if not stats:
+            return
+        self.main_app.log_message(
+            f"{file_name} 译文校验：通过 {stats['passed']} 条，严格重译修复 {stats['fixed']}/{stats['rejected']} 条，"
+            f"未通过 {stats['failed']} 条", "WARNING" if stats['failed'] else "INFO")
+    
+    def _report_run_metrics(self):
+        """在日志中输出本次运行的性能统计，并按配置导出到 Data/metrics"""
+        metrics = self.main_app.metrics
+        metrics.end_run()
+        if not metrics.get_records():
+            return
+        by_file = metrics.summary_by_file()
+        if len(by_file) > 1:
+            for file_name, summary in by_file.items():
+                self.main_app.log_message(metrics.format_summary(summary, file_name))
+        self.main_app.log_message(metrics.format_summary(metrics.run_summary(), "性能统计"))
+        
+        if self.main_app.config_manager.get('export_metrics', False):
+            try:
+                export_path = metrics.export(self.main_app.data_dir / "metrics")
+                self.main_app.log_message(f"性能统计已导出: {export_path.name}（同名CSV为请求明细）")
+            except Exception as e:
+                self.main_app.log_message(f"导出性能统计失败: {str(e)}", "WARNING")
+    
     def stop_translation(self):
         """停止翻译"""
         self.main_app.log_message(self.main_app.get_ui_text("stopping_translation"))
@@ -227,7 +392,11 @@ class TranslationManager:
         self.translation_thread = None
     
     def auto_switch_to_next_file(self):
-        """自动切换到下一个文件"""
+        """自动切换到下一个文件
+        
+        Returns:
+            是否已安排翻译下一个文件
+        """
         try:
             # 检查是否有可用文件列表
             if not hasattr(self.main_app, 'available_files') or not self.main_app.available_files:
@@ -261,10 +430,11 @@ class TranslationManager:
                 def delayed_auto_translate():
                     if not self.is_translating:  # 确保当前没有在翻译
                         self.main_app.log_message(f"开始自动翻译下一个文件: {next_file['name']}")
-                        self.start_translation()
+                        self.start_translation(continue_job=True)
                 
                 # 延迟2秒后开始翻译，确保界面更新完成
                 self.main_app.root.after(2000, delayed_auto_translate)
+                return True
                 
             else:
                 self.main_app.log_message("所有文件翻译完成！")
@@ -272,17 +442,104 @@ class TranslationManager:
         except Exception as e:
             self.main_app.log_message(f"自动切换文件失败: {str(e)}", "ERROR")
     
+    def _collect_items_to_translate(self, json_file, log=True):
+        """读取文件并收集需要翻译的条目
+        
+        Args:
+            json_file: 译文JSON文件
+            log: 是否输出加载原文文件的日志
+        
+        Returns:
+            (数据, 待翻译键列表, 待翻译文本列表, 原文数据, 文本条目总数, 跳过条目数)
+        """
+        # 读取 JSON 文件（支持注释和BOM）
+        data = self.main_app.file_manager.load_json_with_comments(json_file)
+        
+        # 尝试加载对应的原文文件进行对比
+        original_data = None
+        try:
+            # 智能匹配原文件
+            mod_name = self.main_app.current_mod_path.name
+            original_file = self.main_app.find_matching_original_file(json_file, mod_name)
+            
+            if original_file and original_file.exists():
+                original_data = self.main_app.file_manager.load_json_with_comments(original_file)
+                if log:
+                    self.main_app.log_message(self.main_app.get_ui_text("loaded_original_file").format(original_file.name))
+        except Exception as e:
+            if log:
+                self.main_app.log_message(f"加载原文文件失败，将翻译所有条目: {str(e)}")
+        
+        # 智能判断哪些条目需要翻译
+        with profiler.span("classify", entries=len(data)):
+            keys_to_translate, items_to_translate, total_text_entries, skipped_entries = \
+                self.text_classifier.classify(data, original_data)
+        
+        return data, keys_to_translate, items_to_translate, original_data, total_text_entries, skipped_entries
+    
+    def _seed_translation_memory(self, data, original_data, keys_to_translate):
+        """把文件中已翻译的条目（与原文不同且不需要重译）加入翻译记忆"""
+        store = getattr(self.main_app, 'translation_memory', None)
+        if not store or not original_data or not self.main_app.config_manager.get('use_translation_memory', True):
+            return
+        memory = store.get(self.text_classifier.target_lang)
+        pending = set(keys_to_translate)
+        with profiler.span("memory_seed"):
+            for key, value in data.items():
+                original = original_data.get(key)
+                if key in pending or not isinstance(value, str) or not isinstance(original, str) or value == original:
+                    continue
+                pair = self.translation_core.mask_pair(original, value)
+                if pair:
+                    memory.add(*pair)
+    
+    def _save_translation_memory(self):
+        """保存本次运行更新的翻译记忆和向量索引"""
+        for name in ('translation_memory', 'embedding_index'):
+            store = getattr(self.main_app, name, None)
+            if not store:
+                continue
+            try:
+                store.save()
+            except Exception as e:
+                self.main_app.log_message(f"保存翻译记忆失败: {str(e)}", "WARNING")
+    
+    def _scan_job(self, start_index):
+        """扫描从指定索引开始、本次任务将翻译（含自动切换）的文件
+        
+        每个文件只在任务开始时读取和分类一次；文件中已有的译文同时加入翻译记忆，
+        前面的文件也能用后续文件的译文作示例。
+        
+        Returns:
+            文件路径到待翻译文本列表的映射
+        """
+        workload = {}
+        with profiler.span("scan_job"):
+            for file_info in self.main_app.available_files[start_index:]:
+                try:
+                    data, keys_to_translate, items_to_translate, original_data, _, _ = \
+                        self._collect_items_to_translate(file_info['path'], log=False)
+                except Exception:
+                    continue
+                workload[file_info['path']] = items_to_translate
+                self._seed_translation_memory(data, original_data, keys_to_translate)
+        return workload
+    
+    def _collect_queued_texts(self, start_index):
+        """从任务扫描结果中取出指定索引开始的文件的待翻译文本"""
+        workload = self._job_workload or {}
+        return [text for file_info in self.main_app.available_files[start_index:]
+                for text in workload.get(file_info['path'], ())]
+    
     def update_translation_display(self, key, translated_text):
         """实时更新翻译显示"""
         try:
-            if hasattr(self.main_app, 'current_translation_keys') and key in self.main_app.current_translation_keys:
-                index = self.main_app.current_translation_keys.index(key)
-                if index < self.main_app.translation_listbox.size():
-                    self.main_app.translation_listbox.delete(index)
-                    self.main_app.translation_listbox.insert(index, translated_text)
-                    # 更新当前翻译数据
-                    if hasattr(self.main_app, 'current_translation_data'):
-                        self.main_app.current_translation_data[key] = translated_text
+            index = self.main_app.comparison_view.row_of(key)
+            if index >= 0:
+                self.main_app.comparison_view.set_translation(index, translated_text)
+                # 更新当前翻译数据
+                if hasattr(self.main_app, 'current_translation_data'):
+                    self.main_app.current_translation_data[key] = translated_text
         except Exception as e:
             self.main_app.log_message(self.main_app.get_ui_text("update_translation_display_failed").format(str(e)), "ERROR")
     
@@ -297,81 +554,31 @@ class TranslationManager:
         Returns:
             bool: 是否需要翻译
         """
-        # 如果翻译文本为空，需要翻译
-        if not translation_text or not translation_text.strip():
-            return True
-        
-        # 如果有原文数据，进行对比
-        if original_data and key in original_data:
-            original_text = original_data[key]
-            
-            # 如果翻译文本与原文相同，需要翻译
-            if translation_text == original_text:
-                return True
-            
-            # 如果翻译文本主要是英文且与原文不同，可能需要重新翻译
-            if self._is_mainly_english(translation_text) and translation_text != original_text:
-                return True
-        else:
-            # 没有原文数据时，如果翻译文本主要是英文，需要翻译
-            if self._is_mainly_english(translation_text):
-                return True
-        
-        # 其他情况不需要翻译
-        return False
-    
-    def _is_mainly_english(self, text):
-        """判断文本是否主要是英文
-        
-        Args:
-            text: 要检查的文本
-        
-        Returns:
-            bool: 是否主要是英文
-        """
-        if not text or not text.strip():
-            return False
-        
-        # 移除空格和标点符号
-        clean_text = re.sub(r'[\s\W]', '', text)
-        if not clean_text:
-            return False
-        
-        # 计算英文字符比例
-        english_chars = sum(1 for c in clean_text if ord(c) < 128 and c.isalpha())
-        total_chars = len(clean_text)
-        
-        # 如果英文字符占比超过70%，认为主要是英文
-        return english_chars / total_chars > 0.7
+        original_text = original_data.get(key) if original_data else None
+        return self.text_classifier.needs_translation(
+            translation_text, original_text if isinstance(original_text, str) else None)
     
     def display_comparison_data(self, translation_data, original_data):
         """显示对比数据"""
         try:
-            # 清空列表框
-            self.main_app.original_listbox.delete(0, tk.END)
-            self.main_app.translation_listbox.delete(0, tk.END)
-            
             # 保存当前原文和翻译数据，用于编辑和保存功能
             self.main_app.current_original_data = original_data.copy()
             self.main_app.current_translation_data = translation_data.copy()
             self.main_app.current_translation_keys = list(original_data.keys()) if original_data else list(translation_data.keys())
             
-            # 遍历数据（优先使用原文数据，如果没有则使用翻译数据）
-            data_to_iterate = original_data if original_data else translation_data
-            for key in self.main_app.current_translation_keys:
-                # 获取原文和译文
-                original_value = original_data.get(key, self.main_app.get_ui_text("untranslated_text")) if original_data else self.main_app.get_ui_text("untranslated_text")
-                translation_value = translation_data.get(key, self.main_app.get_ui_text("untranslated_text"))
-                
-                # 格式化显示文本 - 只显示值，不显示键
-                original_text = original_value
-                translation_text = translation_value
-                
-                # 添加到列表框
-                self.main_app.original_listbox.insert(tk.END, original_text)
-                self.main_app.translation_listbox.insert(tk.END, translation_text)
+            # 构建后台数组（优先使用原文数据的键顺序），只显示值，不显示键
+            untranslated_text = self.main_app.get_ui_text("untranslated_text")
+            keys = self.main_app.current_translation_keys
+            if original_data:
+                original_texts = [original_data.get(key, untranslated_text) for key in keys]
+            else:
+                original_texts = [untranslated_text] * len(keys)
+            translation_texts = [translation_data.get(key, untranslated_text) for key in keys]
+            
+            # 虚拟化视图只渲染可见行，开销与条目数量无关
+            self.main_app.comparison_view.set_rows(keys, original_texts, translation_texts)
             
             self.main_app.log_message(self.main_app.get_ui_text("comparison_data_displayed").format(len(self.main_app.current_translation_keys)))
              
         except Exception as e:
-             self.main_app.log_message(self.main_app.get_ui_text("display_comparison_failed").format(str(e)), "ERROR")
\ No newline at end of file
+             self.main_app.log_message(self.main_app.get_ui_text("display_comparison_failed").format(str(e)), "ERROR")
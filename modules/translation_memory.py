@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译记忆模块
+保存已通过校验的译文（游戏标记已屏蔽为 {0} 等编号），用字符三元组倒排索引做模糊检索：
+相似的历史译文作为动态示例替换固定示例，去除游戏标记后完全相同的原文直接复用译文
+"""
+
+import heapq
+import json
+import threading
+from collections import Counter
+from itertools import chain
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# n-gram 长度
+NGRAM_SIZE = 3
+
+# 检索时从最少见的n-gram开始取倒排列表，累计条目数不超过该预算，保证检索耗时稳定
+CANDIDATE_BUDGET = 3000
+
+# 按估算相似度取前若干个候选，再精确计算相似度
+MAX_CANDIDATES = 8
+
+# 缓存最近精确比较过的条目的n-gram集合，超过后清空
+GRAM_CACHE_LIMIT = 4096
+
+# 每种语言最多保存的条目数，超过后丢弃最早的条目
+MAX_ENTRIES = 50000
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _ngrams(text: str) -> set:
+    """字符n-gram集合，短文本整体作为一个n-gram"""
+    normalized = f" {_normalize(text)} "
+    if len(normalized) <= NGRAM_SIZE:
+        return {normalized}
+    return {normalized[i:i + NGRAM_SIZE] for i in range(len(normalized) - NGRAM_SIZE + 1)}
+
+
+class TranslationMemory:
+    """单个目标语言的翻译记忆"""
+
+    def __init__(self, pairs: Optional[List[Tuple[str, str]]] = None):
+        """初始化翻译记忆
+
+        Args:
+            pairs: (屏蔽后的原文, 屏蔽后的译文) 列表
+        """
+        self._lock = threading.Lock()
+        self._reset()
+        for source, target in pairs or []:
+            self._add(source, target)
+        self.dirty = False
+
+    def _reset(self) -> None:
+        self._sources: List[str] = []
+        self._targets: List[str] = []
+        self._gram_counts: List[int] = []
+        self._exact: Dict[str, int] = {}
+        self._index: Dict[str, List[int]] = {}
+        self._gram_cache: Dict[int, frozenset] = {}
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def add(self, source: str, target: str) -> None:
+        """添加一条译文（原文相同时覆盖）"""
+        if not source or not target:
+            return
+        with self._lock:
+            if not self._add(source, target):
+                return
+            self.dirty = True
+            if len(self._sources) > MAX_ENTRIES:
+                self._compact()
+
+    def _add(self, source: str, target: str) -> bool:
+        """添加或更新条目，返回是否有变化"""
+        entry_id = self._exact.get(source)
+        if entry_id is not None:
+            if self._targets[entry_id] == target:
+                return False
+            self._targets[entry_id] = target
+            return True
+        entry_id = len(self._sources)
+        grams = _ngrams(source)
+        self._sources.append(source)
+        self._targets.append(target)
+        self._gram_counts.append(len(grams))
+        self._exact[source] = entry_id
+        for gram in grams:
+            self._index.setdefault(gram, []).append(entry_id)
+        return True
+
+    def _compact(self) -> None:
+        """保留最近的条目并重建索引"""
+        keep = int(MAX_ENTRIES * 0.8)
+        pairs = list(zip(self._sources[-keep:], self._targets[-keep:]))
+        self._reset()
+        for source, target in pairs:
+            self._add(source, target)
+
+    def get_exact(self, source: str) -> Optional[str]:
+        """原文完全相同时返回译文"""
+        with self._lock:
+            entry_id = self._exact.get(source)
+            return self._targets[entry_id] if entry_id is not None else None
+
+    def search(self, text: str, limit: int = 3, min_similarity: float = 0.5) -> List[Tuple[float, str, str]]:
+        """检索相似的历史译文
+
+        Args:
+            text: 屏蔽后的原文
+            limit: 最多返回的条数
+            min_similarity: 最低相似度（n-gram集合的Dice系数）
+
+        Returns:
+            (相似度, 原文, 译文) 列表，按相似度从高到低排列，不含与原文完全相同的条目
+        """
+        grams = _ngrams(text)
+        with self._lock:
+            # 少见的n-gram区分度高，优先用来产生候选
+            postings = sorted((posting for posting in map(self._index.get, grams) if posting), key=len)
+            selected = []
+            budget = CANDIDATE_BUDGET
+            for posting in postings:
+                if selected and len(posting) > budget:
+                    break
+                # 第一个列表就超出预算时只取最近加入的条目
+                selected.append(posting[-budget:])
+                budget -= len(selected[-1])
+            counts = Counter(chain.from_iterable(selected))
+            # 按共同n-gram数估算相似度（考虑条目长度，避免长条目因n-gram多而总排在前面）
+            size = len(grams)
+            gram_counts = self._gram_counts
+            estimates = [(common / (size + gram_counts[entry_id]), entry_id) for entry_id, common in counts.items()]
+            candidates = [entry_id for _, entry_id in heapq.nlargest(MAX_CANDIDATES, estimates, key=itemgetter(0))]
+
+            scored = []
+            for entry_id in candidates:
+                source = self._sources[entry_id]
+                if source == text:
+                    continue
+                source_grams = self._cached_ngrams(entry_id)
+                similarity = 2 * len(grams & source_grams) / (len(grams) + len(source_grams))
+                if similarity >= min_similarity:
+                    scored.append((similarity, source, self._targets[entry_id]))
+        return heapq.nlargest(limit, scored)
+
+    def _cached_ngrams(self, entry_id: int) -> frozenset:
+        grams = self._gram_cache.get(entry_id)
+        if grams is None:
+            if len(self._gram_cache) >= GRAM_CACHE_LIMIT:
+                self._gram_cache.clear()
+            grams = frozenset(_ngrams(self._sources[entry_id]))
+            self._gram_cache[entry_id] = grams
+        return grams
+
+    def find_reusable(self, text: str, threshold: float = 1.0) -> Optional[str]:
+        """查找可以直接复用的译文
+
+        Args:
+            text: 屏蔽后的原文
+            threshold: 复用的相似度下限，1.0 表示只复用完全相同的原文
+
+        Returns:
+            译文，没有可复用的条目时返回None
+        """
+        exact = self.get_exact(text)
+        if exact is not None or threshold >= 1.0:
+            return exact
+        matches = self.search(text, limit=1, min_similarity=threshold)
+        return matches[0][2] if matches else None
+
+    def to_pairs(self) -> List[Tuple[str, str]]:
+        with self._lock:
+            return list(zip(self._sources, self._targets))
+
+
+class TranslationMemoryStore:
+    """按语言加载、缓存和保存翻译记忆"""
+
+    def __init__(self, memory_dir: Optional[Path] = None):
+        """初始化翻译记忆存储
+
+        Args:
+            memory_dir: 保存目录，每种语言一个 <语言代码>.json
+        """
+        self.memory_dir = Path(memory_dir) if memory_dir else None
+        self._memories: Dict[str, TranslationMemory] = {}
+        self._lock = threading.Lock()
+
+    def get(self, lang: str) -> TranslationMemory:
+        """获取目标语言的翻译记忆，首次使用时从文件加载"""
+        with self._lock:
+            memory = self._memories.get(lang)
+            if memory is None:
+                memory = TranslationMemory(self._load(lang))
+                self._memories[lang] = memory
+            return memory
+
+    def _load(self, lang: str) -> List[Tuple[str, str]]:
+        if not self.memory_dir:
+            return []
+        file_path = self.memory_dir / f"{lang}.json"
+        if not file_path.exists():
+            return []
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if not isinstance(data, list):
+            return []
+        return [(pair[0], pair[1]) for pair in data
+                if isinstance(pair, list) and len(pair) == 2 and all(isinstance(p, str) for p in pair)]
+
+    def save(self) -> int:
+        """保存有变化的翻译记忆
+
+        Returns:
+            保存的语言数
+        """
+        if not self.memory_dir:
+            return 0
+        saved = 0
+        with self._lock:
+            memories = list(self._memories.items())
+        for lang, memory in memories:
+            if not memory.dirty:
+                continue
+            self.memory_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.memory_dir / f"{lang}.json", 'w', encoding='utf-8') as f:
+                json.dump([list(pair) for pair in memory.to_pairs()], f, ensure_ascii=False)
+            memory.dirty = False
+            saved += 1
+        return saved
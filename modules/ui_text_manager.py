@@ -5,7 +5,62 @@ UI文本管理模块
 负责多语言界面文本的管理和获取
 """
 
-from typing import Dict, Any
+import threading
+from collections.abc import MutableMapping
+from typing import Callable, Dict, Any, Iterator, Optional
+
+
+class LazyTextTable(MutableMapping):
+    """按需构建的多语言文本表
+    
+    对外表现为 {语言: {键: 文本}} 字典，但每种语言的文本字典只在
+    第一次被访问时才构建，启动时只需构建当前界面语言。
+    """
+    
+    def __init__(self, builders: Dict[str, Optional[Callable[[], Dict[str, str]]]]):
+        """初始化文本表
+        
+        Args:
+            builders: {语言: 构建函数}
+        """
+        self._builders = dict(builders)
+        self._tables: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+    
+    def __getitem__(self, language: str) -> Dict[str, str]:
+        table = self._tables.get(language)
+        if table is not None:
+            return table
+        if language not in self._builders:
+            raise KeyError(language)
+        with self._lock:
+            if language not in self._tables:
+                self._tables[language] = self._builders[language]()
+            return self._tables[language]
+    
+    def __setitem__(self, language: str, texts: Dict[str, str]) -> None:
+        with self._lock:
+            self._tables[language] = texts
+            self._builders.setdefault(language, None)
+    
+    def __delitem__(self, language: str) -> None:
+        with self._lock:
+            del self._builders[language]
+            self._tables.pop(language, None)
+    
+    def __contains__(self, language) -> bool:
+        # 只检查是否存在，不触发构建
+        return language in self._builders
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._builders))
+    
+    def __len__(self) -> int:
+        return len(self._builders)
+    
+    def is_loaded(self, language: str) -> bool:
+        """判断指定语言的文本字典是否已构建"""
+        return language in self._tables
 
 
 class UITextManager:
@@ -16,1931 +71,2004 @@ class UITextManager:
         self.current_language = "中文"
         self.ui_texts = self._init_ui_texts()
     
-    def _init_ui_texts(self) -> Dict[str, Dict[str, str]]:
-        """初始化UI文本字典"""
+    def _init_ui_texts(self) -> "LazyTextTable":
+        """初始化UI文本表（各语言的文本字典在首次使用时才构建）"""
+        return LazyTextTable({
+            "中文": self._texts_zh,
+            "English": self._texts_en,
+            "日本語": self._texts_ja,
+            "한국어": self._texts_ko,
+            "Français": self._texts_fr,
+            "Deutsch": self._texts_de,
+            "Español": self._texts_es,
+            "Русский": self._texts_ru,
+            "Português (BR)": self._texts_pt,
+            "Italiano": self._texts_it,
+            "Türkçe": self._texts_tr,
+            "Magyar": self._texts_hu,
+        })
+    
+    @staticmethod
+    def _texts_zh() -> Dict[str, str]:
+        """中文界面文本"""
         return {
-                "中文": {
-                "title": "星露谷物语mod i18n AI翻译工具",
-                "config": "配置",
-                "target_language": "目标语言:",
-                "translation_model": "翻译模型:",
-                "refresh_models": "刷新模型",
-                "functions": "功能",
-                "import_mod": "1. 导入 MOD",
-                "extract_mod": "2. 解压 MOD",
-                "extract_i18n": "3. 提取 i18n",
-                "auto_translate": "4. 自动翻译",
-                "stop_translate": "4. 停止翻译",
-                "recompress": "5. 打包MOD",
-                "log": "日志",
-                "app_started": "星露谷物语mod i18n AI翻译工具已启动",
-                "ollama_connected": "Ollama 服务器已连接",
-                "ollama_connected_no_models": "Ollama 服务器已连接，但没有可用模型",
-                "ollama_connection_failed": "Ollama 服务器连接失败",
-                "ollama_connection_error": "无法连接到 Ollama 服务器",
-                "refreshing_models": "正在刷新模型列表...",
-                "refresh_models_failed": "刷新模型失败",
-                "models_refreshed": "模型列表已刷新",
-                "no_available_models": "未找到可用模型",
-                "model_loading_failed": "模型列表加载失败: {}",
-                "initializing_model": "正在初始化模型...",
-                "model_initialized": "模型初始化完成: {}",
-                "ollama_not_installed": "未检测到 Ollama，请按以下步骤操作：\n1. 下载并安装 Ollama: https://ollama.com/\n2. 启动 ollama app.exe 服务\n3. 下载对应模型，推荐使用 qwen2.5-coder:14b\n4. 低性能电脑使用 qwen2.5-coder:7b",
-                # 按钮功能日志消息
-                "imported_file": "已导入: {}",
-                "import_success": "导入MOD完成,请点击解压MOD按钮",
-                "import_failed": "导入文件失败: {}",
-                "no_archives_found": "在导入目录中未找到压缩文件",
-                "extracting_file": "正在解压: {}",
-                "extract_success": "解压成功: {}",
-                "extract_failed": "解压失败 {}: {}",
-                "extract_completed": "解压MOD完成,请点击提取i18n按钮",
-                "extract_error": "解压过程出错: {}",
-                "processing_mod": "处理 MOD: {}",
-                "i18n_extract_completed": "提取i18n完成,可选择mod或者直接点击自动翻译",
-                "i18n_extract_failed": "提取 i18n 文件失败: {}",
-                "ollama_model_required": "请先启动 Ollama 服务器并选择模型",
-                "start_auto_translate": "开始自动翻译到 {}...",
-                "no_json_files": "未找到待翻译的 JSON 文件",
-                "translating_file": "翻译文件: {}",
-                "translate_entry": "  {}: {} -> {}",
-                "translate_file_failed": "翻译文件失败 {}: {}",
-                "auto_translate_completed": "自动翻译完成,请点击打包mod按钮",
-                "auto_translate_error": "自动翻译过程出错: {}",
-                "translate_request_failed": "翻译请求失败: {}",
-                "translate_text_failed": "翻译文本失败: {}",
-                "compressing_mod": "压缩 MOD: {}",
-                "compress_success": "压缩完成: {}",
-                "recompress_completed": "打包完成,可以导入游戏游玩啦~",
-                "compress_error": "压缩过程出错: {}",
-                # 文件对话框和选择相关
-                "select_mod_files": "选择 MOD 文件",
-                "compressed_files": "压缩文件",
-                "all_files": "所有文件",
-                # 编辑对话框相关
-                "edit_translation": "编辑翻译",
-                "original": "原文",
-                "translation": "翻译",
-                "save": "保存",
-                "cancel": "取消",
-                # 设置对话框相关
-                "settings_dialog": "设置",
-                "batch_translate_settings": "批量翻译设置",
-                "auto_save_settings": "自动保存设置",
-                # 文本对比区域相关
-                "text_comparison": "文本对比",
-                "select_mod": "选择MOD:",
-                "refresh_mod_list": "刷新MOD列表",
-                "save_translation": "保存翻译",
-                "clear_directories": "清空目录",
-                "select_file": "选择文件:",
-                "original_text": "原文",
-                "translation_text": "翻译(可双击文本手动编辑)",
-                # 日志消息相关
-                "please_select_mod": "请先选择要翻译的MOD",
-                "please_select_file": "请先选择要翻译的文件",
-                "no_available_files": "没有可用的翻译文件",
-                "start_translating_file": "开始翻译选中文件: {}",
-                "start_translating_mod": "开始翻译MOD: {}",
-                "translation_stopped": "翻译已停止",
-                "stopping_translation": "正在停止翻译...",
-                "please_start_server_first": "请先启动服务器",
-                "translation_updated": "译文已更新",
-                "save_translation_failed": "保存翻译失败: {}",
-                "select_mod_files_title": "选择 MOD 文件",
-                "compressed_files_type": "压缩文件",
-                "all_files_type": "所有文件",
-                "translation_dir_not_exist": "Translation目录不存在，无法压缩",
+            "title": "星露谷物语mod i18n AI翻译工具",
+            "config": "配置",
+            "target_language": "目标语言:",
+            "translation_model": "翻译模型:",
+            "refresh_models": "刷新模型",
+            "functions": "功能",
+            "import_mod": "1. 导入 MOD",
+            "extract_mod": "2. 解压 MOD",
+            "extract_i18n": "3. 提取 i18n",
+            "auto_translate": "4. 自动翻译",
+            "stop_translate": "4. 停止翻译",
+            "recompress": "5. 打包MOD",
+            "log": "日志",
+            "progress_eta": "剩余 {}，{:.0f} 条/分",
+            "app_started": "星露谷物语mod i18n AI翻译工具已启动",
+            "ollama_connected": "Ollama 服务器已连接",
+            "ollama_connected_no_models": "Ollama 服务器已连接，但没有可用模型",
+            "ollama_connection_failed": "Ollama 服务器连接失败",
+            "ollama_connection_error": "无法连接到 Ollama 服务器",
+            "refreshing_models": "正在刷新模型列表...",
+            "refresh_models_failed": "刷新模型失败",
+            "models_refreshed": "模型列表已刷新",
+            "no_available_models": "未找到可用模型",
+            "model_loading_failed": "模型列表加载失败: {}",
+            "initializing_model": "正在初始化模型...",
+            "model_initialized": "模型初始化完成: {}",
+            "ollama_not_installed": "未检测到 Ollama，请按以下步骤操作：\n1. 下载并安装 Ollama: https://ollama.com/\n2. 启动 ollama app.exe 服务\n3. 下载对应模型，推荐使用 qwen2.5-coder:14b\n4. 低性能电脑使用 qwen2.5-coder:7b",
+            # 按钮功能日志消息
+            "imported_file": "已导入: {}",
+            "import_success": "导入MOD完成,请点击解压MOD按钮",
+            "import_failed": "导入文件失败: {}",
+            "no_archives_found": "在导入目录中未找到压缩文件",
+            "extracting_file": "正在解压: {}",
+            "extract_success": "解压成功: {}",
+            "extract_failed": "解压失败 {}: {}",
+            "extract_completed": "解压MOD完成,请点击提取i18n按钮",
+            "extract_error": "解压过程出错: {}",
+            "processing_mod": "处理 MOD: {}",
+            "i18n_extract_completed": "提取i18n完成,可选择mod或者直接点击自动翻译",
+            "i18n_extract_failed": "提取 i18n 文件失败: {}",
+            "ollama_model_required": "请先启动 Ollama 服务器并选择模型",
+            "start_auto_translate": "开始自动翻译到 {}...",
+            "no_json_files": "未找到待翻译的 JSON 文件",
+            "translating_file": "翻译文件: {}",
+            "translate_entry": "  {}: {} -> {}",
+            "translate_file_failed": "翻译文件失败 {}: {}",
+            "auto_translate_completed": "自动翻译完成,请点击打包mod按钮",
+            "auto_translate_error": "自动翻译过程出错: {}",
+            "translate_request_failed": "翻译请求失败: {}",
+            "translate_text_failed": "翻译文本失败: {}",
+            "compressing_mod": "压缩 MOD: {}",
+            "compress_success": "压缩完成: {}",
+            "recompress_completed": "打包完成,可以导入游戏游玩啦~",
+            "compress_error": "压缩过程出错: {}",
+            # 文件对话框和选择相关
+            "select_mod_files": "选择 MOD 文件",
+            "compressed_files": "压缩文件",
+            "all_files": "所有文件",
+            # 编辑对话框相关
+            "edit_translation": "编辑翻译",
+            "original": "原文",
+            "translation": "翻译",
+            "save": "保存",
+            "cancel": "取消",
+            # 设置对话框相关
+            "settings_dialog": "设置",
+            "batch_translate_settings": "批量翻译设置",
+            "auto_save_settings": "自动保存设置",
+            # 文本对比区域相关
+            "text_comparison": "文本对比",
+            "select_mod": "选择MOD:",
+            "refresh_mod_list": "刷新MOD列表",
+            "save_translation": "保存翻译",
+            "clear_directories": "清空目录",
+            "select_file": "选择文件:",
+            "original_text": "原文",
+            "translation_text": "翻译(可双击文本手动编辑)",
+            # 日志消息相关
+            "please_select_mod": "请先选择要翻译的MOD",
+            "please_select_file": "请先选择要翻译的文件",
+            "no_available_files": "没有可用的翻译文件",
+            "start_translating_file": "开始翻译选中文件: {}",
+            "start_translating_mod": "开始翻译MOD: {}",
+            "translation_stopped": "翻译已停止",
+            "stopping_translation": "正在停止翻译...",
+            "please_start_server_first": "请先启动服务器",
+            "translation_updated": "译文已更新",
+            "save_translation_failed": "保存翻译失败: {}",
+            "select_mod_files_title": "选择 MOD 文件",
+            "compressed_files_type": "压缩文件",
+            "all_files_type": "所有文件",
+            "translation_dir_not_exist": "Translation目录不存在，无法压缩",
             "no_available_file_list": "没有可用的文件列表",
-                "auto_switch_next_file": "自动切换到下一个文件: {}",
-                "start_auto_translate_next": "开始自动翻译下一个文件: {}",
-                "all_files_completed": "所有文件翻译完成！",
-                "auto_switch_failed": "自动切换文件失败: {}",
-                "extract_i18n_file": "提取 i18n 文件: {} -> {}",
-                "loaded_original_file": "已加载原文文件进行对比: {}",
-                "load_original_failed": "加载原文文件失败，将翻译所有条目: {}",
-                "smart_comparison_complete": "智能对比完成: 总计 {} 个文本条目，需要翻译 {} 个，跳过 {} 个已翻译条目",
-                "models_loaded": "模型列表加载完成，共{}个模型",
-                "found_entries_no_comparison": "找到 {} 个需要翻译的条目（无原文对比）",
-                "file_no_translation_needed": "文件 {} 无需翻译，跳过",
-                "batch_translation_failed": "批量翻译失败: {}",
-                "auto_saved_translations": "已自动保存 {} 条翻译",
-                "translation_dir_not_exist": "Translation目录不存在，无法压缩",
-                # 新增的硬编码文本
-                "select_mod_first": "请先选择要翻译的MOD",
-                "select_file_first": "请先选择要翻译的文件",
-                "no_available_translation_files": "没有可用的翻译文件",
-                "start_translate_selected_file": "开始翻译选中文件: {}",
-                "start_translate_mod": "开始翻译MOD: {}",
-                "no_translation_data_to_save": "没有可保存的翻译数据",
-                "translation_file_saved": "翻译文件已保存: {}",
-                "cannot_determine_save_path": "无法确定保存文件路径",
-                "save_translation_file_failed": "保存翻译文件失败: {}",
-                "found_mods": "找到 {} 个MOD: {}",
-                "no_mods_found": "未找到任何MOD",
-                "switch_to_mod": "切换到MOD: {}",
-                "refresh_mod_list_failed": "刷新MOD列表失败: {}",
-                "found_localization_files": "找到 {} 个本地化文件",
-                "no_localization_files_found": "未找到本地化文件",
-                "mod_translation_dir_not_exist": "MOD翻译目录不存在",
-                "refresh_file_list_failed": "刷新文件列表失败: {}",
-                "update_translation_display_failed": "更新翻译显示失败: {}",
-                # 文本对比区域相关文本
-                "comparison_data_refreshed": "文本对比数据已刷新",
-                "refresh_comparison_data_failed": "刷新文本对比数据失败: {}",
-                "switch_to_file": "切换到文件: {} (索引: {})",
-                "original_file_not_found": "未找到对应的原文文件: {}",
-                "file_comparison_loaded": "已加载文件对比: {} <-> {}",
-                "load_comparison_failed": "加载对比文件失败: {}",
-                "comparison_data_displayed": "已显示 {} 条对比数据",
-                "display_comparison_failed": "显示对比数据失败: {}",
-                "untranslated_text": "[未翻译]",
-                # 设置对话框详细文本
-                "batch_size_label": "批量翻译大小（每批处理条目数）:",
-                "entries_unit": "个条目",
-                "batch_size_description": "设置每批同时处理的翻译条目数量，较大的值可能提高速度但占用更多资源",
-                "auto_save_interval_label": "自动保存间隔（翻译条目数）:",
-                "auto_save_description": "AI翻译时每翻译指定数量的条目后自动保存JSON文件",
-                "edit_translation_dialog": "编辑翻译",
-                # 设置对话框消息文本
-                "settings_saved": "设置已保存",
-                "error": "错误",
-                "invalid_number_input": "请输入有效的数字",
-                "show_settings_dialog_failed": "显示设置对话框失败",
-                "stopping_translation": "正在停止翻译...",
-                "translation_stopped": "翻译已停止",
-                # 清空目录相关文本
-                "clear_directories_dialog": "清空目录确认",
-                "clear_directories_message": "是否清空以下目录内的所有文件？\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\n此操作不可撤销！",
-                "clear": "清空",
-                "clear_directories_success": "目录清空完成",
-                "clear_directories_failed": "清空目录失败: {}",
-                "clear_directory_success": "已清空目录: {}",
-                "directory_not_exist": "目录不存在: {}",
-                "clear_directories_error": "清空目录时发生错误: {}",
-                "show_clear_dialog_failed": "显示清空对话框失败: {}",
-                "warning": "警告",
-                "clear_directories_confirm": "确认清空",
-                "clear_directories_unavailable": "清空目录功能不可用",
-                "clear_directories_dialog_error": "显示清空目录对话框失败: {}"
-            },
-            "English": {
-                "title": "Stardew Valley MOD i18n AI Translation Tool",
-                "config": "Configuration",
-                "target_language": "Target Language:",
-                "translation_model": "Translation Model:",
-                "refresh_models": "Refresh Models",
-                "functions": "Functions",
-                "import_mod": "1. Import MOD",
-                "extract_mod": "2. Extract MOD",
-                "extract_i18n": "3. Extract i18n",
-                "auto_translate": "4. Auto Translate",
-                "stop_translate": "4. Stop Translation",
-                "recompress": "5. Recompress",
-                "log": "Log",
-                "app_started": "Stardew Valley MOD i18n AI Translation Tool Started",
-                "ollama_connected": "Ollama Server Connected",
-                "ollama_connected_no_models": "Ollama Server Connected, but No Available Models",
-                "ollama_connection_failed": "Ollama Server Connection Failed",
-                "ollama_connection_error": "Unable to Connect to Ollama Server",
-                "refreshing_models": "Refreshing model list...",
-                "refresh_models_failed": "Failed to refresh models",
-                "models_refreshed": "Model list refreshed",
-                "no_available_models": "No available models found",
-                "model_loading_failed": "Model list loading failed: {}",
-                "initializing_model": "Initializing model...",
-                "model_initialized": "Model initialized: {}",
-                "ollama_not_installed": "Ollama not detected, please follow these steps:\n1. Download and install Ollama: https://ollama.com/\n2. Start ollama app.exe service\n3. Download corresponding model, recommend qwen2.5-coder:14b\n4. Use qwen2.5-coder:7b for low-performance computers",
-                # Button function log messages
-                "imported_file": "Imported: {}",
-                "import_success": "Successfully imported {} files",
-                "import_failed": "Failed to import files: {}",
-                "no_archives_found": "No archive files found in import directory",
-                "extracting_file": "Extracting: {}",
-                "extract_success": "Extract successful: {}",
-                "extract_failed": "Extract failed {}: {}",
-                "extract_completed": "MOD extraction completed",
-                "extract_error": "Extraction process error: {}",
-                "processing_mod": "Processing MOD: {}",
-                "i18n_extract_completed": "i18n file extraction completed",
-                "i18n_extract_failed": "Failed to extract i18n files: {}",
-                "ollama_model_required": "Please start Ollama server and select a model first",
-                "start_auto_translate": "Starting auto translation to {}...",
-                "no_json_files": "No JSON files found for translation",
-                "translating_file": "Translating file: {}",
-                "translate_entry": "  {}: {} -> {}",
-                "translate_file_failed": "Failed to translate file {}: {}",
-                "auto_translate_completed": "Auto translation completed",
-                "auto_translate_error": "Auto translation process error: {}",
-                "translate_request_failed": "Translation request failed: {}",
-                "translate_text_failed": "Failed to translate text: {}",
-                "compressing_mod": "Compressing MOD: {}",
-                "compress_success": "Compression completed: {}",
-                "recompress_completed": "MOD recompression completed",
-                "compress_error": "Compression process error: {}",
-                # File dialog texts
-                "select_mod_file": "Select MOD File",
-                "select_files": "Select Files",
-                "extract_i18n_files": "Extract i18n Files",
-                # Edit dialog texts
-                "edit_translation": "Edit Translation",
-                "original_text": "Original Text",
-                "translation": "Translation",
-                "translation_text": "Translation (Double-click to edit manually)",
-                "save": "Save",
-                "cancel": "Cancel",
-                # Settings dialog texts
-                "settings": "Settings",
-                "batch_translate_settings": "Batch Translation Settings",
-                "auto_save_settings": "Auto Save Settings",
-                # Text comparison area texts
-                "text_comparison": "Text Comparison",
-                "select_mod": "Select MOD:",
-                "refresh_mod_list": "Refresh MOD List",
-                "save_translation": "Save Translation",
-                "clear_directories": "Clear Directories",
-                "select_file": "Select File:",
-                "original": "Original",
-                "translated": "Translated",
-                # Log messages
-                "please_select_mod_first": "Please select a MOD to translate first",
-                "please_select_file_first": "Please select a file to translate first",
-                "no_available_file_list": "No available file list",
-                "auto_switch_next_file": "Auto switching to next file",
-                "all_files_translated": "All files translated!",
-                "auto_switch_file_failed": "Auto switch file failed",
-                "translation_dir_not_exist": "Translation directory does not exist, cannot compress",
-                # Additional hardcoded text
-                "select_mod_first": "Please select a MOD to translate first",
-                "select_file_first": "Please select a file to translate first",
-                "no_available_translation_files": "No available translation files",
-                "start_translate_selected_file": "Starting translation of selected file: {}",
-                "start_translate_mod": "Starting translation of MOD: {}",
-                "no_translation_data_to_save": "No translation data to save",
-                "translation_file_saved": "Translation file saved: {}",
-                "cannot_determine_save_path": "Cannot determine save file path",
-                "save_translation_file_failed": "Failed to save translation file: {}",
-                "found_mods": "Found {} MODs: {}",
-                "no_mods_found": "No MODs found",
-                "switch_to_mod": "Switched to MOD: {}",
-                "refresh_mod_list_failed": "Failed to refresh MOD list: {}",
-                "found_localization_files": "Found {} localization files",
-                "no_localization_files_found": "No localization files found",
-                "mod_translation_dir_not_exist": "MOD translation directory does not exist",
-                "refresh_file_list_failed": "Failed to refresh file list: {}",
-                "update_translation_display_failed": "Failed to update translation display: {}",
-                "smart_comparison_complete": "Smart comparison complete",
-                "models_loaded": "Model list loaded, {} models in total",
-                "found_entries_no_comparison": "Found {} entries without comparison",
-                "file_no_translation_needed": "File {} does not need translation, skipping",
-                # Text comparison area related texts
-                "comparison_data_refreshed": "Text comparison data refreshed",
-                "extract_i18n_file": "Extracting i18n file: {} -> {}",
-                "loaded_original_file": "Loaded original file for comparison: {}",
-                "auto_saved_translations": "Auto-saved {} translations",
-                "switch_to_file": "Switched to file: {} (index: {})",
-                "refresh_comparison_data_failed": "Failed to refresh text comparison data: {}",
-                "original_file_not_found": "Original file not found: {}",
-                "file_comparison_loaded": "File comparison loaded: {} <-> {}",
-                "load_comparison_failed": "Failed to load comparison files: {}",
-                "comparison_data_displayed": "Displayed {} comparison data entries",
-                "display_comparison_failed": "Failed to display comparison data: {}",
-                "untranslated_text": "[Untranslated]",
-                # Settings dialog detailed texts
-                "batch_size_label": "Batch Translation Size (entries per batch):",
-                "entries_unit": "entries",
-                "batch_size_description": "Set the number of translation entries to process simultaneously. Larger values may improve speed but use more resources",
-                "auto_save_interval_label": "Auto Save Interval (translation entries):",
-                "auto_save_description": "Automatically save JSON files after translating the specified number of entries during AI translation",
-                "edit_translation_dialog": "Edit Translation",
-                "settings_dialog": "Settings",
-                # Settings dialog message texts
-                "settings_saved": "Settings saved",
-                "error": "Error",
-                "invalid_number_input": "Please enter a valid number",
-                "show_settings_dialog_failed": "Failed to show settings dialog",
-                "stopping_translation": "Stopping translation...",
-                "translation_stopped": "Translation stopped",
-                "please_start_server_first": "Please start the server first",
-                "translation_updated": "Translation updated",
-                "save_translation_failed": "Failed to save translation: {}",
-                "select_mod_files_title": "Select MOD Files",
-                "compressed_files_type": "Compressed Files",
-                "all_files_type": "All Files",
-                "translation_dir_not_exist": "Translation directory does not exist, cannot compress",
-                # Clear directories related texts
-                "clear_directories_dialog": "Clear Directories Confirmation",
-                "clear_directories_message": "Are you sure you want to clear all files in the following directories?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nThis operation cannot be undone!",
-                "clear": "Clear",
-                "clear_directories_success": "Directories cleared successfully",
-                "clear_directories_failed": "Failed to clear directories: {}",
-                "clear_directory_success": "Directory cleared: {}",
-                "directory_not_exist": "Directory does not exist: {}",
-                "clear_directories_error": "Error occurred while clearing directories: {}",
-                "show_clear_dialog_failed": "Failed to show clear dialog: {}",
-                "warning": "Warning",
-                "clear_directories_confirm": "Confirm Clear",
-                "clear_directories_unavailable": "Clear directories function is unavailable",
-                "clear_directories_dialog_error": "Failed to show clear directories dialog: {}"
-            },
-            "日本語": {
-                "title": "スターデューバレー MOD i18n AI翻訳ツール",
-                "config": "設定",
-                "target_language": "対象言語:",
-                "translation_model": "翻訳モデル:",
-                "refresh_models": "モデル更新",
-                "functions": "機能",
-                "import_mod": "1. MOD インポート",
-                "extract_mod": "2. MOD 展開",
-                "extract_i18n": "3. i18n 抽出",
-                "auto_translate": "4. 自動翻訳",
-                "stop_translate": "4. 翻訳停止",
-                "recompress": "5. 再圧縮",
-                "log": "ログ",
-                "app_started": "スターデューバレー MOD 翻訳ツールが開始されました",
-                "ollama_connected": "Ollama サーバーに接続しました",
-                "ollama_connected_no_models": "Ollama サーバーに接続しましたが、利用可能なモデルがありません",
-                "ollama_connection_failed": "Ollama サーバー接続に失敗しました",
-                "ollama_connection_error": "Ollama サーバーに接続できません",
-                "refreshing_models": "モデルリストを更新中...",
-                "refresh_models_failed": "モデル更新に失敗しました",
-                "models_refreshed": "モデルリストが更新されました",
-                "initializing_model": "モデルを初期化中...",
-                "model_initialized": "モデル初期化完了: {}",
-                "ollama_not_installed": "Ollama が検出されませんでした。以下の手順に従ってください：\n1. Ollama をダウンロードしてインストール: https://ollama.com/\n2. ollama app.exe サービスを起動\n3. 対応するモデルをダウンロード、qwen2.5-coder:14b を推奨\n4. 低性能コンピューターは qwen2.5-coder:7b を使用",
-                # ボタン機能ログメッセージ
-                "imported_file": "インポート済み: {}",
-                "import_success": "{}個のファイルを正常にインポートしました",
-                "import_failed": "ファイルのインポートに失敗しました: {}",
-                "no_archives_found": "インポートディレクトリにアーカイブファイルが見つかりません",
-                "extracting_file": "展開中: {}",
-                "extract_success": "展開成功: {}",
-                "extract_failed": "展開失敗 {}: {}",
-                "extract_completed": "MOD展開完了",
-                "extract_error": "展開プロセスエラー: {}",
-                "processing_mod": "MOD処理中: {}",
-                "i18n_extract_completed": "i18nファイル抽出完了",
-                "i18n_extract_failed": "i18nファイルの抽出に失敗しました: {}",
-                "ollama_model_required": "まずOllamaサーバーを起動してモデルを選択してください",
-                "start_auto_translate": "{}への自動翻訳を開始中...",
-                "no_json_files": "翻訳用のJSONファイルが見つかりません",
-                "translating_file": "ファイル翻訳中: {}",
-                "translate_entry": "  {}: {} -> {}",
-                "translate_file_failed": "ファイル翻訳失敗 {}: {}",
-                "auto_translate_completed": "自動翻訳完了",
-                "auto_translate_error": "自動翻訳プロセスエラー: {}",
-                "translate_request_failed": "翻訳リクエスト失敗: {}",
-                "translate_text_failed": "テキスト翻訳失敗: {}",
-                "compressing_mod": "MOD圧縮中: {}",
-                "compress_success": "圧縮完了: {}",
-                "recompress_completed": "MOD再圧縮完了",
-                "compress_error": "圧縮プロセスエラー: {}",
-                # ファイルダイアログテキスト
-                "select_mod_file": "MODファイルを選択",
-                "select_files": "ファイルを選択",
-                "extract_i18n_files": "i18nファイルを抽出",
-                # 編集ダイアログテキスト
-                "edit_translation": "翻訳を編集",
-                "original_text": "原文",
-                "translation": "翻訳",
-                "translation_text": "翻訳（ダブルクリックで手動編集）",
-                "save": "保存",
-                "cancel": "キャンセル",
-                # 設定ダイアログテキスト
-                "settings": "設定",
-                "batch_translate_settings": "一括翻訳設定",
-                "auto_save_settings": "自動保存設定",
-                # テキスト比較エリアテキスト
-                "text_comparison": "テキスト比較",
-                "select_mod": "MODを選択:",
-                "refresh_mod_list": "MODリストを更新",
-                "save_translation": "翻訳を保存",
-                "clear_directories": "ディレクトリをクリア",
-                "select_file": "ファイルを選択:",
-                "original": "原文",
-                "translated": "翻訳済み",
-                # ログメッセージ
-                "please_select_mod_first": "まず翻訳するMODを選択してください",
-                "please_select_file_first": "まず翻訳するファイルを選択してください",
-                "no_available_file_list": "利用可能なファイルリストがありません",
-                "auto_switch_next_file": "次のファイルに自動切り替え",
-                "all_files_translated": "すべてのファイルが翻訳されました！",
-                "auto_switch_file_failed": "ファイルの自動切り替えに失敗しました",
-                "translation_dir_not_exist": "翻訳ディレクトリが存在しないため、圧縮できません",
-                # 追加のハードコードテキスト
-                "select_mod_first": "まず翻訳するMODを選択してください",
-                "select_file_first": "まず翻訳するファイルを選択してください",
-                "no_available_translation_files": "利用可能な翻訳ファイルがありません",
-                "start_translate_selected_file": "選択されたファイルの翻訳を開始: {}",
-                "start_translate_mod": "MODの翻訳を開始: {}",
-                "no_translation_data_to_save": "保存する翻訳データがありません",
-                "translation_file_saved": "翻訳ファイルが保存されました: {}",
-                "cannot_determine_save_path": "保存ファイルパスを決定できません",
-                "save_translation_file_failed": "翻訳ファイルの保存に失敗しました: {}",
-                "found_mods": "{}個のMODが見つかりました: {}",
-                "no_mods_found": "MODが見つかりませんでした",
-                "switch_to_mod": "MODに切り替えました: {}",
-                "refresh_mod_list_failed": "MODリストの更新に失敗しました: {}",
-                "found_localization_files": "{}個のローカライゼーションファイルが見つかりました",
-                "no_localization_files_found": "ローカライゼーションファイルが見つかりませんでした",
-                "mod_translation_dir_not_exist": "MOD翻訳ディレクトリが存在しません",
-                "refresh_file_list_failed": "ファイルリストの更新に失敗しました: {}",
-                "update_translation_display_failed": "翻訳表示の更新に失敗しました: {}",
-                "smart_comparison_complete": "スマート比較が完了しました",
-                "models_loaded": "モデルリストの読み込みが完了しました、合計{}個のモデル",
-                "found_entries_no_comparison": "比較なしで{}個のエントリが見つかりました",
-                "file_no_translation_needed": "ファイル{}は翻訳が不要です、スキップします",
-                # テキスト比較エリア関連のテキスト
-                "comparison_data_refreshed": "テキスト比較データが更新されました",
-                "refresh_comparison_data_failed": "テキスト比較データの更新に失敗しました: {}",
-                "original_file_not_found": "元ファイルが見つかりません: {}",
-                "file_comparison_loaded": "ファイル比較が読み込まれました: {} <-> {}",
-                "load_comparison_failed": "比較ファイルの読み込みに失敗しました: {}",
-                "comparison_data_displayed": "{}個の比較データエントリが表示されました",
-                "display_comparison_failed": "比較データの表示に失敗しました: {}",
-                "untranslated_text": "[未翻訳]",
-                # 設定ダイアログ詳細テキスト
-                "batch_size_label": "バッチ翻訳サイズ（バッチあたりのエントリ数）:",
-                "entries_unit": "エントリ",
-                "batch_size_description": "同時に処理する翻訳エントリの数を設定します。大きな値は速度を向上させる可能性がありますが、より多くのリソースを使用します",
-                "auto_save_interval_label": "自動保存間隔（翻訳エントリ数）:",
-                "auto_save_description": "AI翻訳中に指定された数のエントリを翻訳した後、JSONファイルを自動保存します",
-                "edit_translation_dialog": "翻訳を編集",
-                "settings_dialog": "設定",
-                # 設定ダイアログメッセージテキスト
-                "settings_saved": "設定が保存されました",
-                "error": "エラー",
-                "invalid_number_input": "有効な数字を入力してください",
-                "show_settings_dialog_failed": "設定ダイアログの表示に失敗しました",
-                "stopping_translation": "翻訳を停止しています...",
-                "translation_stopped": "翻訳が停止されました",
-                "please_start_server_first": "まずサーバーを起動してください",
-                "translation_updated": "翻訳が更新されました",
-                "save_translation_failed": "翻訳の保存に失敗しました: {}",
-                "select_mod_files_title": "MODファイルを選択",
-                "compressed_files_type": "圧縮ファイル",
-                "all_files_type": "すべてのファイル",
-                "translation_dir_not_exist": "Translationディレクトリが存在しません、圧縮できません",
-                # 清空目录相关文本
-                "clear_directories_dialog": "ディレクトリクリア確認",
-                "clear_directories_message": "以下のディレクトリ内のすべてのファイルをクリアしますか？\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nこの操作は元に戻せません！",
-                "clear": "クリア",
-                "clear_directories_success": "ディレクトリクリア完了",
-                "clear_directories_failed": "ディレクトリクリア失敗: {}",
-                "clear_directory_success": "ディレクトリをクリアしました: {}",
-                "directory_not_exist": "ディレクトリが存在しません: {}",
-                "clear_directories_error": "ディレクトリクリア中にエラーが発生しました: {}",
-                "show_clear_dialog_failed": "クリアダイアログの表示に失敗しました: {}",
-                "warning": "警告",
-                "clear_directories_confirm": "クリア確認",
-                "clear_directories_unavailable": "ディレクトリクリア機能は利用できません",
-                "clear_directories_dialog_error": "ディレクトリクリアダイアログの表示に失敗しました: {}",
-                "switch_to_file": "ファイルに切り替えました: {} (インデックス: {})",
-            },
-            "한국어": {
-                "title": "스타듀 밸리 MOD i18n AI번역 도구",
-                "config": "설정",
-                "target_language": "대상 언어:",
-                "translation_model": "번역 모델:",
-                "refresh_models": "모델 새로고침",
-                "functions": "기능",
-                "import_mod": "1. MOD 가져오기",
-                "extract_mod": "2. MOD 압축 해제",
-                "extract_i18n": "3. i18n 추출",
-                "auto_translate": "4. 자동 번역",
-                "stop_translate": "4. 번역 중지",
-                "recompress": "5. 재압축",
-                "log": "로그",
-                "app_started": "스타듀 밸리 MOD 번역 도구가 시작되었습니다",
-                "ollama_connected": "Ollama 서버에 연결되었습니다",
-                "ollama_connected_no_models": "Ollama 서버에 연결되었지만 사용 가능한 모델이 없습니다",
-                "ollama_connection_failed": "Ollama 서버 연결에 실패했습니다",
-                "ollama_connection_error": "Ollama 서버에 연결할 수 없습니다",
-                "refreshing_models": "모델 목록을 새로고침하는 중...",
-                "refresh_models_failed": "모델 새로고침에 실패했습니다",
-                "models_refreshed": "모델 목록이 새로고침되었습니다",
-                "initializing_model": "모델 초기화 중...",
-                "model_initialized": "모델 초기화 완료: {}",
-                "ollama_not_installed": "Ollama가 감지되지 않았습니다. 다음 단계를 따르세요:\n1. Ollama 다운로드 및 설치: https://ollama.com/\n2. ollama app.exe 서비스 시작\n3. 해당 모델 다운로드, qwen2.5-coder:14b 권장\n4. 저성능 컴퓨터는 qwen2.5-coder:7b 사용",
-                # 버튼 기능 로그 메시지
-                "imported_file": "가져옴: {}",
-                "import_success": "{}개 파일을 성공적으로 가져왔습니다",
-                "import_failed": "파일 가져오기 실패: {}",
-                "no_archives_found": "가져오기 디렉토리에서 압축 파일을 찾을 수 없습니다",
-                "extracting_file": "압축 해제 중: {}",
-                "extract_success": "압축 해제 성공: {}",
-                "extract_failed": "압축 해제 실패 {}: {}",
-                "extract_completed": "MOD 압축 해제 완료",
-                "extract_error": "압축 해제 프로세스 오류: {}",
-                "processing_mod": "MOD 처리 중: {}",
-                "i18n_extract_completed": "i18n 파일 추출 완료",
-                "i18n_extract_failed": "i18n 파일 추출 실패: {}",
-                "ollama_model_required": "먼저 Ollama 서버를 시작하고 모델을 선택하세요",
-                "start_auto_translate": "{}로 자동 번역 시작 중...",
-                "no_json_files": "번역할 JSON 파일을 찾을 수 없습니다",
-                "translating_file": "파일 번역 중: {}",
-                "translate_entry": "  {}: {} -> {}",
-                "translate_file_failed": "파일 번역 실패 {}: {}",
-                "auto_translate_completed": "자동 번역 완료",
-                "auto_translate_error": "자동 번역 프로세스 오류: {}",
-                "translate_request_failed": "번역 요청 실패: {}",
-                "translate_text_failed": "텍스트 번역 실패: {}",
-                "compressing_mod": "MOD 압축 중: {}",
-                "compress_success": "압축 완료: {}",
-                "recompress_completed": "MOD 재압축 완료",
-                "compress_error": "압축 프로세스 오류: {}",
-                # 파일 대화상자 텍스트
-                "select_mod_file": "MOD 파일 선택",
-                "select_files": "파일 선택",
-                "extract_i18n_files": "i18n 파일 추출",
-                # 편집 대화상자 텍스트
-                "edit_translation": "번역 편집",
-                "original_text": "원문",
-                "translation": "번역",
-                "translation_text": "번역 (더블클릭하여 수동 편집)",
-                "save": "저장",
-                "cancel": "취소",
-                # 설정 대화상자 텍스트
-                "settings": "설정",
-                "batch_translate_settings": "일괄 번역 설정",
-                "auto_save_settings": "자동 저장 설정",
-                # 텍스트 비교 영역 텍스트
-                "text_comparison": "텍스트 비교",
-                "select_mod": "MOD 선택:",
-                "refresh_mod_list": "MOD 목록 새로고침",
-                "save_translation": "번역 저장",
-                "clear_directories": "디렉토리 지우기",
-                "select_file": "파일 선택:",
-                "original": "원문",
-                "translated": "번역됨",
-                # 로그 메시지
-                "please_select_mod_first": "먼저 번역할 MOD를 선택하세요",
-                "please_select_file_first": "먼저 번역할 파일을 선택하세요",
-                "no_available_file_list": "사용 가능한 파일 목록이 없습니다",
-                "auto_switch_next_file": "다음 파일로 자동 전환",
-                "all_files_translated": "모든 파일이 번역되었습니다!",
-                "auto_switch_file_failed": "파일 자동 전환 실패",
-                "translation_dir_not_exist": "번역 디렉토리가 존재하지 않아 압축할 수 없습니다",
-                # 추가 하드코드 텍스트
-                "select_mod_first": "먼저 번역할 MOD를 선택하세요",
-                "select_file_first": "먼저 번역할 파일을 선택하세요",
-                "no_available_translation_files": "사용 가능한 번역 파일이 없습니다",
-                "start_translate_selected_file": "선택된 파일 번역 시작: {}",
-                "start_translate_mod": "MOD 번역 시작: {}",
-                "no_translation_data_to_save": "저장할 번역 데이터가 없습니다",
-                "translation_file_saved": "번역 파일이 저장되었습니다: {}",
-                "cannot_determine_save_path": "저장 파일 경로를 결정할 수 없습니다",
-                "save_translation_file_failed": "번역 파일 저장 실패: {}",
-                "found_mods": "{}개의 MOD를 찾았습니다: {}",
-                "no_mods_found": "MOD를 찾을 수 없습니다",
-                "switch_to_mod": "MOD로 전환했습니다: {}",
-                "refresh_mod_list_failed": "MOD 목록 새로고침 실패: {}",
-                "found_localization_files": "{}개의 로컬라이제이션 파일을 찾았습니다",
-                "no_localization_files_found": "로컬라이제이션 파일을 찾을 수 없습니다",
-                "mod_translation_dir_not_exist": "MOD 번역 디렉토리가 존재하지 않습니다",
-                "refresh_file_list_failed": "파일 목록 새로고침 실패: {}",
-                "update_translation_display_failed": "번역 표시 업데이트 실패: {}",
-                "smart_comparison_complete": "스마트 비교가 완료되었습니다",
-                "models_loaded": "모델 목록 로드 완료, 총 {}개 모델",
-                "found_entries_no_comparison": "비교 없이 {}개의 항목을 찾았습니다",
-                "file_no_translation_needed": "파일 {}는 번역이 필요하지 않습니다, 건너뜁니다",
-                # 텍스트 비교 영역 관련 텍스트
-                "comparison_data_refreshed": "텍스트 비교 데이터가 새로고침되었습니다",
-                "refresh_comparison_data_failed": "텍스트 비교 데이터 새로고침 실패: {}",
-                "original_file_not_found": "원본 파일을 찾을 수 없습니다: {}",
-                "file_comparison_loaded": "파일 비교가 로드되었습니다: {} <-> {}",
-                "load_comparison_failed": "비교 파일 로드 실패: {}",
-                "comparison_data_displayed": "{}개의 비교 데이터 항목이 표시되었습니다",
-                "display_comparison_failed": "비교 데이터 표시 실패: {}",
-                "untranslated_text": "[번역되지 않음]",
-                # 설정 대화상자 세부 텍스트
-                "batch_size_label": "배치 번역 크기 (배치당 항목 수):",
-                "entries_unit": "항목",
-                "batch_size_description": "동시에 처리할 번역 항목 수를 설정합니다. 큰 값은 속도를 향상시킬 수 있지만 더 많은 리소스를 사용합니다",
-                "auto_save_interval_label": "자동 저장 간격 (번역 항목 수):",
-                "auto_save_description": "AI 번역 중 지정된 수의 항목을 번역한 후 JSON 파일을 자동으로 저장합니다",
-                "edit_translation_dialog": "번역 편집",
-                "settings_dialog": "설정",
-                # 설정 대화상자 메시지 텍스트
-                "settings_saved": "설정이 저장되었습니다",
-                "error": "오류",
-                "invalid_number_input": "유효한 숫자를 입력하세요",
-                "show_settings_dialog_failed": "설정 대화상자 표시 실패",
-                "stopping_translation": "번역을 중지하는 중...",
-                "translation_stopped": "번역이 중지되었습니다",
-                "please_start_server_first": "먼저 서버를 시작하세요",
-                "translation_updated": "번역이 업데이트되었습니다",
-                "save_translation_failed": "번역 저장 실패: {}",
-                "select_mod_files_title": "MOD 파일 선택",
-                "compressed_files_type": "압축 파일",
-                "all_files_type": "모든 파일",
-                "translation_dir_not_exist": "Translation 디렉토리가 존재하지 않아 압축할 수 없습니다",
-                # 清空目录相关文本
-                "clear_directories_dialog": "디렉토리 지우기 확인",
-                "clear_directories_message": "다음 디렉토리의 모든 파일을 지우시겠습니까?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\n이 작업은 되돌릴 수 없습니다!",
-                "clear": "지우기",
-                "clear_directories_success": "디렉토리 지우기 완료",
-                "clear_directories_failed": "디렉토리 지우기 실패: {}",
-                "clear_directory_success": "디렉토리를 지웠습니다: {}",
-                "directory_not_exist": "디렉토리가 존재하지 않습니다: {}",
-                "clear_directories_error": "디렉토리 지우기 중 오류가 발생했습니다: {}",
-                "show_clear_dialog_failed": "지우기 대화상자 표시 실패: {}",
-                "warning": "경고",
-                "clear_directories_confirm": "지우기 확인",
-                "clear_directories_unavailable": "디렉토리 지우기 기능을 사용할 수 없습니다",
-                "clear_directories_dialog_error": "디렉토리 지우기 대화상자 표시 실패: {}",
-                "switch_to_file": "파일로 전환: {} (인덱스: {})",
-            },
-            "Français": {
-                "title": "Outil de Traduction MOD i18n AI Stardew Valley",
-                "config": "Configuration",
-                "target_language": "Langue Cible:",
-                "translation_model": "Modèle de Traduction:",
-                "refresh_models": "Actualiser Modèles",
-                "functions": "Fonctions",
-                "import_mod": "1. Importer MOD",
-                "extract_mod": "2. Extraire MOD",
-                "extract_i18n": "3. Extraire i18n",
-                "auto_translate": "4. Traduction Auto",
-                "stop_translate": "4. Arrêter Traduction",
-                "recompress": "5. Recompresser",
-                "log": "Journal",
-                "app_started": "Outil de Traduction MOD Stardew Valley Démarré",
-                "ollama_connected": "Serveur Ollama Connecté",
-                "ollama_connected_no_models": "Serveur Ollama Connecté, mais Aucun Modèle Disponible",
-                "ollama_connection_failed": "Échec de Connexion au Serveur Ollama",
-                "ollama_connection_error": "Impossible de se Connecter au Serveur Ollama",
-                "refreshing_models": "Actualisation de la liste des modèles...",
-                "refresh_models_failed": "Échec de l'actualisation des modèles",
-                "models_refreshed": "Liste des modèles actualisée",
-                "no_available_models": "Aucun modèle disponible trouvé",
-                "model_loading_failed": "Échec du chargement de la liste des modèles: {}",
-                "initializing_model": "Initialisation du modèle...",
-                "model_initialized": "Modèle initialisé: {}",
-                "ollama_not_installed": "Ollama non détecté, veuillez suivre ces étapes:\n1. Télécharger et installer Ollama: https://ollama.com/\n2. Démarrer le service ollama app.exe\n3. Télécharger le modèle correspondant, qwen2.5-coder:14b recommandé\n4. Utiliser qwen2.5-coder:7b pour les ordinateurs peu performants",
-                # Messages de journal des fonctions de bouton
-                "imported_file": "Importé: {}",
-                "import_success": "{} fichiers importés avec succès",
-                "import_failed": "Échec de l'importation du fichier: {}",
-                "no_archives_found": "Aucun fichier d'archive trouvé dans le répertoire d'importation",
-                "extracting_file": "Extraction: {}",
-                "extract_success": "Extraction réussie: {}",
-                "extract_failed": "Échec de l'extraction {}: {}",
-                "extract_completed": "Extraction MOD terminée",
-                "extract_error": "Erreur du processus d'extraction: {}",
-                "processing_mod": "Traitement du MOD: {}",
-                "i18n_extract_completed": "Extraction des fichiers i18n terminée",
-                "i18n_extract_failed": "Échec de l'extraction des fichiers i18n: {}",
-                "ollama_model_required": "Veuillez d'abord démarrer le serveur Ollama et sélectionner un modèle",
-                "start_auto_translate": "Début de la traduction automatique vers {}...",
-                "no_json_files": "Aucun fichier JSON trouvé pour la traduction",
-                "translating_file": "Traduction du fichier: {}",
-                "translate_entry": "  {}: {} -> {}",
-                "translate_file_failed": "Échec de la traduction du fichier {}: {}",
-                "auto_translate_completed": "Traduction automatique terminée",
-                "auto_translate_error": "Erreur du processus de traduction automatique: {}",
-                "translate_request_failed": "Échec de la demande de traduction: {}",
-                "translate_text_failed": "Échec de la traduction du texte: {}",
-                "compressing_mod": "Compression du MOD: {}",
-                "compress_success": "Compression terminée: {}",
-                "recompress_completed": "Recompression MOD terminée",
-                "compress_error": "Erreur du processus de compression: {}",
-                # Textes de dialogue de fichier
-                "select_mod_file": "Sélectionner Fichier MOD",
-                "select_files": "Sélectionner Fichiers",
-                "extract_i18n_files": "Extraire Fichiers i18n",
-                # Textes de dialogue d'édition
-                "edit_translation": "Éditer Traduction",
-                "original_text": "Texte Original",
-                "translation": "Traduction",
-                "translation_text": "Traduction (Double-cliquez pour éditer manuellement)",
-                "save": "Enregistrer",
-                "cancel": "Annuler",
-                # Textes de dialogue de paramètres
-                "settings": "Paramètres",
-                "batch_translate_settings": "Paramètres Traduction par Lot",
-                "auto_save_settings": "Paramètres Sauvegarde Auto",
-                # Textes de zone de comparaison de texte
-                "text_comparison": "Comparaison de Texte",
-                "select_mod": "Sélectionner MOD:",
-                "refresh_mod_list": "Actualiser Liste MOD",
-                "save_translation": "Enregistrer Traduction",
-                "clear_directories": "Vider Répertoires",
-                "select_file": "Sélectionner Fichier:",
-                "original": "Original",
-                "translated": "Traduit",
-                # Messages de journal
-                "please_select_mod_first": "Veuillez d'abord sélectionner un MOD à traduire",
-                "please_select_file_first": "Veuillez d'abord sélectionner un fichier à traduire",
-                "no_available_file_list": "Aucune liste de fichiers disponible",
-                "auto_switch_next_file": "Basculement automatique vers le fichier suivant",
-                "all_files_translated": "Tous les fichiers ont été traduits!",
-                "auto_switch_file_failed": "Échec du basculement automatique de fichier",
-                "translation_dir_not_exist": "Le répertoire de traduction n'existe pas, impossible de compresser",
-                # Texte codé en dur supplémentaire
-                "select_mod_first": "Veuillez d'abord sélectionner un MOD à traduire",
-                "select_file_first": "Veuillez d'abord sélectionner un fichier à traduire",
-                "no_available_translation_files": "Aucun fichier de traduction disponible",
-                "start_translate_selected_file": "Début de la traduction du fichier sélectionné: {}",
-                "start_translate_mod": "Début de la traduction du MOD: {}",
-                "no_translation_data_to_save": "Aucune donnée de traduction à enregistrer",
-                "translation_file_saved": "Fichier de traduction enregistré: {}",
-                "cannot_determine_save_path": "Impossible de déterminer le chemin du fichier de sauvegarde",
-                "save_translation_file_failed": "Échec de l'enregistrement du fichier de traduction: {}",
-                "found_mods": "Trouvé {} MODs: {}",
-                "no_mods_found": "Aucun MOD trouvé",
-                "switch_to_mod": "Basculé vers le MOD: {}",
-                "refresh_mod_list_failed": "Échec de l'actualisation de la liste des MODs: {}",
-                "found_localization_files": "Trouvé {} fichiers de localisation",
-                "no_localization_files_found": "Aucun fichier de localisation trouvé",
-                "mod_translation_dir_not_exist": "Le répertoire de traduction MOD n'existe pas",
-                "refresh_file_list_failed": "Échec de l'actualisation de la liste des fichiers: {}",
-                "update_translation_display_failed": "Échec de la mise à jour de l'affichage de traduction: {}",
-                "smart_comparison_complete": "Comparaison intelligente terminée",
-                "models_loaded": "Liste des modèles chargée, {} modèles au total",
-                "found_entries_no_comparison": "Trouvé {} entrées sans comparaison",
-                "file_no_translation_needed": "Le fichier {} n'a pas besoin de traduction, ignoré",
-                # Textes liés à la zone de comparaison de texte
-                "comparison_data_refreshed": "Données de comparaison de texte actualisées",
-                "refresh_comparison_data_failed": "Échec de l'actualisation des données de comparaison de texte: {}",
-                "original_file_not_found": "Fichier original non trouvé: {}",
-                "file_comparison_loaded": "Comparaison de fichiers chargée: {} <-> {}",
-                "load_comparison_failed": "Échec du chargement des fichiers de comparaison: {}",
-                "comparison_data_displayed": "Affiché {} entrées de données de comparaison",
-                "display_comparison_failed": "Échec de l'affichage des données de comparaison: {}",
-                "untranslated_text": "[Non traduit]",
-                # Textes détaillés de la boîte de dialogue des paramètres
-                "batch_size_label": "Taille de traduction par lot (entrées par lot):",
-                "entries_unit": "entrées",
-                "batch_size_description": "Définir le nombre d'entrées de traduction à traiter simultanément. Des valeurs plus importantes peuvent améliorer la vitesse mais utilisent plus de ressources",
-                "auto_save_interval_label": "Intervalle de sauvegarde automatique (entrées de traduction):",
-                "auto_save_description": "Sauvegarder automatiquement les fichiers JSON après avoir traduit le nombre spécifié d'entrées pendant la traduction IA",
-                "edit_translation_dialog": "Modifier la traduction",
-                "settings_dialog": "Paramètres",
-                # Textes de message de la boîte de dialogue des paramètres
-                "settings_saved": "Paramètres sauvegardés",
-                "error": "Erreur",
-                "invalid_number_input": "Veuillez entrer un nombre valide",
-                "show_settings_dialog_failed": "Échec de l'affichage de la boîte de dialogue des paramètres",
-                "stopping_translation": "Arrêt de la traduction...",
-                "extract_i18n_file": "Extraction du fichier i18n: {} -> {}",
-                "loaded_original_file": "Fichier original chargé pour comparaison: {}",
-                "auto_saved_translations": "Sauvegarde automatique de {} traductions",
-                "translation_stopped": "Traduction arrêtée",
-                "please_start_server_first": "Veuillez d'abord démarrer le serveur",
-                "translation_updated": "Traduction mise à jour",
-                "save_translation_failed": "Échec de la sauvegarde de la traduction: {}",
-                "select_mod_files_title": "Sélectionner les fichiers MOD",
-                "compressed_files_type": "Fichiers compressés",
-                "all_files_type": "Tous les fichiers",
-                "translation_dir_not_exist": "Le répertoire Translation n'existe pas, impossible de compresser",
-                # 清空目录相关文本
-                "clear_directories_dialog": "Confirmation de vidage des répertoires",
-                "clear_directories_message": "Êtes-vous sûr de vouloir vider tous les fichiers des répertoires suivants ?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nCette opération ne peut pas être annulée !",
-                "clear": "Vider",
-                "clear_directories_success": "Répertoires vidés avec succès",
-                "clear_directories_failed": "Échec du vidage des répertoires : {}",
-                "clear_directory_success": "Répertoire vidé : {}",
-                "directory_not_exist": "Le répertoire n'existe pas : {}",
-                "clear_directories_error": "Erreur lors du vidage des répertoires : {}",
-                "show_clear_dialog_failed": "Échec de l'affichage de la boîte de dialogue de vidage : {}",
-                "warning": "Avertissement",
-                "clear_directories_confirm": "Confirmer le vidage",
-                "clear_directories_unavailable": "La fonction de vidage des répertoires n'est pas disponible",
-                "clear_directories_dialog_error": "Échec de l'affichage de la boîte de dialogue de vidage des répertoires : {}",
-                "switch_to_file": "Basculé vers le fichier : {} (index : {})",
-            },
-            "Deutsch": {
-                "title": "Stardew Valley MOD i18n AI Übersetzungstool",
-                "config": "Konfiguration",
-                "target_language": "Zielsprache:",
-                "translation_model": "Übersetzungsmodell:",
-                "refresh_models": "Modelle Aktualisieren",
-                "functions": "Funktionen",
-                "import_mod": "1. MOD Importieren",
-                "extract_mod": "2. MOD Extrahieren",
-                "extract_i18n": "3. i18n Extrahieren",
-                "auto_translate": "4. Auto Übersetzen",
-                "stop_translate": "4. Übersetzung Stoppen",
-                "recompress": "5. Neu Komprimieren",
-                "log": "Protokoll",
-                "app_started": "Stardew Valley MOD Übersetzungstool Gestartet",
-                "ollama_connected": "Ollama Server Verbunden",
-                "ollama_connected_no_models": "Ollama Server Verbunden, aber Keine Verfügbaren Modelle",
-                "ollama_connection_failed": "Ollama Server Verbindung Fehlgeschlagen",
-                "ollama_connection_error": "Kann nicht mit Ollama Server Verbinden",
-                "refreshing_models": "Modellliste wird aktualisiert...",
-                "refresh_models_failed": "Modellaktualisierung fehlgeschlagen",
-                "models_refreshed": "Modellliste aktualisiert",
-                "no_available_models": "Keine verfügbaren Modelle gefunden",
-                "model_loading_failed": "Laden der Modellliste fehlgeschlagen: {}",
-                "initializing_model": "Modell wird initialisiert...",
-                "model_initialized": "Modell initialisiert: {}",
-                "ollama_not_installed": "Ollama nicht erkannt, bitte folgen Sie diesen Schritten:\n1. Ollama herunterladen und installieren: https://ollama.com/\n2. ollama app.exe Service starten\n3. Entsprechendes Modell herunterladen, qwen2.5-coder:14b empfohlen\n4. qwen2.5-coder:7b für leistungsschwache Computer verwenden",
-                # Button-Funktions-Log-Nachrichten
-                "imported_file": "Importiert: {}",
-                "import_success": "{} Dateien erfolgreich importiert",
-                "import_failed": "Datei-Import fehlgeschlagen: {}",
-                "no_archives_found": "Keine Archivdateien im Import-Verzeichnis gefunden",
-                "extracting_file": "Extrahiere: {}",
-                "extract_success": "Extraktion erfolgreich: {}",
-                "extract_failed": "Extraktion fehlgeschlagen {}: {}",
-                "extract_completed": "MOD-Extraktion abgeschlossen",
-                "extract_error": "Extraktionsprozess-Fehler: {}",
-                "processing_mod": "MOD wird verarbeitet: {}",
-                "i18n_extract_completed": "i18n-Datei-Extraktion abgeschlossen",
-                "i18n_extract_failed": "i18n-Datei-Extraktion fehlgeschlagen: {}",
-                "ollama_model_required": "Bitte starten Sie zuerst den Ollama-Server und wählen Sie ein Modell",
-                "start_auto_translate": "Automatische Übersetzung nach {} wird gestartet...",
-                "no_json_files": "Keine JSON-Dateien für die Übersetzung gefunden",
-                "translating_file": "Datei wird übersetzt: {}",
-                "translate_entry": "  {}: {} -> {}",
-                "translate_file_failed": "Dateiübersetzung fehlgeschlagen {}: {}",
-                "auto_translate_completed": "Automatische Übersetzung abgeschlossen",
-                "auto_translate_error": "Automatischer Übersetzungsprozess-Fehler: {}",
-                "translate_request_failed": "Übersetzungsanfrage fehlgeschlagen: {}",
-                "translate_text_failed": "Textübersetzung fehlgeschlagen: {}",
-                "compressing_mod": "MOD wird komprimiert: {}",
-                "compress_success": "Komprimierung abgeschlossen: {}",
-                "recompress_completed": "MOD-Rekomprimierung abgeschlossen",
-                "compress_error": "Komprimierungsprozess-Fehler: {}",
-                # Dateidialog-Texte
-                "select_mod_file": "MOD-Datei Auswählen",
-                "select_files": "Dateien Auswählen",
-                "extract_i18n_files": "i18n-Dateien Extrahieren",
-                # Bearbeitungsdialog-Texte
-                "edit_translation": "Übersetzung Bearbeiten",
-                "original_text": "Originaltext",
-                "translation": "Übersetzung",
-                "translation_text": "Übersetzung (Doppelklicken zum manuellen Bearbeiten)",
-                "save": "Speichern",
-                "cancel": "Abbrechen",
-                # Einstellungsdialog-Texte
-                "settings": "Einstellungen",
-                "batch_translate_settings": "Stapelübersetzung Einstellungen",
-                "auto_save_settings": "Automatisches Speichern Einstellungen",
-                # Textvergleichsbereich-Texte
-                "text_comparison": "Textvergleich",
-                "select_mod": "MOD Auswählen:",
-                "refresh_mod_list": "MOD-Liste Aktualisieren",
-                "save_translation": "Übersetzung Speichern",
-                "clear_directories": "Verzeichnisse Leeren",
-                "select_file": "Datei Auswählen:",
-                "original": "Original",
-                "translated": "Übersetzt",
-                # Log-Nachrichten
-                "please_select_mod_first": "Bitte wählen Sie zuerst einen MOD zum Übersetzen aus",
-                "please_select_file_first": "Bitte wählen Sie zuerst eine Datei zum Übersetzen aus",
-                "no_available_file_list": "Keine verfügbare Dateiliste",
-                "auto_switch_next_file": "Automatischer Wechsel zur nächsten Datei",
-                "all_files_translated": "Alle Dateien wurden übersetzt!",
-                "auto_switch_file_failed": "Automatischer Dateiwechsel fehlgeschlagen",
-                "translation_dir_not_exist": "Übersetzungsverzeichnis existiert nicht, kann nicht komprimieren",
-                # Zusätzlicher hartcodierter Text
-                "select_mod_first": "Bitte wählen Sie zuerst einen MOD zum Übersetzen aus",
-                "select_file_first": "Bitte wählen Sie zuerst eine Datei zum Übersetzen aus",
-                "no_available_translation_files": "Keine verfügbaren Übersetzungsdateien",
-                "start_translate_selected_file": "Übersetzung der ausgewählten Datei beginnt: {}",
-                "start_translate_mod": "MOD-Übersetzung beginnt: {}",
-                "no_translation_data_to_save": "Keine Übersetzungsdaten zum Speichern",
-                "translation_file_saved": "Übersetzungsdatei gespeichert: {}",
-                "cannot_determine_save_path": "Kann Speicherdateipfad nicht bestimmen",
-                "save_translation_file_failed": "Speichern der Übersetzungsdatei fehlgeschlagen: {}",
-                "found_mods": "{} MODs gefunden: {}",
-                "no_mods_found": "Keine MODs gefunden",
-                "switch_to_mod": "Zu MOD gewechselt: {}",
-                "refresh_mod_list_failed": "MOD-Liste aktualisieren fehlgeschlagen: {}",
-                "found_localization_files": "{} Lokalisierungsdateien gefunden",
-                "no_localization_files_found": "Keine Lokalisierungsdateien gefunden",
-                "mod_translation_dir_not_exist": "MOD-Übersetzungsverzeichnis existiert nicht",
-                "refresh_file_list_failed": "Dateiliste aktualisieren fehlgeschlagen: {}",
-                "update_translation_display_failed": "Übersetzungsanzeige aktualisieren fehlgeschlagen: {}",
-                "smart_comparison_complete": "Intelligenter Vergleich abgeschlossen",
-                "models_loaded": "Modellliste geladen, {} Modelle insgesamt",
-                "found_entries_no_comparison": "{} Einträge ohne Vergleich gefunden",
-                "file_no_translation_needed": "Datei {} benötigt keine Übersetzung, übersprungen",
-                # Textvergleichsbereich-bezogene Texte
-                "comparison_data_refreshed": "Textvergleichsdaten aktualisiert",
-                "refresh_comparison_data_failed": "Aktualisierung der Textvergleichsdaten fehlgeschlagen: {}",
-                "original_file_not_found": "Originaldatei nicht gefunden: {}",
-                "file_comparison_loaded": "Dateivergleich geladen: {} <-> {}",
-                "load_comparison_failed": "Laden der Vergleichsdateien fehlgeschlagen: {}",
-                "comparison_data_displayed": "{} Vergleichsdateneinträge angezeigt",
-                "display_comparison_failed": "Anzeige der Vergleichsdaten fehlgeschlagen: {}",
-                "untranslated_text": "[Unübersetzt]",
-                # Detaillierte Texte für Einstellungsdialog
-                "batch_size_label": "Batch-Übersetzungsgröße (Einträge pro Batch):",
-                "entries_unit": "Einträge",
-                "batch_size_description": "Anzahl der gleichzeitig zu verarbeitenden Übersetzungseinträge festlegen. Größere Werte können die Geschwindigkeit verbessern, verbrauchen aber mehr Ressourcen",
-                "auto_save_interval_label": "Automatisches Speicherintervall (Übersetzungseinträge):",
-                "auto_save_description": "JSON-Dateien automatisch speichern, nachdem die angegebene Anzahl von Einträgen während der KI-Übersetzung übersetzt wurde",
-                "edit_translation_dialog": "Übersetzung bearbeiten",
-                "settings_dialog": "Einstellungen",
-                # Einstellungsdialog-Nachrichtentexte
-                "settings_saved": "Einstellungen gespeichert",
-                "error": "Fehler",
-                "invalid_number_input": "Bitte geben Sie eine gültige Zahl ein",
-                "show_settings_dialog_failed": "Fehler beim Anzeigen des Einstellungsdialogs",
-                "stopping_translation": "Übersetzung wird gestoppt...",
-                "translation_stopped": "Übersetzung gestoppt",
-                "please_start_server_first": "Bitte starten Sie zuerst den Server",
-                "translation_updated": "Übersetzung aktualisiert",
-                "save_translation_failed": "Fehler beim Speichern der Übersetzung: {}",
-                "select_mod_files_title": "MOD-Dateien auswählen",
-                "compressed_files_type": "Komprimierte Dateien",
-                "all_files_type": "Alle Dateien",
-                "extract_i18n_file": "i18n-Datei extrahieren: {} -> {}",
-                "loaded_original_file": "Originaldatei zum Vergleich geladen: {}",
-                "auto_saved_translations": "Automatisch {} Übersetzungen gespeichert",
-                "translation_dir_not_exist": "Translation-Verzeichnis existiert nicht, kann nicht komprimieren",
-                # 清空目录相关文本
-                "clear_directories_dialog": "Verzeichnisse leeren bestätigen",
-                "clear_directories_message": "Sind Sie sicher, dass Sie alle Dateien in den folgenden Verzeichnissen löschen möchten?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nDieser Vorgang kann nicht rückgängig gemacht werden!",
-                "clear": "Leeren",
-                "clear_directories_success": "Verzeichnisse erfolgreich geleert",
-                "clear_directories_failed": "Fehler beim Leeren der Verzeichnisse: {}",
-                "clear_directory_success": "Verzeichnis geleert: {}",
-                "directory_not_exist": "Verzeichnis existiert nicht: {}",
-                "clear_directories_error": "Fehler beim Leeren der Verzeichnisse: {}",
-                "show_clear_dialog_failed": "Fehler beim Anzeigen des Lösch-Dialogs: {}",
-                "warning": "Warnung",
-                "clear_directories_confirm": "Leeren bestätigen",
-                "clear_directories_unavailable": "Verzeichnis-Leerungsfunktion ist nicht verfügbar",
-                "clear_directories_dialog_error": "Fehler beim Anzeigen des Verzeichnis-Leerungs-Dialogs: {}",
-                "switch_to_file": "Zu Datei gewechselt: {} (Index: {})",
-            },
-            "Español": {
-                "title": "Herramienta de Traducción MOD i18n AI Stardew Valley",
-                "config": "Configuración",
-                "target_language": "Idioma Objetivo:",
-                "translation_model": "Modelo de Traducción:",
-                "refresh_models": "Actualizar Modelos",
-                "functions": "Funciones",
-                "import_mod": "1. Importar MOD",
-                "extract_mod": "2. Extraer MOD",
-                "extract_i18n": "3. Extraer i18n",
-                "auto_translate": "4. Traducir Auto",
-                "stop_translate": "4. Detener Traducción",
-                "recompress": "5. Recomprimir",
-                "log": "Registro",
-                "app_started": "Herramienta de Traducción MOD Stardew Valley Iniciada",
-                "ollama_connected": "Servidor Ollama Conectado",
-                "ollama_connected_no_models": "Servidor Ollama Conectado, pero Sin Modelos Disponibles",
-                "ollama_connection_failed": "Falló la Conexión al Servidor Ollama",
-                "ollama_connection_error": "No se Puede Conectar al Servidor Ollama",
-                "refreshing_models": "Actualizando lista de modelos...",
-                "refresh_models_failed": "Falló la actualización de modelos",
-                "models_refreshed": "Lista de modelos actualizada",
-                "no_available_models": "No se encontraron modelos disponibles",
-                "model_loading_failed": "Error al cargar la lista de modelos: {}",
-                "initializing_model": "Inicializando modelo...",
-                "model_initialized": "Modelo inicializado: {}",
-                "ollama_not_installed": "Ollama no detectado, por favor siga estos pasos:\n1. Descargar e instalar Ollama: https://ollama.com/\n2. Iniciar el servicio ollama app.exe\n3. Descargar el modelo correspondiente, se recomienda qwen2.5-coder:14b\n4. Usar qwen2.5-coder:7b para computadoras de bajo rendimiento",
-                # Mensajes de registro de funciones de botón
-                "imported_file": "Importado: {}",
-                "import_success": "{} archivos importados exitosamente",
-                "import_failed": "Falló la importación del archivo: {}",
-                "no_archives_found": "No se encontraron archivos de archivo en el directorio de importación",
-                "extracting_file": "Extrayendo: {}",
-                "extract_success": "Extracción exitosa: {}",
-                "extract_failed": "Falló la extracción {}: {}",
-                "extract_completed": "Extracción de MOD completada",
-                "extract_error": "Error del proceso de extracción: {}",
-                "processing_mod": "Procesando MOD: {}",
-                "i18n_extract_completed": "Extracción de archivos i18n completada",
-                "i18n_extract_failed": "Falló la extracción de archivos i18n: {}",
-                "ollama_model_required": "Por favor, inicie primero el servidor Ollama y seleccione un modelo",
-                "start_auto_translate": "Iniciando traducción automática a {}...",
-                "no_json_files": "No se encontraron archivos JSON para traducir",
-                "translating_file": "Traduciendo archivo: {}",
-                "translate_entry": "  {}: {} -> {}",
-                "translate_file_failed": "Falló la traducción del archivo {}: {}",
-                "auto_translate_completed": "Traducción automática completada",
-                "auto_translate_error": "Error del proceso de traducción automática: {}",
-                "translate_request_failed": "Falló la solicitud de traducción: {}",
-                "translate_text_failed": "Falló la traducción del texto: {}",
-                "compressing_mod": "Comprimiendo MOD: {}",
-                "compress_success": "Compresión completada: {}",
-                "recompress_completed": "Recompresión de MOD completada",
-                "compress_error": "Error del proceso de compresión: {}",
-                # Textos de diálogo de archivo
-                "select_mod_file": "Seleccionar Archivo MOD",
-                "select_files": "Seleccionar Archivos",
-                "extract_i18n_files": "Extraer Archivos i18n",
-                # Textos de diálogo de edición
-                "edit_translation": "Editar Traducción",
-                "original_text": "Texto Original",
-                "translation": "Traducción",
-                "translation_text": "Traducción (Doble clic para editar manualmente)",
-                "save": "Guardar",
-                "cancel": "Cancelar",
-                # Textos de diálogo de configuración
-                "settings": "Configuración",
-                "batch_translate_settings": "Configuración de Traducción por Lotes",
-                "auto_save_settings": "Configuración de Guardado Automático",
-                # Textos del área de comparación de texto
-                "text_comparison": "Comparación de Texto",
-                "select_mod": "Seleccionar MOD:",
-                "refresh_mod_list": "Actualizar Lista de MOD",
-                "save_translation": "Guardar Traducción",
-                "clear_directories": "Vaciar Directorios",
-                "select_file": "Seleccionar Archivo:",
-                "original": "Original",
-                "translated": "Traducido",
-                # Mensajes de registro
-                "please_select_mod_first": "Por favor, seleccione primero un MOD para traducir",
-                "please_select_file_first": "Por favor, seleccione primero un archivo para traducir",
-                "no_available_file_list": "No hay lista de archivos disponible",
-                "auto_switch_next_file": "Cambio automático al siguiente archivo",
-                "all_files_translated": "¡Todos los archivos han sido traducidos!",
-                "auto_switch_file_failed": "Falló el cambio automático de archivo",
-                "translation_dir_not_exist": "El directorio de traducción no existe, no se puede comprimir",
-                # Texto hardcodeado adicional
-                "select_mod_first": "Por favor, seleccione primero un MOD para traducir",
-                "select_file_first": "Por favor, seleccione primero un archivo para traducir",
-                "no_available_translation_files": "No hay archivos de traducción disponibles",
-                "start_translate_selected_file": "Iniciando traducción del archivo seleccionado: {}",
-                "start_translate_mod": "Iniciando traducción del MOD: {}",
-                "no_translation_data_to_save": "No hay datos de traducción para guardar",
-                "translation_file_saved": "Archivo de traducción guardado: {}",
-                "cannot_determine_save_path": "No se puede determinar la ruta de guardado del archivo",
-                "save_translation_file_failed": "Error al guardar el archivo de traducción: {}",
-                "found_mods": "Se encontraron {} MODs: {}",
-                "no_mods_found": "No se encontraron MODs",
-                "switch_to_mod": "Cambiado al MOD: {}",
-                "refresh_mod_list_failed": "Error al actualizar la lista de MODs: {}",
-                "found_localization_files": "Se encontraron {} archivos de localización",
-                "no_localization_files_found": "No se encontraron archivos de localización",
-                "mod_translation_dir_not_exist": "El directorio de traducción del MOD no existe",
-                "refresh_file_list_failed": "Error al actualizar la lista de archivos: {}",
-                "update_translation_display_failed": "Error al actualizar la visualización de traducción: {}",
-                "smart_comparison_complete": "Comparación inteligente completada",
-                "models_loaded": "Lista de modelos cargada, {} modelos en total",
-                "found_entries_no_comparison": "Se encontraron {} entradas sin comparación",
-                "file_no_translation_needed": "El archivo {} no necesita traducción, omitido",
-                # Textos relacionados con el área de comparación de texto
-                "comparison_data_refreshed": "Datos de comparación de texto actualizados",
-                "refresh_comparison_data_failed": "Error al actualizar los datos de comparación de texto: {}",
-                "original_file_not_found": "Archivo original no encontrado: {}",
-                "file_comparison_loaded": "Comparación de archivos cargada: {} <-> {}",
-                "load_comparison_failed": "Error al cargar archivos de comparación: {}",
-                "comparison_data_displayed": "Se mostraron {} entradas de datos de comparación",
-                "display_comparison_failed": "Error al mostrar datos de comparación: {}",
-                "untranslated_text": "[Sin traducir]",
-                # Textos detallados del diálogo de configuración
-                "batch_size_label": "Tamaño de traducción por lotes (entradas por lote):",
-                "entries_unit": "entradas",
-                "batch_size_description": "Establecer el número de entradas de traducción a procesar simultáneamente. Valores más grandes pueden mejorar la velocidad pero usan más recursos",
-                "auto_save_interval_label": "Intervalo de guardado automático (entradas de traducción):",
-                "auto_save_description": "Guardar automáticamente archivos JSON después de traducir el número especificado de entradas durante la traducción IA",
-                "edit_translation_dialog": "Editar traducción",
-                "settings_dialog": "Configuración",
-                # Textos de mensaje del diálogo de configuración
-                "settings_saved": "Configuración guardada",
-                "error": "Error",
-                "invalid_number_input": "Por favor ingrese un número válido",
-                "show_settings_dialog_failed": "Error al mostrar el diálogo de configuración",
-                "stopping_translation": "Deteniendo traducción...",
-                "translation_stopped": "Traducción detenida",
-                "please_start_server_first": "Por favor inicie el servidor primero",
-                "translation_updated": "Traducción actualizada",
-                "save_translation_failed": "Error al guardar la traducción: {}",
-                "select_mod_files_title": "Seleccionar archivos MOD",
-                "compressed_files_type": "Archivos comprimidos",
-                "all_files_type": "Todos los archivos",
-                "extract_i18n_file": "Extrayendo archivo i18n: {} -> {}",
-                "loaded_original_file": "Archivo original cargado para comparación: {}",
-                "auto_saved_translations": "Guardado automático de {} traducciones",
-                "translation_dir_not_exist": "El directorio Translation no existe, no se puede comprimir",
-                # 清空目录相关文本
-                "clear_directories_dialog": "Confirmar vaciado de directorios",
-                "clear_directories_message": "¿Está seguro de que desea vaciar todos los archivos de los siguientes directorios?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\n¡Esta operación no se puede deshacer!",
-                "clear": "Vaciar",
-                "clear_directories_success": "Directorios vaciados exitosamente",
-                "clear_directories_failed": "Error al vaciar directorios: {}",
-                "clear_directory_success": "Directorio vaciado: {}",
-                "directory_not_exist": "El directorio no existe: {}",
-                "clear_directories_error": "Error al vaciar directorios: {}",
-                "show_clear_dialog_failed": "Error al mostrar el diálogo de vaciado: {}",
-                "warning": "Advertencia",
-                "clear_directories_confirm": "Confirmar vaciado",
-                "clear_directories_unavailable": "La función de vaciado de directorios no está disponible",
-                "clear_directories_dialog_error": "Error al mostrar el diálogo de vaciado de directorios: {}",
-                "switch_to_file": "Cambiado a archivo: {} (índice: {})",
-            },
-            "Русский": {
-                "title": "Инструмент Перевода MOD i18n AI Stardew Valley",
-                "config": "Конфигурация",
-                "target_language": "Целевой Язык:",
-                "translation_model": "Модель Перевода:",
-                "refresh_models": "Обновить Модели",
-                "functions": "Функции",
-                "import_mod": "1. Импорт MOD",
-                "extract_mod": "2. Извлечь MOD",
-                "extract_i18n": "3. Извлечь i18n",
-                "auto_translate": "4. Авто Перевод",
-                "stop_translate": "4. Остановить Перевод",
-                "recompress": "5. Пересжать",
-                "log": "Журнал",
-                "app_started": "Инструмент Перевода MOD Stardew Valley Запущен",
-                "ollama_connected": "Сервер Ollama Подключен",
-                "ollama_connected_no_models": "Сервер Ollama Подключен, но Нет Доступных Моделей",
-                "ollama_connection_failed": "Не Удалось Подключиться к Серверу Ollama",
-                "ollama_connection_error": "Невозможно Подключиться к Серверу Ollama",
-                "refreshing_models": "Обновление списка моделей...",
-                "refresh_models_failed": "Не удалось обновить модели",
-                "models_refreshed": "Список моделей обновлен",
-                "no_available_models": "Доступные модели не найдены",
-                "model_loading_failed": "Ошибка загрузки списка моделей: {}",
-                "initializing_model": "Инициализация модели...",
-                "model_initialized": "Модель инициализирована: {}",
-                "ollama_not_installed": "Ollama не обнаружен, пожалуйста, выполните следующие шаги:\n1. Скачать и установить Ollama: https://ollama.com/\n2. Запустить службу ollama app.exe\n3. Скачать соответствующую модель, рекомендуется qwen2.5-coder:14b\n4. Использовать qwen2.5-coder:7b для компьютеров с низкой производительностью",
-                # Сообщения журнала функций кнопок
-                "imported_file": "Импортировано: {}",
-                "import_success": "{} файлов успешно импортировано",
-                "import_failed": "Не удалось импортировать файл: {}",
-                "no_archives_found": "Архивные файлы не найдены в каталоге импорта",
-                "extracting_file": "Извлечение: {}",
-                "extract_success": "Извлечение успешно: {}",
-                "extract_failed": "Не удалось извлечь {}: {}",
-                "extract_completed": "Извлечение MOD завершено",
-                "extract_error": "Ошибка процесса извлечения: {}",
-                "processing_mod": "Обработка MOD: {}",
-                "i18n_extract_completed": "Извлечение файлов i18n завершено",
-                "i18n_extract_failed": "Не удалось извлечь файлы i18n: {}",
-                "ollama_model_required": "Пожалуйста, сначала запустите сервер Ollama и выберите модель",
-                "start_auto_translate": "Начинается автоматический перевод на {}...",
-                "no_json_files": "JSON файлы для перевода не найдены",
-                "translating_file": "Перевод файла: {}",
-                "translate_entry": "  {}: {} -> {}",
-                "translate_file_failed": "Не удалось перевести файл {}: {}",
-                "auto_translate_completed": "Автоматический перевод завершен",
-                "auto_translate_error": "Ошибка процесса автоматического перевода: {}",
-                "translate_request_failed": "Не удалось выполнить запрос перевода: {}",
-                "translate_text_failed": "Не удалось перевести текст: {}",
-                "compressing_mod": "Сжатие MOD: {}",
-                "compress_success": "Сжатие завершено: {}",
-                "recompress_completed": "Пересжатие MOD завершено",
-                "compress_error": "Ошибка процесса сжатия: {}",
-                # Тексты диалогов файлов
-                "select_mod_file": "Выбрать Файл MOD",
-                "select_files": "Выбрать Файлы",
-                "extract_i18n_files": "Извлечь Файлы i18n",
-                # Тексты диалога редактирования
-                "edit_translation": "Редактировать Перевод",
-                "original_text": "Исходный Текст",
-                "translation": "Перевод",
-                "translation_text": "Перевод (Дважды щелкните для ручного редактирования)",
-                "save": "Сохранить",
-                "cancel": "Отмена",
-                # Тексты диалога настроек
-                "settings": "Настройки",
-                "batch_translate_settings": "Настройки Пакетного Перевода",
-                "auto_save_settings": "Настройки Автосохранения",
-                # Тексты области сравнения текста
-                "text_comparison": "Сравнение Текста",
-                "select_mod": "Выбрать MOD:",
-                "refresh_mod_list": "Обновить Список MOD",
-                "save_translation": "Сохранить Перевод",
-                "clear_directories": "Очистить Каталоги",
-                "select_file": "Выбрать Файл:",
-                "original": "Оригинал",
-                "translated": "Переведено",
-                # Сообщения журнала
-                "please_select_mod_first": "Пожалуйста, сначала выберите MOD для перевода",
-                "please_select_file_first": "Пожалуйста, сначала выберите файл для перевода",
-                "no_available_file_list": "Нет доступного списка файлов",
-                "auto_switch_next_file": "Автоматическое переключение на следующий файл",
-                "all_files_translated": "Все файлы переведены!",
-                "auto_switch_file_failed": "Не удалось автоматически переключить файл",
-                "translation_dir_not_exist": "Каталог переводов не существует, невозможно сжать",
-                # Дополнительный жестко закодированный текст
-                "select_mod_first": "Пожалуйста, сначала выберите MOD для перевода",
-                "select_file_first": "Пожалуйста, сначала выберите файл для перевода",
-                "no_available_translation_files": "Нет доступных файлов перевода",
-                "start_translate_selected_file": "Начинается перевод выбранного файла: {}",
-                "start_translate_mod": "Начинается перевод MOD: {}",
-                "no_translation_data_to_save": "Нет данных перевода для сохранения",
-                "translation_file_saved": "Файл перевода сохранен: {}",
-                "cannot_determine_save_path": "Невозможно определить путь сохранения файла",
-                "save_translation_file_failed": "Ошибка сохранения файла перевода: {}",
-                "found_mods": "Найдено {} MOD: {}",
-                "no_mods_found": "MOD не найдены",
-                "switch_to_mod": "Переключено на MOD: {}",
-                "refresh_mod_list_failed": "Ошибка обновления списка MOD: {}",
-                "found_localization_files": "Найдено {} файлов локализации",
-                "no_localization_files_found": "Файлы локализации не найдены",
-                "mod_translation_dir_not_exist": "Каталог переводов MOD не существует",
-                "refresh_file_list_failed": "Ошибка обновления списка файлов: {}",
-                "update_translation_display_failed": "Ошибка обновления отображения перевода: {}",
-                "smart_comparison_complete": "Умное сравнение завершено",
-                "models_loaded": "Список моделей загружен, всего {} моделей",
-                "found_entries_no_comparison": "Найдено {} записей без сравнения",
-                "file_no_translation_needed": "Файл {} не нуждается в переводе, пропущен",
-                # Тексты, связанные с областью сравнения текста
-                "comparison_data_refreshed": "Данные сравнения текста обновлены",
-                "refresh_comparison_data_failed": "Не удалось обновить данные сравнения текста: {}",
-                "original_file_not_found": "Исходный файл не найден: {}",
-                "file_comparison_loaded": "Сравнение файлов загружено: {} <-> {}",
-                "load_comparison_failed": "Не удалось загрузить файлы сравнения: {}",
-                "comparison_data_displayed": "Отображено {} записей данных сравнения",
-                "display_comparison_failed": "Не удалось отобразить данные сравнения: {}",
-                "untranslated_text": "[Не переведено]",
-                # Подробные тексты диалога настроек
-                "batch_size_label": "Размер пакетного перевода (записей в пакете):",
-                "entries_unit": "записей",
-                "batch_size_description": "Установить количество записей перевода для одновременной обработки. Большие значения могут улучшить скорость, но используют больше ресурсов",
-                "auto_save_interval_label": "Интервал автосохранения (записей перевода):",
-                "auto_save_description": "Автоматически сохранять JSON файлы после перевода указанного количества записей во время ИИ перевода",
-                "edit_translation_dialog": "Редактировать перевод",
-                "settings_dialog": "Настройки",
-                # Тексты сообщений диалога настроек
-                "settings_saved": "Настройки сохранены",
-                "error": "Ошибка",
-                "invalid_number_input": "Пожалуйста, введите действительное число",
-                "show_settings_dialog_failed": "Ошибка отображения диалога настроек",
-                "stopping_translation": "Остановка перевода...",
-                "translation_stopped": "Перевод остановлен",
-                "please_start_server_first": "Пожалуйста, сначала запустите сервер",
-                "translation_updated": "Перевод обновлен",
-                "save_translation_failed": "Ошибка сохранения перевода: {}",
-                "select_mod_files_title": "Выбрать файлы MOD",
-                "compressed_files_type": "Сжатые файлы",
-                "all_files_type": "Все файлы",
-                "extract_i18n_file": "Извлечение файла i18n: {} -> {}",
-                "loaded_original_file": "Оригинальный файл загружен для сравнения: {}",
-                "auto_saved_translations": "Автоматически сохранено {} переводов",
-                "translation_dir_not_exist": "Каталог Translation не существует, сжатие невозможно",
-                # 清空目录相关文本
-                "clear_directories_dialog": "Подтверждение очистки каталогов",
-                "clear_directories_message": "Вы уверены, что хотите очистить все файлы в следующих каталогах?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nЭта операция необратима!",
-                "clear": "Очистить",
-                "clear_directories_success": "Каталоги успешно очищены",
-                "clear_directories_failed": "Ошибка очистки каталогов: {}",
-                "clear_directory_success": "Каталог очищен: {}",
-                "directory_not_exist": "Каталог не существует: {}",
-                "clear_directories_error": "Ошибка при очистке каталогов: {}",
-                "show_clear_dialog_failed": "Ошибка отображения диалога очистки: {}",
-                "warning": "Предупреждение",
-                "clear_directories_confirm": "Подтвердить очистку",
-                "clear_directories_unavailable": "Функция очистки каталогов недоступна",
-                "clear_directories_dialog_error": "Ошибка отображения диалога очистки каталогов: {}",
-                "switch_to_file": "Переключено на файл: {} (индекс: {})",
-            },
-            "Português (BR)": {
-                "title": "Ferramenta de Tradução MOD i18n AI Stardew Valley",
-                "config": "Configuração",
-                "target_language": "Idioma Alvo:",
-                "translation_model": "Modelo de Tradução:",
-                "refresh_models": "Atualizar Modelos",
-                "functions": "Funções",
-                "import_mod": "1. Importar MOD",
-                "extract_mod": "2. Extrair MOD",
-                "extract_i18n": "3. Extrair i18n",
-                "auto_translate": "4. Tradução Auto",
-                "stop_translate": "4. Parar Tradução",
-                "recompress": "5. Recomprimir",
-                "log": "Registro",
-                "app_started": "Ferramenta de Tradução MOD Stardew Valley Iniciada",
-                "ollama_connected": "Servidor Ollama Conectado",
-                "ollama_connected_no_models": "Servidor Ollama Conectado, mas Sem Modelos Disponíveis",
-                "ollama_connection_failed": "Falha na Conexão com Servidor Ollama",
-                "ollama_connection_error": "Não é Possível Conectar ao Servidor Ollama",
-                "refreshing_models": "Atualizando lista de modelos...",
-                "refresh_models_failed": "Falha ao atualizar modelos",
-                "models_refreshed": "Lista de modelos atualizada",
-                "no_available_models": "Nenhum modelo disponível encontrado",
-                "model_loading_failed": "Falha ao carregar lista de modelos: {}",
-                "initializing_model": "Inicializando modelo...",
-                "model_initialized": "Modelo inicializado: {}",
-                "ollama_not_installed": "Ollama não detectado, por favor siga estes passos:\n1. Baixar e instalar Ollama: https://ollama.com/\n2. Iniciar o serviço ollama app.exe\n3. Baixar o modelo correspondente, recomenda-se qwen2.5-coder:14b\n4. Usar qwen2.5-coder:7b para computadores de baixo desempenho",
-                # Mensagens de log das funções dos botões
-                "imported_file": "Importado: {}",
-                "import_success": "{} arquivos importados com sucesso",
-                "import_failed": "Falha ao importar arquivo: {}",
-                "no_archives_found": "Nenhum arquivo de arquivo encontrado no diretório de importação",
-                "extracting_file": "Extraindo: {}",
-                "extract_success": "Extração bem-sucedida: {}",
-                "extract_failed": "Falha na extração {}: {}",
-                "extract_completed": "Extração de MOD concluída",
-                "extract_error": "Erro no processo de extração: {}",
-                "processing_mod": "Processando MOD: {}",
-                "i18n_extract_completed": "Extração de arquivos i18n concluída",
-                "i18n_extract_failed": "Falha na extração de arquivos i18n: {}",
-                "ollama_model_required": "Por favor, inicie primeiro o servidor Ollama e selecione um modelo",
-                "start_auto_translate": "Iniciando tradução automática para {}...",
-                "no_json_files": "Nenhum arquivo JSON encontrado para tradução",
-                "translating_file": "Traduzindo arquivo: {}",
-                "translate_entry": "  {}: {} -> {}",
-                "translate_file_failed": "Falha na tradução do arquivo {}: {}",
-                "auto_translate_completed": "Tradução automática concluída",
-                "auto_translate_error": "Erro no processo de tradução automática: {}",
-                "translate_request_failed": "Falha na solicitação de tradução: {}",
-                "translate_text_failed": "Falha na tradução do texto: {}",
-                "compressing_mod": "Comprimindo MOD: {}",
-                "compress_success": "Compressão concluída: {}",
-                "recompress_completed": "Recompressão de MOD concluída",
-                "compress_error": "Erro no processo de compressão: {}",
-                # Textos de diálogo de arquivo
-                "select_mod_file": "Selecionar Arquivo MOD",
-                "select_files": "Selecionar Arquivos",
-                "extract_i18n_files": "Extrair Arquivos i18n",
-                # Textos de diálogo de edição
-                "edit_translation": "Editar Tradução",
-                "original_text": "Texto Original",
-                "translation": "Tradução",
-                "save": "Salvar",
-                "cancel": "Cancelar",
-                # Textos de diálogo de configuração
-                "settings": "Configurações",
-                "batch_translate_settings": "Configurações de Tradução em Lote",
-                "auto_save_settings": "Configurações de Salvamento Automático",
-                # Textos da área de comparação de texto
-                "text_comparison": "Comparação de Texto",
-                "select_mod": "Selecionar MOD:",
-                "refresh_mod_list": "Atualizar Lista de MOD",
-                "save_translation": "Salvar Tradução",
-                "clear_directories": "Limpar Diretórios",
-                "select_file": "Selecionar Arquivo:",
-                "original": "Original",
-                "translation_text": "Tradução (Clique duplo para editar manualmente)",
-                "translated": "Traduzido",
-                # Mensagens de log
-                "please_select_mod_first": "Por favor, selecione primeiro um MOD para traduzir",
-                "please_select_file_first": "Por favor, selecione primeiro um arquivo para traduzir",
-                "no_available_file_list": "Nenhuma lista de arquivos disponível",
-                "auto_switch_next_file": "Mudança automática para o próximo arquivo",
-                "all_files_translated": "Todos os arquivos foram traduzidos!",
-                "auto_switch_file_failed": "Falha na mudança automática de arquivo",
-                "translation_dir_not_exist": "Diretório de tradução não existe, não é possível comprimir",
-                # Texto hardcoded adicional
-                "select_mod_first": "Por favor, selecione primeiro um MOD para traduzir",
-                "select_file_first": "Por favor, selecione primeiro um arquivo para traduzir",
-                "no_available_translation_files": "Nenhum arquivo de tradução disponível",
-                "start_translate_selected_file": "Iniciando tradução do arquivo selecionado: {}",
-                "start_translate_mod": "Iniciando tradução do MOD: {}",
-                "no_translation_data_to_save": "Nenhum dado de tradução para salvar",
-                "translation_file_saved": "Arquivo de tradução salvo: {}",
-                "cannot_determine_save_path": "Não é possível determinar o caminho de salvamento do arquivo",
-                "save_translation_file_failed": "Falha ao salvar arquivo de tradução: {}",
-                "found_mods": "Encontrados {} MODs: {}",
-                "no_mods_found": "Nenhum MOD encontrado",
-                "switch_to_mod": "Mudado para MOD: {}",
-                "refresh_mod_list_failed": "Falha ao atualizar lista de MODs: {}",
-                "found_localization_files": "Encontrados {} arquivos de localização",
-                "no_localization_files_found": "Nenhum arquivo de localização encontrado",
-                "mod_translation_dir_not_exist": "Diretório de tradução do MOD não existe",
-                "refresh_file_list_failed": "Falha ao atualizar lista de arquivos: {}",
-                "update_translation_display_failed": "Falha ao atualizar exibição de tradução: {}",
-                "smart_comparison_complete": "Comparação inteligente concluída",
-                "models_loaded": "Lista de modelos carregada, {} modelos no total",
-                "found_entries_no_comparison": "Encontradas {} entradas sem comparação",
-                "file_no_translation_needed": "Arquivo {} não precisa de tradução, ignorado",
-                # Textos relacionados à área de comparação de texto
-                "comparison_data_refreshed": "Dados de comparação de texto atualizados",
-                "refresh_comparison_data_failed": "Falha ao atualizar dados de comparação de texto: {}",
-                "original_file_not_found": "Arquivo original não encontrado: {}",
-                "file_comparison_loaded": "Comparação de arquivos carregada: {} <-> {}",
-                "load_comparison_failed": "Falha ao carregar arquivos de comparação: {}",
-                "comparison_data_displayed": "Exibidas {} entradas de dados de comparação",
-                "display_comparison_failed": "Falha ao exibir dados de comparação: {}",
-                "untranslated_text": "[Não traduzido]",
-                # Textos detalhados do diálogo de configurações
-                "batch_size_label": "Tamanho da tradução em lote (entradas por lote):",
-                "entries_unit": "entradas",
-                "batch_size_description": "Definir o número de entradas de tradução para processar simultaneamente. Valores maiores podem melhorar a velocidade mas usam mais recursos",
-                "auto_save_interval_label": "Intervalo de salvamento automático (entradas de tradução):",
-                "auto_save_description": "Salvar automaticamente arquivos JSON após traduzir o número especificado de entradas durante a tradução IA",
-                "edit_translation_dialog": "Editar tradução",
-                "settings_dialog": "Configurações",
-                # Textos de mensagem do diálogo de configurações
-                "settings_saved": "Configurações salvas",
-                "error": "Erro",
-                "invalid_number_input": "Por favor, insira um número válido",
-                "show_settings_dialog_failed": "Falha ao exibir diálogo de configurações",
-                "stopping_translation": "Parando tradução...",
-                "translation_stopped": "Tradução parada",
-                "please_start_server_first": "Por favor, inicie o servidor primeiro",
-                "translation_updated": "Tradução atualizada",
-                "save_translation_failed": "Falha ao salvar tradução: {}",
-                "select_mod_files_title": "Selecionar arquivos MOD",
-                "compressed_files_type": "Arquivos comprimidos",
-                "all_files_type": "Todos os arquivos",
-                "extract_i18n_file": "Extraindo arquivo i18n: {} -> {}",
-                "loaded_original_file": "Arquivo original carregado para comparação: {}",
-                "auto_saved_translations": "Salvamento automático de {} traduções",
-                "translation_dir_not_exist": "Diretório Translation não existe, não é possível comprimir",
-                # 清空目录相关文本
-                "clear_directories_dialog": "Confirmação de limpeza de diretórios",
-                "clear_directories_message": "Tem certeza de que deseja limpar todos os arquivos dos seguintes diretórios?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nEsta operação não pode ser desfeita!",
-                "clear": "Limpar",
-                "clear_directories_success": "Diretórios limpos com sucesso",
-                "clear_directories_failed": "Falha ao limpar diretórios: {}",
-                "clear_directory_success": "Diretório limpo: {}",
-                "directory_not_exist": "Diretório não existe: {}",
-                "clear_directories_error": "Erro ao limpar diretórios: {}",
-                "show_clear_dialog_failed": "Falha ao exibir diálogo de limpeza: {}",
-                "warning": "Aviso",
-                "clear_directories_confirm": "Confirmar limpeza",
-                "clear_directories_unavailable": "Função de limpeza de diretórios não está disponível",
-                "clear_directories_dialog_error": "Falha ao exibir diálogo de limpeza de diretórios: {}",
-                "switch_to_file": "Mudado para arquivo: {} (índice: {})",
-            },
-            "Italiano": {
-                "title": "Strumento di Traduzione MOD i18n AI Stardew Valley",
-                "config": "Configurazione",
-                "target_language": "Lingua di Destinazione:",
-                "translation_model": "Modello di Traduzione:",
-                "refresh_models": "Aggiorna Modelli",
-                "functions": "Funzioni",
-                "import_mod": "1. Importa MOD",
-                "extract_mod": "2. Estrai MOD",
-                "extract_i18n": "3. Estrai i18n",
-                "auto_translate": "4. Traduzione Auto",
-                "stop_translate": "4. Fermare Traduzione",
-                "recompress": "5. Ricomprimi",
-                "log": "Registro",
-                "app_started": "Strumento di Traduzione MOD Stardew Valley Avviato",
-                "ollama_connected": "Server Ollama Connesso",
-                "ollama_connected_no_models": "Server Ollama Connesso, ma Nessun Modello Disponibile",
-                "ollama_connection_failed": "Connessione al Server Ollama Fallita",
-                "ollama_connection_error": "Impossibile Connettersi al Server Ollama",
-                "refreshing_models": "Aggiornamento elenco modelli...",
-                "refresh_models_failed": "Aggiornamento modelli fallito",
-                "models_refreshed": "Elenco modelli aggiornato",
-                "no_available_models": "Nessun modello disponibile trovato",
-                "model_loading_failed": "Caricamento elenco modelli fallito: {}",
-                "initializing_model": "Inizializzazione modello...",
-                "model_initialized": "Modello inizializzato: {}",
-                "ollama_not_installed": "Ollama non rilevato, si prega di seguire questi passaggi:\n1. Scaricare e installare Ollama: https://ollama.com/\n2. Avviare il servizio ollama app.exe\n3. Scaricare il modello corrispondente, si consiglia qwen2.5-coder:14b\n4. Utilizzare qwen2.5-coder:7b per computer a basse prestazioni",
-                # Messaggi di log delle funzioni dei pulsanti
-                "imported_file": "Importato: {}",
-                "import_success": "{} file importati con successo",
-                "import_failed": "Importazione file fallita: {}",
-                "no_archives_found": "Nessun file di archivio trovato nella directory di importazione",
-                "extracting_file": "Estrazione: {}",
-                "extract_success": "Estrazione riuscita: {}",
-                "extract_failed": "Estrazione fallita {}: {}",
-                "extract_completed": "Estrazione MOD completata",
-                "extract_error": "Errore del processo di estrazione: {}",
-                "processing_mod": "Elaborazione MOD: {}",
-                "i18n_extract_completed": "Estrazione file i18n completata",
-                "i18n_extract_failed": "Estrazione file i18n fallita: {}",
-                "ollama_model_required": "Si prega di avviare prima il server Ollama e selezionare un modello",
-                "start_auto_translate": "Avvio traduzione automatica in {}...",
-                "no_json_files": "Nessun file JSON trovato per la traduzione",
-                "translating_file": "Traduzione file: {}",
-                "translate_entry": "  {}: {} -> {}",
-                "translate_file_failed": "Traduzione file fallita {}: {}",
-                "auto_translate_completed": "Traduzione automatica completata",
-                "auto_translate_error": "Errore del processo di traduzione automatica: {}",
-                "translate_request_failed": "Richiesta di traduzione fallita: {}",
-                "translate_text_failed": "Traduzione testo fallita: {}",
-                "compressing_mod": "Compressione MOD: {}",
-                "compress_success": "Compressione completata: {}",
-                "recompress_completed": "Ricompressione MOD completata",
-                "compress_error": "Errore del processo di compressione: {}",
-                # Testi di dialogo file
-                "select_mod_file": "Seleziona File MOD",
-                "select_files": "Seleziona File",
-                "extract_i18n_files": "Estrai File i18n",
-                # Testi di dialogo modifica
-                "edit_translation": "Modifica Traduzione",
-                "original_text": "Testo Originale",
-                "translation": "Traduzione",
-                "save": "Salva",
-                "cancel": "Annulla",
-                # Testi di dialogo impostazioni
-                "settings": "Impostazioni",
-                "batch_translate_settings": "Impostazioni Traduzione Batch",
-                "auto_save_settings": "Impostazioni Salvataggio Automatico",
-                # Testi area confronto testo
-                "text_comparison": "Confronto Testo",
-                "select_mod": "Seleziona MOD:",
-                "refresh_mod_list": "Aggiorna Elenco MOD",
-                "save_translation": "Salva Traduzione",
-                "clear_directories": "Svuota Directory",
-                "select_file": "Seleziona File:",
-                "original": "Originale",
-                "translation_text": "Traduzione (Doppio clic per modificare manualmente)",
-                "translated": "Tradotto",
-                # Messaggi di log
-                "please_select_mod_first": "Si prega di selezionare prima un MOD da tradurre",
-                "please_select_file_first": "Si prega di selezionare prima un file da tradurre",
-                "no_available_file_list": "Nessun elenco file disponibile",
-                "auto_switch_next_file": "Cambio automatico al file successivo",
-                "all_files_translated": "Tutti i file sono stati tradotti!",
-                "auto_switch_file_failed": "Cambio automatico file fallito",
-                "translation_dir_not_exist": "La directory di traduzione non esiste, impossibile comprimere",
-                # Testo hardcoded aggiuntivo
-                "select_mod_first": "Si prega di selezionare prima un MOD da tradurre",
-                "select_file_first": "Si prega di selezionare prima un file da tradurre",
-                "no_available_translation_files": "Nessun file di traduzione disponibile",
-                "start_translate_selected_file": "Inizio traduzione del file selezionato: {}",
-                "start_translate_mod": "Inizio traduzione del MOD: {}",
-                "no_translation_data_to_save": "Nessun dato di traduzione da salvare",
-                "translation_file_saved": "File di traduzione salvato: {}",
-                "cannot_determine_save_path": "Impossibile determinare il percorso di salvataggio del file",
-                "save_translation_file_failed": "Errore nel salvare il file di traduzione: {}",
-                "found_mods": "Trovati {} MOD: {}",
-                "no_mods_found": "Nessun MOD trovato",
-                "switch_to_mod": "Passato al MOD: {}",
-                "refresh_mod_list_failed": "Errore nell'aggiornare l'elenco MOD: {}",
-                "found_localization_files": "Trovati {} file di localizzazione",
-                "no_localization_files_found": "Nessun file di localizzazione trovato",
-                "mod_translation_dir_not_exist": "La directory di traduzione del MOD non esiste",
-                "refresh_file_list_failed": "Errore nell'aggiornare l'elenco file: {}",
-                "update_translation_display_failed": "Errore nell'aggiornare la visualizzazione della traduzione: {}",
-                "smart_comparison_complete": "Confronto intelligente completato",
-                "models_loaded": "Elenco modelli caricato, {} modelli in totale",
-                "found_entries_no_comparison": "Trovate {} voci senza confronto",
-                "file_no_translation_needed": "Il file {} non necessita traduzione, saltato",
-                # Testi relativi all'area di confronto del testo
-                "comparison_data_refreshed": "Dati di confronto del testo aggiornati",
-                "refresh_comparison_data_failed": "Aggiornamento dei dati di confronto del testo fallito: {}",
-                "original_file_not_found": "File originale non trovato: {}",
-                "file_comparison_loaded": "Confronto file caricato: {} <-> {}",
-                "load_comparison_failed": "Caricamento file di confronto fallito: {}",
-                "comparison_data_displayed": "Visualizzate {} voci di dati di confronto",
-                "display_comparison_failed": "Visualizzazione dati di confronto fallita: {}",
-                "untranslated_text": "[Non tradotto]",
-                # Testi dettagliati della finestra di dialogo delle impostazioni
-                "batch_size_label": "Dimensione traduzione batch (voci per batch):",
-                "entries_unit": "voci",
-                "batch_size_description": "Impostare il numero di voci di traduzione da elaborare simultaneamente. Valori più grandi possono migliorare la velocità ma usano più risorse",
-                "auto_save_interval_label": "Intervallo salvataggio automatico (voci di traduzione):",
-                "auto_save_description": "Salva automaticamente i file JSON dopo aver tradotto il numero specificato di voci durante la traduzione IA",
-                "edit_translation_dialog": "Modifica traduzione",
-                "settings_dialog": "Impostazioni",
-                # Testi di messaggio della finestra di dialogo delle impostazioni
-                "settings_saved": "Impostazioni salvate",
-                "error": "Errore",
-                "invalid_number_input": "Inserisci un numero valido",
-                "show_settings_dialog_failed": "Errore nella visualizzazione della finestra di dialogo delle impostazioni",
-                "stopping_translation": "Arresto traduzione...",
-                "translation_stopped": "Traduzione arrestata",
-                "please_start_server_first": "Si prega di avviare prima il server",
-                "translation_updated": "Traduzione aggiornata",
-                "save_translation_failed": "Errore nel salvare la traduzione: {}",
-                "select_mod_files_title": "Seleziona file MOD",
-                "compressed_files_type": "File compressi",
-                "all_files_type": "Tutti i file",
-                "extract_i18n_file": "Estrazione file i18n: {} -> {}",
-                "loaded_original_file": "File originale caricato per confronto: {}",
-                "auto_saved_translations": "Salvataggio automatico di {} traduzioni",
-                "translation_dir_not_exist": "La directory Translation non esiste, impossibile comprimere",
-                # 清空目录相关文本
-                "clear_directories_dialog": "Conferma svuotamento directory",
-                "clear_directories_message": "Sei sicuro di voler svuotare tutti i file nelle seguenti directory?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nQuesta operazione non può essere annullata!",
-                "clear": "Svuota",
-                "clear_directories_success": "Directory svuotate con successo",
-                "clear_directories_failed": "Errore nello svuotamento delle directory: {}",
-                "clear_directory_success": "Directory svuotata: {}",
-                "directory_not_exist": "La directory non esiste: {}",
-                "clear_directories_error": "Errore durante lo svuotamento delle directory: {}",
-                "show_clear_dialog_failed": "Errore nella visualizzazione del dialogo di svuotamento: {}",
-                "warning": "Avvertimento",
-                "clear_directories_confirm": "Conferma svuotamento",
-                "clear_directories_unavailable": "La funzione di svuotamento delle directory non è disponibile",
-                "clear_directories_dialog_error": "Errore nella visualizzazione del dialogo di svuotamento delle directory: {}",
-                "switch_to_file": "Passato al file: {} (indice: {})",
-            },
-            "Türkçe": {
-                "title": "Stardew Valley MOD i18n AI Çeviri Aracı",
-                "config": "Yapılandırma",
-                "target_language": "Hedef Dil:",
-                "translation_model": "Çeviri Modeli:",
-                "refresh_models": "Modelleri Yenile",
-                "functions": "İşlevler",
-                "import_mod": "1. MOD İçe Aktar",
-                "extract_mod": "2. MOD Çıkart",
-                "extract_i18n": "3. i18n Çıkart",
-                "auto_translate": "4. Otomatik Çeviri",
-                "stop_translate": "4. Çeviriyi Durdur",
-                "recompress": "5. Yeniden Sıkıştır",
-                "log": "Günlük",
-                "app_started": "Stardew Valley MOD Çeviri Aracı Başlatıldı",
-                "ollama_connected": "Ollama Sunucusu Bağlandı",
-                "ollama_connected_no_models": "Ollama Sunucusu Bağlandı, ancak Kullanılabilir Model Yok",
-                "ollama_connection_failed": "Ollama Sunucusu Bağlantısı Başarısız",
-                "ollama_connection_error": "Ollama Sunucusuna Bağlanılamıyor",
-                "refreshing_models": "Model listesi yenileniyor...",
-                "refresh_models_failed": "Model yenileme başarısız",
-                "models_refreshed": "Model listesi yenilendi",
-                "no_available_models": "Kullanılabilir model bulunamadı",
-                "model_loading_failed": "Model listesi yükleme başarısız: {}",
-                "initializing_model": "Model başlatılıyor...",
-                "model_initialized": "Model başlatıldı: {}",
-                "ollama_not_installed": "Ollama algılanmadı, lütfen şu adımları izleyin:\n1. Ollama'yı indirin ve kurun: https://ollama.com/\n2. ollama app.exe hizmetini başlatın\n3. İlgili modeli indirin, qwen2.5-coder:14b önerilir\n4. Düşük performanslı bilgisayarlar için qwen2.5-coder:7b kullanın",
-                "imported_file": "İçe aktarıldı: {}",
-                "import_success": "{} dosya başarıyla içe aktarıldı",
-                "import_failed": "Dosya içe aktarma başarısız: {}",
-                "no_archives_found": "İçe aktarma dizininde arşiv dosyası bulunamadı",
-                "extracting_file": "Çıkartılıyor: {}",
-                "extract_success": "Çıkartma başarılı: {}",
-                "extract_failed": "Çıkartma başarısız {}: {}",
-                "extract_completed": "MOD çıkartma tamamlandı",
-                "extract_error": "Çıkartma işlemi hatası: {}",
-                "processing_mod": "MOD işleniyor: {}",
-                "i18n_extract_completed": "i18n dosya çıkartma tamamlandı",
-                "i18n_extract_failed": "i18n dosya çıkartma başarısız: {}",
-                "ollama_model_required": "Lütfen önce Ollama sunucusunu başlatın ve bir model seçin",
-                "start_auto_translate": "{} diline otomatik çeviri başlatılıyor...",
-                "no_json_files": "Çeviri için JSON dosyası bulunamadı",
-                "translating_file": "Dosya çevriliyor: {}",
-                "translate_entry": "  {}: {} -> {}",
-                "translate_file_failed": "Dosya çevirisi başarısız {}: {}",
-                "auto_translate_completed": "Otomatik çeviri tamamlandı",
-                "auto_translate_error": "Otomatik çeviri işlemi hatası: {}",
-                "translate_request_failed": "Çeviri isteği başarısız: {}",
-                "translate_text_failed": "Metin çevirisi başarısız: {}",
-                "compressing_mod": "MOD sıkıştırılıyor: {}",
-                "compress_success": "Sıkıştırma tamamlandı: {}",
-                "recompress_completed": "MOD yeniden sıkıştırma tamamlandı",
-                "compress_error": "Sıkıştırma işlemi hatası: {}",
-                # Dosya diyalog metinleri
-                "select_mod_file": "MOD Dosyası Seç",
-                "select_files": "Dosyaları Seç",
-                "extract_i18n_files": "i18n Dosyalarını Çıkart",
-                # Düzenleme diyalog metinleri
-                "edit_translation": "Çeviriyi Düzenle",
-                "original_text": "Orijinal Metin",
-                "translation": "Çeviri",
-                "save": "Kaydet",
-                "cancel": "İptal",
-                # Ayarlar diyalog metinleri
-                "settings": "Ayarlar",
-                "batch_translate_settings": "Toplu Çeviri Ayarları",
-                "auto_save_settings": "Otomatik Kaydetme Ayarları",
-                # Metin karşılaştırma alanı metinleri
-                "text_comparison": "Metin Karşılaştırması",
-                "select_mod": "MOD Seç:",
-                "refresh_mod_list": "MOD Listesini Yenile",
-                "save_translation": "Çeviriyi Kaydet",
-                "clear_directories": "Dizinleri Temizle",
-                "select_file": "Dosya Seç:",
-                "original": "Orijinal",
-                "translation_text": "Çeviri (Manuel düzenleme için çift tıklayın)",
-                "translated": "Çevrilmiş",
-                # Log mesajları
-                "please_select_mod_first": "Lütfen önce çevrilecek bir MOD seçin",
-                "please_select_file_first": "Lütfen önce çevrilecek bir dosya seçin",
-                "no_available_file_list": "Kullanılabilir dosya listesi yok",
-                "auto_switch_next_file": "Otomatik olarak sonraki dosyaya geçiş",
-                "all_files_translated": "Tüm dosyalar çevrildi!",
-                "auto_switch_file_failed": "Otomatik dosya değiştirme başarısız",
-                "translation_dir_not_exist": "Çeviri dizini mevcut değil, sıkıştırılamıyor",
-                # Ek sabit kodlanmış metin
-                "select_mod_first": "Lütfen önce çevrilecek bir MOD seçin",
-                "select_file_first": "Lütfen önce çevrilecek bir dosya seçin",
-                "no_available_translation_files": "Kullanılabilir çeviri dosyası yok",
-                "start_translate_selected_file": "Seçilen dosyanın çevirisi başlıyor: {}",
-                "start_translate_mod": "MOD çevirisi başlıyor: {}",
-                "no_translation_data_to_save": "Kaydedilecek çeviri verisi yok",
-                "translation_file_saved": "Çeviri dosyası kaydedildi: {}",
-                "cannot_determine_save_path": "Dosya kaydetme yolu belirlenemiyor",
-                "save_translation_file_failed": "Çeviri dosyası kaydetme başarısız: {}",
-                "found_mods": "{} MOD bulundu: {}",
-                "no_mods_found": "Hiç MOD bulunamadı",
-                "switch_to_mod": "MOD'a geçildi: {}",
-                "refresh_mod_list_failed": "MOD listesi yenileme başarısız: {}",
-                "found_localization_files": "{} yerelleştirme dosyası bulundu",
-                "no_localization_files_found": "Hiç yerelleştirme dosyası bulunamadı",
-                "mod_translation_dir_not_exist": "MOD çeviri dizini mevcut değil",
-                "refresh_file_list_failed": "Dosya listesi yenileme başarısız: {}",
-                "update_translation_display_failed": "Çeviri görüntüsü güncelleme başarısız: {}",
-                "smart_comparison_complete": "Akıllı karşılaştırma tamamlandı",
-                "models_loaded": "Model listesi yüklendi, toplam {} model",
-                "found_entries_no_comparison": "Karşılaştırmasız {} giriş bulundu",
-                "file_no_translation_needed": "Dosya {} çeviriye ihtiyaç duymuyor, atlandı",
-                # Metin karşılaştırma alanı ile ilgili metinler
-                "comparison_data_refreshed": "Metin karşılaştırma verileri yenilendi",
-                "refresh_comparison_data_failed": "Metin karşılaştırma verilerini yenileme başarısız: {}",
-                "original_file_not_found": "Orijinal dosya bulunamadı: {}",
-                "file_comparison_loaded": "Dosya karşılaştırması yüklendi: {} <-> {}",
-                "load_comparison_failed": "Karşılaştırma dosyalarını yükleme başarısız: {}",
-                "comparison_data_displayed": "{} karşılaştırma veri girişi görüntülendi",
-                "display_comparison_failed": "Karşılaştırma verilerini görüntüleme başarısız: {}",
-                "untranslated_text": "[Çevrilmemiş]",
-                # Ayarlar iletişim kutusunun ayrıntılı metinleri
-                "batch_size_label": "Toplu çeviri boyutu (toplu başına girdi):",
-                "entries_unit": "girdi",
-                "batch_size_description": "Aynı anda işlenecek çeviri girdilerinin sayısını ayarlayın. Daha büyük değerler hızı artırabilir ancak daha fazla kaynak kullanır",
-                "auto_save_interval_label": "Otomatik kaydetme aralığı (çeviri girdileri):",
-                "auto_save_description": "AI çevirisi sırasında belirtilen sayıda girdi çevrildikten sonra JSON dosyalarını otomatik olarak kaydet",
-                "edit_translation_dialog": "Çeviriyi Düzenle",
-                "settings_dialog": "Ayarlar",
-                # Ayarlar iletişim kutusu mesaj metinleri
-                "settings_saved": "Ayarlar kaydedildi",
-                "error": "Hata",
-                "invalid_number_input": "Lütfen geçerli bir sayı girin",
-                "show_settings_dialog_failed": "Ayarlar iletişim kutusunu gösterme başarısız",
-                "stopping_translation": "Çeviri durduruluyor...",
-                "translation_stopped": "Çeviri durduruldu",
-                "please_start_server_first": "Lütfen önce sunucuyu başlatın",
-                "translation_updated": "Çeviri güncellendi",
-                "save_translation_failed": "Çeviri kaydetme başarısız: {}",
-                "select_mod_files_title": "MOD dosyalarını seç",
-                "compressed_files_type": "Sıkıştırılmış dosyalar",
-                "all_files_type": "Tüm dosyalar",
-                "extract_i18n_file": "i18n dosyası çıkarılıyor: {} -> {}",
-                "loaded_original_file": "Karşılaştırma için orijinal dosya yüklendi: {}",
-                "auto_saved_translations": "Otomatik olarak {} çeviri kaydedildi",
-                "translation_dir_not_exist": "Translation dizini mevcut değil, sıkıştırılamıyor",
-                # 清空目录相关文本
-                "clear_directories_dialog": "Dizin temizleme onayı",
-                "clear_directories_message": "Aşağıdaki dizinlerdeki tüm dosyaları temizlemek istediğinizden emin misiniz?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nBu işlem geri alınamaz!",
-                "clear": "Temizle",
-                "clear_directories_success": "Dizinler başarıyla temizlendi",
-                "clear_directories_failed": "Dizin temizleme hatası: {}",
-                "clear_directory_success": "Dizin temizlendi: {}",
-                "directory_not_exist": "Dizin mevcut değil: {}",
-                "clear_directories_error": "Dizin temizleme sırasında hata: {}",
-                "show_clear_dialog_failed": "Temizleme diyalogu gösterme hatası: {}",
-                "warning": "Uyarı",
-                "clear_directories_confirm": "Temizlemeyi onayla",
-                "clear_directories_unavailable": "Dizin temizleme işlevi kullanılamıyor",
-                "clear_directories_dialog_error": "Dizin temizleme diyalogu gösterme hatası: {}",
-                "switch_to_file": "Dosyaya geçildi: {} (indeks: {})",
-            },
-            "Magyar": {
-                "title": "Stardew Valley MOD i18n AI Fordító Eszköz",
-                "config": "Konfiguráció",
-                "target_language": "Célnyelv:",
-                "translation_model": "Fordítási Modell:",
-                "refresh_models": "Modellek Frissítése",
-                "functions": "Funkciók",
-                "import_mod": "1. MOD Importálás",
-                "extract_mod": "2. MOD Kicsomagolás",
-                "extract_i18n": "3. i18n Kinyerés",
-                "auto_translate": "4. Automatikus Fordítás",
-                "stop_translate": "4. Fordítás Leállítása",
-                "recompress": "5. Újratömörítés",
-                "log": "Napló",
-                "app_started": "Stardew Valley MOD Fordító Eszköz Elindítva",
-                "ollama_connected": "Ollama Szerver Csatlakoztatva",
-                "ollama_connected_no_models": "Ollama Szerver Csatlakoztatva, de Nincs Elérhető Modell",
-                "ollama_connection_failed": "Ollama Szerver Csatlakozás Sikertelen",
-                "ollama_connection_error": "Nem Lehet Csatlakozni az Ollama Szerverhez",
-                "refreshing_models": "Modell lista frissítése...",
-                "refresh_models_failed": "Modell frissítés sikertelen",
-                "models_refreshed": "Modell lista frissítve",
-                "no_available_models": "Nem található elérhető modell",
-                "model_loading_failed": "Modell lista betöltése sikertelen: {}",
-                "initializing_model": "Modell inicializálása...",
-                "model_initialized": "Modell inicializálva: {}",
-                "ollama_not_installed": "Ollama nem észlelhető, kérjük kövesse ezeket a lépéseket:\n1. Töltse le és telepítse az Ollama-t: https://ollama.com/\n2. Indítsa el az ollama app.exe szolgáltatást\n3. Töltse le a megfelelő modellt, ajánlott a qwen2.5-coder:14b\n4. Alacsony teljesítményű számítógépekhez használja a qwen2.5-coder:7b-t",
-                "imported_file": "Importálva: {}",
-                "import_success": "{} fájl sikeresen importálva",
-                "import_failed": "Fájl importálás sikertelen: {}",
-                "no_archives_found": "Nem található archív fájl az import könyvtárban",
-                "extracting_file": "Kicsomagolás: {}",
-                "extract_success": "Kicsomagolás sikeres: {}",
-                "extract_failed": "Kicsomagolás sikertelen {}: {}",
-                "extract_completed": "MOD kicsomagolás befejezve",
-                "extract_error": "Kicsomagolási folyamat hiba: {}",
-                "processing_mod": "MOD feldolgozás: {}",
-                "i18n_extract_completed": "i18n fájl kinyerés befejezve",
-                "i18n_extract_failed": "i18n fájl kinyerés sikertelen: {}",
-                "ollama_model_required": "Kérjük először indítsa el az Ollama szervert és válasszon egy modellt",
-                "start_auto_translate": "Automatikus fordítás indítása {} nyelvre...",
-                "no_json_files": "Nem található JSON fájl fordításhoz",
-                "translating_file": "Fájl fordítása: {}",
-                "translate_entry": "  {}: {} -> {}",
-                "translate_file_failed": "Fájl fordítás sikertelen {}: {}",
-                "auto_translate_completed": "Automatikus fordítás befejezve",
-                "auto_translate_error": "Automatikus fordítási folyamat hiba: {}",
-                "translate_request_failed": "Fordítási kérés sikertelen: {}",
-                "translate_text_failed": "Szöveg fordítás sikertelen: {}",
-                "compressing_mod": "MOD tömörítése: {}",
-                "compress_success": "Tömörítés befejezve: {}",
-                "recompress_completed": "MOD újratömörítés befejezve",
-                "compress_error": "Tömörítési folyamat hiba: {}",
-                
-                # 文件对话框
-                "select_import_folder": "Válassza ki az importálási mappát",
-                "select_extract_folder": "Válassza ki a kicsomagolási mappát",
-                "select_translation_folder": "Válassza ki a fordítási mappát",
-                "select_compress_folder": "Válassza ki a tömörítési mappát",
-                
-                # 编辑对话框
-                "edit_translation": "Fordítás szerkesztése",
-                "original_text": "Eredeti szöveg:",
-                "translation_text": "Fordított szöveg (Dupla kattintás a kézi szerkesztéshez):",
-                "save_button": "Mentés",
-                "cancel_button": "Mégse",
-                
-                # 设置对话框
-                "settings": "Beállítások",
-                "batch_translate_settings": "Kötegelt Fordítás Beállítások",
-                "auto_save_settings": "Automatikus Mentés Beállítások",
-                "settings_title": "Beállítások",
-                "ollama_server_url": "Ollama szerver URL:",
-                "translation_model": "Fordítási modell:",
-                "ui_language": "Felhasználói felület nyelve:",
-                "target_language": "Célnyelv:",
-                "batch_size": "Köteg méret:",
-                "request_delay": "Kérés késleltetés (ms):",
-                "max_retries": "Maximális újrapróbálkozások:",
-                "timeout": "Időtúllépés (s):",
-                "apply_button": "Alkalmaz",
-                "close_button": "Bezárás",
-                
-                # 文本对比区域
-                "text_comparison": "Szöveg összehasonlítás",
-                "select_mod": "MOD kiválasztása:",
-                "refresh_mod_list": "MOD Lista Frissítése",
-                "save_translation": "Fordítás Mentése",
-                "clear_directories": "Könyvtárak Törlése",
-                "select_file": "Fájl kiválasztása:",
-                "original_files": "Eredeti fájlok",
-                "translation_files": "Fordított fájlok",
-                "comparison_area": "Összehasonlítási terület",
-                "no_data_to_display": "Nincs megjeleníthető adat",
-                "file_not_found": "Fájl nem található: {}",
-                "json_parse_error": "JSON elemzési hiba: {}",
-                
-                # 日志消息
-                "log_messages": "Napló üzenetek",
-                "progress_info": "Haladási információ: {}/{}",
-                "translation_progress": "Fordítási haladás",
-                "current_file_progress": "Jelenlegi fájl haladása: {}/{}",
-                "overall_progress": "Összesített haladás: {}/{}",
-                # További beépített szövegek
-                "select_mod_first": "Kérjük, először válasszon ki egy fordítandó MOD-ot",
-                "select_file_first": "Kérjük, először válasszon ki egy fordítandó fájlt",
-                "no_available_translation_files": "Nincsenek elérhető fordítási fájlok",
-                "start_translate_selected_file": "A kiválasztott fájl fordítása kezdődik: {}",
-                "start_translate_mod": "A MOD fordítása kezdődik: {}",
-                "no_translation_data_to_save": "Nincs mentendő fordítási adat",
-                "translation_file_saved": "Fordítási fájl mentve: {}",
-                "cannot_determine_save_path": "Nem lehet meghatározni a fájl mentési útvonalát",
-                "save_translation_file_failed": "Fordítási fájl mentése sikertelen: {}",
-                "found_mods": "{} MOD található: {}",
-                "no_mods_found": "Nem található MOD",
-                "switch_to_mod": "MOD-ra váltva: {}",
-                "refresh_mod_list_failed": "MOD lista frissítése sikertelen: {}",
-                "found_localization_files": "{} lokalizációs fájl található",
-                "no_localization_files_found": "Nem található lokalizációs fájl",
-                "mod_translation_dir_not_exist": "MOD fordítási könyvtár nem létezik",
-                "refresh_file_list_failed": "Fájllista frissítése sikertelen: {}",
-                "update_translation_display_failed": "Fordítási megjelenítés frissítése sikertelen: {}",
-                "smart_comparison_complete": "Intelligens összehasonlítás befejezve",
-                "models_loaded": "Modell lista betöltve, összesen {} modell",
-                "found_entries_no_comparison": "Összehasonlítás nélküli {} bejegyzés található",
-                "file_no_translation_needed": "A {} fájl nem igényel fordítást, kihagyva",
-                # Szöveg összehasonlítási területtel kapcsolatos szövegek
-                "comparison_data_refreshed": "Szöveg összehasonlítási adatok frissítve",
-                "refresh_comparison_data_failed": "Szöveg összehasonlítási adatok frissítése sikertelen: {}",
-                "original_file_not_found": "Eredeti fájl nem található: {}",
-                "file_comparison_loaded": "Fájl összehasonlítás betöltve: {} <-> {}",
-                "load_comparison_failed": "Összehasonlítási fájlok betöltése sikertelen: {}",
-                "comparison_data_displayed": "{} összehasonlítási adat bejegyzés megjelenítve",
-                "display_comparison_failed": "Összehasonlítási adatok megjelenítése sikertelen: {}",
-                "untranslated_text": "[Nem fordított]",
-                "translation_dir_not_exist": "Fordítási könyvtár nem létezik, nem lehet tömöríteni",
-                # Beállítások párbeszédpanel részletes szövegei
-                "batch_size_label": "Kötegelt fordítás mérete (bejegyzés/köteg):",
-                "entries_unit": "bejegyzés",
-                "batch_size_description": "Állítsa be az egyszerre feldolgozandó fordítási bejegyzések számát. A nagyobb értékek növelhetik a sebességet, de több erőforrást használnak",
-                "auto_save_interval_label": "Automatikus mentés intervalluma (fordítási bejegyzések):",
-                "auto_save_description": "AI fordítás során automatikusan mentse a JSON fájlokat a megadott számú bejegyzés lefordítása után",
-                "edit_translation_dialog": "Fordítás szerkesztése",
-                "settings_dialog": "Beállítások",
-                # Beállítások párbeszédpanel üzenet szövegei
-                "settings_saved": "Beállítások mentve",
-                "error": "Hiba",
-                "invalid_number_input": "Kérjük, adjon meg egy érvényes számot",
-                "show_settings_dialog_failed": "Beállítások párbeszédablak megjelenítése sikertelen",
-                "stopping_translation": "Fordítás leállítása...",
-                "translation_stopped": "Fordítás leállítva",
-                "please_start_server_first": "Kérjük, először indítsa el a szervert",
-                "translation_updated": "Fordítás frissítve",
-                "save_translation_failed": "Fordítás mentése sikertelen: {}",
-                "select_mod_files_title": "MOD fájlok kiválasztása",
-                "compressed_files_type": "Tömörített fájlok",
-                "all_files_type": "Minden fájl",
-                "extract_i18n_file": "i18n fájl kinyerése: {} -> {}",
-                "loaded_original_file": "Eredeti fájl betöltve összehasonlításhoz: {}",
-                "auto_saved_translations": "Automatikusan {} fordítás mentve",
-                "translation_dir_not_exist": "A Translation könyvtár nem létezik, nem lehet tömöríteni",
-                # 清空目录相关文本
-                "clear_directories_dialog": "Könyvtárak törlésének megerősítése",
-                "clear_directories_message": "Biztosan törölni szeretné az összes fájlt a következő könyvtárakból?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nEz a művelet nem vonható vissza!",
-                "clear": "Törlés",
-                "clear_directories_success": "Könyvtárak sikeresen törölve",
-                "clear_directories_failed": "Könyvtárak törlése sikertelen: {}",
-                "clear_directory_success": "Könyvtár törölve: {}",
-                "directory_not_exist": "A könyvtár nem létezik: {}",
-                "clear_directories_error": "Hiba a könyvtárak törlése során: {}",
-                "show_clear_dialog_failed": "Törlési párbeszédablak megjelenítése sikertelen: {}",
-                "warning": "Figyelmeztetés",
-                "clear_directories_confirm": "Törlés megerősítése",
-                "clear_directories_unavailable": "A könyvtárak törlése funkció nem elérhető",
-                "clear_directories_dialog_error": "Könyvtárak törlési párbeszédablak megjelenítése sikertelen: {}",
-                "switch_to_file": "Fájlra váltva: {} (index: {})",
-            },
+            "auto_switch_next_file": "自动切换到下一个文件: {}",
+            "start_auto_translate_next": "开始自动翻译下一个文件: {}",
+            "all_files_completed": "所有文件翻译完成！",
+            "auto_switch_failed": "自动切换文件失败: {}",
+            "extract_i18n_file": "提取 i18n 文件: {} -> {}",
+            "loaded_original_file": "已加载原文文件进行对比: {}",
+            "load_original_failed": "加载原文文件失败，将翻译所有条目: {}",
+            "smart_comparison_complete": "智能对比完成: 总计 {} 个文本条目，需要翻译 {} 个，跳过 {} 个已翻译条目",
+            "models_loaded": "模型列表加载完成，共{}个模型",
+            "found_entries_no_comparison": "找到 {} 个需要翻译的条目（无原文对比）",
+            "file_no_translation_needed": "文件 {} 无需翻译，跳过",
+            "batch_translation_failed": "批量翻译失败: {}",
+            "auto_saved_translations": "已自动保存 {} 条翻译",
+            "translation_dir_not_exist": "Translation目录不存在，无法压缩",
+            # 新增的硬编码文本
+            "select_mod_first": "请先选择要翻译的MOD",
+            "select_file_first": "请先选择要翻译的文件",
+            "no_available_translation_files": "没有可用的翻译文件",
+            "start_translate_selected_file": "开始翻译选中文件: {}",
+            "start_translate_mod": "开始翻译MOD: {}",
+            "no_translation_data_to_save": "没有可保存的翻译数据",
+            "translation_file_saved": "翻译文件已保存: {}",
+            "cannot_determine_save_path": "无法确定保存文件路径",
+            "save_translation_file_failed": "保存翻译文件失败: {}",
+            "found_mods": "找到 {} 个MOD: {}",
+            "no_mods_found": "未找到任何MOD",
+            "switch_to_mod": "切换到MOD: {}",
+            "refresh_mod_list_failed": "刷新MOD列表失败: {}",
+            "found_localization_files": "找到 {} 个本地化文件",
+            "no_localization_files_found": "未找到本地化文件",
+            "mod_translation_dir_not_exist": "MOD翻译目录不存在",
+            "refresh_file_list_failed": "刷新文件列表失败: {}",
+            "update_translation_display_failed": "更新翻译显示失败: {}",
+            # 文本对比区域相关文本
+            "comparison_data_refreshed": "文本对比数据已刷新",
+            "refresh_comparison_data_failed": "刷新文本对比数据失败: {}",
+            "switch_to_file": "切换到文件: {} (索引: {})",
+            "original_file_not_found": "未找到对应的原文文件: {}",
+            "file_comparison_loaded": "已加载文件对比: {} <-> {}",
+            "load_comparison_failed": "加载对比文件失败: {}",
+            "comparison_data_displayed": "已显示 {} 条对比数据",
+            "display_comparison_failed": "显示对比数据失败: {}",
+            "untranslated_text": "[未翻译]",
+            # 设置对话框详细文本
+            "batch_size_label": "批量翻译大小（每批处理条目数）:",
+            "entries_unit": "个条目",
+            "batch_size_description": "设置每批同时处理的翻译条目数量，较大的值可能提高速度但占用更多资源",
+            "auto_save_interval_label": "自动保存间隔（翻译条目数）:",
+            "auto_save_description": "AI翻译时每翻译指定数量的条目后自动保存JSON文件",
+            "edit_translation_dialog": "编辑翻译",
+            # 设置对话框消息文本
+            "settings_saved": "设置已保存",
+            "error": "错误",
+            "invalid_number_input": "请输入有效的数字",
+            "show_settings_dialog_failed": "显示设置对话框失败",
+            "stopping_translation": "正在停止翻译...",
+            "translation_stopped": "翻译已停止",
+            # 清空目录相关文本
+            "clear_directories_dialog": "清空目录确认",
+            "clear_directories_message": "是否清空以下目录内的所有文件？\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\n此操作不可撤销！",
+            "clear": "清空",
+            "clear_directories_success": "目录清空完成",
+            "clear_directories_failed": "清空目录失败: {}",
+            "clear_directory_success": "已清空目录: {}",
+            "directory_not_exist": "目录不存在: {}",
+            "clear_directories_error": "清空目录时发生错误: {}",
+            "show_clear_dialog_failed": "显示清空对话框失败: {}",
+            "warning": "警告",
+            "clear_directories_confirm": "确认清空",
+            "clear_directories_unavailable": "清空目录功能不可用",
+            "clear_directories_dialog_error": "显示清空目录对话框失败: {}"
+        }
+    
+    @staticmethod
+    def _texts_en() -> Dict[str, str]:
+        """English界面文本"""
+        return {
+            "title": "Stardew Valley MOD i18n AI Translation Tool",
+            "config": "Configuration",
+            "target_language": "Target Language:",
+            "translation_model": "Translation Model:",
+            "refresh_models": "Refresh Models",
+            "functions": "Functions",
+            "import_mod": "1. Import MOD",
+            "extract_mod": "2. Extract MOD",
+            "extract_i18n": "3. Extract i18n",
+            "auto_translate": "4. Auto Translate",
+            "stop_translate": "4. Stop Translation",
+            "recompress": "5. Recompress",
+            "log": "Log",
+            "progress_eta": "{} left, {:.0f}/min",
+            "app_started": "Stardew Valley MOD i18n AI Translation Tool Started",
+            "ollama_connected": "Ollama Server Connected",
+            "ollama_connected_no_models": "Ollama Server Connected, but No Available Models",
+            "ollama_connection_failed": "Ollama Server Connection Failed",
+            "ollama_connection_error": "Unable to Connect to Ollama Server",
+            "refreshing_models": "Refreshing model list...",
+            "refresh_models_failed": "Failed to refresh models",
+            "models_refreshed": "Model list refreshed",
+            "no_available_models": "No available models found",
+            "model_loading_failed": "Model list loading failed: {}",
+            "initializing_model": "Initializing model...",
+            "model_initialized": "Model initialized: {}",
+            "ollama_not_installed": "Ollama not detected, please follow these steps:\n1. Download and install Ollama: https://ollama.com/\n2. Start ollama app.exe service\n3. Download corresponding model, recommend qwen2.5-coder:14b\n4. Use qwen2.5-coder:7b for low-performance computers",
+            # Button function log messages
+            "imported_file": "Imported: {}",
+            "import_success": "Successfully imported {} files",
+            "import_failed": "Failed to import files: {}",
+            "no_archives_found": "No archive files found in import directory",
+            "extracting_file": "Extracting: {}",
+            "extract_success": "Extract successful: {}",
+            "extract_failed": "Extract failed {}: {}",
+            "extract_completed": "MOD extraction completed",
+            "extract_error": "Extraction process error: {}",
+            "processing_mod": "Processing MOD: {}",
+            "i18n_extract_completed": "i18n file extraction completed",
+            "i18n_extract_failed": "Failed to extract i18n files: {}",
+            "ollama_model_required": "Please start Ollama server and select a model first",
+            "start_auto_translate": "Starting auto translation to {}...",
+            "no_json_files": "No JSON files found for translation",
+            "translating_file": "Translating file: {}",
+            "translate_entry": "  {}: {} -> {}",
+            "translate_file_failed": "Failed to translate file {}: {}",
+            "auto_translate_completed": "Auto translation completed",
+            "auto_translate_error": "Auto translation process error: {}",
+            "translate_request_failed": "Translation request failed: {}",
+            "translate_text_failed": "Failed to translate text: {}",
+            "compressing_mod": "Compressing MOD: {}",
+            "compress_success": "Compression completed: {}",
+            "recompress_completed": "MOD recompression completed",
+            "compress_error": "Compression process error: {}",
+            # File dialog texts
+            "select_mod_file": "Select MOD File",
+            "select_files": "Select Files",
+            "extract_i18n_files": "Extract i18n Files",
+            # Edit dialog texts
+            "edit_translation": "Edit Translation",
+            "original_text": "Original Text",
+            "translation": "Translation",
+            "translation_text": "Translation (Double-click to edit manually)",
+            "save": "Save",
+            "cancel": "Cancel",
+            # Settings dialog texts
+            "settings": "Settings",
+            "batch_translate_settings": "Batch Translation Settings",
+            "auto_save_settings": "Auto Save Settings",
+            # Text comparison area texts
+            "text_comparison": "Text Comparison",
+            "select_mod": "Select MOD:",
+            "refresh_mod_list": "Refresh MOD List",
+            "save_translation": "Save Translation",
+            "clear_directories": "Clear Directories",
+            "select_file": "Select File:",
+            "original": "Original",
+            "translated": "Translated",
+            # Log messages
+            "please_select_mod_first": "Please select a MOD to translate first",
+            "please_select_file_first": "Please select a file to translate first",
+            "no_available_file_list": "No available file list",
+            "auto_switch_next_file": "Auto switching to next file",
+            "all_files_translated": "All files translated!",
+            "auto_switch_file_failed": "Auto switch file failed",
+            "translation_dir_not_exist": "Translation directory does not exist, cannot compress",
+            # Additional hardcoded text
+            "select_mod_first": "Please select a MOD to translate first",
+            "select_file_first": "Please select a file to translate first",
+            "no_available_translation_files": "No available translation files",
+            "start_translate_selected_file": "Starting translation of selected file: {}",
+            "start_translate_mod": "Starting translation of MOD: {}",
+            "no_translation_data_to_save": "No translation data to save",
+            "translation_file_saved": "Translation file saved: {}",
+            "cannot_determine_save_path": "Cannot determine save file path",
+            "save_translation_file_failed": "Failed to save translation file: {}",
+            "found_mods": "Found {} MODs: {}",
+            "no_mods_found": "No MODs found",
+            "switch_to_mod": "Switched to MOD: {}",
+            "refresh_mod_list_failed": "Failed to refresh MOD list: {}",
+            "found_localization_files": "Found {} localization files",
+            "no_localization_files_found": "No localization files found",
+            "mod_translation_dir_not_exist": "MOD translation directory does not exist",
+            "refresh_file_list_failed": "Failed to refresh file list: {}",
+            "update_translation_display_failed": "Failed to update translation display: {}",
+            "smart_comparison_complete": "Smart comparison complete",
+            "models_loaded": "Model list loaded, {} models in total",
+            "found_entries_no_comparison": "Found {} entries without comparison",
+            "file_no_translation_needed": "File {} does not need translation, skipping",
+            # Text comparison area related texts
+            "comparison_data_refreshed": "Text comparison data refreshed",
+            "extract_i18n_file": "Extracting i18n file: {} -> {}",
+            "loaded_original_file": "Loaded original file for comparison: {}",
+            "auto_saved_translations": "Auto-saved {} translations",
+            "switch_to_file": "Switched to file: {} (index: {})",
+            "refresh_comparison_data_failed": "Failed to refresh text comparison data: {}",
+            "original_file_not_found": "Original file not found: {}",
+            "file_comparison_loaded": "File comparison loaded: {} <-> {}",
+            "load_comparison_failed": "Failed to load comparison files: {}",
+            "comparison_data_displayed": "Displayed {} comparison data entries",
+            "display_comparison_failed": "Failed to display comparison data: {}",
+            "untranslated_text": "[Untranslated]",
+            # Settings dialog detailed texts
+            "batch_size_label": "Batch Translation Size (entries per batch):",
+            "entries_unit": "entries",
+            "batch_size_description": "Set the number of translation entries to process simultaneously. Larger values may improve speed but use more resources",
+            "auto_save_interval_label": "Auto Save Interval (translation entries):",
+            "auto_save_description": "Automatically save JSON files after translating the specified number of entries during AI translation",
+            "edit_translation_dialog": "Edit Translation",
+            "settings_dialog": "Settings",
+            # Settings dialog message texts
+            "settings_saved": "Settings saved",
+            "error": "Error",
+            "invalid_number_input": "Please enter a valid number",
+            "show_settings_dialog_failed": "Failed to show settings dialog",
+            "stopping_translation": "Stopping translation...",
+            "translation_stopped": "Translation stopped",
+            "please_start_server_first": "Please start the server first",
+            "translation_updated": "Translation updated",
+            "save_translation_failed": "Failed to save translation: {}",
+            "select_mod_files_title": "Select MOD Files",
+            "compressed_files_type": "Compressed Files",
+            "all_files_type": "All Files",
+            "translation_dir_not_exist": "Translation directory does not exist, cannot compress",
+            # Clear directories related texts
+            "clear_directories_dialog": "Clear Directories Confirmation",
+            "clear_directories_message": "Are you sure you want to clear all files in the following directories?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nThis operation cannot be undone!",
+            "clear": "Clear",
+            "clear_directories_success": "Directories cleared successfully",
+            "clear_directories_failed": "Failed to clear directories: {}",
+            "clear_directory_success": "Directory cleared: {}",
+            "directory_not_exist": "Directory does not exist: {}",
+            "clear_directories_error": "Error occurred while clearing directories: {}",
+            "show_clear_dialog_failed": "Failed to show clear dialog: {}",
+            "warning": "Warning",
+            "clear_directories_confirm": "Confirm Clear",
+            "clear_directories_unavailable": "Clear directories function is unavailable",
+            "clear_directories_dialog_error": "Failed to show clear directories dialog: {}"
+        }
+    
+    @staticmethod
+    def _texts_ja() -> Dict[str, str]:
+        """日本語界面文本"""
+        return {
+            "title": "スターデューバレー MOD i18n AI翻訳ツール",
+            "config": "設定",
+            "target_language": "対象言語:",
+            "translation_model": "翻訳モデル:",
+            "refresh_models": "モデル更新",
+            "functions": "機能",
+            "import_mod": "1. MOD インポート",
+            "extract_mod": "2. MOD 展開",
+            "extract_i18n": "3. i18n 抽出",
+            "auto_translate": "4. 自動翻訳",
+            "stop_translate": "4. 翻訳停止",
+            "recompress": "5. 再圧縮",
+            "log": "ログ",
+            "progress_eta": "残り {}、{:.0f} 件/分",
+            "app_started": "スターデューバレー MOD 翻訳ツールが開始されました",
+            "ollama_connected": "Ollama サーバーに接続しました",
+            "ollama_connected_no_models": "Ollama サーバーに接続しましたが、利用可能なモデルがありません",
+            "ollama_connection_failed": "Ollama サーバー接続に失敗しました",
+            "ollama_connection_error": "Ollama サーバーに接続できません",
+            "refreshing_models": "モデルリストを更新中...",
+            "refresh_models_failed": "モデル更新に失敗しました",
+            "models_refreshed": "モデルリストが更新されました",
+            "initializing_model": "モデルを初期化中...",
+            "model_initialized": "モデル初期化完了: {}",
+            "ollama_not_installed": "Ollama が検出されませんでした。以下の手順に従ってください：\n1. Ollama をダウンロードしてインストール: https://ollama.com/\n2. ollama app.exe サービスを起動\n3. 対応するモデルをダウンロード、qwen2.5-coder:14b を推奨\n4. 低性能コンピューターは qwen2.5-coder:7b を使用",
+            # ボタン機能ログメッセージ
+            "imported_file": "インポート済み: {}",
+            "import_success": "{}個のファイルを正常にインポートしました",
+            "import_failed": "ファイルのインポートに失敗しました: {}",
+            "no_archives_found": "インポートディレクトリにアーカイブファイルが見つかりません",
+            "extracting_file": "展開中: {}",
+            "extract_success": "展開成功: {}",
+            "extract_failed": "展開失敗 {}: {}",
+            "extract_completed": "MOD展開完了",
+            "extract_error": "展開プロセスエラー: {}",
+            "processing_mod": "MOD処理中: {}",
+            "i18n_extract_completed": "i18nファイル抽出完了",
+            "i18n_extract_failed": "i18nファイルの抽出に失敗しました: {}",
+            "ollama_model_required": "まずOllamaサーバーを起動してモデルを選択してください",
+            "start_auto_translate": "{}への自動翻訳を開始中...",
+            "no_json_files": "翻訳用のJSONファイルが見つかりません",
+            "translating_file": "ファイル翻訳中: {}",
+            "translate_entry": "  {}: {} -> {}",
+            "translate_file_failed": "ファイル翻訳失敗 {}: {}",
+            "auto_translate_completed": "自動翻訳完了",
+            "auto_translate_error": "自動翻訳プロセスエラー: {}",
+            "translate_request_failed": "翻訳リクエスト失敗: {}",
+            "translate_text_failed": "テキスト翻訳失敗: {}",
+            "compressing_mod": "MOD圧縮中: {}",
+            "compress_success": "圧縮完了: {}",
+            "recompress_completed": "MOD再圧縮完了",
+            "compress_error": "圧縮プロセスエラー: {}",
+            # ファイルダイアログテキスト
+            "select_mod_file": "MODファイルを選択",
+            "select_files": "ファイルを選択",
+            "extract_i18n_files": "i18nファイルを抽出",
+            # 編集ダイアログテキスト
+            "edit_translation": "翻訳を編集",
+            "original_text": "原文",
+            "translation": "翻訳",
+            "translation_text": "翻訳（ダブルクリックで手動編集）",
+            "save": "保存",
+            "cancel": "キャンセル",
+            # 設定ダイアログテキスト
+            "settings": "設定",
+            "batch_translate_settings": "一括翻訳設定",
+            "auto_save_settings": "自動保存設定",
+            # テキスト比較エリアテキスト
+            "text_comparison": "テキスト比較",
+            "select_mod": "MODを選択:",
+            "refresh_mod_list": "MODリストを更新",
+            "save_translation": "翻訳を保存",
+            "clear_directories": "ディレクトリをクリア",
+            "select_file": "ファイルを選択:",
+            "original": "原文",
+            "translated": "翻訳済み",
+            # ログメッセージ
+            "please_select_mod_first": "まず翻訳するMODを選択してください",
+            "please_select_file_first": "まず翻訳するファイルを選択してください",
+            "no_available_file_list": "利用可能なファイルリストがありません",
+            "auto_switch_next_file": "次のファイルに自動切り替え",
+            "all_files_translated": "すべてのファイルが翻訳されました！",
+            "auto_switch_file_failed": "ファイルの自動切り替えに失敗しました",
+            "translation_dir_not_exist": "翻訳ディレクトリが存在しないため、圧縮できません",
+            # 追加のハードコードテキスト
+            "select_mod_first": "まず翻訳するMODを選択してください",
+            "select_file_first": "まず翻訳するファイルを選択してください",
+            "no_available_translation_files": "利用可能な翻訳ファイルがありません",
+            "start_translate_selected_file": "選択されたファイルの翻訳を開始: {}",
+            "start_translate_mod": "MODの翻訳を開始: {}",
+            "no_translation_data_to_save": "保存する翻訳データがありません",
+            "translation_file_saved": "翻訳ファイルが保存されました: {}",
+            "cannot_determine_save_path": "保存ファイルパスを決定できません",
+            "save_translation_file_failed": "翻訳ファイルの保存に失敗しました: {}",
+            "found_mods": "{}個のMODが見つかりました: {}",
+            "no_mods_found": "MODが見つかりませんでした",
+            "switch_to_mod": "MODに切り替えました: {}",
+            "refresh_mod_list_failed": "MODリストの更新に失敗しました: {}",
+            "found_localization_files": "{}個のローカライゼーションファイルが見つかりました",
+            "no_localization_files_found": "ローカライゼーションファイルが見つかりませんでした",
+            "mod_translation_dir_not_exist": "MOD翻訳ディレクトリが存在しません",
+            "refresh_file_list_failed": "ファイルリストの更新に失敗しました: {}",
+            "update_translation_display_failed": "翻訳表示の更新に失敗しました: {}",
+            "smart_comparison_complete": "スマート比較が完了しました",
+            "models_loaded": "モデルリストの読み込みが完了しました、合計{}個のモデル",
+            "found_entries_no_comparison": "比較なしで{}個のエントリが見つかりました",
+            "file_no_translation_needed": "ファイル{}は翻訳が不要です、スキップします",
+            # テキスト比較エリア関連のテキスト
+            "comparison_data_refreshed": "テキスト比較データが更新されました",
+            "refresh_comparison_data_failed": "テキスト比較データの更新に失敗しました: {}",
+            "original_file_not_found": "元ファイルが見つかりません: {}",
+            "file_comparison_loaded": "ファイル比較が読み込まれました: {} <-> {}",
+            "load_comparison_failed": "比較ファイルの読み込みに失敗しました: {}",
+            "comparison_data_displayed": "{}個の比較データエントリが表示されました",
+            "display_comparison_failed": "比較データの表示に失敗しました: {}",
+            "untranslated_text": "[未翻訳]",
+            # 設定ダイアログ詳細テキスト
+            "batch_size_label": "バッチ翻訳サイズ（バッチあたりのエントリ数）:",
+            "entries_unit": "エントリ",
+            "batch_size_description": "同時に処理する翻訳エントリの数を設定します。大きな値は速度を向上させる可能性がありますが、より多くのリソースを使用します",
+            "auto_save_interval_label": "自動保存間隔（翻訳エントリ数）:",
+            "auto_save_description": "AI翻訳中に指定された数のエントリを翻訳した後、JSONファイルを自動保存します",
+            "edit_translation_dialog": "翻訳を編集",
+            "settings_dialog": "設定",
+            # 設定ダイアログメッセージテキスト
+            "settings_saved": "設定が保存されました",
+            "error": "エラー",
+            "invalid_number_input": "有効な数字を入力してください",
+            "show_settings_dialog_failed": "設定ダイアログの表示に失敗しました",
+            "stopping_translation": "翻訳を停止しています...",
+            "translation_stopped": "翻訳が停止されました",
+            "please_start_server_first": "まずサーバーを起動してください",
+            "translation_updated": "翻訳が更新されました",
+            "save_translation_failed": "翻訳の保存に失敗しました: {}",
+            "select_mod_files_title": "MODファイルを選択",
+            "compressed_files_type": "圧縮ファイル",
+            "all_files_type": "すべてのファイル",
+            "translation_dir_not_exist": "Translationディレクトリが存在しません、圧縮できません",
+            # 清空目录相关文本
+            "clear_directories_dialog": "ディレクトリクリア確認",
+            "clear_directories_message": "以下のディレクトリ内のすべてのファイルをクリアしますか？\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nこの操作は元に戻せません！",
+            "clear": "クリア",
+            "clear_directories_success": "ディレクトリクリア完了",
+            "clear_directories_failed": "ディレクトリクリア失敗: {}",
+            "clear_directory_success": "ディレクトリをクリアしました: {}",
+            "directory_not_exist": "ディレクトリが存在しません: {}",
+            "clear_directories_error": "ディレクトリクリア中にエラーが発生しました: {}",
+            "show_clear_dialog_failed": "クリアダイアログの表示に失敗しました: {}",
+            "warning": "警告",
+            "clear_directories_confirm": "クリア確認",
+            "clear_directories_unavailable": "ディレクトリクリア機能は利用できません",
+            "clear_directories_dialog_error": "ディレクトリクリアダイアログの表示に失敗しました: {}",
+            "switch_to_file": "ファイルに切り替えました: {} (インデックス: {})",
+        }
+    
+    @staticmethod
+    def _texts_ko() -> Dict[str, str]:
+        """한국어界面文本"""
+        return {
+            "title": "스타듀 밸리 MOD i18n AI번역 도구",
+            "config": "설정",
+            "target_language": "대상 언어:",
+            "translation_model": "번역 모델:",
+            "refresh_models": "모델 새로고침",
+            "functions": "기능",
+            "import_mod": "1. MOD 가져오기",
+            "extract_mod": "2. MOD 압축 해제",
+            "extract_i18n": "3. i18n 추출",
+            "auto_translate": "4. 자동 번역",
+            "stop_translate": "4. 번역 중지",
+            "recompress": "5. 재압축",
+            "log": "로그",
+            "progress_eta": "남은 시간 {}, {:.0f}개/분",
+            "app_started": "스타듀 밸리 MOD 번역 도구가 시작되었습니다",
+            "ollama_connected": "Ollama 서버에 연결되었습니다",
+            "ollama_connected_no_models": "Ollama 서버에 연결되었지만 사용 가능한 모델이 없습니다",
+            "ollama_connection_failed": "Ollama 서버 연결에 실패했습니다",
+            "ollama_connection_error": "Ollama 서버에 연결할 수 없습니다",
+            "refreshing_models": "모델 목록을 새로고침하는 중...",
+            "refresh_models_failed": "모델 새로고침에 실패했습니다",
+            "models_refreshed": "모델 목록이 새로고침되었습니다",
+            "initializing_model": "모델 초기화 중...",
+            "model_initialized": "모델 초기화 완료: {}",
+            "ollama_not_installed": "Ollama가 감지되지 않았습니다. 다음 단계를 따르세요:\n1. Ollama 다운로드 및 설치: https://ollama.com/\n2. ollama app.exe 서비스 시작\n3. 해당 모델 다운로드, qwen2.5-coder:14b 권장\n4. 저성능 컴퓨터는 qwen2.5-coder:7b 사용",
+            # 버튼 기능 로그 메시지
+            "imported_file": "가져옴: {}",
+            "import_success": "{}개 파일을 성공적으로 가져왔습니다",
+            "import_failed": "파일 가져오기 실패: {}",
+            "no_archives_found": "가져오기 디렉토리에서 압축 파일을 찾을 수 없습니다",
+            "extracting_file": "압축 해제 중: {}",
+            "extract_success": "압축 해제 성공: {}",
+            "extract_failed": "압축 해제 실패 {}: {}",
+            "extract_completed": "MOD 압축 해제 완료",
+            "extract_error": "압축 해제 프로세스 오류: {}",
+            "processing_mod": "MOD 처리 중: {}",
+            "i18n_extract_completed": "i18n 파일 추출 완료",
+            "i18n_extract_failed": "i18n 파일 추출 실패: {}",
+            "ollama_model_required": "먼저 Ollama 서버를 시작하고 모델을 선택하세요",
+            "start_auto_translate": "{}로 자동 번역 시작 중...",
+            "no_json_files": "번역할 JSON 파일을 찾을 수 없습니다",
+            "translating_file": "파일 번역 중: {}",
+            "translate_entry": "  {}: {} -> {}",
+            "translate_file_failed": "파일 번역 실패 {}: {}",
+            "auto_translate_completed": "자동 번역 완료",
+            "auto_translate_error": "자동 번역 프로세스 오류: {}",
+            "translate_request_failed": "번역 요청 실패: {}",
+            "translate_text_failed": "텍스트 번역 실패: {}",
+            "compressing_mod": "MOD 압축 중: {}",
+            "compress_success": "압축 완료: {}",
+            "recompress_completed": "MOD 재압축 완료",
+            "compress_error": "압축 프로세스 오류: {}",
+            # 파일 대화상자 텍스트
+            "select_mod_file": "MOD 파일 선택",
+            "select_files": "파일 선택",
+            "extract_i18n_files": "i18n 파일 추출",
+            # 편집 대화상자 텍스트
+            "edit_translation": "번역 편집",
+            "original_text": "원문",
+            "translation": "번역",
+            "translation_text": "번역 (더블클릭하여 수동 편집)",
+            "save": "저장",
+            "cancel": "취소",
+            # 설정 대화상자 텍스트
+            "settings": "설정",
+            "batch_translate_settings": "일괄 번역 설정",
+            "auto_save_settings": "자동 저장 설정",
+            # 텍스트 비교 영역 텍스트
+            "text_comparison": "텍스트 비교",
+            "select_mod": "MOD 선택:",
+            "refresh_mod_list": "MOD 목록 새로고침",
+            "save_translation": "번역 저장",
+            "clear_directories": "디렉토리 지우기",
+            "select_file": "파일 선택:",
+            "original": "원문",
+            "translated": "번역됨",
+            # 로그 메시지
+            "please_select_mod_first": "먼저 번역할 MOD를 선택하세요",
+            "please_select_file_first": "먼저 번역할 파일을 선택하세요",
+            "no_available_file_list": "사용 가능한 파일 목록이 없습니다",
+            "auto_switch_next_file": "다음 파일로 자동 전환",
+            "all_files_translated": "모든 파일이 번역되었습니다!",
+            "auto_switch_file_failed": "파일 자동 전환 실패",
+            "translation_dir_not_exist": "번역 디렉토리가 존재하지 않아 압축할 수 없습니다",
+            # 추가 하드코드 텍스트
+            "select_mod_first": "먼저 번역할 MOD를 선택하세요",
+            "select_file_first": "먼저 번역할 파일을 선택하세요",
+            "no_available_translation_files": "사용 가능한 번역 파일이 없습니다",
+            "start_translate_selected_file": "선택된 파일 번역 시작: {}",
+            "start_translate_mod": "MOD 번역 시작: {}",
+            "no_translation_data_to_save": "저장할 번역 데이터가 없습니다",
+            "translation_file_saved": "번역 파일이 저장되었습니다: {}",
+            "cannot_determine_save_path": "저장 파일 경로를 결정할 수 없습니다",
+            "save_translation_file_failed": "번역 파일 저장 실패: {}",
+            "found_mods": "{}개의 MOD를 찾았습니다: {}",
+            "no_mods_found": "MOD를 찾을 수 없습니다",
+            "switch_to_mod": "MOD로 전환했습니다: {}",
+            "refresh_mod_list_failed": "MOD 목록 새로고침 실패: {}",
+            "found_localization_files": "{}개의 로컬라이제이션 파일을 찾았습니다",
+            "no_localization_files_found": "로컬라이제이션 파일을 찾을 수 없습니다",
+            "mod_translation_dir_not_exist": "MOD 번역 디렉토리가 존재하지 않습니다",
+            "refresh_file_list_failed": "파일 목록 새로고침 실패: {}",
+            "update_translation_display_failed": "번역 표시 업데이트 실패: {}",
+            "smart_comparison_complete": "스마트 비교가 완료되었습니다",
+            "models_loaded": "모델 목록 로드 완료, 총 {}개 모델",
+            "found_entries_no_comparison": "비교 없이 {}개의 항목을 찾았습니다",
+            "file_no_translation_needed": "파일 {}는 번역이 필요하지 않습니다, 건너뜁니다",
+            # 텍스트 비교 영역 관련 텍스트
+            "comparison_data_refreshed": "텍스트 비교 데이터가 새로고침되었습니다",
+            "refresh_comparison_data_failed": "텍스트 비교 데이터 새로고침 실패: {}",
+            "original_file_not_found": "원본 파일을 찾을 수 없습니다: {}",
+            "file_comparison_loaded": "파일 비교가 로드되었습니다: {} <-> {}",
+            "load_comparison_failed": "비교 파일 로드 실패: {}",
+            "comparison_data_displayed": "{}개의 비교 데이터 항목이 표시되었습니다",
+            "display_comparison_failed": "비교 데이터 표시 실패: {}",
+            "untranslated_text": "[번역되지 않음]",
+            # 설정 대화상자 세부 텍스트
+            "batch_size_label": "배치 번역 크기 (배치당 항목 수):",
+            "entries_unit": "항목",
+            "batch_size_description": "동시에 처리할 번역 항목 수를 설정합니다. 큰 값은 속도를 향상시킬 수 있지만 더 많은 리소스를 사용합니다",
+            "auto_save_interval_label": "자동 저장 간격 (번역 항목 수):",
+            "auto_save_description": "AI 번역 중 지정된 수의 항목을 번역한 후 JSON 파일을 자동으로 저장합니다",
+            "edit_translation_dialog": "번역 편집",
+            "settings_dialog": "설정",
+            # 설정 대화상자 메시지 텍스트
+            "settings_saved": "설정이 저장되었습니다",
+            "error": "오류",
+            "invalid_number_input": "유효한 숫자를 입력하세요",
+            "show_settings_dialog_failed": "설정 대화상자 표시 실패",
+            "stopping_translation": "번역을 중지하는 중...",
+            "translation_stopped": "번역이 중지되었습니다",
+            "please_start_server_first": "먼저 서버를 시작하세요",
+            "translation_updated": "번역이 업데이트되었습니다",
+            "save_translation_failed": "번역 저장 실패: {}",
+            "select_mod_files_title": "MOD 파일 선택",
+            "compressed_files_type": "압축 파일",
+            "all_files_type": "모든 파일",
+            "translation_dir_not_exist": "Translation 디렉토리가 존재하지 않아 압축할 수 없습니다",
+            # 清空目录相关文本
+            "clear_directories_dialog": "디렉토리 지우기 확인",
+            "clear_directories_message": "다음 디렉토리의 모든 파일을 지우시겠습니까?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\n이 작업은 되돌릴 수 없습니다!",
+            "clear": "지우기",
+            "clear_directories_success": "디렉토리 지우기 완료",
+            "clear_directories_failed": "디렉토리 지우기 실패: {}",
+            "clear_directory_success": "디렉토리를 지웠습니다: {}",
+            "directory_not_exist": "디렉토리가 존재하지 않습니다: {}",
+            "clear_directories_error": "디렉토리 지우기 중 오류가 발생했습니다: {}",
+            "show_clear_dialog_failed": "지우기 대화상자 표시 실패: {}",
+            "warning": "경고",
+            "clear_directories_confirm": "지우기 확인",
+            "clear_directories_unavailable": "디렉토리 지우기 기능을 사용할 수 없습니다",
+            "clear_directories_dialog_error": "디렉토리 지우기 대화상자 표시 실패: {}",
+            "switch_to_file": "파일로 전환: {} (인덱스: {})",
+        }
+    
+    @staticmethod
+    def _texts_fr() -> Dict[str, str]:
+        """Français界面文本"""
+        return {
+            "title": "Outil de Traduction MOD i18n AI Stardew Valley",
+            "config": "Configuration",
+            "target_language": "Langue Cible:",
+            "translation_model": "Modèle de Traduction:",
+            "refresh_models": "Actualiser Modèles",
+            "functions": "Fonctions",
+            "import_mod": "1. Importer MOD",
+            "extract_mod": "2. Extraire MOD",
+            "extract_i18n": "3. Extraire i18n",
+            "auto_translate": "4. Traduction Auto",
+            "stop_translate": "4. Arrêter Traduction",
+            "recompress": "5. Recompresser",
+            "log": "Journal",
+            "progress_eta": "{} restant, {:.0f}/min",
+            "app_started": "Outil de Traduction MOD Stardew Valley Démarré",
+            "ollama_connected": "Serveur Ollama Connecté",
+            "ollama_connected_no_models": "Serveur Ollama Connecté, mais Aucun Modèle Disponible",
+            "ollama_connection_failed": "Échec de Connexion au Serveur Ollama",
+            "ollama_connection_error": "Impossible de se Connecter au Serveur Ollama",
+            "refreshing_models": "Actualisation de la liste des modèles...",
+            "refresh_models_failed": "Échec de l'actualisation des modèles",
+            "models_refreshed": "Liste des modèles actualisée",
+            "no_available_models": "Aucun modèle disponible trouvé",
+            "model_loading_failed": "Échec du chargement de la liste des modèles: {}",
+            "initializing_model": "Initialisation du modèle...",
+            "model_initialized": "Modèle initialisé: {}",
+            "ollama_not_installed": "Ollama non détecté, veuillez suivre ces étapes:\n1. Télécharger et installer Ollama: https://ollama.com/\n2. Démarrer le service ollama app.exe\n3. Télécharger le modèle correspondant, qwen2.5-coder:14b recommandé\n4. Utiliser qwen2.5-coder:7b pour les ordinateurs peu performants",
+            # Messages de journal des fonctions de bouton
+            "imported_file": "Importé: {}",
+            "import_success": "{} fichiers importés avec succès",
+            "import_failed": "Échec de l'importation du fichier: {}",
+            "no_archives_found": "Aucun fichier d'archive trouvé dans le répertoire d'importation",
+            "extracting_file": "Extraction: {}",
+            "extract_success": "Extraction réussie: {}",
+            "extract_failed": "Échec de l'extraction {}: {}",
+            "extract_completed": "Extraction MOD terminée",
+            "extract_error": "Erreur du processus d'extraction: {}",
+            "processing_mod": "Traitement du MOD: {}",
+            "i18n_extract_completed": "Extraction des fichiers i18n terminée",
+            "i18n_extract_failed": "Échec de l'extraction des fichiers i18n: {}",
+            "ollama_model_required": "Veuillez d'abord démarrer le serveur Ollama et sélectionner un modèle",
+            "start_auto_translate": "Début de la traduction automatique vers {}...",
+            "no_json_files": "Aucun fichier JSON trouvé pour la traduction",
+            "translating_file": "Traduction du fichier: {}",
+            "translate_entry": "  {}: {} -> {}",
+            "translate_file_failed": "Échec de la traduction du fichier {}: {}",
+            "auto_translate_completed": "Traduction automatique terminée",
+            "auto_translate_error": "Erreur du processus de traduction automatique: {}",
+            "translate_request_failed": "Échec de la demande de traduction: {}",
+            "translate_text_failed": "Échec de la traduction du texte: {}",
+            "compressing_mod": "Compression du MOD: {}",
+            "compress_success": "Compression terminée: {}",
+            "recompress_completed": "Recompression MOD terminée",
+            "compress_error": "Erreur du processus de compression: {}",
+            # Textes de dialogue de fichier
+            "select_mod_file": "Sélectionner Fichier MOD",
+            "select_files": "Sélectionner Fichiers",
+            "extract_i18n_files": "Extraire Fichiers i18n",
+            # Textes de dialogue d'édition
+            "edit_translation": "Éditer Traduction",
+            "original_text": "Texte Original",
+            "translation": "Traduction",
+            "translation_text": "Traduction (Double-cliquez pour éditer manuellement)",
+            "save": "Enregistrer",
+            "cancel": "Annuler",
+            # Textes de dialogue de paramètres
+            "settings": "Paramètres",
+            "batch_translate_settings": "Paramètres Traduction par Lot",
+            "auto_save_settings": "Paramètres Sauvegarde Auto",
+            # Textes de zone de comparaison de texte
+            "text_comparison": "Comparaison de Texte",
+            "select_mod": "Sélectionner MOD:",
+            "refresh_mod_list": "Actualiser Liste MOD",
+            "save_translation": "Enregistrer Traduction",
+            "clear_directories": "Vider Répertoires",
+            "select_file": "Sélectionner Fichier:",
+            "original": "Original",
+            "translated": "Traduit",
+            # Messages de journal
+            "please_select_mod_first": "Veuillez d'abord sélectionner un MOD à traduire",
+            "please_select_file_first": "Veuillez d'abord sélectionner un fichier à traduire",
+            "no_available_file_list": "Aucune liste de fichiers disponible",
+            "auto_switch_next_file": "Basculement automatique vers le fichier suivant",
+            "all_files_translated": "Tous les fichiers ont été traduits!",
+            "auto_switch_file_failed": "Échec du basculement automatique de fichier",
+            "translation_dir_not_exist": "Le répertoire de traduction n'existe pas, impossible de compresser",
+            # Texte codé en dur supplémentaire
+            "select_mod_first": "Veuillez d'abord sélectionner un MOD à traduire",
+            "select_file_first": "Veuillez d'abord sélectionner un fichier à traduire",
+            "no_available_translation_files": "Aucun fichier de traduction disponible",
+            "start_translate_selected_file": "Début de la traduction du fichier sélectionné: {}",
+            "start_translate_mod": "Début de la traduction du MOD: {}",
+            "no_translation_data_to_save": "Aucune donnée de traduction à enregistrer",
+            "translation_file_saved": "Fichier de traduction enregistré: {}",
+            "cannot_determine_save_path": "Impossible de déterminer le chemin du fichier de sauvegarde",
+            "save_translation_file_failed": "Échec de l'enregistrement du fichier de traduction: {}",
+            "found_mods": "Trouvé {} MODs: {}",
+            "no_mods_found": "Aucun MOD trouvé",
+            "switch_to_mod": "Basculé vers le MOD: {}",
+            "refresh_mod_list_failed": "Échec de l'actualisation de la liste des MODs: {}",
+            "found_localization_files": "Trouvé {} fichiers de localisation",
+            "no_localization_files_found": "Aucun fichier de localisation trouvé",
+            "mod_translation_dir_not_exist": "Le répertoire de traduction MOD n'existe pas",
+            "refresh_file_list_failed": "Échec de l'actualisation de la liste des fichiers: {}",
+            "update_translation_display_failed": "Échec de la mise à jour de l'affichage de traduction: {}",
+            "smart_comparison_complete": "Comparaison intelligente terminée",
+            "models_loaded": "Liste des modèles chargée, {} modèles au total",
+            "found_entries_no_comparison": "Trouvé {} entrées sans comparaison",
+            "file_no_translation_needed": "Le fichier {} n'a pas besoin de traduction, ignoré",
+            # Textes liés à la zone de comparaison de texte
+            "comparison_data_refreshed": "Données de comparaison de texte actualisées",
+            "refresh_comparison_data_failed": "Échec de l'actualisation des données de comparaison de texte: {}",
+            "original_file_not_found": "Fichier original non trouvé: {}",
+            "file_comparison_loaded": "Comparaison de fichiers chargée: {} <-> {}",
+            "load_comparison_failed": "Échec du chargement des fichiers de comparaison: {}",
+            "comparison_data_displayed": "Affiché {} entrées de données de comparaison",
+            "display_comparison_failed": "Échec de l'affichage des données de comparaison: {}",
+            "untranslated_text": "[Non traduit]",
+            # Textes détaillés de la boîte de dialogue des paramètres
+            "batch_size_label": "Taille de traduction par lot (entrées par lot):",
+            "entries_unit": "entrées",
+            "batch_size_description": "Définir le nombre d'entrées de traduction à traiter simultanément. Des valeurs plus importantes peuvent améliorer la vitesse mais utilisent plus de ressources",
+            "auto_save_interval_label": "Intervalle de sauvegarde automatique (entrées de traduction):",
+            "auto_save_description": "Sauvegarder automatiquement les fichiers JSON après avoir traduit le nombre spécifié d'entrées pendant la traduction IA",
+            "edit_translation_dialog": "Modifier la traduction",
+            "settings_dialog": "Paramètres",
+            # Textes de message de la boîte de dialogue des paramètres
+            "settings_saved": "Paramètres sauvegardés",
+            "error": "Erreur",
+            "invalid_number_input": "Veuillez entrer un nombre valide",
+            "show_settings_dialog_failed": "Échec de l'affichage de la boîte de dialogue des paramètres",
+            "stopping_translation": "Arrêt de la traduction...",
+            "extract_i18n_file": "Extraction du fichier i18n: {} -> {}",
+            "loaded_original_file": "Fichier original chargé pour comparaison: {}",
+            "auto_saved_translations": "Sauvegarde automatique de {} traductions",
+            "translation_stopped": "Traduction arrêtée",
+            "please_start_server_first": "Veuillez d'abord démarrer le serveur",
+            "translation_updated": "Traduction mise à jour",
+            "save_translation_failed": "Échec de la sauvegarde de la traduction: {}",
+            "select_mod_files_title": "Sélectionner les fichiers MOD",
+            "compressed_files_type": "Fichiers compressés",
+            "all_files_type": "Tous les fichiers",
+            "translation_dir_not_exist": "Le répertoire Translation n'existe pas, impossible de compresser",
+            # 清空目录相关文本
+            "clear_directories_dialog": "Confirmation de vidage des répertoires",
+            "clear_directories_message": "Êtes-vous sûr de vouloir vider tous les fichiers des répertoires suivants ?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nCette opération ne peut pas être annulée !",
+            "clear": "Vider",
+            "clear_directories_success": "Répertoires vidés avec succès",
+            "clear_directories_failed": "Échec du vidage des répertoires : {}",
+            "clear_directory_success": "Répertoire vidé : {}",
+            "directory_not_exist": "Le répertoire n'existe pas : {}",
+            "clear_directories_error": "Erreur lors du vidage des répertoires : {}",
+            "show_clear_dialog_failed": "Échec de l'affichage de la boîte de dialogue de vidage : {}",
+            "warning": "Avertissement",
+            "clear_directories_confirm": "Confirmer le vidage",
+            "clear_directories_unavailable": "La fonction de vidage des répertoires n'est pas disponible",
+            "clear_directories_dialog_error": "Échec de l'affichage de la boîte de dialogue de vidage des répertoires : {}",
+            "switch_to_file": "Basculé vers le fichier : {} (index : {})",
         }
+    
+    @staticmethod
+    def _texts_de() -> Dict[str, str]:
+        """Deutsch界面文本"""
+        return {
+            "title": "Stardew Valley MOD i18n AI Übersetzungstool",
+            "config": "Konfiguration",
+            "target_language": "Zielsprache:",
+            "translation_model": "Übersetzungsmodell:",
+            "refresh_models": "Modelle Aktualisieren",
+            "functions": "Funktionen",
+            "import_mod": "1. MOD Importieren",
+            "extract_mod": "2. MOD Extrahieren",
+            "extract_i18n": "3. i18n Extrahieren",
+            "auto_translate": "4. Auto Übersetzen",
+            "stop_translate": "4. Übersetzung Stoppen",
+            "recompress": "5. Neu Komprimieren",
+            "log": "Protokoll",
+            "progress_eta": "noch {}, {:.0f}/min",
+            "app_started": "Stardew Valley MOD Übersetzungstool Gestartet",
+            "ollama_connected": "Ollama Server Verbunden",
+            "ollama_connected_no_models": "Ollama Server Verbunden, aber Keine Verfügbaren Modelle",
+            "ollama_connection_failed": "Ollama Server Verbindung Fehlgeschlagen",
+            "ollama_connection_error": "Kann nicht mit Ollama Server Verbinden",
+            "refreshing_models": "Modellliste wird aktualisiert...",
+            "refresh_models_failed": "Modellaktualisierung fehlgeschlagen",
+            "models_refreshed": "Modellliste aktualisiert",
+            "no_available_models": "Keine verfügbaren Modelle gefunden",
+            "model_loading_failed": "Laden der Modellliste fehlgeschlagen: {}",
+            "initializing_model": "Modell wird initialisiert...",
+            "model_initialized": "Modell initialisiert: {}",
+            "ollama_not_installed": "Ollama nicht erkannt, bitte folgen Sie diesen Schritten:\n1. Ollama herunterladen und installieren: https://ollama.com/\n2. ollama app.exe Service starten\n3. Entsprechendes Modell herunterladen, qwen2.5-coder:14b empfohlen\n4. qwen2.5-coder:7b für leistungsschwache Computer verwenden",
+            # Button-Funktions-Log-Nachrichten
+            "imported_file": "Importiert: {}",
+            "import_success": "{} Dateien erfolgreich importiert",
+            "import_failed": "Datei-Import fehlgeschlagen: {}",
+            "no_archives_found": "Keine Archivdateien im Import-Verzeichnis gefunden",
+            "extracting_file": "Extrahiere: {}",
+            "extract_success": "Extraktion erfolgreich: {}",
+            "extract_failed": "Extraktion fehlgeschlagen {}: {}",
+            "extract_completed": "MOD-Extraktion abgeschlossen",
+            "extract_error": "Extraktionsprozess-Fehler: {}",
+            "processing_mod": "MOD wird verarbeitet: {}",
+            "i18n_extract_completed": "i18n-Datei-Extraktion abgeschlossen",
+            "i18n_extract_failed": "i18n-Datei-Extraktion fehlgeschlagen: {}",
+            "ollama_model_required": "Bitte starten Sie zuerst den Ollama-Server und wählen Sie ein Modell",
+            "start_auto_translate": "Automatische Übersetzung nach {} wird gestartet...",
+            "no_json_files": "Keine JSON-Dateien für die Übersetzung gefunden",
+            "translating_file": "Datei wird übersetzt: {}",
+            "translate_entry": "  {}: {} -> {}",
+            "translate_file_failed": "Dateiübersetzung fehlgeschlagen {}: {}",
+            "auto_translate_completed": "Automatische Übersetzung abgeschlossen",
+            "auto_translate_error": "Automatischer Übersetzungsprozess-Fehler: {}",
+            "translate_request_failed": "Übersetzungsanfrage fehlgeschlagen: {}",
+            "translate_text_failed": "Textübersetzung fehlgeschlagen: {}",
+            "compressing_mod": "MOD wird komprimiert: {}",
+            "compress_success": "Komprimierung abgeschlossen: {}",
+            "recompress_completed": "MOD-Rekomprimierung abgeschlossen",
+            "compress_error": "Komprimierungsprozess-Fehler: {}",
+            # Dateidialog-Texte
+            "select_mod_file": "MOD-Datei Auswählen",
+            "select_files": "Dateien Auswählen",
+            "extract_i18n_files": "i18n-Dateien Extrahieren",
+            # Bearbeitungsdialog-Texte
+            "edit_translation": "Übersetzung Bearbeiten",
+            "original_text": "Originaltext",
+            "translation": "Übersetzung",
+            "translation_text": "Übersetzung (Doppelklicken zum manuellen Bearbeiten)",
+            "save": "Speichern",
+            "cancel": "Abbrechen",
+            # Einstellungsdialog-Texte
+            "settings": "Einstellungen",
+            "batch_translate_settings": "Stapelübersetzung Einstellungen",
+            "auto_save_settings": "Automatisches Speichern Einstellungen",
+            # Textvergleichsbereich-Texte
+            "text_comparison": "Textvergleich",
+            "select_mod": "MOD Auswählen:",
+            "refresh_mod_list": "MOD-Liste Aktualisieren",
+            "save_translation": "Übersetzung Speichern",
+            "clear_directories": "Verzeichnisse Leeren",
+            "select_file": "Datei Auswählen:",
+            "original": "Original",
+            "translated": "Übersetzt",
+            # Log-Nachrichten
+            "please_select_mod_first": "Bitte wählen Sie zuerst einen MOD zum Übersetzen aus",
+            "please_select_file_first": "Bitte wählen Sie zuerst eine Datei zum Übersetzen aus",
+            "no_available_file_list": "Keine verfügbare Dateiliste",
+            "auto_switch_next_file": "Automatischer Wechsel zur nächsten Datei",
+            "all_files_translated": "Alle Dateien wurden übersetzt!",
+            "auto_switch_file_failed": "Automatischer Dateiwechsel fehlgeschlagen",
+            "translation_dir_not_exist": "Übersetzungsverzeichnis existiert nicht, kann nicht komprimieren",
+            # Zusätzlicher hartcodierter Text
+            "select_mod_first": "Bitte wählen Sie zuerst einen MOD zum Übersetzen aus",
+            "select_file_first": "Bitte wählen Sie zuerst eine Datei zum Übersetzen aus",
+            "no_available_translation_files": "Keine verfügbaren Übersetzungsdateien",
+            "start_translate_selected_file": "Übersetzung der ausgewählten Datei beginnt: {}",
+            "start_translate_mod": "MOD-Übersetzung beginnt: {}",
+            "no_translation_data_to_save": "Keine Übersetzungsdaten zum Speichern",
+            "translation_file_saved": "Übersetzungsdatei gespeichert: {}",
+            "cannot_determine_save_path": "Kann Speicherdateipfad nicht bestimmen",
+            "save_translation_file_failed": "Speichern der Übersetzungsdatei fehlgeschlagen: {}",
+            "found_mods": "{} MODs gefunden: {}",
+            "no_mods_found": "Keine MODs gefunden",
+            "switch_to_mod": "Zu MOD gewechselt: {}",
+            "refresh_mod_list_failed": "MOD-Liste aktualisieren fehlgeschlagen: {}",
+            "found_localization_files": "{} Lokalisierungsdateien gefunden",
+            "no_localization_files_found": "Keine Lokalisierungsdateien gefunden",
+            "mod_translation_dir_not_exist": "MOD-Übersetzungsverzeichnis existiert nicht",
+            "refresh_file_list_failed": "Dateiliste aktualisieren fehlgeschlagen: {}",
+            "update_translation_display_failed": "Übersetzungsanzeige aktualisieren fehlgeschlagen: {}",
+            "smart_comparison_complete": "Intelligenter Vergleich abgeschlossen",
+            "models_loaded": "Modellliste geladen, {} Modelle insgesamt",
+            "found_entries_no_comparison": "{} Einträge ohne Vergleich gefunden",
+            "file_no_translation_needed": "Datei {} benötigt keine Übersetzung, übersprungen",
+            # Textvergleichsbereich-bezogene Texte
+            "comparison_data_refreshed": "Textvergleichsdaten aktualisiert",
+            "refresh_comparison_data_failed": "Aktualisierung der Textvergleichsdaten fehlgeschlagen: {}",
+            "original_file_not_found": "Originaldatei nicht gefunden: {}",
+            "file_comparison_loaded": "Dateivergleich geladen: {} <-> {}",
+            "load_comparison_failed": "Laden der Vergleichsdateien fehlgeschlagen: {}",
+            "comparison_data_displayed": "{} Vergleichsdateneinträge angezeigt",
+            "display_comparison_failed": "Anzeige der Vergleichsdaten fehlgeschlagen: {}",
+            "untranslated_text": "[Unübersetzt]",
+            # Detaillierte Texte für Einstellungsdialog
+            "batch_size_label": "Batch-Übersetzungsgröße (Einträge pro Batch):",
+            "entries_unit": "Einträge",
+            "batch_size_description": "Anzahl der gleichzeitig zu verarbeitenden Übersetzungseinträge festlegen. Größere Werte können die Geschwindigkeit verbessern, verbrauchen aber mehr Ressourcen",
+            "auto_save_interval_label": "Automatisches Speicherintervall (Übersetzungseinträge):",
+            "auto_save_description": "JSON-Dateien automatisch speichern, nachdem die angegebene Anzahl von Einträgen während der KI-Übersetzung übersetzt wurde",
+            "edit_translation_dialog": "Übersetzung bearbeiten",
+            "settings_dialog": "Einstellungen",
+            # Einstellungsdialog-Nachrichtentexte
+            "settings_saved": "Einstellungen gespeichert",
+            "error": "Fehler",
+            "invalid_number_input": "Bitte geben Sie eine gültige Zahl ein",
+            "show_settings_dialog_failed": "Fehler beim Anzeigen des Einstellungsdialogs",
+            "stopping_translation": "Übersetzung wird gestoppt...",
+            "translation_stopped": "Übersetzung gestoppt",
+            "please_start_server_first": "Bitte starten Sie zuerst den Server",
+            "translation_updated": "Übersetzung aktualisiert",
+            "save_translation_failed": "Fehler beim Speichern der Übersetzung: {}",
+            "select_mod_files_title": "MOD-Dateien auswählen",
+            "compressed_files_type": "Komprimierte Dateien",
+            "all_files_type": "Alle Dateien",
+            "extract_i18n_file": "i18n-Datei extrahieren: {} -> {}",
+            "loaded_original_file": "Originaldatei zum Vergleich geladen: {}",
+            "auto_saved_translations": "Automatisch {} Übersetzungen gespeichert",
+            "translation_dir_not_exist": "Translation-Verzeichnis existiert nicht, kann nicht komprimieren",
+            # 清空目录相关文本
+            "clear_directories_dialog": "Verzeichnisse leeren bestätigen",
+            "clear_directories_message": "Sind Sie sicher, dass Sie alle Dateien in den folgenden Verzeichnissen löschen möchten?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nDieser Vorgang kann nicht rückgängig gemacht werden!",
+            "clear": "Leeren",
+            "clear_directories_success": "Verzeichnisse erfolgreich geleert",
+            "clear_directories_failed": "Fehler beim Leeren der Verzeichnisse: {}",
+            "clear_directory_success": "Verzeichnis geleert: {}",
+            "directory_not_exist": "Verzeichnis existiert nicht: {}",
+            "clear_directories_error": "Fehler beim Leeren der Verzeichnisse: {}",
+            "show_clear_dialog_failed": "Fehler beim Anzeigen des Lösch-Dialogs: {}",
+            "warning": "Warnung",
+            "clear_directories_confirm": "Leeren bestätigen",
+            "clear_directories_unavailable": "Verzeichnis-Leerungsfunktion ist nicht verfügbar",
+            "clear_directories_dialog_error": "Fehler beim Anzeigen des Verzeichnis-Leerungs-Dialogs: {}",
+            "switch_to_file": "Zu Datei gewechselt: {} (Index: {})",
+        }
+    
+    @staticmethod
+    def _texts_es() -> Dict[str, str]:
+        """Español界面文本"""
+        return {
+            "title": "Herramienta de Traducción MOD i18n AI Stardew Valley",
+            "config": "Configuración",
+            "target_language": "Idioma Objetivo:",
+            "translation_model": "Modelo de Traducción:",
+            "refresh_models": "Actualizar Modelos",
+            "functions": "Funciones",
+            "import_mod": "1. Importar MOD",
+            "extract_mod": "2. Extraer MOD",
+            "extract_i18n": "3. Extraer i18n",
+            "auto_translate": "4. Traducir Auto",
+            "stop_translate": "4. Detener Traducción",
+            "recompress": "5. Recomprimir",
+            "log": "Registro",
+            "progress_eta": "quedan {}, {:.0f}/min",
+            "app_started": "Herramienta de Traducción MOD Stardew Valley Iniciada",
+            "ollama_connected": "Servidor Ollama Conectado",
+            "ollama_connected_no_models": "Servidor Ollama Conectado, pero Sin Modelos Disponibles",
+            "ollama_connection_failed": "Falló la Conexión al Servidor Ollama",
+            "ollama_connection_error": "No se Puede Conectar al Servidor Ollama",
+            "refreshing_models": "Actualizando lista de modelos...",
+            "refresh_models_failed": "Falló la actualización de modelos",
+            "models_refreshed": "Lista de modelos actualizada",
+            "no_available_models": "No se encontraron modelos disponibles",
+            "model_loading_failed": "Error al cargar la lista de modelos: {}",
+            "initializing_model": "Inicializando modelo...",
+            "model_initialized": "Modelo inicializado: {}",
+            "ollama_not_installed": "Ollama no detectado, por favor siga estos pasos:\n1. Descargar e instalar Ollama: https://ollama.com/\n2. Iniciar el servicio ollama app.exe\n3. Descargar el modelo correspondiente, se recomienda qwen2.5-coder:14b\n4. Usar qwen2.5-coder:7b para computadoras de bajo rendimiento",
+            # Mensajes de registro de funciones de botón
+            "imported_file": "Importado: {}",
+            "import_success": "{} archivos importados exitosamente",
+            "import_failed": "Falló la importación del archivo: {}",
+            "no_archives_found": "No se encontraron archivos de archivo en el directorio de importación",
+            "extracting_file": "Extrayendo: {}",
+            "extract_success": "Extracción exitosa: {}",
+            "extract_failed": "Falló la extracción {}: {}",
+            "extract_completed": "Extracción de MOD completada",
+            "extract_error": "Error del proceso de extracción: {}",
+            "processing_mod": "Procesando MOD: {}",
+            "i18n_extract_completed": "Extracción de archivos i18n completada",
+            "i18n_extract_failed": "Falló la extracción de archivos i18n: {}",
+            "ollama_model_required": "Por favor, inicie primero el servidor Ollama y seleccione un modelo",
+            "start_auto_translate": "Iniciando traducción automática a {}...",
+            "no_json_files": "No se encontraron archivos JSON para traducir",
+            "translating_file": "Traduciendo archivo: {}",
+            "translate_entry": "  {}: {} -> {}",
+            "translate_file_failed": "Falló la traducción del archivo {}: {}",
+            "auto_translate_completed": "Traducción automática completada",
+            "auto_translate_error": "Error del proceso de traducción automática: {}",
+            "translate_request_failed": "Falló la solicitud de traducción: {}",
+            "translate_text_failed": "Falló la traducción del texto: {}",
+            "compressing_mod": "Comprimiendo MOD: {}",
+            "compress_success": "Compresión completada: {}",
+            "recompress_completed": "Recompresión de MOD completada",
+            "compress_error": "Error del proceso de compresión: {}",
+            # Textos de diálogo de archivo
+            "select_mod_file": "Seleccionar Archivo MOD",
+            "select_files": "Seleccionar Archivos",
+            "extract_i18n_files": "Extraer Archivos i18n",
+            # Textos de diálogo de edición
+            "edit_translation": "Editar Traducción",
+            "original_text": "Texto Original",
+            "translation": "Traducción",
+            "translation_text": "Traducción (Doble clic para editar manualmente)",
+            "save": "Guardar",
+            "cancel": "Cancelar",
+            # Textos de diálogo de configuración
+            "settings": "Configuración",
+            "batch_translate_settings": "Configuración de Traducción por Lotes",
+            "auto_save_settings": "Configuración de Guardado Automático",
+            # Textos del área de comparación de texto
+            "text_comparison": "Comparación de Texto",
+            "select_mod": "Seleccionar MOD:",
+            "refresh_mod_list": "Actualizar Lista de MOD",
+            "save_translation": "Guardar Traducción",
+            "clear_directories": "Vaciar Directorios",
+            "select_file": "Seleccionar Archivo:",
+            "original": "Original",
+            "translated": "Traducido",
+            # Mensajes de registro
+            "please_select_mod_first": "Por favor, seleccione primero un MOD para traducir",
+            "please_select_file_first": "Por favor, seleccione primero un archivo para traducir",
+            "no_available_file_list": "No hay lista de archivos disponible",
+            "auto_switch_next_file": "Cambio automático al siguiente archivo",
+            "all_files_translated": "¡Todos los archivos han sido traducidos!",
+            "auto_switch_file_failed": "Falló el cambio automático de archivo",
+            "translation_dir_not_exist": "El directorio de traducción no existe, no se puede comprimir",
+            # Texto hardcodeado adicional
+            "select_mod_first": "Por favor, seleccione primero un MOD para traducir",
+            "select_file_first": "Por favor, seleccione primero un archivo para traducir",
+            "no_available_translation_files": "No hay archivos de traducción disponibles",
+            "start_translate_selected_file": "Iniciando traducción del archivo seleccionado: {}",
+            "start_translate_mod": "Iniciando traducción del MOD: {}",
+            "no_translation_data_to_save": "No hay datos de traducción para guardar",
+            "translation_file_saved": "Archivo de traducción guardado: {}",
+            "cannot_determine_save_path": "No se puede determinar la ruta de guardado del archivo",
+            "save_translation_file_failed": "Error al guardar el archivo de traducción: {}",
+            "found_mods": "Se encontraron {} MODs: {}",
+            "no_mods_found": "No se encontraron MODs",
+            "switch_to_mod": "Cambiado al MOD: {}",
+            "refresh_mod_list_failed": "Error al actualizar la lista de MODs: {}",
+            "found_localization_files": "Se encontraron {} archivos de localización",
+            "no_localization_files_found": "No se encontraron archivos de localización",
+            "mod_translation_dir_not_exist": "El directorio de traducción del MOD no existe",
+            "refresh_file_list_failed": "Error al actualizar la lista de archivos: {}",
+            "update_translation_display_failed": "Error al actualizar la visualización de traducción: {}",
+            "smart_comparison_complete": "Comparación inteligente completada",
+            "models_loaded": "Lista de modelos cargada, {} modelos en total",
+            "found_entries_no_comparison": "Se encontraron {} entradas sin comparación",
+            "file_no_translation_needed": "El archivo {} no necesita traducción, omitido",
+            # Textos relacionados con el área de comparación de texto
+            "comparison_data_refreshed": "Datos de comparación de texto actualizados",
+            "refresh_comparison_data_failed": "Error al actualizar los datos de comparación de texto: {}",
+            "original_file_not_found": "Archivo original no encontrado: {}",
+            "file_comparison_loaded": "Comparación de archivos cargada: {} <-> {}",
+            "load_comparison_failed": "Error al cargar archivos de comparación: {}",
+            "comparison_data_displayed": "Se mostraron {} entradas de datos de comparación",
+            "display_comparison_failed": "Error al mostrar datos de comparación: {}",
+            "untranslated_text": "[Sin traducir]",
+            # Textos detallados del diálogo de configuración
+            "batch_size_label": "Tamaño de traducción por lotes (entradas por lote):",
+            "entries_unit": "entradas",
+            "batch_size_description": "Establecer el número de entradas de traducción a procesar simultáneamente. Valores más grandes pueden mejorar la velocidad pero usan más recursos",
+            "auto_save_interval_label": "Intervalo de guardado automático (entradas de traducción):",
+            "auto_save_description": "Guardar automáticamente archivos JSON después de traducir el número especificado de entradas durante la traducción IA",
+            "edit_translation_dialog": "Editar traducción",
+            "settings_dialog": "Configuración",
+            # Textos de mensaje del diálogo de configuración
+            "settings_saved": "Configuración guardada",
+            "error": "Error",
+            "invalid_number_input": "Por favor ingrese un número válido",
+            "show_settings_dialog_failed": "Error al mostrar el diálogo de configuración",
+            "stopping_translation": "Deteniendo traducción...",
+            "translation_stopped": "Traducción detenida",
+            "please_start_server_first": "Por favor inicie el servidor primero",
+            "translation_updated": "Traducción actualizada",
+            "save_translation_failed": "Error al guardar la traducción: {}",
+            "select_mod_files_title": "Seleccionar archivos MOD",
+            "compressed_files_type": "Archivos comprimidos",
+            "all_files_type": "Todos los archivos",
+            "extract_i18n_file": "Extrayendo archivo i18n: {} -> {}",
+            "loaded_original_file": "Archivo original cargado para comparación: {}",
+            "auto_saved_translations": "Guardado automático de {} traducciones",
+            "translation_dir_not_exist": "El directorio Translation no existe, no se puede comprimir",
+            # 清空目录相关文本
+            "clear_directories_dialog": "Confirmar vaciado de directorios",
+            "clear_directories_message": "¿Está seguro de que desea vaciar todos los archivos de los siguientes directorios?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\n¡Esta operación no se puede deshacer!",
+            "clear": "Vaciar",
+            "clear_directories_success": "Directorios vaciados exitosamente",
+            "clear_directories_failed": "Error al vaciar directorios: {}",
+            "clear_directory_success": "Directorio vaciado: {}",
+            "directory_not_exist": "El directorio no existe: {}",
+            "clear_directories_error": "Error al vaciar directorios: {}",
+            "show_clear_dialog_failed": "Error al mostrar el diálogo de vaciado: {}",
+            "warning": "Advertencia",
+            "clear_directories_confirm": "Confirmar vaciado",
+            "clear_directories_unavailable": "La función de vaciado de directorios no está disponible",
+            "clear_directories_dialog_error": "Error al mostrar el diálogo de vaciado de directorios: {}",
+            "switch_to_file": "Cambiado a archivo: {} (índice: {})",
+        }
+    
+    @staticmethod
+    def _texts_ru() -> Dict[str, str]:
+        """Русский界面文本"""
+        return {
+            "title": "Инструмент Перевода MOD i18n AI Stardew Valley",
+            "config": "Конфигурация",
+            "target_language": "Целевой Язык:",
+            "translation_model": "Модель Перевода:",
+            "refresh_models": "Обновить Модели",
+            "functions": "Функции",
+            "import_mod": "1. Импорт MOD",
+            "extract_mod": "2. Извлечь MOD",
+            "extract_i18n": "3. Извлечь i18n",
+            "auto_translate": "4. Авто Перевод",
+            "stop_translate": "4. Остановить Перевод",
+            "recompress": "5. Пересжать",
+            "log": "Журнал",
+            "progress_eta": "осталось {}, {:.0f}/мин",
+            "app_started": "Инструмент Перевода MOD Stardew Valley Запущен",
+            "ollama_connected": "Сервер Ollama Подключен",
+            "ollama_connected_no_models": "Сервер Ollama Подключен, но Нет Доступных Моделей",
+            "ollama_connection_failed": "Не Удалось Подключиться к Серверу Ollama",
+            "ollama_connection_error": "Невозможно Подключиться к Серверу Ollama",
+            "refreshing_models": "Обновление списка моделей...",
+            "refresh_models_failed": "Не удалось обновить модели",
+            "models_refreshed": "Список моделей обновлен",
+            "no_available_models": "Доступные модели не найдены",
+            "model_loading_failed": "Ошибка загрузки списка моделей: {}",
+            "initializing_model": "Инициализация модели...",
+            "model_initialized": "Модель инициализирована: {}",
+            "ollama_not_installed": "Ollama не обнаружен, пожалуйста, выполните следующие шаги:\n1. Скачать и установить Ollama: https://ollama.com/\n2. Запустить службу ollama app.exe\n3. Скачать соответствующую модель, рекомендуется qwen2.5-coder:14b\n4. Использовать qwen2.5-coder:7b для компьютеров с низкой производительностью",
+            # Сообщения журнала функций кнопок
+            "imported_file": "Импортировано: {}",
+            "import_success": "{} файлов успешно импортировано",
+            "import_failed": "Не удалось импортировать файл: {}",
+            "no_archives_found": "Архивные файлы не найдены в каталоге импорта",
+            "extracting_file": "Извлечение: {}",
+            "extract_success": "Извлечение успешно: {}",
+            "extract_failed": "Не удалось извлечь {}: {}",
+            "extract_completed": "Извлечение MOD завершено",
+            "extract_error": "Ошибка процесса извлечения: {}",
+            "processing_mod": "Обработка MOD: {}",
+            "i18n_extract_completed": "Извлечение файлов i18n завершено",
+            "i18n_extract_failed": "Не удалось извлечь файлы i18n: {}",
+            "ollama_model_required": "Пожалуйста, сначала запустите сервер Ollama и выберите модель",
+            "start_auto_translate": "Начинается автоматический перевод на {}...",
+            "no_json_files": "JSON файлы для перевода не найдены",
+            "translating_file": "Перевод файла: {}",
+            "translate_entry": "  {}: {} -> {}",
+            "translate_file_failed": "Не удалось перевести файл {}: {}",
+            "auto_translate_completed": "Автоматический перевод завершен",
+            "auto_translate_error": "Ошибка процесса автоматического перевода: {}",
+            "translate_request_failed": "Не удалось выполнить запрос перевода: {}",
+            "translate_text_failed": "Не удалось перевести текст: {}",
+            "compressing_mod": "Сжатие MOD: {}",
+            "compress_success": "Сжатие завершено: {}",
+            "recompress_completed": "Пересжатие MOD завершено",
+            "compress_error": "Ошибка процесса сжатия: {}",
+            # Тексты диалогов файлов
+            "select_mod_file": "Выбрать Файл MOD",
+            "select_files": "Выбрать Файлы",
+            "extract_i18n_files": "Извлечь Файлы i18n",
+            # Тексты диалога редактирования
+            "edit_translation": "Редактировать Перевод",
+            "original_text": "Исходный Текст",
+            "translation": "Перевод",
+            "translation_text": "Перевод (Дважды щелкните для ручного редактирования)",
+            "save": "Сохранить",
+            "cancel": "Отмена",
+            # Тексты диалога настроек
+            "settings": "Настройки",
+            "batch_translate_settings": "Настройки Пакетного Перевода",
+            "auto_save_settings": "Настройки Автосохранения",
+            # Тексты области сравнения текста
+            "text_comparison": "Сравнение Текста",
+            "select_mod": "Выбрать MOD:",
+            "refresh_mod_list": "Обновить Список MOD",
+            "save_translation": "Сохранить Перевод",
+            "clear_directories": "Очистить Каталоги",
+            "select_file": "Выбрать Файл:",
+            "original": "Оригинал",
+            "translated": "Переведено",
+            # Сообщения журнала
+            "please_select_mod_first": "Пожалуйста, сначала выберите MOD для перевода",
+            "please_select_file_first": "Пожалуйста, сначала выберите файл для перевода",
+            "no_available_file_list": "Нет доступного списка файлов",
+            "auto_switch_next_file": "Автоматическое переключение на следующий файл",
+            "all_files_translated": "Все файлы переведены!",
+            "auto_switch_file_failed": "Не удалось автоматически переключить файл",
+            "translation_dir_not_exist": "Каталог переводов не существует, невозможно сжать",
+            # Дополнительный жестко закодированный текст
+            "select_mod_first": "Пожалуйста, сначала выберите MOD для перевода",
+            "select_file_first": "Пожалуйста, сначала выберите файл для перевода",
+            "no_available_translation_files": "Нет доступных файлов перевода",
+            "start_translate_selected_file": "Начинается перевод выбранного файла: {}",
+            "start_translate_mod": "Начинается перевод MOD: {}",
+            "no_translation_data_to_save": "Нет данных перевода для сохранения",
+            "translation_file_saved": "Файл перевода сохранен: {}",
+            "cannot_determine_save_path": "Невозможно определить путь сохранения файла",
+            "save_translation_file_failed": "Ошибка сохранения файла перевода: {}",
+            "found_mods": "Найдено {} MOD: {}",
+            "no_mods_found": "MOD не найдены",
+            "switch_to_mod": "Переключено на MOD: {}",
+            "refresh_mod_list_failed": "Ошибка обновления списка MOD: {}",
+            "found_localization_files": "Найдено {} файлов локализации",
+            "no_localization_files_found": "Файлы локализации не найдены",
+            "mod_translation_dir_not_exist": "Каталог переводов MOD не существует",
+            "refresh_file_list_failed": "Ошибка обновления списка файлов: {}",
+            "update_translation_display_failed": "Ошибка обновления отображения перевода: {}",
+            "smart_comparison_complete": "Умное сравнение завершено",
+            "models_loaded": "Список моделей загружен, всего {} моделей",
+            "found_entries_no_comparison": "Найдено {} записей без сравнения",
+            "file_no_translation_needed": "Файл {} не нуждается в переводе, пропущен",
+            # Тексты, связанные с областью сравнения текста
+            "comparison_data_refreshed": "Данные сравнения текста обновлены",
+            "refresh_comparison_data_failed": "Не удалось обновить данные сравнения текста: {}",
+            "original_file_not_found": "Исходный файл не найден: {}",
+            "file_comparison_loaded": "Сравнение файлов загружено: {} <-> {}",
+            "load_comparison_failed": "Не удалось загрузить файлы сравнения: {}",
+            "comparison_data_displayed": "Отображено {} записей данных сравнения",
+            "display_comparison_failed": "Не удалось отобразить данные сравнения: {}",
+            "untranslated_text": "[Не переведено]",
+            # Подробные тексты диалога настроек
+            "batch_size_label": "Размер пакетного перевода (записей в пакете):",
+            "entries_unit": "записей",
+            "batch_size_description": "Установить количество записей перевода для одновременной обработки. Большие значения могут улучшить скорость, но используют больше ресурсов",
+            "auto_save_interval_label": "Интервал автосохранения (записей перевода):",
+            "auto_save_description": "Автоматически сохранять JSON файлы после перевода указанного количества записей во время ИИ перевода",
+            "edit_translation_dialog": "Редактировать перевод",
+            "settings_dialog": "Настройки",
+            # Тексты сообщений диалога настроек
+            "settings_saved": "Настройки сохранены",
+            "error": "Ошибка",
+            "invalid_number_input": "Пожалуйста, введите действительное число",
+            "show_settings_dialog_failed": "Ошибка отображения диалога настроек",
+            "stopping_translation": "Остановка перевода...",
+            "translation_stopped": "Перевод остановлен",
+            "please_start_server_first": "Пожалуйста, сначала запустите сервер",
+            "translation_updated": "Перевод обновлен",
+            "save_translation_failed": "Ошибка сохранения перевода: {}",
+            "select_mod_files_title": "Выбрать файлы MOD",
+            "compressed_files_type": "Сжатые файлы",
+            "all_files_type": "Все файлы",
+            "extract_i18n_file": "Извлечение файла i18n: {} -> {}",
+            "loaded_original_file": "Оригинальный файл загружен для сравнения: {}",
+            "auto_saved_translations": "Автоматически сохранено {} переводов",
+            "translation_dir_not_exist": "Каталог Translation не существует, сжатие невозможно",
+            # 清空目录相关文本
+            "clear_directories_dialog": "Подтверждение очистки каталогов",
+            "clear_directories_message": "Вы уверены, что хотите очистить все файлы в следующих каталогах?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nЭта операция необратима!",
+            "clear": "Очистить",
+            "clear_directories_success": "Каталоги успешно очищены",
+            "clear_directories_failed": "Ошибка очистки каталогов: {}",
+            "clear_directory_success": "Каталог очищен: {}",
+            "directory_not_exist": "Каталог не существует: {}",
+            "clear_directories_error": "Ошибка при очистке каталогов: {}",
+            "show_clear_dialog_failed": "Ошибка отображения диалога очистки: {}",
+            "warning": "Предупреждение",
+            "clear_directories_confirm": "Подтвердить очистку",
+            "clear_directories_unavailable": "Функция очистки каталогов недоступна",
+            "clear_directories_dialog_error": "Ошибка отображения диалога очистки каталогов: {}",
+            "switch_to_file": "Переключено на файл: {} (индекс: {})",
+        }
+    
+    @staticmethod
+    def _texts_pt() -> Dict[str, str]:
+        """Português (BR)界面文本"""
+        return {
+            "title": "Ferramenta de Tradução MOD i18n AI Stardew Valley",
+            "config": "Configuração",
+            "target_language": "Idioma Alvo:",
+            "translation_model": "Modelo de Tradução:",
+            "refresh_models": "Atualizar Modelos",
+            "functions": "Funções",
+            "import_mod": "1. Importar MOD",
+            "extract_mod": "2. Extrair MOD",
+            "extract_i18n": "3. Extrair i18n",
+            "auto_translate": "4. Tradução Auto",
+            "stop_translate": "4. Parar Tradução",
+            "recompress": "5. Recomprimir",
+            "log": "Registro",
+            "progress_eta": "restam {}, {:.0f}/min",
+            "app_started": "Ferramenta de Tradução MOD Stardew Valley Iniciada",
+            "ollama_connected": "Servidor Ollama Conectado",
+            "ollama_connected_no_models": "Servidor Ollama Conectado, mas Sem Modelos Disponíveis",
+            "ollama_connection_failed": "Falha na Conexão com Servidor Ollama",
+            "ollama_connection_error": "Não é Possível Conectar ao Servidor Ollama",
+            "refreshing_models": "Atualizando lista de modelos...",
+            "refresh_models_failed": "Falha ao atualizar modelos",
+            "models_refreshed": "Lista de modelos atualizada",
+            "no_available_models": "Nenhum modelo disponível encontrado",
+            "model_loading_failed": "Falha ao carregar lista de modelos: {}",
+            "initializing_model": "Inicializando modelo...",
+            "model_initialized": "Modelo inicializado: {}",
+            "ollama_not_installed": "Ollama não detectado, por favor siga estes passos:\n1. Baixar e instalar Ollama: https://ollama.com/\n2. Iniciar o serviço ollama app.exe\n3. Baixar o modelo correspondente, recomenda-se qwen2.5-coder:14b\n4. Usar qwen2.5-coder:7b para computadores de baixo desempenho",
+            # Mensagens de log das funções dos botões
+            "imported_file": "Importado: {}",
+            "import_success": "{} arquivos importados com sucesso",
+            "import_failed": "Falha ao importar arquivo: {}",
+            "no_archives_found": "Nenhum arquivo de arquivo encontrado no diretório de importação",
+            "extracting_file": "Extraindo: {}",
+            "extract_success": "Extração bem-sucedida: {}",
+            "extract_failed": "Falha na extração {}: {}",
+            "extract_completed": "Extração de MOD concluída",
+            "extract_error": "Erro no processo de extração: {}",
+            "processing_mod": "Processando MOD: {}",
+            "i18n_extract_completed": "Extração de arquivos i18n concluída",
+            "i18n_extract_failed": "Falha na extração de arquivos i18n: {}",
+            "ollama_model_required": "Por favor, inicie primeiro o servidor Ollama e selecione um modelo",
+            "start_auto_translate": "Iniciando tradução automática para {}...",
+            "no_json_files": "Nenhum arquivo JSON encontrado para tradução",
+            "translating_file": "Traduzindo arquivo: {}",
+            "translate_entry": "  {}: {} -> {}",
+            "translate_file_failed": "Falha na tradução do arquivo {}: {}",
+            "auto_translate_completed": "Tradução automática concluída",
+            "auto_translate_error": "Erro no processo de tradução automática: {}",
+            "translate_request_failed": "Falha na solicitação de tradução: {}",
+            "translate_text_failed": "Falha na tradução do texto: {}",
+            "compressing_mod": "Comprimindo MOD: {}",
+            "compress_success": "Compressão concluída: {}",
+            "recompress_completed": "Recompressão de MOD concluída",
+            "compress_error": "Erro no processo de compressão: {}",
+            # Textos de diálogo de arquivo
+            "select_mod_file": "Selecionar Arquivo MOD",
+            "select_files": "Selecionar Arquivos",
+            "extract_i18n_files": "Extrair Arquivos i18n",
+            # Textos de diálogo de edição
+            "edit_translation": "Editar Tradução",
+            "original_text": "Texto Original",
+            "translation": "Tradução",
+            "save": "Salvar",
+            "cancel": "Cancelar",
+            # Textos de diálogo de configuração
+            "settings": "Configurações",
+            "batch_translate_settings": "Configurações de Tradução em Lote",
+            "auto_save_settings": "Configurações de Salvamento Automático",
+            # Textos da área de comparação de texto
+            "text_comparison": "Comparação de Texto",
+            "select_mod": "Selecionar MOD:",
+            "refresh_mod_list": "Atualizar Lista de MOD",
+            "save_translation": "Salvar Tradução",
+            "clear_directories": "Limpar Diretórios",
+            "select_file": "Selecionar Arquivo:",
+            "original": "Original",
+            "translation_text": "Tradução (Clique duplo para editar manualmente)",
+            "translated": "Traduzido",
+            # Mensagens de log
+            "please_select_mod_first": "Por favor, selecione primeiro um MOD para traduzir",
+            "please_select_file_first": "Por favor, selecione primeiro um arquivo para traduzir",
+            "no_available_file_list": "Nenhuma lista de arquivos disponível",
+            "auto_switch_next_file": "Mudança automática para o próximo arquivo",
+            "all_files_translated": "Todos os arquivos foram traduzidos!",
+            "auto_switch_file_failed": "Falha na mudança automática de arquivo",
+            "translation_dir_not_exist": "Diretório de tradução não existe, não é possível comprimir",
+            # Texto hardcoded adicional
+            "select_mod_first": "Por favor, selecione primeiro um MOD para traduzir",
+            "select_file_first": "Por favor, selecione primeiro um arquivo para traduzir",
+            "no_available_translation_files": "Nenhum arquivo de tradução disponível",
+            "start_translate_selected_file": "Iniciando tradução do arquivo selecionado: {}",
+            "start_translate_mod": "Iniciando tradução do MOD: {}",
+            "no_translation_data_to_save": "Nenhum dado de tradução para salvar",
+            "translation_file_saved": "Arquivo de tradução salvo: {}",
+            "cannot_determine_save_path": "Não é possível determinar o caminho de salvamento do arquivo",
+            "save_translation_file_failed": "Falha ao salvar arquivo de tradução: {}",
+            "found_mods": "Encontrados {} MODs: {}",
+            "no_mods_found": "Nenhum MOD encontrado",
+            "switch_to_mod": "Mudado para MOD: {}",
+            "refresh_mod_list_failed": "Falha ao atualizar lista de MODs: {}",
+            "found_localization_files": "Encontrados {} arquivos de localização",
+            "no_localization_files_found": "Nenhum arquivo de localização encontrado",
+            "mod_translation_dir_not_exist": "Diretório de tradução do MOD não existe",
+            "refresh_file_list_failed": "Falha ao atualizar lista de arquivos: {}",
+            "update_translation_display_failed": "Falha ao atualizar exibição de tradução: {}",
+            "smart_comparison_complete": "Comparação inteligente concluída",
+            "models_loaded": "Lista de modelos carregada, {} modelos no total",
+            "found_entries_no_comparison": "Encontradas {} entradas sem comparação",
+            "file_no_translation_needed": "Arquivo {} não precisa de tradução, ignorado",
+            # Textos relacionados à área de comparação de texto
+            "comparison_data_refreshed": "Dados de comparação de texto atualizados",
+            "refresh_comparison_data_failed": "Falha ao atualizar dados de comparação de texto: {}",
+            "original_file_not_found": "Arquivo original não encontrado: {}",
+            "file_comparison_loaded": "Comparação de arquivos carregada: {} <-> {}",
+            "load_comparison_failed": "Falha ao carregar arquivos de comparação: {}",
+            "comparison_data_displayed": "Exibidas {} entradas de dados de comparação",
+            "display_comparison_failed": "Falha ao exibir dados de comparação: {}",
+            "untranslated_text": "[Não traduzido]",
+            # Textos detalhados do diálogo de configurações
+            "batch_size_label": "Tamanho da tradução em lote (entradas por lote):",
+            "entries_unit": "entradas",
+            "batch_size_description": "Definir o número de entradas de tradução para processar simultaneamente. Valores maiores podem melhorar a velocidade mas usam mais recursos",
+            "auto_save_interval_label": "Intervalo de salvamento automático (entradas de tradução):",
+            "auto_save_description": "Salvar automaticamente arquivos JSON após traduzir o número especificado de entradas durante a tradução IA",
+            "edit_translation_dialog": "Editar tradução",
+            "settings_dialog": "Configurações",
+            # Textos de mensagem do diálogo de configurações
+            "settings_saved": "Configurações salvas",
+            "error": "Erro",
+            "invalid_number_input": "Por favor, insira um número válido",
+            "show_settings_dialog_failed": "Falha ao exibir diálogo de configurações",
+            "stopping_translation": "Parando tradução...",
+            "translation_stopped": "Tradução parada",
+            "please_start_server_first": "Por favor, inicie o servidor primeiro",
+            "translation_updated": "Tradução atualizada",
+            "save_translation_failed": "Falha ao salvar tradução: {}",
+            "select_mod_files_title": "Selecionar arquivos MOD",
+            "compressed_files_type": "Arquivos comprimidos",
+            "all_files_type": "Todos os arquivos",
+            "extract_i18n_file": "Extraindo arquivo i18n: {} -> {}",
+            "loaded_original_file": "Arquivo original carregado para comparação: {}",
+            "auto_saved_translations": "Salvamento automático de {} traduções",
+            "translation_dir_not_exist": "Diretório Translation não existe, não é possível comprimir",
+            # 清空目录相关文本
+            "clear_directories_dialog": "Confirmação de limpeza de diretórios",
+            "clear_directories_message": "Tem certeza de que deseja limpar todos os arquivos dos seguintes diretórios?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nEsta operação não pode ser desfeita!",
+            "clear": "Limpar",
+            "clear_directories_success": "Diretórios limpos com sucesso",
+            "clear_directories_failed": "Falha ao limpar diretórios: {}",
+            "clear_directory_success": "Diretório limpo: {}",
+            "directory_not_exist": "Diretório não existe: {}",
+            "clear_directories_error": "Erro ao limpar diretórios: {}",
+            "show_clear_dialog_failed": "Falha ao exibir diálogo de limpeza: {}",
+            "warning": "Aviso",
+            "clear_directories_confirm": "Confirmar limpeza",
+            "clear_directories_unavailable": "Função de limpeza de diretórios não está disponível",
+            "clear_directories_dialog_error": "Falha ao exibir diálogo de limpeza de diretórios: {}",
+            "switch_to_file": "Mudado para arquivo: {} (índice: {})",
+        }
+    
+    @staticmethod
+    def _texts_it() -> Dict[str, str]:
+        """Italiano界面文本"""
+        return {
+            "title": "Strumento di Traduzione MOD i18n AI Stardew Valley",
+            "config": "Configurazione",
+            "target_language": "Lingua di Destinazione:",
+            "translation_model": "Modello di Traduzione:",
+            "refresh_models": "Aggiorna Modelli",
+            "functions": "Funzioni",
+            "import_mod": "1. Importa MOD",
+            "extract_mod": "2. Estrai MOD",
+            "extract_i18n": "3. Estrai i18n",
+            "auto_translate": "4. Traduzione Auto",
+            "stop_translate": "4. Fermare Traduzione",
+            "recompress": "5. Ricomprimi",
+            "log": "Registro",
+            "progress_eta": "{} rimanenti, {:.0f}/min",
+            "app_started": "Strumento di Traduzione MOD Stardew Valley Avviato",
+            "ollama_connected": "Server Ollama Connesso",
+            "ollama_connected_no_models": "Server Ollama Connesso, ma Nessun Modello Disponibile",
+            "ollama_connection_failed": "Connessione al Server Ollama Fallita",
+            "ollama_connection_error": "Impossibile Connettersi al Server Ollama",
+            "refreshing_models": "Aggiornamento elenco modelli...",
+            "refresh_models_failed": "Aggiornamento modelli fallito",
+            "models_refreshed": "Elenco modelli aggiornato",
+            "no_available_models": "Nessun modello disponibile trovato",
+            "model_loading_failed": "Caricamento elenco modelli fallito: {}",
+            "initializing_model": "Inizializzazione modello...",
+            "model_initialized": "Modello inizializzato: {}",
+            "ollama_not_installed": "Ollama non rilevato, si prega di seguire questi passaggi:\n1. Scaricare e installare Ollama: https://ollama.com/\n2. Avviare il servizio ollama app.exe\n3. Scaricare il modello corrispondente, si consiglia qwen2.5-coder:14b\n4. Utilizzare qwen2.5-coder:7b per computer a basse prestazioni",
+            # Messaggi di log delle funzioni dei pulsanti
+            "imported_file": "Importato: {}",
+            "import_success": "{} file importati con successo",
+            "import_failed": "Importazione file fallita: {}",
+            "no_archives_found": "Nessun file di archivio trovato nella directory di importazione",
+            "extracting_file": "Estrazione: {}",
+            "extract_success": "Estrazione riuscita: {}",
+            "extract_failed": "Estrazione fallita {}: {}",
+            "extract_completed": "Estrazione MOD completata",
+            "extract_error": "Errore del processo di estrazione: {}",
+            "processing_mod": "Elaborazione MOD: {}",
+            "i18n_extract_completed": "Estrazione file i18n completata",
+            "i18n_extract_failed": "Estrazione file i18n fallita: {}",
+            "ollama_model_required": "Si prega di avviare prima il server Ollama e selezionare un modello",
+            "start_auto_translate": "Avvio traduzione automatica in {}...",
+            "no_json_files": "Nessun file JSON trovato per la traduzione",
+            "translating_file": "Traduzione file: {}",
+            "translate_entry": "  {}: {} -> {}",
+            "translate_file_failed": "Traduzione file fallita {}: {}",
+            "auto_translate_completed": "Traduzione automatica completata",
+            "auto_translate_error": "Errore del processo di traduzione automatica: {}",
+            "translate_request_failed": "Richiesta di traduzione fallita: {}",
+            "translate_text_failed": "Traduzione testo fallita: {}",
+            "compressing_mod": "Compressione MOD: {}",
+            "compress_success": "Compressione completata: {}",
+            "recompress_completed": "Ricompressione MOD completata",
+            "compress_error": "Errore del processo di compressione: {}",
+            # Testi di dialogo file
+            "select_mod_file": "Seleziona File MOD",
+            "select_files": "Seleziona File",
+            "extract_i18n_files": "Estrai File i18n",
+            # Testi di dialogo modifica
+            "edit_translation": "Modifica Traduzione",
+            "original_text": "Testo Originale",
+            "translation": "Traduzione",
+            "save": "Salva",
+            "cancel": "Annulla",
+            # Testi di dialogo impostazioni
+            "settings": "Impostazioni",
+            "batch_translate_settings": "Impostazioni Traduzione Batch",
+            "auto_save_settings": "Impostazioni Salvataggio Automatico",
+            # Testi area confronto testo
+            "text_comparison": "Confronto Testo",
+            "select_mod": "Seleziona MOD:",
+            "refresh_mod_list": "Aggiorna Elenco MOD",
+            "save_translation": "Salva Traduzione",
+            "clear_directories": "Svuota Directory",
+            "select_file": "Seleziona File:",
+            "original": "Originale",
+            "translation_text": "Traduzione (Doppio clic per modificare manualmente)",
+            "translated": "Tradotto",
+            # Messaggi di log
+            "please_select_mod_first": "Si prega di selezionare prima un MOD da tradurre",
+            "please_select_file_first": "Si prega di selezionare prima un file da tradurre",
+            "no_available_file_list": "Nessun elenco file disponibile",
+            "auto_switch_next_file": "Cambio automatico al file successivo",
+            "all_files_translated": "Tutti i file sono stati tradotti!",
+            "auto_switch_file_failed": "Cambio automatico file fallito",
+            "translation_dir_not_exist": "La directory di traduzione non esiste, impossibile comprimere",
+            # Testo hardcoded aggiuntivo
+            "select_mod_first": "Si prega di selezionare prima un MOD da tradurre",
+            "select_file_first": "Si prega di selezionare prima un file da tradurre",
+            "no_available_translation_files": "Nessun file di traduzione disponibile",
+            "start_translate_selected_file": "Inizio traduzione del file selezionato: {}",
+            "start_translate_mod": "Inizio traduzione del MOD: {}",
+            "no_translation_data_to_save": "Nessun dato di traduzione da salvare",
+            "translation_file_saved": "File di traduzione salvato: {}",
+            "cannot_determine_save_path": "Impossibile determinare il percorso di salvataggio del file",
+            "save_translation_file_failed": "Errore nel salvare il file di traduzione: {}",
+            "found_mods": "Trovati {} MOD: {}",
+            "no_mods_found": "Nessun MOD trovato",
+            "switch_to_mod": "Passato al MOD: {}",
+            "refresh_mod_list_failed": "Errore nell'aggiornare l'elenco MOD: {}",
+            "found_localization_files": "Trovati {} file di localizzazione",
+            "no_localization_files_found": "Nessun file di localizzazione trovato",
+            "mod_translation_dir_not_exist": "La directory di traduzione del MOD non esiste",
+            "refresh_file_list_failed": "Errore nell'aggiornare l'elenco file: {}",
+            "update_translation_display_failed": "Errore nell'aggiornare la visualizzazione della traduzione: {}",
+            "smart_comparison_complete": "Confronto intelligente completato",
+            "models_loaded": "Elenco modelli caricato, {} modelli in totale",
+            "found_entries_no_comparison": "Trovate {} voci senza confronto",
+            "file_no_translation_needed": "Il file {} non necessita traduzione, saltato",
+            # Testi relativi all'area di confronto del testo
+            "comparison_data_refreshed": "Dati di confronto del testo aggiornati",
+            "refresh_comparison_data_failed": "Aggiornamento dei dati di confronto del testo fallito: {}",
+            "original_file_not_found": "File originale non trovato: {}",
+            "file_comparison_loaded": "Confronto file caricato: {} <-> {}",
+            "load_comparison_failed": "Caricamento file di confronto fallito: {}",
+            "comparison_data_displayed": "Visualizzate {} voci di dati di confronto",
+            "display_comparison_failed": "Visualizzazione dati di confronto fallita: {}",
+            "untranslated_text": "[Non tradotto]",
+            # Testi dettagliati della finestra di dialogo delle impostazioni
+            "batch_size_label": "Dimensione traduzione batch (voci per batch):",
+            "entries_unit": "voci",
+            "batch_size_description": "Impostare il numero di voci di traduzione da elaborare simultaneamente. Valori più grandi possono migliorare la velocità ma usano più risorse",
+            "auto_save_interval_label": "Intervallo salvataggio automatico (voci di traduzione):",
+            "auto_save_description": "Salva automaticamente i file JSON dopo aver tradotto il numero specificato di voci durante la traduzione IA",
+            "edit_translation_dialog": "Modifica traduzione",
+            "settings_dialog": "Impostazioni",
+            # Testi di messaggio della finestra di dialogo delle impostazioni
+            "settings_saved": "Impostazioni salvate",
+            "error": "Errore",
+            "invalid_number_input": "Inserisci un numero valido",
+            "show_settings_dialog_failed": "Errore nella visualizzazione della finestra di dialogo delle impostazioni",
+            "stopping_translation": "Arresto traduzione...",
+            "translation_stopped": "Traduzione arrestata",
+            "please_start_server_first": "Si prega di avviare prima il server",
+            "translation_updated": "Traduzione aggiornata",
+            "save_translation_failed": "Errore nel salvare la traduzione: {}",
+            "select_mod_files_title": "Seleziona file MOD",
+            "compressed_files_type": "File compressi",
+            "all_files_type": "Tutti i file",
+            "extract_i18n_file": "Estrazione file i18n: {} -> {}",
+            "loaded_original_file": "File originale caricato per confronto: {}",
+            "auto_saved_translations": "Salvataggio automatico di {} traduzioni",
+            "translation_dir_not_exist": "La directory Translation non esiste, impossibile comprimere",
+            # 清空目录相关文本
+            "clear_directories_dialog": "Conferma svuotamento directory",
+            "clear_directories_message": "Sei sicuro di voler svuotare tutti i file nelle seguenti directory?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nQuesta operazione non può essere annullata!",
+            "clear": "Svuota",
+            "clear_directories_success": "Directory svuotate con successo",
+            "clear_directories_failed": "Errore nello svuotamento delle directory: {}",
+            "clear_directory_success": "Directory svuotata: {}",
+            "directory_not_exist": "La directory non esiste: {}",
+            "clear_directories_error": "Errore durante lo svuotamento delle directory: {}",
+            "show_clear_dialog_failed": "Errore nella visualizzazione del dialogo di svuotamento: {}",
+            "warning": "Avvertimento",
+            "clear_directories_confirm": "Conferma svuotamento",
+            "clear_directories_unavailable": "La funzione di svuotamento delle directory non è disponibile",
+            "clear_directories_dialog_error": "Errore nella visualizzazione del dialogo di svuotamento delle directory: {}",
+            "switch_to_file": "Passato al file: {} (indice: {})",
+        }
+    
+    @staticmethod
+    def _texts_tr() -> Dict[str, str]:
+        """Türkçe界面文本"""
+        return {
+            "title": "Stardew Valley MOD i18n AI Çeviri Aracı",
+            "config": "Yapılandırma",
+            "target_language": "Hedef Dil:",
+            "translation_model": "Çeviri Modeli:",
+            "refresh_models": "Modelleri Yenile",
+            "functions": "İşlevler",
+            "import_mod": "1. MOD İçe Aktar",
+            "extract_mod": "2. MOD Çıkart",
+            "extract_i18n": "3. i18n Çıkart",
+            "auto_translate": "4. Otomatik Çeviri",
+            "stop_translate": "4. Çeviriyi Durdur",
+            "recompress": "5. Yeniden Sıkıştır",
+            "log": "Günlük",
+            "progress_eta": "kalan {}, {:.0f}/dk",
+            "app_started": "Stardew Valley MOD Çeviri Aracı Başlatıldı",
+            "ollama_connected": "Ollama Sunucusu Bağlandı",
+            "ollama_connected_no_models": "Ollama Sunucusu Bağlandı, ancak Kullanılabilir Model Yok",
+            "ollama_connection_failed": "Ollama Sunucusu Bağlantısı Başarısız",
+            "ollama_connection_error": "Ollama Sunucusuna Bağlanılamıyor",
+            "refreshing_models": "Model listesi yenileniyor...",
+            "refresh_models_failed": "Model yenileme başarısız",
+            "models_refreshed": "Model listesi yenilendi",
+            "no_available_models": "Kullanılabilir model bulunamadı",
+            "model_loading_failed": "Model listesi yükleme başarısız: {}",
+            "initializing_model": "Model başlatılıyor...",
+            "model_initialized": "Model başlatıldı: {}",
+            "ollama_not_installed": "Ollama algılanmadı, lütfen şu adımları izleyin:\n1. Ollama'yı indirin ve kurun: https://ollama.com/\n2. ollama app.exe hizmetini başlatın\n3. İlgili modeli indirin, qwen2.5-coder:14b önerilir\n4. Düşük performanslı bilgisayarlar için qwen2.5-coder:7b kullanın",
+            "imported_file": "İçe aktarıldı: {}",
+            "import_success": "{} dosya başarıyla içe aktarıldı",
+            "import_failed": "Dosya içe aktarma başarısız: {}",
+            "no_archives_found": "İçe aktarma dizininde arşiv dosyası bulunamadı",
+            "extracting_file": "Çıkartılıyor: {}",
+            "extract_success": "Çıkartma başarılı: {}",
+            "extract_failed": "Çıkartma başarısız {}: {}",
+            "extract_completed": "MOD çıkartma tamamlandı",
+            "extract_error": "Çıkartma işlemi hatası: {}",
+            "processing_mod": "MOD işleniyor: {}",
+            "i18n_extract_completed": "i18n dosya çıkartma tamamlandı",
+            "i18n_extract_failed": "i18n dosya çıkartma başarısız: {}",
+            "ollama_model_required": "Lütfen önce Ollama sunucusunu başlatın ve bir model seçin",
+            "start_auto_translate": "{} diline otomatik çeviri başlatılıyor...",
+            "no_json_files": "Çeviri için JSON dosyası bulunamadı",
+            "translating_file": "Dosya çevriliyor: {}",
+            "translate_entry": "  {}: {} -> {}",
+            "translate_file_failed": "Dosya çevirisi başarısız {}: {}",
+            "auto_translate_completed": "Otomatik çeviri tamamlandı",
+            "auto_translate_error": "Otomatik çeviri işlemi hatası: {}",
+            "translate_request_failed": "Çeviri isteği başarısız: {}",
+            "translate_text_failed": "Metin çevirisi başarısız: {}",
+            "compressing_mod": "MOD sıkıştırılıyor: {}",
+            "compress_success": "Sıkıştırma tamamlandı: {}",
+            "recompress_completed": "MOD yeniden sıkıştırma tamamlandı",
+            "compress_error": "Sıkıştırma işlemi hatası: {}",
+            # Dosya diyalog metinleri
+            "select_mod_file": "MOD Dosyası Seç",
+            "select_files": "Dosyaları Seç",
+            "extract_i18n_files": "i18n Dosyalarını Çıkart",
+            # Düzenleme diyalog metinleri
+            "edit_translation": "Çeviriyi Düzenle",
+            "original_text": "Orijinal Metin",
+            "translation": "Çeviri",
+            "save": "Kaydet",
+            "cancel": "İptal",
+            # Ayarlar diyalog metinleri
+            "settings": "Ayarlar",
+            "batch_translate_settings": "Toplu Çeviri Ayarları",
+            "auto_save_settings": "Otomatik Kaydetme Ayarları",
+            # Metin karşılaştırma alanı metinleri
+            "text_comparison": "Metin Karşılaştırması",
+            "select_mod": "MOD Seç:",
+            "refresh_mod_list": "MOD Listesini Yenile",
+            "save_translation": "Çeviriyi Kaydet",
+            "clear_directories": "Dizinleri Temizle",
+            "select_file": "Dosya Seç:",
+            "original": "Orijinal",
+            "translation_text": "Çeviri (Manuel düzenleme için çift tıklayın)",
+            "translated": "Çevrilmiş",
+            # Log mesajları
+            "please_select_mod_first": "Lütfen önce çevrilecek bir MOD seçin",
+            "please_select_file_first": "Lütfen önce çevrilecek bir dosya seçin",
+            "no_available_file_list": "Kullanılabilir dosya listesi yok",
+            "auto_switch_next_file": "Otomatik olarak sonraki dosyaya geçiş",
+            "all_files_translated": "Tüm dosyalar çevrildi!",
+            "auto_switch_file_failed": "Otomatik dosya değiştirme başarısız",
+            "translation_dir_not_exist": "Çeviri dizini mevcut değil, sıkıştırılamıyor",
+            # Ek sabit kodlanmış metin
+            "select_mod_first": "Lütfen önce çevrilecek bir MOD seçin",
+            "select_file_first": "Lütfen önce çevrilecek bir dosya seçin",
+            "no_available_translation_files": "Kullanılabilir çeviri dosyası yok",
+            "start_translate_selected_file": "Seçilen dosyanın çevirisi başlıyor: {}",
+            "start_translate_mod": "MOD çevirisi başlıyor: {}",
+            "no_translation_data_to_save": "Kaydedilecek çeviri verisi yok",
+            "translation_file_saved": "Çeviri dosyası kaydedildi: {}",
+            "cannot_determine_save_path": "Dosya kaydetme yolu belirlenemiyor",
+            "save_translation_file_failed": "Çeviri dosyası kaydetme başarısız: {}",
+            "found_mods": "{} MOD bulundu: {}",
+            "no_mods_found": "Hiç MOD bulunamadı",
+            "switch_to_mod": "MOD'a geçildi: {}",
+            "refresh_mod_list_failed": "MOD listesi yenileme başarısız: {}",
+            "found_localization_files": "{} yerelleştirme dosyası bulundu",
+            "no_localization_files_found": "Hiç yerelleştirme dosyası bulunamadı",
+            "mod_translation_dir_not_exist": "MOD çeviri dizini mevcut değil",
+            "refresh_file_list_failed": "Dosya listesi yenileme başarısız: {}",
+            "update_translation_display_failed": "Çeviri görüntüsü güncelleme başarısız: {}",
+            "smart_comparison_complete": "Akıllı karşılaştırma tamamlandı",
+            "models_loaded": "Model listesi yüklendi, toplam {} model",
+            "found_entries_no_comparison": "Karşılaştırmasız {} giriş bulundu",
+            "file_no_translation_needed": "Dosya {} çeviriye ihtiyaç duymuyor, atlandı",
+            # Metin karşılaştırma alanı ile ilgili metinler
+            "comparison_data_refreshed": "Metin karşılaştırma verileri yenilendi",
+            "refresh_comparison_data_failed": "Metin karşılaştırma verilerini yenileme başarısız: {}",
+            "original_file_not_found": "Orijinal dosya bulunamadı: {}",
+            "file_comparison_loaded": "Dosya karşılaştırması yüklendi: {} <-> {}",
+            "load_comparison_failed": "Karşılaştırma dosyalarını yükleme başarısız: {}",
+            "comparison_data_displayed": "{} karşılaştırma veri girişi görüntülendi",
+            "display_comparison_failed": "Karşılaştırma verilerini görüntüleme başarısız: {}",
+            "untranslated_text": "[Çevrilmemiş]",
+            # Ayarlar iletişim kutusunun ayrıntılı metinleri
+            "batch_size_label": "Toplu çeviri boyutu (toplu başına girdi):",
+            "entries_unit": "girdi",
+            "batch_size_description": "Aynı anda işlenecek çeviri girdilerinin sayısını ayarlayın. Daha büyük değerler hızı artırabilir ancak daha fazla kaynak kullanır",
+            "auto_save_interval_label": "Otomatik kaydetme aralığı (çeviri girdileri):",
+            "auto_save_description": "AI çevirisi sırasında belirtilen sayıda girdi çevrildikten sonra JSON dosyalarını otomatik olarak kaydet",
+            "edit_translation_dialog": "Çeviriyi Düzenle",
+            "settings_dialog": "Ayarlar",
+            # Ayarlar iletişim kutusu mesaj metinleri
+            "settings_saved": "Ayarlar kaydedildi",
+            "error": "Hata",
+            "invalid_number_input": "Lütfen geçerli bir sayı girin",
+            "show_settings_dialog_failed": "Ayarlar iletişim kutusunu gösterme başarısız",
+            "stopping_translation": "Çeviri durduruluyor...",
+            "translation_stopped": "Çeviri durduruldu",
+            "please_start_server_first": "Lütfen önce sunucuyu başlatın",
+            "translation_updated": "Çeviri güncellendi",
+            "save_translation_failed": "Çeviri kaydetme başarısız: {}",
+            "select_mod_files_title": "MOD dosyalarını seç",
+            "compressed_files_type": "Sıkıştırılmış dosyalar",
+            "all_files_type": "Tüm dosyalar",
+            "extract_i18n_file": "i18n dosyası çıkarılıyor: {} -> {}",
+            "loaded_original_file": "Karşılaştırma için orijinal dosya yüklendi: {}",
+            "auto_saved_translations": "Otomatik olarak {} çeviri kaydedildi",
+            "translation_dir_not_exist": "Translation dizini mevcut değil, sıkıştırılamıyor",
+            # 清空目录相关文本
+            "clear_directories_dialog": "Dizin temizleme onayı",
+            "clear_directories_message": "Aşağıdaki dizinlerdeki tüm dosyaları temizlemek istediğinizden emin misiniz?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nBu işlem geri alınamaz!",
+            "clear": "Temizle",
+            "clear_directories_success": "Dizinler başarıyla temizlendi",
+            "clear_directories_failed": "Dizin temizleme hatası: {}",
+            "clear_directory_success": "Dizin temizlendi: {}",
+            "directory_not_exist": "Dizin mevcut değil: {}",
+            "clear_directories_error": "Dizin temizleme sırasında hata: {}",
+            "show_clear_dialog_failed": "Temizleme diyalogu gösterme hatası: {}",
+            "warning": "Uyarı",
+            "clear_directories_confirm": "Temizlemeyi onayla",
+            "clear_directories_unavailable": "Dizin temizleme işlevi kullanılamıyor",
+            "clear_directories_dialog_error": "Dizin temizleme diyalogu gösterme hatası: {}",
+            "switch_to_file": "Dosyaya geçildi: {} (indeks: {})",
+        }
+    
+    @staticmethod
+    def _texts_hu() -> Dict[str, str]:
+        """Magyar界面文本"""
+        return {
+            "title": "Stardew Valley MOD i18n AI Fordító Eszköz",
+            "config": "Konfiguráció",
+            "target_language": "Célnyelv:",
+            "translation_model": "Fordítási Modell:",
+            "refresh_models": "Modellek Frissítése",
+            "functions": "Funkciók",
+            "import_mod": "1. MOD Importálás",
+            "extract_mod": "2. MOD Kicsomagolás",
+            "extract_i18n": "3. i18n Kinyerés",
+            "auto_translate": "4. Automatikus Fordítás",
+            "stop_translate": "4. Fordítás Leállítása",
+            "recompress": "5. Újratömörítés",
+            "log": "Napló",
+            "progress_eta": "hátra {}, {:.0f}/perc",
+            "app_started": "Stardew Valley MOD Fordító Eszköz Elindítva",
+            "ollama_connected": "Ollama Szerver Csatlakoztatva",
+            "ollama_connected_no_models": "Ollama Szerver Csatlakoztatva, de Nincs Elérhető Modell",
+            "ollama_connection_failed": "Ollama Szerver Csatlakozás Sikertelen",
+            "ollama_connection_error": "Nem Lehet Csatlakozni az Ollama Szerverhez",
+            "refreshing_models": "Modell lista frissítése...",
+            "refresh_models_failed": "Modell frissítés sikertelen",
+            "models_refreshed": "Modell lista frissítve",
+            "no_available_models": "Nem található elérhető modell",
+            "model_loading_failed": "Modell lista betöltése sikertelen: {}",
+            "initializing_model": "Modell inicializálása...",
+            "model_initialized": "Modell inicializálva: {}",
+            "ollama_not_installed": "Ollama nem észlelhető, kérjük kövesse ezeket a lépéseket:\n1. Töltse le és telepítse az Ollama-t: https://ollama.com/\n2. Indítsa el az ollama app.exe szolgáltatást\n3. Töltse le a megfelelő modellt, ajánlott a qwen2.5-coder:14b\n4. Alacsony teljesítményű számítógépekhez használja a qwen2.5-coder:7b-t",
+            "imported_file": "Importálva: {}",
+            "import_success": "{} fájl sikeresen importálva",
+            "import_failed": "Fájl importálás sikertelen: {}",
+            "no_archives_found": "Nem található archív fájl az import könyvtárban",
+            "extracting_file": "Kicsomagolás: {}",
+            "extract_success": "Kicsomagolás sikeres: {}",
+            "extract_failed": "Kicsomagolás sikertelen {}: {}",
+            "extract_completed": "MOD kicsomagolás befejezve",
+            "extract_error": "Kicsomagolási folyamat hiba: {}",
+            "processing_mod": "MOD feldolgozás: {}",
+            "i18n_extract_completed": "i18n fájl kinyerés befejezve",
+            "i18n_extract_failed": "i18n fájl kinyerés sikertelen: {}",
+            "ollama_model_required": "Kérjük először indítsa el az Ollama szervert és válasszon egy modellt",
+            "start_auto_translate": "Automatikus fordítás indítása {} nyelvre...",
+            "no_json_files": "Nem található JSON fájl fordításhoz",
+            "translating_file": "Fájl fordítása: {}",
+            "translate_entry": "  {}: {} -> {}",
+            "translate_file_failed": "Fájl fordítás sikertelen {}: {}",
+            "auto_translate_completed": "Automatikus fordítás befejezve",
+            "auto_translate_error": "Automatikus fordítási folyamat hiba: {}",
+            "translate_request_failed": "Fordítási kérés sikertelen: {}",
+            "translate_text_failed": "Szöveg fordítás sikertelen: {}",
+            "compressing_mod": "MOD tömörítése: {}",
+            "compress_success": "Tömörítés befejezve: {}",
+            "recompress_completed": "MOD újratömörítés befejezve",
+            "compress_error": "Tömörítési folyamat hiba: {}",
+
+            # 文件对话框
+            "select_import_folder": "Válassza ki az importálási mappát",
+            "select_extract_folder": "Válassza ki a kicsomagolási mappát",
+            "select_translation_folder": "Válassza ki a fordítási mappát",
+            "select_compress_folder": "Válassza ki a tömörítési mappát",
+
+            # 编辑对话框
+            "edit_translation": "Fordítás szerkesztése",
+            "original_text": "Eredeti szöveg:",
+            "translation_text": "Fordított szöveg (Dupla kattintás a kézi szerkesztéshez):",
+            "save_button": "Mentés",
+            "cancel_button": "Mégse",
+
+            # 设置对话框
+            "settings": "Beállítások",
+            "batch_translate_settings": "Kötegelt Fordítás Beállítások",
+            "auto_save_settings": "Automatikus Mentés Beállítások",
+            "settings_title": "Beállítások",
+            "ollama_server_url": "Ollama szerver URL:",
+            "translation_model": "Fordítási modell:",
+            "ui_language": "Felhasználói felület nyelve:",
+            "target_language": "Célnyelv:",
+            "batch_size": "Köteg méret:",
+            "request_delay": "Kérés késleltetés (ms):",
+            "max_retries": "Maximális újrapróbálkozások:",
+            "timeout": "Időtúllépés (s):",
+            "apply_button": "Alkalmaz",
+            "close_button": "Bezárás",
+
+            # 文本对比区域
+            "text_comparison": "Szöveg összehasonlítás",
+            "select_mod": "MOD kiválasztása:",
+            "refresh_mod_list": "MOD Lista Frissítése",
+            "save_translation": "Fordítás Mentése",
+            "clear_directories": "Könyvtárak Törlése",
+            "select_file": "Fájl kiválasztása:",
+            "original_files": "Eredeti fájlok",
+            "translation_files": "Fordított fájlok",
+            "comparison_area": "Összehasonlítási terület",
+            "no_data_to_display": "Nincs megjeleníthető adat",
+            "file_not_found": "Fájl nem található: {}",
+            "json_parse_error": "JSON elemzési hiba: {}",
+
+            # 日志消息
+            "log_messages": "Napló üzenetek",
+            "progress_info": "Haladási információ: {}/{}",
+            "translation_progress": "Fordítási haladás",
+            "current_file_progress": "Jelenlegi fájl haladása: {}/{}",
+            "overall_progress": "Összesített haladás: {}/{}",
+            # További beépített szövegek
+            "select_mod_first": "Kérjük, először válasszon ki egy fordítandó MOD-ot",
+            "select_file_first": "Kérjük, először válasszon ki egy fordítandó fájlt",
+            "no_available_translation_files": "Nincsenek elérhető fordítási fájlok",
+            "start_translate_selected_file": "A kiválasztott fájl fordítása kezdődik: {}",
+            "start_translate_mod": "A MOD fordítása kezdődik: {}",
+            "no_translation_data_to_save": "Nincs mentendő fordítási adat",
+            "translation_file_saved": "Fordítási fájl mentve: {}",
+            "cannot_determine_save_path": "Nem lehet meghatározni a fájl mentési útvonalát",
+            "save_translation_file_failed": "Fordítási fájl mentése sikertelen: {}",
+            "found_mods": "{} MOD található: {}",
+            "no_mods_found": "Nem található MOD",
+            "switch_to_mod": "MOD-ra váltva: {}",
+            "refresh_mod_list_failed": "MOD lista frissítése sikertelen: {}",
+            "found_localization_files": "{} lokalizációs fájl található",
+            "no_localization_files_found": "Nem található lokalizációs fájl",
+            "mod_translation_dir_not_exist": "MOD fordítási könyvtár nem létezik",
+            "refresh_file_list_failed": "Fájllista frissítése sikertelen: {}",
+            "update_translation_display_failed": "Fordítási megjelenítés frissítése sikertelen: {}",
+            "smart_comparison_complete": "Intelligens összehasonlítás befejezve",
+            "models_loaded": "Modell lista betöltve, összesen {} modell",
+            "found_entries_no_comparison": "Összehasonlítás nélküli {} bejegyzés található",
+            "file_no_translation_needed": "A {} fájl nem igényel fordítást, kihagyva",
+            # Szöveg összehasonlítási területtel kapcsolatos szövegek
+            "comparison_data_refreshed": "Szöveg összehasonlítási adatok frissítve",
+            "refresh_comparison_data_failed": "Szöveg összehasonlítási adatok frissítése sikertelen: {}",
+            "original_file_not_found": "Eredeti fájl nem található: {}",
+            "file_comparison_loaded": "Fájl összehasonlítás betöltve: {} <-> {}",
+            "load_comparison_failed": "Összehasonlítási fájlok betöltése sikertelen: {}",
+            "comparison_data_displayed": "{} összehasonlítási adat bejegyzés megjelenítve",
+            "display_comparison_failed": "Összehasonlítási adatok megjelenítése sikertelen: {}",
+            "untranslated_text": "[Nem fordított]",
+            "translation_dir_not_exist": "Fordítási könyvtár nem létezik, nem lehet tömöríteni",
+            # Beállítások párbeszédpanel részletes szövegei
+            "batch_size_label": "Kötegelt fordítás mérete (bejegyzés/köteg):",
+            "entries_unit": "bejegyzés",
+            "batch_size_description": "Állítsa be az egyszerre feldolgozandó fordítási bejegyzések számát. A nagyobb értékek növelhetik a sebességet, de több erőforrást használnak",
+            "auto_save_interval_label": "Automatikus mentés intervalluma (fordítási bejegyzések):",
+            "auto_save_description": "AI fordítás során automatikusan mentse a JSON fájlokat a megadott számú bejegyzés lefordítása után",
+            "edit_translation_dialog": "Fordítás szerkesztése",
+            "settings_dialog": "Beállítások",
+            # Beállítások párbeszédpanel üzenet szövegei
+            "settings_saved": "Beállítások mentve",
+            "error": "Hiba",
+            "invalid_number_input": "Kérjük, adjon meg egy érvényes számot",
+            "show_settings_dialog_failed": "Beállítások párbeszédablak megjelenítése sikertelen",
+            "stopping_translation": "Fordítás leállítása...",
+            "translation_stopped": "Fordítás leállítva",
+            "please_start_server_first": "Kérjük, először indítsa el a szervert",
+            "translation_updated": "Fordítás frissítve",
+            "save_translation_failed": "Fordítás mentése sikertelen: {}",
+            "select_mod_files_title": "MOD fájlok kiválasztása",
+            "compressed_files_type": "Tömörített fájlok",
+            "all_files_type": "Minden fájl",
+            "extract_i18n_file": "i18n fájl kinyerése: {} -> {}",
+            "loaded_original_file": "Eredeti fájl betöltve összehasonlításhoz: {}",
+            "auto_saved_translations": "Automatikusan {} fordítás mentve",
+            "translation_dir_not_exist": "A Translation könyvtár nem létezik, nem lehet tömöríteni",
+            # 清空目录相关文本
+            "clear_directories_dialog": "Könyvtárak törlésének megerősítése",
+            "clear_directories_message": "Biztosan törölni szeretné az összes fájlt a következő könyvtárakból?\n\nData\\1Import\nData\\2Extract\nData\\3Completei18n\n\nEz a művelet nem vonható vissza!",
+            "clear": "Törlés",
+            "clear_directories_success": "Könyvtárak sikeresen törölve",
+            "clear_directories_failed": "Könyvtárak törlése sikertelen: {}",
+            "clear_directory_success": "Könyvtár törölve: {}",
+            "directory_not_exist": "A könyvtár nem létezik: {}",
+            "clear_directories_error": "Hiba a könyvtárak törlése során: {}",
+            "show_clear_dialog_failed": "Törlési párbeszédablak megjelenítése sikertelen: {}",
+            "warning": "Figyelmeztetés",
+            "clear_directories_confirm": "Törlés megerősítése",
+            "clear_directories_unavailable": "A könyvtárak törlése funkció nem elérhető",
+            "clear_directories_dialog_error": "Könyvtárak törlési párbeszédablak megjelenítése sikertelen: {}",
+            "switch_to_file": "Fájlra váltva: {} (index: {})",
+        }
+    
     def set_language(self, language: str) -> None:
         """设置当前语言
         
@@ -1949,6 +2077,8 @@ class UITextManager:
         """
         if language in self.ui_texts:
             self.current_language = language
+            # 预先构建当前界面语言的文本，其他语言保持按需构建
+            self.ui_texts[language]
     
     def get_text(self, key: str, *args) -> str:
         """获取UI文本
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+界面更新总线模块
+汇总工作线程产生的翻译结果、进度和日志，按固定帧率批量刷新到界面
+"""
+
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .profiler import profiler
+
+
+class UIUpdateBus:
+    """界面更新总线
+
+    工作线程只向缓冲区写入数据，不直接调用 root.after；
+    Tk 主线程每隔固定时间取出缓冲区，一次性应用所有行更新、
+    刷新一次进度标题，并批量追加日志。
+    """
+
+    def __init__(self, root, interval_ms: int = 100):
+        """初始化更新总线
+
+        Args:
+            root: Tk根窗口
+            interval_ms: 刷新间隔（毫秒）
+        """
+        self.root = root
+        self.interval_ms = interval_ms
+        self._lock = threading.Lock()
+
+        # 缓冲区：同一条目多次更新时只保留最新值
+        self._rows: Dict[Tuple[object, str], str] = {}
+        self._logs: List[str] = []
+        self._progress_dirty = False
+
+        # 刷新处理函数
+        self.row_handler: Optional[Callable[[object, Dict[str, str]], None]] = None
+        self.progress_handler: Optional[Callable[[], None]] = None
+        self.log_handler: Optional[Callable[[List[str]], None]] = None
+
+        self._running = False
+
+    def set_handlers(self, row_handler: Callable = None, progress_handler: Callable = None,
+                     log_handler: Callable = None) -> None:
+        """设置刷新处理函数
+
+        Args:
+            row_handler: 行更新处理函数，参数为 (文件, {键: 译文})
+            progress_handler: 进度刷新处理函数
+            log_handler: 日志处理函数，参数为日志行列表
+        """
+        self.row_handler = row_handler
+        self.progress_handler = progress_handler
+        self.log_handler = log_handler
+
+    def start(self) -> None:
+        """开始定时刷新（需在Tk主线程调用）"""
+        if not self._running:
+            self._running = True
+            self.root.after(self.interval_ms, self._tick)
+
+    def stop(self) -> None:
+        """停止定时刷新"""
+        self._running = False
+
+    def post_row(self, file_path, key: str, text: str) -> None:
+        """提交一条译文行更新（线程安全）"""
+        with self._lock:
+            self._rows[(file_path, key)] = text
+
+    def post_progress(self) -> None:
+        """标记进度已变化（线程安全）"""
+        with self._lock:
+            self._progress_dirty = True
+
+    def post_log(self, log_entry: str) -> None:
+        """提交一条日志（线程安全）"""
+        with self._lock:
+            self._logs.append(log_entry)
+
+    def flush(self) -> None:
+        """取出缓冲区并应用到界面（需在Tk主线程调用）"""
+        with self._lock:
+            rows, self._rows = self._rows, {}
+            logs, self._logs = self._logs, []
+            progress_dirty, self._progress_dirty = self._progress_dirty, False
+
+        if rows and self.row_handler:
+            # 按文件分组后批量应用
+            grouped: Dict[object, Dict[str, str]] = {}
+            for (file_path, key), text in rows.items():
+                grouped.setdefault(file_path, {})[key] = text
+            for file_path, updates in grouped.items():
+                self._safe_call(self.row_handler, file_path, updates)
+
+        if progress_dirty and self.progress_handler:
+            self._safe_call(self.progress_handler)
+
+        if logs and self.log_handler:
+            self._safe_call(self.log_handler, logs)
+
+    def _tick(self) -> None:
+        if not self._running:
+            return
+        self.flush()
+        self.root.after(self.interval_ms, self._tick)
+
+    def _safe_call(self, handler: Callable, *args) -> None:
+        try:
+            with profiler.span(f"ui.{getattr(handler, '__name__', 'handler')}"):
+                handler(*args)
+        except Exception as e:
+            # 刷新失败不能中断定时器，至少保证控制台输出
+            print(f"界面批量刷新失败: {str(e)}")
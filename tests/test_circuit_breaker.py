@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""熔断器测试：断开 → 等待超时 → 服务恢复后请求可以继续"""
+
+import socket
+import time
+
+import pytest
+
+from modules.ollama_manager import CircuitBreaker, OllamaTranslator, TranslationError
+from modules.prompt_builder import MIN_RATIO_SAMPLES, PREDICT_RATIO
+from tools.fake_ollama import FakeOllamaServer
+
+
+def _open_breaker(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    assert breaker.is_open
+
+
+def _unused_url():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+def test_wait_timeout_half_opens():
+    breaker = CircuitBreaker(lambda: False, base_delay=0.05, max_delay=0.05, max_wait=0.2)
+    _open_breaker(breaker)
+
+    assert breaker.wait() is False
+    assert not breaker.is_open
+    # 半开：请求被放行
+    assert breaker.wait() is True
+    # 半开期间再失败一次立即重新断开
+    assert breaker.record_failure()
+
+
+def test_half_open_success_closes():
+    breaker = CircuitBreaker(lambda: False, base_delay=0.05, max_delay=0.05, max_wait=0.2)
+    _open_breaker(breaker)
+    assert breaker.wait() is False
+
+    breaker.record_success()
+    for _ in range(breaker.failure_threshold - 1):
+        assert not breaker.record_failure()
+
+
+def test_reset_stats_closes_breaker():
+    breaker = CircuitBreaker(lambda: False, max_wait=60)
+    _open_breaker(breaker)
+
+    breaker.reset_stats()
+    assert not breaker.is_open
+    assert breaker.trips == 0
+    assert breaker.wait() is True
+
+
+def test_requests_succeed_after_ollama_returns():
+    translator = OllamaTranslator(base_url=_unused_url(), model="fake-model:latest")
+    translator.retry_policy.base_delay = 0.01
+    translator.breaker.base_delay = 0.05
+    translator.breaker.max_delay = 0.05
+    translator.breaker.max_wait = 0.3
+
+    started = time.monotonic()
+    with pytest.raises(TranslationError):
+        translator.translate_text("Hello there.", "zh")
+    assert time.monotonic() - started < 5
+    assert not translator.breaker.is_open
+
+    with FakeOllamaServer(latency=0.0) as server:
+        translator.base_url = server.base_url
+        assert translator.translate_text("Hello there.", "zh") == "Hello there.（译）"
+        assert translator.translate_text("Good morning.", "zh") == "Good morning.（译）"
+    assert not translator.breaker.is_open
+
+
+def test_zh_target_learns_its_own_length_estimate():
+    with FakeOllamaServer(latency=0.0) as server:
+        translator = OllamaTranslator(base_url=server.base_url, model="fake-model:latest")
+        for i in range(MIN_RATIO_SAMPLES):
+            translator.translate_text(f"Villager {i} walks to the saloon after a long day at the farm.", "zh")
+    # 扩展比例按语言代码学习：中文目标与尚无样本的拉丁字母目标得到不同的生成长度上限
+    assert translator.expansion.ratio("fr") == PREDICT_RATIO
+    assert translator.expansion.num_predict("zh", 20) < translator.expansion.num_predict("fr", 20)
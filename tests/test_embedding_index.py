@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""向量索引测试：numpy延迟导入和相似度检索"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from modules.embedding_index import EmbeddingIndex
+
+
+def test_startup_imports_do_not_load_numpy():
+    code = ("import sys, modules.ollama_manager, modules.embedding_index as e; "
+            "e.vector_search_available(); print('numpy' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            check=True, cwd=Path(__file__).resolve().parent.parent)
+    assert result.stdout.strip() == "False"
+
+
+def test_search_ranks_by_cosine_similarity():
+    pytest.importorskip("numpy")
+    index = EmbeddingIndex("test-model")
+    index.add("east", [1.0, 0.0])
+    index.add("north", [0.0, 1.0])
+    index.add("northeast", [1.0, 1.0])
+    assert [source for _, source in index.search([1.0, 0.1], limit=2)] == ["east", "northeast"]
+    assert [source for _, source in index.search([1.0, 0.1], limit=1, exclude="east")] == ["northeast"]
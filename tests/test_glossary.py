@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""术语表测试：内置人名区分大小写，用户术语不区分大小写"""
+
+import json
+
+from modules.glossary import Glossary, GlossaryStore
+
+
+def test_vanilla_names_do_not_match_common_words():
+    glossary = GlossaryStore().get('zh')
+    assert glossary.find_terms("A penny for your thoughts, the sand is sandy") == []
+    assert glossary.find_terms("Penny met Sandy") == [("Penny", "潘妮"), ("Sandy", "桑迪")]
+
+
+def test_user_terms_ignore_case(tmp_path):
+    (tmp_path / "zh.json").write_text(json.dumps({"Junimo": "祝尼魔", "Penny": "潘妮"}), encoding="utf-8")
+    glossary = GlossaryStore(tmp_path).get('zh')
+    assert glossary.find_terms("a junimo hut") == [("Junimo", "祝尼魔")]
+    # 用户术语覆盖内置术语后按用户术语的规则匹配
+    assert glossary.find_terms("a penny") == [("Penny", "潘妮")]
+
+
+def test_identity_terms_are_not_hinted_or_checked(tmp_path):
+    # 拉丁字母语言的人名保持原文，既不写进提示也不作为违规检查
+    assert GlossaryStore().get('fr').find_terms("Penny met Sandy") == []
+    (tmp_path / "de.json").write_text(json.dumps({"Junimo": "Junimo", "Mayor": "Bürgermeister"}), encoding="utf-8")
+    terms = GlossaryStore(tmp_path).get('de').find_terms("The Mayor saw a Junimo")
+    assert terms == [("Mayor", "Bürgermeister")]
+    assert Glossary.format_hint(terms) == "术语表：Mayor=Bürgermeister。"
+    assert Glossary.find_violations(terms, "Der Bürgermeister sah einen Junimo") == []
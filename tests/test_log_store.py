@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""日志存储测试：有界环形缓冲区和级别过滤"""
+
+from modules.log_store import LogStore
+
+
+def test_buffer_keeps_only_latest_entries():
+    store = LogStore(max_lines=3)
+    for i in range(5):
+        assert store.append(f"line {i}")
+    assert store.get_lines() == ["line 2", "line 3", "line 4"]
+
+
+def test_entries_below_level_are_not_buffered():
+    store = LogStore(max_lines=10)
+    assert not store.append("debug", "DEBUG")
+    assert store.append("warning", "WARNING")
+    assert store.get_lines() == ["warning"]
+    assert store.get_lines("ERROR") == []
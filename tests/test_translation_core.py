@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""游戏标记屏蔽测试：只屏蔽游戏语法，普通方括号文字照常翻译"""
+
+import pytest
+
+from modules.translation_core import TranslationCore
+
+
+@pytest.mark.parametrize("token", [
+    "{{PlayerName}}",
+    "[74 128]",
+    "[(O)128]",
+    "[LocalizedText Strings\\UI:Chat_Hello]",
+    "[FarmName]",
+    "[ItemName (O)128]",
+    "[CP]",
+    "[#]",
+    "#$b#",
+    "$h",
+    "@",
+])
+def test_game_tokens_are_masked(token):
+    masked, placeholder_map = TranslationCore().preserve_placeholders(f"Hello {token} there")
+    assert masked == "Hello {0} there"
+    assert placeholder_map == {"{0}": token}
+
+
+@pytest.mark.parametrize("text", [
+    "[Optional] Adds more fish",
+    "Meet me at [Pierre's shop]",
+    "[Spring] Festival",
+    "[wip] Notes",
+])
+def test_bracketed_prose_is_not_masked(text):
+    masked, placeholder_map = TranslationCore().preserve_placeholders(text)
+    assert masked == text
+    assert placeholder_map == {}
+
+
+@pytest.mark.parametrize("original, translation", [
+    ("Caution: the floor is slippery near the pond today.", "注意：今天池塘附近的地面很滑。"),
+    ("The following items are sold here.", "以下是这里出售的物品。"),
+    ("Hi.\nWarning: wet floor.", "你好。\n注意：地面湿滑。"),
+])
+def test_translated_notes_are_not_explanations(original, translation):
+    assert TranslationCore().find_translation_issues(original, translation, "zh") == []
+
+
+@pytest.mark.parametrize("translation", [
+    "翻译：你好。",
+    "以下是翻译结果：你好。",
+    "你好。\n注：这是问候语。",
+])
+def test_leaked_explanations_are_flagged(translation):
+    assert "explanation" in TranslationCore().find_translation_issues("Hello there.", translation, "zh")
+
+
+def test_strict_retry_keeps_output_when_only_explanation_flagged():
+    from modules.ollama_manager import OllamaTranslator, ValidationError
+
+    translator = OllamaTranslator()
+    with pytest.raises(ValidationError):
+        translator._check_translation("Hello there.", "译文：你好。", {}, "zh", None, [], False)
+    assert translator._check_translation("Hello there.", "译文：你好。", {}, "zh", None, [], True) == \
+        ("译文：你好。", False)
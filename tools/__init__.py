@@ -0,0 +1,6 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+开发工具包
+基准测试、模拟Ollama服务等不随程序发布的辅助工具，在项目根目录以 python -m tools.xxx 运行
+"""
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+离线基准测试
+在临时目录用语料生成器生成MOD压缩包，启动模拟Ollama服务，用无界面宿主驱动真实的
+FileManager / OllamaTranslator / TranslationManager，从解压到打包分阶段输出吞吐量
+
+运行：python -m tools.benchmark --mods 4 --files-per-mod 3 --keys 200 --asset-mb 5 --json bench.json
+对比：python -m tools.benchmark --compare bench.json   （任一阶段吞吐量下降超过阈值时返回1）
+"""
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# 以 python tools/benchmark.py 直接运行时也能导入项目模块
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.config_manager import ConfigManager
+from modules.embedding_index import DEFAULT_EMBEDDING_MODEL, EmbeddingStore
+from modules.file_manager import FileManager
+from modules.glossary import GlossaryStore
+from modules.log_store import LogStore
+from modules.metrics import MetricsStore
+from modules.ollama_manager import OllamaManager
+from modules.profiler import profiler
+from modules.translation_manager import TranslationManager
+from modules.translation_memory import TranslationMemoryStore
+from modules.ui_text_manager import UITextManager
+from tools.corpus_generator import generate_import_corpus
+from tools.fake_ollama import FakeOllamaServer
+
+
+# 级联阶段使用的模拟快速模型
+FAST_MODEL = "fake-small:3b"
+
+
+class _Value:
+    """代替 tk.StringVar 的简单取值对象"""
+
+    def __init__(self, value=""):
+        self._value = value
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+
+
+class _NullWidget:
+    """代替界面控件，忽略所有配置调用"""
+
+    def config(self, **kwargs):
+        pass
+
+    configure = config
+
+
+class _ImmediateRoot:
+    """代替Tk根窗口，after回调立即在调用线程执行"""
+
+    def after(self, ms, func=None, *args):
+        if func:
+            func(*args)
+
+
+class HeadlessApp:
+    """无界面宿主
+
+    提供 TranslationManager、FileManager 和 OllamaTranslator 用到的主应用接口，
+    业务逻辑全部使用真实模块，只有Tk控件和变量被替换为空实现。
+    """
+
+    def __init__(self, work_dir: Path, base_url: str, model: str, batch_size: int = 5, verbose: bool = False):
+        self.verbose = verbose
+        self.root = _ImmediateRoot()
+        self.log_store = LogStore(max_lines=5000, min_level="DEBUG" if verbose else "INFO")
+
+        self.file_manager = FileManager(self, work_dir=work_dir)
+        self.data_dir = self.file_manager.data_dir
+        self.i18n_dir = self.file_manager.i18n_dir
+        self.config_manager = ConfigManager(self.data_dir / "config.json")
+        self.config_manager.set('export_metrics', False)
+        self.ui_texts = UITextManager().ui_texts
+        self.current_ui_language = "中文"
+        self.metrics = MetricsStore()
+        self.glossary = GlossaryStore(self.data_dir / "glossary")
+        self.translation_memory = TranslationMemoryStore(self.data_dir / "translation_memory")
+        self.embedding_index = EmbeddingStore(self.data_dir / "translation_memory")
+
+        self.ollama_base_url = base_url
+        self.ollama_model = model
+        self.available_models = [model]
+        self.ollama_manager = OllamaManager(self, base_url=base_url, model=model)
+        self.translator = self.ollama_manager.translator
+        self.translation_manager = TranslationManager(self)
+
+        self.language_codes = {"中文": "zh"}
+        self.target_language_var = _Value("中文")
+        self.batch_size_var = _Value(str(batch_size))
+        self.batch_size = batch_size
+        self.auto_save_interval = 20
+        self.translate_btn = _NullWidget()
+
+        self.current_mod_path = None
+        self.available_files = []
+        self.current_file_index = 0
+        self.current_translation_file = None
+        self.translation_progress = {"current": 0, "total": 0}
+
+    def get_ui_text(self, key: str) -> str:
+        return self.ui_texts.get(self.current_ui_language, {}).get(key, key)
+
+    def log_message(self, message: str, level: str = "INFO") -> None:
+        if self.log_store.append(message, level) and self.verbose:
+            print(f"  [{level}] {message}")
+
+    def update_progress_display(self, current=None, total=None) -> None:
+        if current is not None:
+            self.translation_progress["current"] = current
+        if total is not None:
+            self.translation_progress["total"] = total
+
+    def find_matching_original_file(self, translation_file_path, mod_name):
+        return self.file_manager.find_matching_original_file(translation_file_path, mod_name)
+
+    def refresh_mod_list(self) -> None:
+        pass
+
+    def report_profile(self) -> None:
+        # 基准测试结束后统一输出整个流程的剖析结果
+        pass
+
+
+def _result(items: int, seconds: float, unit: str, **extra) -> Dict:
+    result = {"items": items, "seconds": round(seconds, 4),
+              "rate": round(items / seconds, 2) if seconds > 0 else 0.0, "unit": unit}
+    result.update(extra)
+    return result
+
+
+def _dir_bytes(directory: Path) -> int:
+    return sum(p.stat().st_size for p in directory.rglob("*") if p.is_file())
+
+
+def bench_extract_mods(app: HeadlessApp) -> Dict:
+    archive_bytes = _dir_bytes(app.file_manager.import_dir)
+    start = time.perf_counter()
+    app.file_manager.extract_mods().join()
+    return _result(archive_bytes, time.perf_counter() - start, "bytes/s",
+                   megabytes=round(archive_bytes / 1e6, 3))
+
+
+def bench_extract_i18n(app: HeadlessApp) -> Dict:
+    start = time.perf_counter()
+    app.file_manager.extract_i18n().join()
+    seconds = time.perf_counter() - start
+    files = sorted((app.i18n_dir / "Translation").rglob("*.json"))
+    return _result(len(files), seconds, "files/s")
+
+
+def bench_load(app: HeadlessApp, files: List[Path], repeat: int) -> Dict:
+    start = time.perf_counter()
+    entries = 0
+    for _ in range(repeat):
+        entries += sum(len(app.file_manager.load_json_with_comments(path)) for path in files)
+    return _result(entries, time.perf_counter() - start, "entries/s", files=len(files) * repeat)
+
+
+def bench_batch(app: HeadlessApp, files: List[Path], batch_size: int, limit: int,
+                by_length: bool = True) -> Dict:
+    """批量翻译，by_length 为 False 时按文件顺序发送（FIFO）作为对照
+
+    两次对照翻译相同的文本，关闭翻译记忆，避免后一次直接复用前一次的译文
+    """
+    texts = []
+    for path in files:
+        texts.extend(v for v in app.file_manager.load_json_with_comments(path).values() if isinstance(v, str))
+    texts = texts[:limit]
+    app.config_manager.set('schedule_by_length', by_length)
+    app.config_manager.set('use_translation_memory', False)
+    completions = []
+    app.metrics.begin_run()
+    start = time.perf_counter()
+    try:
+        app.translator.translate_batch_async(
+            texts, "zh", batch_size, result_callback=lambda *_: completions.append(time.perf_counter() - start))
+    finally:
+        app.config_manager.set('use_translation_memory', True)
+    seconds = time.perf_counter() - start
+    summary = app.metrics.run_summary()
+    mean_completion = sum(completions) / len(completions) if completions else 0.0
+    return _result(len(texts), seconds, "entries/s", mean_completion=round(mean_completion, 4),
+                   latency_p50=round(summary["latency_p50"], 4), latency_p95=round(summary["latency_p95"], 4),
+                   failed=summary["failed"])
+
+
+def bench_pipeline(app: HeadlessApp, files: List[Path]) -> Dict:
+    """逐个文件运行 TranslationManager 的完整翻译流程"""
+    translation_dir = app.i18n_dir / "Translation"
+    manager = app.translation_manager
+    entries = 0
+    start = time.perf_counter()
+    for path in files:
+        mod_name = path.relative_to(translation_dir).parts[0]
+        app.current_mod_path = translation_dir / mod_name
+        app.available_files = [{"name": path.name, "path": path}]
+        app.current_file_index = 0
+        manager.start_translation()
+        thread = manager.translation_thread
+        if thread:
+            thread.join()
+        entries += app.metrics.run_summary()["requests"]
+    return _result(entries, time.perf_counter() - start, "entries/s", files=len(files))
+
+
+def bench_save(app: HeadlessApp, files: List[Path], repeat: int) -> Dict:
+    datas = [(path, app.file_manager.load_json_with_comments(path)) for path in files]
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path, data in datas:
+            app.file_manager.save_json_with_original_format(data, path, path)
+    return _result(sum(len(data) for _, data in datas) * repeat, time.perf_counter() - start, "entries/s",
+                   files=len(files) * repeat)
+
+
+def bench_repack(app: HeadlessApp, repeat: int) -> Dict:
+    mod_bytes = _dir_bytes(app.i18n_dir / "Translation")
+    start = time.perf_counter()
+    for _ in range(repeat):
+        app.file_manager.recompress_mods(open_folder=False).join()
+    seconds = time.perf_counter() - start
+    return _result(mod_bytes * repeat, seconds, "bytes/s", megabytes=round(mod_bytes * repeat / 1e6, 3))
+
+
+def run_benchmark(args) -> Dict:
+    work_dir = Path(tempfile.mkdtemp(prefix="stardew_bench_"))
+    # 模拟服务列出嵌入模型，完整流程中启用语义示例
+    models = ["fake-model:latest", f"{DEFAULT_EMBEDDING_MODEL}:latest"]
+    if args.fast_model_speed > 0:
+        models.append(FAST_MODEL)
+    server = FakeOllamaServer(latency=args.latency, jitter=args.jitter, failure_rate=args.failure_rate,
+                              tokens_per_second=args.tokens_per_second, seed=args.seed, models=models,
+                              runaway_rate=args.runaway_rate,
+                              model_speed={FAST_MODEL: args.fast_model_speed}).start()
+    try:
+        app = HeadlessApp(work_dir, server.base_url, server.models[0], args.batch_size, args.verbose)
+        generate_import_corpus(app.file_manager.import_dir, args.mods, args.files_per_mod, args.keys,
+                               args.asset_mb, args.seed)
+
+        if args.profile:
+            profiler.enabled = True
+            profiler.reset()
+
+        stages = {}
+        stages["extract_mods"] = bench_extract_mods(app)
+        stages["extract_i18n"] = bench_extract_i18n(app)
+        files = sorted((app.i18n_dir / "Translation").rglob("*.json"))
+        stages["load_json"] = bench_load(app, files, args.io_repeat)
+        stages["translate_fifo"] = bench_batch(app, files, args.batch_size, args.batch_limit, by_length=False)
+        stages["translate_batch"] = bench_batch(app, files, args.batch_size, args.batch_limit)
+        if args.fast_model_speed > 0:
+            # 级联模式：短条目交给更快的模拟小模型
+            app.translator.fast_model = FAST_MODEL
+            stages["translate_cascade"] = bench_batch(app, files, args.batch_size, args.batch_limit)
+            app.translator.fast_model = None
+        stages["pipeline"] = bench_pipeline(app, files)
+        stages["save_json"] = bench_save(app, files, args.io_repeat)
+        stages["repack"] = bench_repack(app, args.io_repeat)
+
+        if args.profile:
+            print(profiler.format_summary())
+            trace_file = profiler.export_chrome_trace(Path(args.profile).resolve())
+            print(f"trace已导出: {trace_file}\n")
+        return {
+            "config": {k: v for k, v in vars(args).items() if k not in ("json", "compare", "verbose", "profile")},
+            "stages": stages,
+        }
+    finally:
+        server.stop()
+        if not args.keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        else:
+            print(f"语料保留在 {work_dir}")
+
+
+def print_report(report: Dict, baseline: Dict = None) -> None:
+    print(f"{'阶段':<18}{'数量':>10}{'耗时(s)':>10}{'吞吐量':>14}  单位")
+    for name, stage in report["stages"].items():
+        line = f"{name:<18}{stage['items']:>10}{stage['seconds']:>10.3f}{stage['rate']:>14.1f}  {stage['unit']}"
+        if baseline and name in baseline.get("stages", {}):
+            base_rate = baseline["stages"][name]["rate"]
+            if base_rate:
+                line += f"  ({(stage['rate'] / base_rate - 1) * 100:+.1f}%)"
+        print(line)
+
+    fifo, scheduled = report["stages"].get("translate_fifo"), report["stages"].get("translate_batch")
+    if fifo and scheduled and fifo["seconds"] and fifo.get("mean_completion"):
+        print(f"长度调度相对FIFO：总耗时 {(scheduled['seconds'] / fifo['seconds'] - 1) * 100:+.1f}%，"
+              f"平均完成时间 {(scheduled['mean_completion'] / fifo['mean_completion'] - 1) * 100:+.1f}%")
+
+
+def find_regressions(report: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """找出吞吐量低于基线超过阈值的阶段"""
+    regressions = []
+    for name, stage in report["stages"].items():
+        base = baseline.get("stages", {}).get(name)
+        if base and base["rate"] and stage["rate"] < base["rate"] * (1 - tolerance):
+            regressions.append(name)
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="翻译流程离线基准测试")
+    parser.add_argument("--mods", type=int, default=3, help="MOD数量")
+    parser.add_argument("--files-per-mod", type=int, default=2, help="每个MOD的i18n文件数")
+    parser.add_argument("--keys", type=int, default=100, help="每个文件的条目数")
+    parser.add_argument("--asset-mb", type=float, default=1.0, help="每个MOD压缩包中的二进制资源体积（MB）")
+    parser.add_argument("--batch-size", type=int, default=5, help="并发数")
+    parser.add_argument("--batch-limit", type=int, default=200, help="translate_batch 阶段的条目上限")
+    parser.add_argument("--io-repeat", type=int, default=20, help="读取、保存和打包阶段的重复次数，使计时足够稳定")
+    parser.add_argument("--latency", type=float, default=0.02, help="模拟请求延迟（秒）")
+    parser.add_argument("--jitter", type=float, default=0.0, help="模拟延迟抖动（秒）")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="模拟失败率")
+    parser.add_argument("--runaway-rate", type=float, default=0.0, help="模拟模型输出大段解释的概率")
+    parser.add_argument("--fast-model-speed", type=float, default=0.0,
+                        help="大于0时增加 translate_cascade 阶段，模拟的快速小模型相对主模型的速度倍数")
+    parser.add_argument("--tokens-per-second", type=float, default=2000.0, help="模拟生成速度")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    parser.add_argument("--json", help="将结果写入JSON文件")
+    parser.add_argument("--compare", help="与基线JSON对比")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="判定退化的吞吐量下降比例")
+    parser.add_argument("--profile", metavar="TRACE_FILE", help="开启分阶段剖析，输出汇总并导出Chrome trace")
+    parser.add_argument("--keep", action="store_true", help="保留生成的语料目录")
+    parser.add_argument("--verbose", action="store_true", help="输出翻译日志")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    report = run_benchmark(args)
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if baseline:
+        regressions = find_regressions(report, baseline, args.tolerance)
+        if regressions:
+            print(f"吞吐量退化超过 {args.tolerance:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
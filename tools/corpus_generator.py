@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+合成MOD语料生成器
+按可配置的规模生成接近真实MOD的输入：带注释和BOM的JSONC i18n文件、
+{{占位符}}、含 // 的网址、末尾逗号、多层子目录，以及带大体积二进制资源的MOD压缩包
+
+生成可导入的压缩包：python -m tools.corpus_generator --layout import --out Data/1Import --mods 10 --asset-mb 20
+生成已提取的i18n：  python -m tools.corpus_generator --layout i18n --out Data/3Completei18n --keys 2000
+"""
+
+import argparse
+import json
+import random
+import shutil
+import sys
+import zipfile
+from pathlib import Path
+from typing import Dict, List
+
+
+WORDS = ("farm", "quarry", "Abigail", "sword", "level", "shield", "Pierre", "shop", "crop", "festival",
+         "mine", "iridium", "fishing", "rod", "villager", "gift", "heart", "season", "spring", "winter",
+         "Haley", "Sebastian", "Willy", "Clint", "forge", "geode", "greenhouse", "barn", "coop", "truffle")
+PLACEHOLDERS = ("{{level}}", "{{name}}", "{{count}}", "{{author}}", "{{ItemName}}", "{{season}}")
+URLS = ("https://www.nexusmods.com/stardewvalley/mods/{}", "https://github.com/example/mod{}/wiki",
+        "http://stardewvalleywiki.com/Modding:Mod_{}")
+# 条目长度分布（单词数）：大量短名称，少量长对话
+LENGTHS = (1, 2, 2, 3, 3, 5, 8, 12, 20, 40, 80)
+
+# 单个资源文件的最大体积，超过后拆分为多个文件
+ASSET_CHUNK = 8 * 1024 * 1024
+
+
+def make_text(rng: random.Random) -> str:
+    """生成一条英文条目，按比例混入占位符和网址"""
+    length = rng.choice(LENGTHS)
+    words = [rng.choice(WORDS) for _ in range(length)]
+    if rng.random() < 0.3:
+        words.insert(rng.randrange(len(words) + 1), rng.choice(PLACEHOLDERS))
+    if rng.random() < 0.05:
+        words.append(rng.choice(URLS).format(rng.randrange(1, 30000)))
+    return " ".join(words).capitalize() + ("." if length > 3 else "")
+
+
+def make_entries(rng: random.Random, keys: int, prefix: str = "") -> Dict[str, str]:
+    """生成一个i18n文件的全部条目"""
+    return {f"{prefix}{rng.choice(WORDS).lower()}.{i:05d}": make_text(rng) for i in range(keys)}
+
+
+def render_jsonc(data: Dict[str, str], rng: random.Random, comments: bool = True) -> str:
+    """渲染为Stardew MOD常见的JSONC：行注释、块注释、行尾注释和末尾逗号"""
+    lines = ["{"]
+    if comments:
+        lines += ["  // 由语料生成器生成", "  /* 多行注释", "   * 用于测试注释剥离", "   */"]
+    items = list(data.items())
+    for index, (key, value) in enumerate(items):
+        if comments and index and index % 25 == 0:
+            lines.append(f"  // ---- 第 {index // 25} 组 ----")
+        line = f"  {json.dumps(key, ensure_ascii=False)}: {json.dumps(value, ensure_ascii=False)}"
+        # 末尾逗号：JSONC中最后一项后也常带逗号
+        if index < len(items) - 1 or comments:
+            line += ","
+        if comments and rng.random() < 0.05:
+            line += " // 行尾注释"
+        lines.append(line)
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def write_i18n_file(path: Path, data: Dict[str, str], rng: random.Random,
+                    comments: bool = True, bom_rate: float = 0.3) -> Path:
+    """写入一个i18n文件，按比例带UTF-8 BOM"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    encoding = "utf-8-sig" if rng.random() < bom_rate else "utf-8"
+    content = render_jsonc(data, rng, comments) if comments else json.dumps(data, ensure_ascii=False, indent=2)
+    path.write_text(content, encoding=encoding)
+    return path
+
+
+def i18n_rel_dirs(mod_name: str, files_per_mod: int) -> List[Path]:
+    """MOD内的i18n目录：根目录一个，其余放在 [CP]/[JA] 子包和更深的Content目录中"""
+    dirs = [Path("i18n")]
+    for part in range(1, files_per_mod):
+        if part % 2:
+            dirs.append(Path(f"[CP] {mod_name} Part{part}") / "i18n")
+        else:
+            dirs.append(Path(f"[JA] {mod_name} Part{part}") / "Content" / "Data" / "i18n")
+    return dirs
+
+
+def write_assets(mod_dir: Path, asset_bytes: int, rng: random.Random) -> int:
+    """写入不可压缩的二进制资源，返回写入的字节数"""
+    written = 0
+    index = 0
+    while written < asset_bytes:
+        size = min(ASSET_CHUNK, asset_bytes - written)
+        asset = mod_dir / "assets" / f"sprites_{index:02d}.png"
+        asset.parent.mkdir(parents=True, exist_ok=True)
+        asset.write_bytes(rng.randbytes(size))
+        written += size
+        index += 1
+    return written
+
+
+def generate_mod(mod_dir: Path, files_per_mod: int, keys: int, asset_bytes: int,
+                 rng: random.Random, comments: bool = True) -> List[Path]:
+    """生成一个解压后的MOD目录
+
+    Returns:
+        生成的 default.json 列表
+    """
+    mod_name = mod_dir.name
+    mod_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {"Name": mod_name, "Author": "CorpusGenerator", "Version": "1.0.0",
+                "UniqueID": f"Bench.{mod_name}", "UpdateKeys": ["Nexus:0"]}
+    (mod_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    files = []
+    for index, rel_dir in enumerate(i18n_rel_dirs(mod_name, files_per_mod)):
+        data = make_entries(rng, keys, prefix=f"p{index}.")
+        files.append(write_i18n_file(mod_dir / rel_dir / "default.json", data, rng, comments))
+    if asset_bytes > 0:
+        write_assets(mod_dir, asset_bytes, rng)
+    return files
+
+
+def zip_directory(source_dir: Path, zip_path: Path) -> Path:
+    """将目录打包为ZIP（与MOD发布包一样以MOD目录为根）"""
+    zip_path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+        for file_path in sorted(source_dir.rglob("*")):
+            if file_path.is_file():
+                zipf.write(file_path, file_path.relative_to(source_dir.parent))
+    return zip_path
+
+
+def generate_import_corpus(import_dir: Path, mods: int, files_per_mod: int, keys: int,
+                           asset_mb: float = 0.0, seed: int = 0, comments: bool = True) -> List[Path]:
+    """生成可导入的MOD压缩包（对应 Data/1Import）
+
+    Returns:
+        压缩包列表
+    """
+    rng = random.Random(seed)
+    staging = import_dir / ".staging"
+    archives = []
+    try:
+        for mod_index in range(mods):
+            mod_dir = staging / f"BenchMod{mod_index:03d}"
+            generate_mod(mod_dir, files_per_mod, keys, int(asset_mb * 1024 * 1024), rng, comments)
+            archives.append(zip_directory(mod_dir, import_dir / f"{mod_dir.name}.zip"))
+            shutil.rmtree(mod_dir)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return archives
+
+
+def generate_extract_corpus(extract_dir: Path, mods: int, files_per_mod: int, keys: int,
+                            asset_mb: float = 0.0, seed: int = 0, comments: bool = True) -> List[Path]:
+    """生成解压后的MOD目录（对应 Data/2Extract）
+
+    Returns:
+        生成的 default.json 列表
+    """
+    rng = random.Random(seed)
+    files = []
+    for mod_index in range(mods):
+        # 与压缩包解压结果一致：Data/2Extract/<包名>/<MOD目录>
+        mod_dir = extract_dir / f"BenchMod{mod_index:03d}" / f"BenchMod{mod_index:03d}"
+        files.extend(generate_mod(mod_dir, files_per_mod, keys, int(asset_mb * 1024 * 1024), rng, comments))
+    return files
+
+
+def generate_i18n_corpus(i18n_dir: Path, mods: int, files_per_mod: int, keys: int,
+                         seed: int = 0, comments: bool = True, lang: str = "zh") -> List[Path]:
+    """生成已提取的i18n目录（对应 Data/3Completei18n）：Original 为原文，Translation 为待翻译副本
+
+    Returns:
+        Translation 下的译文文件列表
+    """
+    rng = random.Random(seed)
+    translation_files = []
+    for mod_index in range(mods):
+        mod_name = f"BenchMod{mod_index:03d}"
+        for index, rel_dir in enumerate(i18n_rel_dirs(mod_name, files_per_mod)):
+            data = make_entries(rng, keys, prefix=f"p{index}.")
+            original = write_i18n_file(i18n_dir / "Original" / mod_name / rel_dir / "default.json",
+                                       data, rng, comments)
+            translation = i18n_dir / "Translation" / mod_name / rel_dir / f"{lang}.json"
+            translation.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(original, translation)
+            translation_files.append(translation)
+    return translation_files
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="合成MOD语料生成器")
+    parser.add_argument("--out", required=True, help="输出目录")
+    parser.add_argument("--layout", choices=("import", "extract", "i18n"), default="import",
+                        help="import: MOD压缩包；extract: 解压后的MOD目录；i18n: Original/Translation 目录")
+    parser.add_argument("--mods", type=int, default=5, help="MOD数量")
+    parser.add_argument("--files-per-mod", type=int, default=3, help="每个MOD的i18n文件数")
+    parser.add_argument("--keys", type=int, default=500, help="每个i18n文件的条目数")
+    parser.add_argument("--asset-mb", type=float, default=0.0, help="每个MOD的二进制资源体积（MB）")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    parser.add_argument("--plain-json", action="store_true", help="生成不带注释和末尾逗号的标准JSON")
+    args = parser.parse_args(argv)
+
+    out = Path(args.out)
+    comments = not args.plain_json
+    if args.layout == "import":
+        outputs = generate_import_corpus(out, args.mods, args.files_per_mod, args.keys, args.asset_mb,
+                                         args.seed, comments)
+    elif args.layout == "extract":
+        outputs = generate_extract_corpus(out, args.mods, args.files_per_mod, args.keys, args.asset_mb,
+                                          args.seed, comments)
+    else:
+        outputs = generate_i18n_corpus(out, args.mods, args.files_per_mod, args.keys, args.seed, comments)
+    total = sum(path.stat().st_size for path in outputs)
+    print(f"已生成 {len(outputs)} 个文件，共 {total / 1e6:.1f} MB -> {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
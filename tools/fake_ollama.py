@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+模拟Ollama服务
+在本地提供 /api/tags、/api/chat、/api/generate 和 /api/embed 接口，按配置的延迟、抖动、
+失败率和生成速度返回确定性的结果，用于在没有GPU和真实模型时测量翻译流程性能
+
+单独运行：python -m tools.fake_ollama --port 11435 --latency 0.2 --tokens-per-second 40
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+
+# 当前提示词中位于待翻译文本之前的固定结尾，用于从消息中取出原文
+PROMPT_SUFFIX = "只返回翻译结果，不需要解释："
+
+# 提示词中注入的术语表，模拟的模型会遵守
+GLOSSARY_HINT = re.compile(r"术语表：(.*?)。")
+
+# 模拟嵌入向量的维度
+EMBED_DIM = 64
+
+# 模拟模型失控时在译文后输出的解释
+RUNAWAY_TEXT = "\n\n注：以上是翻译结果。这句话描述了游戏中的场景，其中的人名和地名均按照官方译名处理。" * 8
+
+
+class FakeOllamaServer:
+    """模拟Ollama服务器
+
+    每个请求的抖动和是否失败由种子、请求内容和该内容的第几次请求共同决定，
+    同一语料在不同并发和调度顺序下得到相同的模拟耗时，重试则会得到新的结果。
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.05,
+                 jitter: float = 0.0, failure_rate: float = 0.0, tokens_per_second: float = 200.0,
+                 load_time: float = 0.0, seed: int = 0, models: Optional[List[str]] = None,
+                 runaway_rate: float = 0.0, model_speed: Optional[Dict[str, float]] = None):
+        """初始化模拟服务器
+
+        Args:
+            host: 监听地址
+            port: 监听端口，0表示自动分配
+            latency: 每个请求的固定延迟（秒，对应提示词处理）
+            jitter: 延迟的随机抖动幅度（秒，均匀分布在 ±jitter）
+            failure_rate: 返回HTTP 500的概率
+            tokens_per_second: 模拟的生成速度
+            load_time: 首次请求时模拟的模型加载时间（秒）
+            seed: 随机种子
+            models: /api/tags 返回的模型列表
+            runaway_rate: 在译文后输出大段解释的概率（受请求中的 num_predict 限制）
+            model_speed: 各模型相对的速度倍数（延迟除以倍数、生成速度乘以倍数），用于模拟大小模型
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.tokens_per_second = tokens_per_second
+        self.load_time = load_time
+        self.seed = seed
+        self.models = models or ["fake-model:latest"]
+        self.runaway_rate = runaway_rate
+        self.model_speed = model_speed or {}
+
+        self.request_count = 0
+        self.failure_count = 0
+        self._attempts = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeOllamaServer":
+        """在后台线程中启动服务"""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """停止服务"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ---- 模拟逻辑 ----
+
+    def _rng_for(self, text: str) -> random.Random:
+        with self._lock:
+            attempt = self._attempts.get(text, 0)
+            self._attempts[text] = attempt + 1
+        digest = hashlib.md5(f"{self.seed}:{attempt}:{text}".encode("utf-8")).hexdigest()
+        return random.Random(int(digest[:16], 16))
+
+    def _take_load_time(self) -> float:
+        """首次请求承担模型加载时间"""
+        with self._lock:
+            if self._loaded:
+                return 0.0
+            self._loaded = True
+            return self.load_time
+
+    @staticmethod
+    def extract_source_text(messages: List[dict]) -> str:
+        """从最后一条用户消息中取出待翻译原文"""
+        content = messages[-1].get("content", "") if messages else ""
+        _, sep, text = content.rpartition(PROMPT_SUFFIX)
+        return text.strip() if sep else content
+
+    @staticmethod
+    def extract_terms(messages: List[dict]) -> List[tuple]:
+        """从最后一条用户消息中取出术语表"""
+        content = messages[-1].get("content", "") if messages else ""
+        match = GLOSSARY_HINT.search(content)
+        if not match:
+            return []
+        return [tuple(pair.split("=", 1)) for pair in match.group(1).split("；") if "=" in pair]
+
+    @staticmethod
+    def fake_translate(text: str, terms: Optional[List[tuple]] = None) -> str:
+        """确定性的“翻译”：保留原文（含占位符），替换术语并加上译文标记"""
+        for source, target in terms or []:
+            text = re.sub(re.escape(source), lambda _: target, text, flags=re.IGNORECASE)
+        return f"{text}（译）"
+
+    def handle_chat(self, body: dict):
+        """处理 /api/chat，返回 (状态码, 响应JSON)"""
+        messages = body.get("messages", [])
+        text = self.extract_source_text(messages)
+        rng = self._rng_for(text)
+        with self._lock:
+            self.request_count += 1
+
+        speed = self.model_speed.get(body.get("model"), 1.0)
+        load_time = self._take_load_time()
+        prompt_time = max(0.0, self.latency + rng.uniform(-self.jitter, self.jitter)) / speed
+        if rng.random() < self.failure_rate:
+            time.sleep(load_time + prompt_time)
+            with self._lock:
+                self.failure_count += 1
+            return 500, {"error": "simulated failure"}
+
+        content = self.fake_translate(text, self.extract_terms(messages))
+        if rng.random() < self.runaway_rate:
+            content += RUNAWAY_TEXT
+        prompt_tokens = sum(len(m.get("content", "")) for m in messages) // 4 + 1
+        eval_count = len(content) // 2 + 1
+        done_reason = "stop"
+        num_predict = (body.get("options") or {}).get("num_predict") or 0
+        if 0 < num_predict < eval_count:
+            content, eval_count, done_reason = content[:num_predict * 2], num_predict, "length"
+        eval_time = eval_count / (self.tokens_per_second * speed) if self.tokens_per_second > 0 else 0.0
+        time.sleep(load_time + prompt_time + eval_time)
+        return 200, {
+            "model": body.get("model", self.models[0]),
+            "message": {"role": "assistant", "content": content},
+            "done": True,
+            "done_reason": done_reason,
+            "load_duration": int(load_time * 1e9),
+            "prompt_eval_count": prompt_tokens,
+            "prompt_eval_duration": int(prompt_time * 1e9),
+            "eval_count": eval_count,
+            "eval_duration": int(eval_time * 1e9),
+            "total_duration": int((load_time + prompt_time + eval_time) * 1e9),
+        }
+
+    def handle_generate(self, body: dict):
+        """处理 /api/generate（空提示词用于预热模型）"""
+        load_time = self._take_load_time()
+        time.sleep(load_time)
+        return 200, {"model": body.get("model", self.models[0]), "response": "", "done": True,
+                     "load_duration": int(load_time * 1e9)}
+
+    @staticmethod
+    def fake_embed(text: str) -> List[float]:
+        """确定性的“嵌入”：字符三元组散列到固定维度后计数，字面相近的文本向量相近"""
+        vector = [0.0] * EMBED_DIM
+        normalized = f" {' '.join(text.lower().split())} "
+        for i in range(max(1, len(normalized) - 2)):
+            digest = hashlib.md5(normalized[i:i + 3].encode("utf-8")).digest()
+            vector[digest[0] % EMBED_DIM] += 1.0 if digest[1] & 1 else -1.0
+        return vector
+
+    def handle_embed(self, body: dict):
+        """处理 /api/embed，input 可以是字符串或字符串列表"""
+        inputs = body.get("input", [])
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        time.sleep(self.latency / 10)
+        return 200, {"model": body.get("model", self.models[0]),
+                     "embeddings": [self.fake_embed(text) for text in inputs]}
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _send_json(self, status: int, data: dict) -> None:
+                payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                if self.path == "/api/tags":
+                    self._send_json(200, {"models": [{"name": name} for name in server.models]})
+                else:
+                    self._send_json(404, {"error": "not found"})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    self._send_json(400, {"error": "invalid json"})
+                    return
+                if self.path == "/api/chat":
+                    self._send_json(*server.handle_chat(body))
+                elif self.path == "/api/generate":
+                    self._send_json(*server.handle_generate(body))
+                elif self.path == "/api/embed":
+                    self._send_json(*server.handle_embed(body))
+                else:
+                    self._send_json(404, {"error": "not found"})
+
+            def log_message(self, format, *args):
+                # 不输出访问日志
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="模拟Ollama服务")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--latency", type=float, default=0.05, help="固定延迟（秒）")
+    parser.add_argument("--jitter", type=float, default=0.0, help="延迟抖动（秒）")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="失败率（0-1）")
+    parser.add_argument("--tokens-per-second", type=float, default=200.0, help="生成速度")
+    parser.add_argument("--load-time", type=float, default=0.0, help="模型加载时间（秒）")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--runaway-rate", type=float, default=0.0, help="输出大段解释的概率（0-1）")
+    args = parser.parse_args()
+
+    server = FakeOllamaServer(args.host, args.port, args.latency, args.jitter, args.failure_rate,
+                              args.tokens_per_second, args.load_time, args.seed, runaway_rate=args.runaway_rate)
+    print(f"模拟Ollama服务运行于 {server.base_url}，按 Ctrl+C 停止")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()